@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django import forms
+from django.utils import timezone
 
 from .models import GuidanceSession
 from masterdata.models import PeriodePKL
@@ -38,7 +39,11 @@ class PeriodeAktifFilter(admin.SimpleListFilter):
 
 @admin.action(description="Tandai sebagai selesai (DONE)")
 def mark_done(modeladmin, request, queryset):
-    updated = queryset.update(status="DONE")
+    updated = queryset.update(
+        status="DONE",
+        # update() melewati auto_now; isi manual agar tetap terbaca di change feed
+        diupdate_pada=timezone.now(),
+    )
     modeladmin.message_user(
         request, f"{updated} sesi bimbingan ditandai sebagai DONE."
     )
@@ -46,7 +51,7 @@ def mark_done(modeladmin, request, queryset):
 
 @admin.action(description="Tandai sebagai dibatalkan (CANCELLED)")
 def mark_cancelled(modeladmin, request, queryset):
-    updated = queryset.update(status="CANCELLED")
+    updated = queryset.update(status="CANCELLED", diupdate_pada=timezone.now())
     modeladmin.message_user(
         request, f"{updated} sesi bimbingan ditandai sebagai CANCELLED."
     )
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('guidance', '0001_initial'),
+        ('masterdata', '0012_changefeed_timestamps_dan_tombstone'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='guidancesession',
+            index=models.Index(fields=['diupdate_pada', 'id'], name='guidance_gu_diupdat_cbbc23_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 
+from masterdata.periode import AktivitasQuerySet, manager_berjalan
 from masterdata.models import Mahasiswa, Dosen, PeriodePKL
 
 
@@ -86,13 +87,17 @@ class GuidanceSession(models.Model):
     dibuat_pada = models.DateTimeField(auto_now_add=True)
     diupdate_pada = models.DateTimeField(auto_now=True)
 
+    objects = AktivitasQuerySet.as_manager()
+    berjalan = manager_berjalan(AktivitasQuerySet)
+
     def save(self, *args, **kwargs):
         # Auto-fill dosen & periode dari Mahasiswa kalau belum diisi
-        if self.mahasiswa:
-            if self.dosen_pembimbing is None:
-                self.dosen_pembimbing = self.mahasiswa.dosen_pembimbing
-            if self.periode is None:
-                self.periode = self.mahasiswa.periode
+        if self.mahasiswa_id and (self.dosen_pembimbing_id is None or self.periode_id is None):
+            mhs = self.mahasiswa
+            if self.dosen_pembimbing_id is None:
+                self.dosen_pembimbing_id = mhs.dosen_pembimbing_id
+            if self.periode_id is None:
+                self.periode_id = mhs.periode_id
 
         super().save(*args, **kwargs)
 
@@ -100,6 +105,7 @@ class GuidanceSession(models.Model):
         verbose_name = "Sesi Bimbingan"
         verbose_name_plural = "Sesi Bimbingan"
         ordering = ["-tanggal", "-dibuat_pada"]
+        indexes = [models.Index(fields=["diupdate_pada", "id"])]
 
     def __str__(self):
         return f"{self.mahasiswa.nama} - Pertemuan {self.pertemuan_ke or '-'} ({self.tanggal})"
@@ -0,0 +1,34 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "task",
+        "status",
+        "percobaan",
+        "maks_percobaan",
+        "jalankan_pada",
+        "dibuat_oleh",
+        "selesai_pada",
+    )
+    list_filter = ("status", "task")
+    search_fields = ("task", "error_terakhir")
+    readonly_fields = ("dibuat_pada", "diupdate_pada", "selesai_pada", "dikunci_oleh", "dikunci_pada")
+    actions = ["jalankan_ulang"]
+
+    @admin.action(description="Masukkan ulang ke antrean")
+    def jalankan_ulang(self, request, queryset):
+        now = timezone.now()
+        updated = queryset.exclude(status="BERJALAN").update(
+            status="ANTRI",
+            percobaan=0,
+            jalankan_pada=now,
+            selesai_pada=None,
+            diupdate_pada=now,
+        )
+        self.message_user(request, f"{updated} job dimasukkan ulang ke antrean.")
@@ -0,0 +1,95 @@
+# backend/jobs/management/commands/runworker.py
+import multiprocessing
+import os
+import signal
+import socket
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+_stop = False
+
+
+def _request_stop(signum, frame):
+    global _stop
+    _stop = True
+
+
+def _process_main(worker_id, burst, poll_interval):
+    # proses anak (spawn) memulai interpreter baru: setup Django ulang
+    import django
+
+    django.setup()
+
+    from jobs.worker import work_loop
+
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+    work_loop(worker_id, burst=burst, poll_interval=poll_interval, should_stop=lambda: _stop)
+
+
+class Command(BaseCommand):
+    help = (
+        "Jalankan worker antrean job (jobs.Job). Setiap proses mengambil job "
+        "satu per satu; SIGTERM/Ctrl+C menunggu job yang sedang berjalan selesai."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes", type=int, default=settings.JOBS_WORKER_PROCESSES,
+            help="Jumlah proses worker (default: settings.JOBS_WORKER_PROCESSES).",
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=settings.JOBS_POLL_INTERVAL,
+            help="Jeda (detik) saat antrean kosong.",
+        )
+        parser.add_argument(
+            "--burst", action="store_true",
+            help="Berhenti setelah antrean kosong (untuk cron/CI).",
+        )
+
+    def handle(self, *args, **options):
+        base_id = f"{socket.gethostname()}:{os.getpid()}"
+        processes = max(1, options["processes"])
+        self.stdout.write(f"Worker {base_id}: {processes} proses")
+
+        if processes == 1:
+            from jobs.worker import work_loop
+
+            signal.signal(signal.SIGTERM, _request_stop)
+            signal.signal(signal.SIGINT, _request_stop)
+            done = work_loop(
+                f"{base_id}-0",
+                burst=options["burst"],
+                poll_interval=options["poll_interval"],
+                should_stop=lambda: _stop,
+            )
+            self.stdout.write(f"Selesai, {done} job diproses.")
+            return
+
+        # koneksi DB tidak boleh terbawa ke proses anak
+        connections.close_all()
+        ctx = multiprocessing.get_context("spawn")
+        children = [
+            ctx.Process(
+                target=_process_main,
+                args=(f"{base_id}-{i}", options["burst"], options["poll_interval"]),
+                name=f"runworker-{i}",
+            )
+            for i in range(processes)
+        ]
+        for child in children:
+            child.start()
+
+        def _forward(signum, frame):
+            for child in children:
+                if child.is_alive():
+                    os.kill(child.pid, signal.SIGTERM)
+
+        signal.signal(signal.SIGTERM, _forward)
+        signal.signal(signal.SIGINT, _forward)
+        for child in children:
+            child.join()
+        self.stdout.write("Semua proses worker berhenti.")
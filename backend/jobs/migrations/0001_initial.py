@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:42
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task', models.CharField(max_length=100)),
+                ('argumen', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('ANTRI', 'Menunggu di antrean'), ('BERJALAN', 'Sedang diproses'), ('SELESAI', 'Selesai'), ('GAGAL', 'Gagal')], default='ANTRI', max_length=20)),
+                ('percobaan', models.PositiveIntegerField(default=0)),
+                ('maks_percobaan', models.PositiveIntegerField(default=3)),
+                ('jalankan_pada', models.DateTimeField(default=django.utils.timezone.now, help_text='Job baru diambil worker setelah waktu ini (dipakai juga untuk backoff retry).')),
+                ('dikunci_oleh', models.CharField(blank=True, max_length=100)),
+                ('dikunci_pada', models.DateTimeField(blank=True, null=True)),
+                ('hasil', models.JSONField(blank=True, null=True)),
+                ('error_terakhir', models.TextField(blank=True)),
+                ('dibuat_pada', models.DateTimeField(auto_now_add=True)),
+                ('diupdate_pada', models.DateTimeField(auto_now=True)),
+                ('selesai_pada', models.DateTimeField(blank=True, null=True)),
+                ('dibuat_oleh', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pkl_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Job',
+                'verbose_name_plural': 'Job',
+                'ordering': ['-dibuat_pada'],
+                'indexes': [models.Index(fields=['status', 'jalankan_pada'], name='jobs_job_status_d629db_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    Satu unit pekerjaan latar belakang (ekspor, PDF, impor, notifikasi).
+
+    Job dibuat lewat ``jobs.registry.enqueue`` dan dieksekusi oleh
+    ``manage.py runworker``; tidak ada broker eksternal, database adalah antreannya.
+    """
+
+    STATUS_CHOICES = [
+        ("ANTRI", "Menunggu di antrean"),
+        ("BERJALAN", "Sedang diproses"),
+        ("SELESAI", "Selesai"),
+        ("GAGAL", "Gagal"),
+    ]
+
+    task = models.CharField(max_length=100)
+    argumen = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="ANTRI")
+
+    percobaan = models.PositiveIntegerField(default=0)
+    maks_percobaan = models.PositiveIntegerField(default=3)
+    jalankan_pada = models.DateTimeField(
+        default=timezone.now,
+        help_text="Job baru diambil worker setelah waktu ini (dipakai juga untuk backoff retry).",
+    )
+
+    dikunci_oleh = models.CharField(max_length=100, blank=True)
+    dikunci_pada = models.DateTimeField(null=True, blank=True)
+
+    hasil = models.JSONField(null=True, blank=True)
+    error_terakhir = models.TextField(blank=True)
+
+    dibuat_oleh = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="pkl_jobs",
+    )
+    dibuat_pada = models.DateTimeField(auto_now_add=True)
+    diupdate_pada = models.DateTimeField(auto_now=True)
+    selesai_pada = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Job"
+        verbose_name_plural = "Job"
+        ordering = ["-dibuat_pada"]
+        indexes = [
+            # query klaim worker: status=ANTRI & jalankan_pada <= now, urut jalankan_pada
+            models.Index(fields=["status", "jalankan_pada"]),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - representasi sederhana
+        return f"#{self.pk} {self.task} ({self.status})"
+
+    @property
+    def is_final(self) -> bool:
+        return self.status in {"SELESAI", "GAGAL"}
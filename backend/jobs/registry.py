@@ -0,0 +1,60 @@
+# backend/jobs/registry.py
+"""
+Registri task latar belakang.
+
+    from jobs.registry import task, enqueue
+
+    @task("portal.export_logbook_dosen")
+    def export_logbook_dosen(dosen_id):
+        ...
+        return {"file": nama_file}   # disimpan di Job.hasil (harus JSON)
+
+    job = enqueue("portal.export_logbook_dosen", {"dosen_id": 3}, user=request.user)
+
+Task dipanggil dengan ``**job.argumen``. Exception apa pun memicu retry
+dengan backoff sampai ``maks_percobaan`` habis.
+"""
+
+from django.conf import settings
+from django.utils import timezone
+
+_TASKS = {}
+
+
+def task(name: str, max_attempts: int | None = None):
+    def decorator(func):
+        _TASKS[name] = func
+        func.task_name = name
+        func.max_attempts = max_attempts
+        return func
+
+    return decorator
+
+
+def get_task(name: str):
+    try:
+        return _TASKS[name]
+    except KeyError:
+        raise LookupError(f"Task tidak terdaftar: {name}") from None
+
+
+def registered_tasks() -> list[str]:
+    return sorted(_TASKS)
+
+
+def enqueue(name: str, argumen: dict | None = None, *, user=None, run_at=None,
+            max_attempts: int | None = None):
+    """Masukkan job ke antrean dan kembalikan objek ``Job``-nya."""
+
+    from .models import Job
+
+    func = get_task(name)
+    if max_attempts is None:
+        max_attempts = func.max_attempts or settings.JOBS_MAX_ATTEMPTS
+    return Job.objects.create(
+        task=name,
+        argumen=argumen or {},
+        dibuat_oleh=user if user is not None and user.is_authenticated else None,
+        jalankan_pada=run_at or timezone.now(),
+        maks_percobaan=max_attempts,
+    )
@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from masterdata.models import Dosen
+from masterdata.testing import MediaSementaraMixin
+from .models import Job
+from .registry import enqueue, task
+from .worker import claim_next, release_stale_jobs, run_pending
+
+
+_panggilan = []
+
+
+@task("tests.catat")
+def _task_catat(nilai):
+    _panggilan.append(nilai)
+    return {"nilai": nilai}
+
+
+@task("tests.selalu_gagal", max_attempts=2)
+def _task_gagal():
+    raise RuntimeError("sengaja gagal")
+
+
+@override_settings(JOBS_RETRY_BACKOFF_BASE=10, JOBS_RETRY_BACKOFF_MAX=60)
+class JobQueueTests(MediaSementaraMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        _panggilan.clear()
+
+    def test_job_diklaim_sekali_dan_hasil_disimpan(self):
+        job = enqueue("tests.catat", {"nilai": 7})
+
+        claimed = claim_next("w1")
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.status, "BERJALAN")
+        self.assertEqual(claimed.percobaan, 1)
+        # job yang sedang dikunci tidak bisa diambil worker lain
+        self.assertIsNone(claim_next("w2"))
+
+        Job.objects.filter(pk=job.pk).update(status="ANTRI")
+        self.assertEqual(run_pending(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "SELESAI")
+        self.assertEqual(job.hasil, {"nilai": 7})
+        self.assertEqual(_panggilan, [7])
+
+    def test_retry_dengan_backoff_lalu_gagal(self):
+        job = enqueue("tests.selalu_gagal")
+        self.assertEqual(job.maks_percobaan, 2)
+
+        run_pending()
+        job.refresh_from_db()
+        self.assertEqual(job.status, "ANTRI")
+        self.assertGreaterEqual(job.jalankan_pada, timezone.now() + timedelta(seconds=9))
+        self.assertIn("sengaja gagal", job.error_terakhir)
+        # belum waktunya dijalankan lagi
+        self.assertEqual(run_pending(), 0)
+
+        Job.objects.filter(pk=job.pk).update(jalankan_pada=timezone.now())
+        run_pending()
+        job.refresh_from_db()
+        self.assertEqual(job.status, "GAGAL")
+        self.assertEqual(job.percobaan, 2)
+
+    def test_job_ditinggal_worker_dikembalikan_ke_antrean(self):
+        job = enqueue("tests.catat", {"nilai": 1})
+        claim_next("w-mati")
+        Job.objects.filter(pk=job.pk).update(dikunci_pada=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(release_stale_jobs(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "ANTRI")
+
+    def test_endpoint_status_dan_ekspor_logbook_latar_belakang(self):
+        user = User.objects.create_user(username="dsn_job", password="test")
+        Dosen.objects.create(user=user, nidn="6060", nama="Dosen Job")
+        self.client.force_login(user)
+
+        response = self.client.get("/dosen/logbook/export/?background=1")
+        self.assertEqual(response.status_code, 202)
+        status_url = response.json()["status_url"]
+        self.assertEqual(self.client.get(status_url).json()["status"], "ANTRI")
+
+        run_pending()
+        data = self.client.get(status_url).json()
+        self.assertEqual(data["status"], "SELESAI")
+        self.assertEqual(data["hasil"]["baris"], 0)
+        # nama berkas tidak memuat NIDN; unduhan lewat view terproteksi
+        self.assertNotIn("6060", data["hasil"]["file"])
+        self.assertEqual(data["hasil"]["url"], f"/jobs/{response.json()['job_id']}/berkas/")
+        unduh = self.client.get(data["hasil"]["url"])
+        self.assertEqual(unduh.status_code, 200)
+        self.assertIn("logbook_dosen_6060_", unduh["Content-Disposition"])
+        self.assertTrue(b"".join(unduh.streaming_content))
+        unduh.close()
+
+        lain = User.objects.create_user(username="dsn_lain", password="test")
+        self.client.force_login(lain)
+        self.assertEqual(self.client.get(status_url).status_code, 404)
+        self.assertEqual(self.client.get(data["hasil"]["url"]).status_code, 404)
@@ -0,0 +1,181 @@
+# backend/jobs/worker.py
+"""
+Eksekusi job dari antrean database.
+
+Klaim job memakai ``SELECT ... FOR UPDATE SKIP LOCKED`` jika backend
+mendukungnya (PostgreSQL/MySQL), lalu dikonfirmasi dengan UPDATE bersyarat
+``status='ANTRI'``. Di SQLite (tanpa row lock) UPDATE bersyarat itu sendiri
+yang menjamin satu job hanya diambil satu worker: transaksi tulis sudah
+diserialisasi oleh BEGIN IMMEDIATE.
+"""
+
+import logging
+import random
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+from .registry import get_task
+
+logger = logging.getLogger("jobs")
+
+
+def claim_next(worker_id: str):
+    """Ambil satu job yang siap dijalankan, atau None jika antrean kosong."""
+
+    now = timezone.now()
+    with transaction.atomic():
+        qs = Job.objects.filter(status="ANTRI", jalankan_pada__lte=now).order_by(
+            "jalankan_pada", "id"
+        )
+        if connection.features.has_select_for_update_skip_locked:
+            qs = qs.select_for_update(skip_locked=True)
+        job = qs.first()
+        if job is None:
+            return None
+        claimed = Job.objects.filter(pk=job.pk, status="ANTRI").update(
+            status="BERJALAN",
+            dikunci_oleh=worker_id,
+            dikunci_pada=now,
+            percobaan=F("percobaan") + 1,
+            diupdate_pada=now,
+        )
+    if not claimed:
+        # sudah diambil worker lain di antara SELECT dan UPDATE
+        return None
+    job.refresh_from_db()
+    return job
+
+
+def retry_delay(percobaan: int) -> timedelta:
+    """Backoff eksponensial dengan jitter: base * 2^(n-1), dibatasi JOBS_RETRY_BACKOFF_MAX."""
+
+    base = settings.JOBS_RETRY_BACKOFF_BASE
+    delay = min(base * 2 ** max(percobaan - 1, 0), settings.JOBS_RETRY_BACKOFF_MAX)
+    return timedelta(seconds=delay + random.uniform(0, base / 2))
+
+
+def _tandai_gagal(job: Job, error: str) -> None:
+    now = timezone.now()
+    Job.objects.filter(pk=job.pk).update(
+        status="GAGAL",
+        error_terakhir=error,
+        dikunci_oleh="",
+        dikunci_pada=None,
+        selesai_pada=now,
+        diupdate_pada=now,
+    )
+    logger.error("Job #%s %s gagal permanen:\n%s", job.pk, job.task, error)
+
+
+def execute(job: Job) -> None:
+    try:
+        func = get_task(job.task)
+    except LookupError as exc:
+        _tandai_gagal(job, str(exc))
+        return
+
+    try:
+        result = func(**job.argumen)
+    except Exception as exc:  # noqa: BLE001 - semua error task dicatat di job
+        error = "".join(traceback.format_exception(exc))
+        if job.percobaan >= job.maks_percobaan:
+            _tandai_gagal(job, error)
+            return
+        now = timezone.now()
+        Job.objects.filter(pk=job.pk).update(
+            status="ANTRI",
+            error_terakhir=error,
+            dikunci_oleh="",
+            dikunci_pada=None,
+            jalankan_pada=now + retry_delay(job.percobaan),
+            diupdate_pada=now,
+        )
+        logger.warning(
+            "Job #%s %s gagal (percobaan %s/%s), dijadwalkan ulang: %s",
+            job.pk, job.task, job.percobaan, job.maks_percobaan, exc,
+        )
+        return
+
+    now = timezone.now()
+    Job.objects.filter(pk=job.pk).update(
+        status="SELESAI",
+        hasil=result,
+        error_terakhir="",
+        dikunci_oleh="",
+        dikunci_pada=None,
+        selesai_pada=now,
+        diupdate_pada=now,
+    )
+    logger.info("Job #%s %s selesai", job.pk, job.task)
+
+
+def release_stale_jobs() -> int:
+    """
+    Kembalikan job BERJALAN yang kuncinya kedaluwarsa (worker mati di tengah
+    jalan) ke antrean, atau tandai GAGAL jika percobaannya sudah habis.
+    """
+
+    now = timezone.now()
+    stale = Job.objects.filter(
+        status="BERJALAN",
+        dikunci_pada__lt=now - timedelta(seconds=settings.JOBS_LOCK_TIMEOUT),
+    )
+    habis = stale.filter(percobaan__gte=F("maks_percobaan")).update(
+        status="GAGAL",
+        error_terakhir="Worker berhenti sebelum job selesai.",
+        dikunci_oleh="",
+        dikunci_pada=None,
+        selesai_pada=now,
+        diupdate_pada=now,
+    )
+    ulang = stale.update(
+        status="ANTRI", dikunci_oleh="", dikunci_pada=None, jalankan_pada=now, diupdate_pada=now
+    )
+    return habis + ulang
+
+
+def run_pending(worker_id: str = "inline", limit: int | None = None) -> int:
+    """Jalankan job yang siap sampai antrean kosong (dipakai juga di test)."""
+
+    processed = 0
+    while limit is None or processed < limit:
+        job = claim_next(worker_id)
+        if job is None:
+            break
+        execute(job)
+        processed += 1
+    return processed
+
+
+def work_loop(worker_id: str, *, burst: bool = False, poll_interval: float = 1.0,
+              should_stop=lambda: False) -> int:
+    """Loop utama satu proses worker."""
+
+    processed = 0
+    last_cleanup = 0.0
+    while not should_stop():
+        close_old_connections()
+        if time.monotonic() - last_cleanup > settings.JOBS_LOCK_TIMEOUT / 2:
+            release_stale_jobs()
+            last_cleanup = time.monotonic()
+
+        job = claim_next(worker_id)
+        if job is not None:
+            execute(job)
+            processed += 1
+            continue
+        if burst and not Job.objects.filter(
+            status="ANTRI", jalankan_pada__lte=timezone.now()
+        ).exists():
+            # mode burst: berhenti begitu tidak ada lagi job yang siap
+            break
+        time.sleep(poll_interval)
+    close_old_connections()
+    return processed
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django import forms
+from django.utils import timezone
 
 from .models import LogbookEntry
 from masterdata.models import PeriodePKL
@@ -44,7 +45,11 @@ class PeriodeAktifFilter(admin.SimpleListFilter):
 
 @admin.action(description="Tandai sebagai disetujui (Disetujui)")
 def mark_as_reviewed(modeladmin, request, queryset):
-    updated = queryset.update(status="DISETUJUI")
+    updated = queryset.update(
+        status="DISETUJUI",
+        # update() melewati auto_now; isi manual agar tetap terbaca di change feed
+        diupdate_pada=timezone.now(),
+    )
     modeladmin.message_user(
         request,
         f"{updated} entri logbook ditandai sebagai DISETUJUI."
@@ -53,7 +58,7 @@ def mark_as_reviewed(modeladmin, request, queryset):
 
 @admin.action(description="Tandai sebagai diajukan (SUBMIT)")
 def mark_as_submitted(modeladmin, request, queryset):
-    updated = queryset.update(status="SUBMIT")
+    updated = queryset.update(status="SUBMIT", diupdate_pada=timezone.now())
     modeladmin.message_user(
         request,
         f"{updated} entri logbook ditandai sebagai SUBMIT."
@@ -90,7 +95,7 @@ class LogbookEntryAdmin(admin.ModelAdmin):
     )
     autocomplete_fields = ("mahasiswa", "dosen_pembimbing", "periode")
     date_hierarchy = "tanggal"
-    readonly_fields = ("dosen_pembimbing", "periode")
+    readonly_fields = ("dosen_pembimbing", "periode", "idempotency_key")
 
     actions = [mark_as_reviewed, mark_as_submitted]
 
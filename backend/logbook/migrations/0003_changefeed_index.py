@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logbook', '0002_alter_logbookentry_options_and_more'),
+        ('masterdata', '0012_changefeed_timestamps_dan_tombstone'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='logbookentry',
+            index=models.Index(fields=['diupdate_pada', 'id'], name='logbook_log_diupdat_87c5c0_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-19 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logbook', '0003_changefeed_index'),
+        ('masterdata', '0017_arsip_periode'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='logbookentry',
+            name='idempotency_key',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='logbookentry',
+            constraint=models.UniqueConstraint(condition=models.Q(('idempotency_key__isnull', False)), fields=('mahasiswa', 'idempotency_key'), name='uniq_logbook_idempotency_key'),
+        ),
+    ]
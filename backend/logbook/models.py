@@ -1,5 +1,6 @@
 # backend/logbook/models.py
 from django.db import models
+from masterdata.periode import AktivitasQuerySet, manager_berjalan
 from masterdata.models import Mahasiswa, Dosen, PeriodePKL
 
 
@@ -44,24 +45,39 @@ class LogbookEntry(models.Model):
         default="DRAFT",
     )
     catatan_dosen = models.TextField(blank=True)
+    # kunci dari klien (kiriman massal/offline): kirim ulang batch yang sama tidak menggandakan entri
+    idempotency_key = models.UUIDField(null=True, blank=True)
 
     dibuat_pada = models.DateTimeField(auto_now_add=True)
     diupdate_pada = models.DateTimeField(auto_now=True)
 
+    objects = AktivitasQuerySet.as_manager()
+    berjalan = manager_berjalan(AktivitasQuerySet)
+
     def save(self, *args, **kwargs):
         """Isi dosen pembimibng dan periode secara otomatis dari mahasiswa."""
         
-        if self.mahasiswa:
-            if self.dosen_pembimbing is None:
-                self.dosen_pembimbing = self.mahasiswa.dosen_pembimbing
-        if self.periode is None:
-            self.periode = self.mahasiswa.periode
-        
+        # bandingkan *_id: FK yang sudah terisi tidak perlu dimuat
+        if self.mahasiswa_id and (self.dosen_pembimbing_id is None or self.periode_id is None):
+            mhs = self.mahasiswa
+            if self.dosen_pembimbing_id is None:
+                self.dosen_pembimbing_id = mhs.dosen_pembimbing_id
+            if self.periode_id is None:
+                self.periode_id = mhs.periode_id
+
         super().save(*args, **kwargs)
 
     class Meta:
         verbose_name = "Logbook"
         verbose_name_plural = "Logbook"
+        indexes = [models.Index(fields=["diupdate_pada", "id"])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["mahasiswa", "idempotency_key"],
+                condition=models.Q(idempotency_key__isnull=False),
+                name="uniq_logbook_idempotency_key",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.mahasiswa.nim} - {self.tanggal} ({self.get_status_display()})"
@@ -0,0 +1,173 @@
+# backend/masterdata/access.py
+"""
+Lapisan akses baris (row-level) per peran.
+
+Setiap model PKL memakai QuerySet turunan ``AksesQuerySet`` sehingga view
+cukup menulis::
+
+    LogbookEntry.objects.visible_to(request.user).filter(...)
+    get_object_or_404(SeminarHasilPKL.objects.visible_to(request.user), pk=pk)
+
+Aturannya ditulis dua kali di tempat yang sama, sengaja:
+
+- ``q_akses(role)``: filter ORM (dipakai ``visible_to``), dan
+- ``boleh_lihat(role, obj)``: predikat Python untuk satu objek yang sudah
+  dimuat.
+
+Keduanya hanya membandingkan kolom ``*_id`` (tidak pernah memuat FK), jadi
+otorisasi tidak menambah query; panel penguji dibaca dari prefetch
+``dengan_panel()`` bila tersedia. Uji properti di masterdata/tests.py
+memastikan kedua bentuk selalu sepakat.
+
+Lingkup peran:
+
+- koordinator PKL dan staf: semua baris;
+- dosen: baris yang ia bimbing (``dosen_pembimbing_id``) dan seminar (serta
+  penilaiannya) yang ia uji;
+- mahasiswa: miliknya sendiri;
+- selain itu: tidak ada.
+
+Halaman dosen memakai ``visible_to(user, peran=DOSEN)`` sehingga koordinator
+yang membuka halaman dosen tetap hanya melihat bimbingan/seminar ujiannya.
+"""
+
+from abc import ABCMeta, abstractmethod
+
+from django.db import models
+from django.db.models import Exists, OuterRef, Q
+
+SEMUA = "SEMUA"
+# ``peran=DOSEN``: hanya hak sebagai dosen pembimbing/penguji, tanpa hak
+# lihat-semua koordinator/staf (halaman /dosen/ untuk dosen yang juga koordinator)
+DOSEN = "dosen"
+
+
+def lingkup(user, peran=None):
+    """
+    ``SEMUA`` untuk koordinator/staf, RoleContext untuk dosen/mahasiswa,
+    atau None. Menerima User atau RoleContext (mis. ``request.pkl_role``).
+    Dengan ``peran=DOSEN`` hanya profil dosen yang dipakai.
+    """
+
+    from .roles import RoleContext, resolve_role
+
+    if isinstance(user, RoleContext):
+        role = user
+    else:
+        if user is None or not user.is_authenticated:
+            return None
+        if user.is_staff and peran is None:
+            return SEMUA
+        role = resolve_role(user)
+    if peran == DOSEN:
+        return RoleContext(dosen_id=role.dosen_id) if role.is_dosen else None
+    if peran is not None:
+        raise ValueError(f"Peran akses tidak dikenal: {peran}")
+    if role.is_koordinator:
+        return SEMUA
+    if not role.is_dosen and not role.is_mahasiswa:
+        return None
+    return role
+
+
+class AksesQuerySet(models.QuerySet, metaclass=ABCMeta):
+    def visible_to(self, user, peran=None):
+        scope = lingkup(user, peran)
+        if scope is None:
+            return self.none()
+        if scope == SEMUA:
+            return self.all()
+        return self.filter(self.q_akses(scope))
+
+    @abstractmethod
+    def q_akses(self, role) -> Q:
+        """Filter ORM baris yang boleh dilihat ``role`` (RoleContext)."""
+
+    @staticmethod
+    @abstractmethod
+    def boleh_lihat(role, obj) -> bool:
+        """Padanan Python ``q_akses`` untuk satu objek yang sudah dimuat."""
+
+
+def boleh_lihat(user, obj, peran=None) -> bool:
+    """Predikat satu objek; aturan diambil dari QuerySet model-nya."""
+
+    scope = lingkup(user, peran)
+    if scope is None:
+        return False
+    if scope == SEMUA:
+        return True
+    return type(obj)._default_manager.get_queryset().boleh_lihat(scope, obj)
+
+
+def _q_milik(role, *, dosen_field="dosen_pembimbing_id", mahasiswa_field="mahasiswa_id") -> Q:
+    q = Q(pk__in=[])
+    if role.dosen_id is not None:
+        q |= Q(**{dosen_field: role.dosen_id})
+    if role.mahasiswa_id is not None:
+        q |= Q(**{mahasiswa_field: role.mahasiswa_id})
+    return q
+
+
+def _milik(role, dosen_id, mahasiswa_id) -> bool:
+    return (role.dosen_id is not None and dosen_id == role.dosen_id) or (
+        role.mahasiswa_id is not None and mahasiswa_id == role.mahasiswa_id
+    )
+
+
+class DibimbingQuerySet(AksesQuerySet):
+    """Baris milik mahasiswa dengan kolom ``dosen_pembimbing`` sendiri (logbook, bimbingan, pendaftaran)."""
+
+    def q_akses(self, role) -> Q:
+        return _q_milik(role)
+
+    @staticmethod
+    def boleh_lihat(role, obj) -> bool:
+        return _milik(role, obj.dosen_pembimbing_id, obj.mahasiswa_id)
+
+
+class MahasiswaQuerySet(AksesQuerySet):
+    def q_akses(self, role) -> Q:
+        return _q_milik(role, mahasiswa_field="pk")
+
+    @staticmethod
+    def boleh_lihat(role, obj) -> bool:
+        return _milik(role, obj.dosen_pembimbing_id, obj.pk)
+
+
+def _q_seminar(role, prefix="", seminar_ref="pk") -> Q:
+    q = _q_milik(role, dosen_field=f"{prefix}dosen_pembimbing_id", mahasiswa_field=f"{prefix}mahasiswa_id")
+    if role.dosen_id is not None:
+        from .models import SeminarPenguji
+
+        # EXISTS, bukan JOIN: tidak menggandakan baris untuk panel besar
+        q |= Q(Exists(SeminarPenguji.objects.filter(seminar_id=OuterRef(seminar_ref), dosen_id=role.dosen_id)))
+    return q
+
+
+def _seminar_boleh(role, seminar) -> bool:
+    if _milik(role, seminar.dosen_pembimbing_id, seminar.mahasiswa_id):
+        return True
+    return role.dosen_id is not None and role.dosen_id in seminar.penguji_ids()
+
+
+class SeminarQuerySet(AksesQuerySet):
+    def q_akses(self, role) -> Q:
+        return _q_seminar(role)
+
+    @staticmethod
+    def boleh_lihat(role, obj) -> bool:
+        return _seminar_boleh(role, obj)
+
+
+class PenilaianQuerySet(AksesQuerySet):
+    """Penilaian mengikuti seminarnya."""
+
+    def q_akses(self, role) -> Q:
+        return _q_seminar(role, prefix="seminar__", seminar_ref="seminar_id")
+
+    @staticmethod
+    def boleh_lihat(role, obj) -> bool:
+        # objek penilaian biasanya datang dari seminar.assessments (seminar sudah ada)
+        return _seminar_boleh(role, obj.seminar)
+
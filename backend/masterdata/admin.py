@@ -1,9 +1,14 @@
 from django.contrib import admin
+from django.db import transaction
+from django.utils import timezone
+
 from .models import Dosen, Mahasiswa, Mitra, PeriodePKL, PendaftaranPKL
 
 # import dari app lain untuk kebutuhan dashboard dosen
 from logbook.models import LogbookEntry
 from guidance.models import GuidanceSession
+from notifications import events as notif_events
+from notifications.outbox import catat
 
 class MahasiswaInline(admin.TabularInline):
     model = Mahasiswa
@@ -101,7 +106,7 @@ class MitraAdmin(admin.ModelAdmin):
 
 @admin.register(PeriodePKL)
 class PeriodePKLAdmin(admin.ModelAdmin):
-    list_display = ("nama_periode", "tahun_ajaran", "semester", "tanggal_mulai", "tanggal_selesai", "aktif")
+    list_display = ("nama_periode", "tahun_ajaran", "semester", "tanggal_mulai", "tanggal_selesai", "aktif", "diarsipkan_pada")
     list_filter = ("tahun_ajaran", "semester", "aktif")
     search_fields = ("nama_periode", "tahun_ajaran")
 
@@ -119,3 +124,22 @@ class PendaftaranPKLAdmin(admin.ModelAdmin):
     list_filter = ("status", "periode", "mitra", "jenis_pkl")
     search_fields = ("mahasiswa__nim", "mahasiswa__nama", "mitra__nama")
     autocomplete_fields = ("mahasiswa", "periode", "mitra", "dosen_pembimbing")
+    actions = ["setujui_pendaftaran"]
+
+    @admin.action(description="Setujui pendaftaran terpilih")
+    def setujui_pendaftaran(self, request, queryset):
+        # jalur massal: bulk_update + sinkron + notifikasi dalam satu transaksi
+        now = timezone.now()
+        with transaction.atomic():
+            daftar = list(
+                queryset.exclude(status="DISETUJUI").select_related(
+                    "mahasiswa__user", "dosen_pembimbing__user"
+                )
+            )
+            for pendaftaran in daftar:
+                pendaftaran.status = "DISETUJUI"
+                pendaftaran.tanggal_update = now
+            PendaftaranPKL.objects.bulk_update(daftar, ["status", "tanggal_update"])
+            PendaftaranPKL.sinkron_massal_ke_mahasiswa(daftar)
+            catat([item for p in daftar for item in notif_events.pendaftaran_diproses(p)])
+        self.message_user(request, f"{len(daftar)} pendaftaran disetujui.")
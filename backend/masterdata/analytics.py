@@ -0,0 +1,238 @@
+# backend/masterdata/analytics.py
+"""
+Analitik penilaian seminar per periode: sebaran nilai tiap aspek, profil
+per dosen penilai (kalibrasi z-score), dan kesepakatan antar-penilai
+(penguji vs pembimbing).
+
+Data diambil dengan SATU query ``values_list`` per periode, lalu semua
+statistik dihitung sebagai operasi array NumPy. Hasil (dict yang aman
+di-pickle/JSON) di-cache per periode dengan versi namespace
+``penilaian:<periode_id>`` yang dinaikkan setiap kali SeminarAssessment
+berubah (masterdata/signals.py), jadi cache tidak pernah basi.
+
+Definisi singkat:
+
+- ``z_rata``: rata-rata z-score nilai akhir penilai terhadap seluruh nilai
+  pada periode itu (> 0 berarti cenderung memberi nilai lebih tinggi).
+- ``selisih_rekan``: rata-rata selisih nilai penilai terhadap rata-rata
+  penilai LAIN pada seminar yang sama; mengontrol kualitas mahasiswa
+  sehingga lebih adil daripada z-score mentah.
+- ``icc``: ICC(2,1) kesepakatan absolut dua penilai (rata-rata penguji vs
+  pembimbing per seminar); ``korelasi``: Pearson r per aspek.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache_versions import get_version
+from .grading import ASPEK_FIELDS, konversi_huruf, skema_aktif
+
+KOLOM_NILAI = (*ASPEK_FIELDS, "nilai_angka")
+AMBANG_KALIBRASI = 0.5  # |z_rata| di atas ini ditandai
+
+
+class AnalitikTidakTersedia(RuntimeError):
+    """NumPy belum terpasang."""
+
+
+def namespace_penilaian(periode_id) -> str:
+    return f"penilaian:{periode_id}"
+
+
+def _numpy():
+    try:
+        import numpy as np  # import lokal agar optional di lingkungan dev/CI
+    except ModuleNotFoundError as exc:
+        raise AnalitikTidakTersedia(
+            "Dependensi numpy belum terpasang. Install dengan `pip install numpy`."
+        ) from exc
+    return np
+
+
+def _ekstrak(periode_id):
+    from .models import SeminarAssessment
+
+    return list(
+        SeminarAssessment.objects.filter(seminar__periode_id=periode_id, nilai_angka__isnull=False)
+        .order_by()
+        .values_list("seminar_id", "penguji_id", "penguji__nama", "role", *KOLOM_NILAI)
+    )
+
+
+def _ringkas(np, kolom):
+    """Statistik deskriptif per kolom (matriks n x k) -> list dict sejajar KOLOM_NILAI."""
+
+    if kolom.shape[0] == 0:
+        return [{"aspek": nama, "n": 0} for nama in KOLOM_NILAI]
+    q = np.percentile(kolom, [0, 25, 50, 75, 100], axis=0)
+    mean = kolom.mean(axis=0)
+    std = kolom.std(axis=0, ddof=1) if kolom.shape[0] > 1 else np.zeros(kolom.shape[1])
+    return [
+        {
+            "aspek": nama,
+            "n": int(kolom.shape[0]),
+            "rata": round(float(mean[j]), 2),
+            "sd": round(float(std[j]), 2),
+            "min": float(q[0, j]),
+            "q1": float(q[1, j]),
+            "median": float(q[2, j]),
+            "q3": float(q[3, j]),
+            "maks": float(q[4, j]),
+        }
+        for j, nama in enumerate(KOLOM_NILAI)
+    ]
+
+
+def _sebaran_huruf(np, nilai):
+    skema = skema_aktif()
+    idx = np.searchsorted(np.asarray(skema.batas), nilai, side="right")
+    jumlah = np.bincount(idx, minlength=len(skema.huruf))
+    # urut dari huruf tertinggi seperti tabel di settings
+    return [
+        {"huruf": huruf, "jumlah": int(n)}
+        for huruf, n in reversed(list(zip(skema.huruf, jumlah.tolist())))
+    ]
+
+
+def _pearson(np, x, y):
+    if len(x) < 3 or x.std() == 0 or y.std() == 0:
+        return None
+    return round(float(np.corrcoef(x, y)[0, 1]), 3)
+
+
+def _icc_2_1(np, pasangan):
+    """ICC(2,1) Shrout & Fleiss untuk matriks n subjek x k penilai."""
+
+    n, k = pasangan.shape
+    if n < 3:
+        return None
+    grand = pasangan.mean()
+    ms_baris = k * ((pasangan.mean(axis=1) - grand) ** 2).sum() / (n - 1)
+    ms_kolom = n * ((pasangan.mean(axis=0) - grand) ** 2).sum() / (k - 1)
+    residu = pasangan - pasangan.mean(axis=1, keepdims=True) - pasangan.mean(axis=0) + grand
+    ms_error = (residu ** 2).sum() / ((n - 1) * (k - 1))
+    penyebut = ms_baris + (k - 1) * ms_error + k * (ms_kolom - ms_error) / n
+    if penyebut == 0:
+        return None
+    return round(float((ms_baris - ms_error) / penyebut), 3)
+
+
+def hitung_analitik(periode_id) -> dict:
+    np = _numpy()
+    baris = _ekstrak(periode_id)
+    if not baris:
+        return {"periode_id": periode_id, "jumlah_penilaian": 0}
+
+    seminar = np.array([b[0] for b in baris])
+    penilai = np.array([b[1] for b in baris])
+    nama = {b[1]: b[2] for b in baris}
+    peran = np.array([b[3] for b in baris])
+    nilai = np.array([b[4:] for b in baris], dtype=float)
+    akhir = nilai[:, -1]
+
+    # --- sebaran per peran ---
+    sebaran = {"SEMUA": _ringkas(np, nilai)}
+    for p in ("PENGUJI", "PEMBIMBING"):
+        sebaran[p] = _ringkas(np, nilai[peran == p])
+
+    # --- kalibrasi per penilai ---
+    mu = nilai.mean(axis=0)
+    sd = nilai.std(axis=0)
+    sd[sd == 0] = 1.0
+    z = (nilai - mu) / sd
+
+    # rata-rata nilai akhir penilai lain pada seminar yang sama:
+    # (jumlah per seminar - nilai sendiri) / (n per seminar - 1)
+    kode_seminar, inv = np.unique(seminar, return_inverse=True)
+    jumlah_seminar = np.bincount(inv, weights=akhir)
+    n_seminar = np.bincount(inv)
+    punya_rekan = n_seminar[inv] > 1
+    rata_rekan = np.divide(
+        jumlah_seminar[inv] - akhir,
+        n_seminar[inv] - 1,
+        out=np.zeros_like(akhir),
+        where=punya_rekan,
+    )
+
+    kode_penilai, inv_p = np.unique(penilai, return_inverse=True)
+    n_penilai = np.bincount(inv_p)
+    penilai_list = []
+    for i, dosen_id in enumerate(kode_penilai.tolist()):
+        mask = inv_p == i
+        rekan = mask & punya_rekan
+        z_rata = float(z[mask, -1].mean())
+        penilai_list.append(
+            {
+                "dosen_id": dosen_id,
+                "nama": nama[dosen_id],
+                "n": int(n_penilai[i]),
+                "peran": sorted(set(peran[mask].tolist())),
+                "rata": [round(float(v), 2) for v in nilai[mask].mean(axis=0)],
+                "z": [round(float(v), 2) for v in z[mask].mean(axis=0)],
+                "z_rata": round(z_rata, 2),
+                "selisih_rekan": (
+                    round(float((akhir[rekan] - rata_rekan[rekan]).mean()), 2) if rekan.any() else None
+                ),
+                "n_rekan": int(rekan.sum()),
+                "tanda": (
+                    "tinggi" if z_rata >= AMBANG_KALIBRASI
+                    else "rendah" if z_rata <= -AMBANG_KALIBRASI
+                    else ""
+                ),
+            }
+        )
+    penilai_list.sort(key=lambda r: r["z_rata"], reverse=True)
+
+    # --- kesepakatan penguji vs pembimbing ---
+    def rata_per_seminar(mask):
+        jumlah = np.zeros((len(kode_seminar), nilai.shape[1]))
+        np.add.at(jumlah, inv[mask], nilai[mask])
+        n = np.bincount(inv[mask], minlength=len(kode_seminar))
+        return jumlah, n
+
+    jml_uji, n_uji = rata_per_seminar(peran == "PENGUJI")
+    jml_bimb, n_bimb = rata_per_seminar(peran == "PEMBIMBING")
+    lengkap = (n_uji > 0) & (n_bimb > 0)
+    uji = jml_uji[lengkap] / n_uji[lengkap, None]
+    bimb = jml_bimb[lengkap] / n_bimb[lengkap, None]
+    kesepakatan = {"n_seminar": int(lengkap.sum())}
+    if lengkap.any():
+        selisih = bimb[:, -1] - uji[:, -1]
+        huruf_sama = np.array(
+            [konversi_huruf(round(a, 2)) == konversi_huruf(round(b, 2)) for a, b in zip(uji[:, -1], bimb[:, -1])]
+        )
+        kesepakatan.update(
+            {
+                "bias_pembimbing": round(float(selisih.mean()), 2),
+                "selisih_absolut": round(float(np.abs(selisih).mean()), 2),
+                "huruf_sama_persen": round(float(huruf_sama.mean() * 100), 1),
+                "icc": _icc_2_1(np, np.column_stack([uji[:, -1], bimb[:, -1]])),
+                "korelasi": [
+                    {"aspek": nama_kolom, "r": _pearson(np, uji[:, j], bimb[:, j])}
+                    for j, nama_kolom in enumerate(KOLOM_NILAI)
+                ],
+            }
+        )
+
+    return {
+        "periode_id": periode_id,
+        "jumlah_penilaian": len(baris),
+        "jumlah_seminar": int(len(kode_seminar)),
+        "aspek": list(KOLOM_NILAI),
+        "sebaran": sebaran,
+        "sebaran_huruf": _sebaran_huruf(np, akhir),
+        "penilai": penilai_list,
+        "kesepakatan": kesepakatan,
+    }
+
+
+def analitik_periode(periode_id) -> dict:
+    """``hitung_analitik`` yang di-cache sampai ada penilaian periode ini berubah."""
+
+    versi = get_version(namespace_penilaian(periode_id))
+    key = f"pkl_analitik_penilaian:{periode_id}:{versi}"
+    data = cache.get(key)
+    if data is None:
+        data = hitung_analitik(periode_id)
+        cache.set(key, data, settings.PKL_FRAGMENT_CACHE_TIMEOUT)
+    return data
@@ -8,3 +8,5 @@ class MasterdataConfig(AppConfig):
     def ready(self):
         # Import signal supaya terdaftar saat app ready
         from . import signals  # noqa: F401
+        # Hook connection_created untuk profil PRAGMA SQLite
+        from pkl_backend import db  # noqa: F401
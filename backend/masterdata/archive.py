@@ -0,0 +1,288 @@
+# backend/masterdata/archive.py
+"""
+Arsip periode PKL yang sudah ditutup.
+
+Baris logbook, bimbingan, pendaftaran, dan seminar (beserta panel dan
+penilaiannya) dari periode nonaktif dipindah dari tabel utama ke
+``ArsipBaris`` sehingga query periode berjalan tidak ikut memindai riwayat.
+Data disimpan dalam format serializer "python" Django, jadi bisa dibaca
+kembali sebagai instance model biasa (read-only) dan dipulihkan utuh
+dengan primary key aslinya.
+
+- ``arsipkan_periode`` / ``pulihkan_periode``: dipakai management command
+  dengan nama yang sama;
+- ``baca_periode``: view memakai queryset biasa; bila periode yang diminta
+  sudah diarsipkan, hasilnya diambil dari arsip dengan select_related dan
+  urutan yang sama.
+
+Berkas (surat penerimaan, laporan) tetap di ContentAddressedStorage dan
+tetap dianggap dirujuk oleh gc_uploads.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core import serializers
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
+
+from .models import ArsipBaris, PeriodePKL
+
+# urutan penting untuk pemulihan (pendaftaran/seminar merujuk mahasiswa yang tetap ada)
+ARSIP_MODELS = [
+    "masterdata.PendaftaranPKL",
+    "logbook.LogbookEntry",
+    "guidance.GuidanceSession",
+    "masterdata.SeminarHasilPKL",
+]
+# relasi anak seminar yang ikut diarsipkan di dalam data seminarnya
+ANAK_SEMINAR = ["panel_penguji", "assessments"]
+
+BATCH = 500
+
+_mengarsipkan: ContextVar[bool] = ContextVar("pkl_mengarsipkan", default=False)
+
+
+class ArsipError(Exception):
+    pass
+
+
+def sedang_mengarsipkan() -> bool:
+    """True selama baris dihapus oleh proses arsip (sinyal boleh melewatkan kerja ulang)."""
+    return _mengarsipkan.get()
+
+
+@contextmanager
+def _mode_arsip():
+    token = _mengarsipkan.set(True)
+    try:
+        yield
+    finally:
+        _mengarsipkan.reset(token)
+
+
+def periode_siap_arsip(today=None):
+    """Periode nonaktif yang selesai lebih lama dari PKL_ARSIP_RETENSI_HARI."""
+    today = today or timezone.localdate()
+    batas = today - timedelta(days=settings.PKL_ARSIP_RETENSI_HARI)
+    return PeriodePKL.objects.filter(
+        aktif=False, diarsipkan_pada__isnull=True, tanggal_selesai__lt=batas
+    ).order_by("tanggal_selesai")
+
+
+def _serialisasi(obj) -> dict:
+    return serializers.serialize("python", [obj])[0]
+
+
+def _objek(data):
+    return next(serializers.deserialize("python", [data])).object
+
+
+def arsipkan_periode(periode) -> dict:
+    """Pindahkan semua baris aktivitas ``periode`` ke arsip; kembalikan jumlah per model."""
+
+    if periode.aktif:
+        raise ArsipError(f"Periode {periode} masih aktif.")
+    if periode.diarsipkan_pada is not None:
+        raise ArsipError(f"Periode {periode} sudah diarsipkan.")
+
+    jumlah = {}
+    with transaction.atomic(), _mode_arsip():
+        for label in ARSIP_MODELS:
+            model = apps.get_model(label)
+            qs = model._base_manager.filter(periode=periode).order_by("pk")
+            if label == "masterdata.SeminarHasilPKL":
+                qs = qs.prefetch_related(*ANAK_SEMINAR)
+
+            baris = []
+            for obj in qs.iterator(chunk_size=BATCH):
+                data = _serialisasi(obj)
+                if label == "masterdata.SeminarHasilPKL":
+                    data["anak"] = {
+                        nama: serializers.serialize("python", getattr(obj, nama).all())
+                        for nama in ANAK_SEMINAR
+                    }
+                baris.append(
+                    ArsipBaris(
+                        periode=periode,
+                        model=label,
+                        object_id=obj.pk,
+                        mahasiswa_id=obj.mahasiswa_id,
+                        dosen_pembimbing_id=obj.dosen_pembimbing_id,
+                        data=data,
+                    )
+                )
+            ArsipBaris.objects.bulk_create(baris, batch_size=BATCH)
+            model._base_manager.filter(periode=periode).delete()
+            jumlah[label] = len(baris)
+
+        periode.diarsipkan_pada = timezone.now()
+        periode.save(update_fields=["diarsipkan_pada", "diupdate_pada"])
+    return jumlah
+
+
+def _bulk_create_utuh(model, objs) -> None:
+    """
+    bulk_create dengan pk asli. Kolom auto_now_add dikembalikan ke nilai
+    aslinya; kolom auto_now sengaja dibiarkan "sekarang" supaya change feed
+    melihat baris ini muncul kembali.
+    """
+
+    if not objs:
+        return
+    dibuat = [f for f in model._meta.concrete_fields if getattr(f, "auto_now_add", False)]
+    asli = [[getattr(o, f.attname) for f in dibuat] for o in objs]
+    model._base_manager.bulk_create(objs, batch_size=BATCH)
+    if dibuat:
+        for obj, nilai in zip(objs, asli):
+            for field, value in zip(dibuat, nilai):
+                setattr(obj, field.attname, value)
+        model._base_manager.bulk_update(objs, [f.name for f in dibuat], batch_size=BATCH)
+
+
+def pulihkan_periode(periode) -> dict:
+    """Kembalikan baris arsip ``periode`` ke tabel utama, lalu hapus arsipnya."""
+
+    if periode.diarsipkan_pada is None:
+        raise ArsipError(f"Periode {periode} tidak sedang diarsipkan.")
+
+    jumlah = {}
+    with transaction.atomic():
+        for label in ARSIP_MODELS:
+            objs = []
+            anak = defaultdict(list)
+            for data in (
+                ArsipBaris.objects.filter(periode=periode, model=label)
+                .order_by("object_id")
+                .values_list("data", flat=True)
+                .iterator(chunk_size=BATCH)
+            ):
+                objs.append(_objek(data))
+                for nama, rows in data.get("anak", {}).items():
+                    anak[nama].extend(_objek(row) for row in rows)
+
+            _bulk_create_utuh(apps.get_model(label), objs)
+            for rows in anak.values():
+                _bulk_create_utuh(type(rows[0]), rows)
+            jumlah[label] = len(objs)
+
+        ArsipBaris.objects.filter(periode=periode).delete()
+        periode.diarsipkan_pada = None
+        periode.save(update_fields=["diarsipkan_pada", "diupdate_pada"])
+    return jumlah
+
+
+# =========================
+# Baca arsip lewat view yang sama
+# =========================
+
+def _jalur_select_related(value, prefix=""):
+    if not isinstance(value, dict):
+        return []
+    jalur = []
+    for nama, anak in value.items():
+        jalur.append(prefix + nama)
+        jalur.extend(_jalur_select_related(anak, f"{prefix}{nama}__"))
+    return jalur
+
+
+def _nilai(obj, jalur):
+    for nama in jalur.split("__"):
+        if obj is None:
+            return None
+        obj = getattr(obj, nama)
+    return obj
+
+
+def _urutkan(objs, order_by) -> None:
+    # sort stabil dari kunci terakhir; NULL di depan saat naik, seperti SQLite
+    for field in reversed(order_by):
+        jalur = field.lstrip("-")
+        objs.sort(
+            key=lambda o: (_nilai(o, jalur) is not None, _nilai(o, jalur)),
+            reverse=field.startswith("-"),
+        )
+
+
+def _pasang_anak(seminar, data) -> dict:
+    """
+    Isi cache prefetch seminar dari data arsip supaya panel() dan
+    penilaian_*() tidak query; kembalikan objek anak per relasi.
+    """
+
+    cache = {}
+    anak = {}
+    for nama, rows in data.get("anak", {}).items():
+        objs = [_objek(row) for row in rows]
+        qs = getattr(seminar, nama).all()
+        qs._result_cache = objs
+        qs._prefetch_done = True
+        cache[nama] = qs
+        anak[nama] = objs
+    seminar._prefetched_objects_cache = cache
+    anak["panel_penguji"].sort(key=lambda slot: slot.urutan)
+    return anak
+
+
+def baca_arsip(model, periode, *, select_related=(), order_by=(), **filters) -> list:
+    """
+    Instance read-only (``diarsipkan = True``) dari arsip ``periode``.
+    Filter pada ``mahasiswa``/``dosen_pembimbing`` memakai kolom berindeks;
+    filter lain dicocokkan dengan isi data.
+    """
+
+    qs = ArsipBaris.objects.filter(periode=periode, model=model._meta.label)
+    for key, value in filters.items():
+        nama = key.removesuffix("_id")
+        value = getattr(value, "pk", value)
+        if nama in ("mahasiswa", "dosen_pembimbing"):
+            qs = qs.filter(**{f"{nama}_id": value})
+        else:
+            qs = qs.filter(**{f"data__fields__{key}": value})
+
+    objs = []
+    slot_panel, penilaian = [], []
+    for data in qs.order_by("object_id").values_list("data", flat=True):
+        obj = _objek(data)
+        obj.diarsipkan = True
+        if "anak" in data:
+            anak = _pasang_anak(obj, data)
+            slot_panel.extend(anak["panel_penguji"])
+            penilaian.extend(anak["assessments"])
+        objs.append(obj)
+
+    # dosen panel dan penilai dimuat sekali untuk semua seminar
+    prefetch_related_objects(slot_panel, "dosen")
+    prefetch_related_objects(penilaian, "penguji")
+
+    if select_related:
+        prefetch_related_objects(objs, *select_related)
+    if order_by:
+        _urutkan(objs, list(order_by))
+    return objs
+
+
+def baca_periode(queryset, periode, **filters):
+    """
+    ``queryset.filter(periode=periode, **filters)``, atau, bila ``periode``
+    sudah diarsipkan, list objek arsip dengan select_related dan order_by
+    yang diambil dari ``queryset``.
+    """
+
+    if periode is None:
+        return queryset.filter(**filters)
+    if periode.diarsipkan_pada is None:
+        return queryset.filter(periode=periode, **filters)
+    query = queryset.query
+    return baca_arsip(
+        queryset.model,
+        periode,
+        select_related=_jalur_select_related(query.select_related),
+        order_by=query.order_by,
+        **filters,
+    )
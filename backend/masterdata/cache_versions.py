@@ -0,0 +1,48 @@
+# backend/masterdata/cache_versions.py
+"""
+Versi cache per namespace (mis. "pengumuman", "faq", "peran").
+
+Kunci cache fragmen/data menyertakan nomor versi namespace-nya; cukup
+``bump_version`` saat data sumber berubah maka semua entri lama otomatis
+tidak terpakai lagi (tanpa perlu menghapus kunci satu per satu).
+"""
+
+import time
+
+from django.core.cache import cache
+
+
+def version_cache_key(namespace: str) -> str:
+    return f"pkl_ver:{namespace}"
+
+
+def _initial_version() -> int:
+    # Berbasis waktu, bukan 1: jika kunci versi ter-evict, nilai baru tidak
+    # akan bertabrakan dengan fragmen lama yang mungkin masih tersimpan.
+    return time.time_ns() // 1000
+
+
+def get_versions(*namespaces) -> dict:
+    """Versi beberapa namespace sekaligus (satu round-trip ke cache)."""
+
+    keys = {version_cache_key(ns): ns for ns in namespaces}
+    found = cache.get_many(list(keys))
+    missing = {key: _initial_version() for key in keys if key not in found}
+    if missing:
+        for key, value in missing.items():
+            cache.add(key, value, None)
+        found.update(cache.get_many(list(missing)))
+    return {ns: found.get(key, missing.get(key)) for key, ns in keys.items()}
+
+
+def get_version(namespace: str) -> int:
+    return get_versions(namespace)[namespace]
+
+
+def bump_version(*namespaces) -> None:
+    for namespace in namespaces:
+        key = version_cache_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _initial_version(), None)
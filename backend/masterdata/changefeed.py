@@ -0,0 +1,156 @@
+# backend/masterdata/changefeed.py
+"""
+Change feed inkremental untuk entitas PKL.
+
+Setiap entitas dibaca berurutan berdasarkan (timestamp update, id) sehingga
+klien (mis. data warehouse) cukup menyimpan kursor terakhir lalu meminta
+perubahan sesudahnya. Penghapusan dicatat sebagai ``ChangeTombstone`` oleh
+sinyal post_delete dan dibaca lewat entitas khusus ``"tombstone"``.
+
+Semua kolom timestamp yang dipakai sudah diberi index (timestamp, id) agar
+biaya satu kali sinkronisasi sebanding dengan jumlah perubahan saja.
+"""
+
+from datetime import datetime
+
+from django.apps import apps
+from django.db.models import Q
+
+
+# nama entitas -> (label model, field timestamp update, field timestamp dibuat)
+FEED_SOURCES = {
+    "dosen": ("masterdata.Dosen", "diupdate_pada", None),
+    "mitra": ("masterdata.Mitra", "diupdate_pada", None),
+    "periode": ("masterdata.PeriodePKL", "diupdate_pada", None),
+    "mahasiswa": ("masterdata.Mahasiswa", "diupdate_pada", None),
+    "pendaftaran": ("masterdata.PendaftaranPKL", "tanggal_update", "tanggal_pengajuan"),
+    "seminar": ("masterdata.SeminarHasilPKL", "updated_at", "created_at"),
+    "penilaian": ("masterdata.SeminarAssessment", "updated_at", "created_at"),
+    # slot panel tidak pernah diubah di tempat: diganti = tombstone + baris baru
+    "panel_penguji": ("masterdata.SeminarPenguji", "created_at", "created_at"),
+    "logbook": ("logbook.LogbookEntry", "diupdate_pada", "dibuat_pada"),
+    "bimbingan": ("guidance.GuidanceSession", "diupdate_pada", "dibuat_pada"),
+}
+
+TOMBSTONE_ENTITY = "tombstone"
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 5000
+
+
+def feed_entities() -> list[str]:
+    return [*FEED_SOURCES, TOMBSTONE_ENTITY]
+
+
+def entity_for_model(model) -> str | None:
+    """Nama entitas feed untuk sebuah kelas model (None jika tidak dilacak)."""
+
+    label = model._meta.label
+    for entity, (model_label, _, _) in FEED_SOURCES.items():
+        if model_label == label:
+            return entity
+    return None
+
+
+def _cursor_filter(ts_field: str, since: datetime | None, after_id: int) -> Q:
+    if since is None:
+        return Q(pk__gt=after_id) if after_id else Q()
+    return Q(**{f"{ts_field}__gt": since}) | Q(**{ts_field: since, "pk__gt": after_id})
+
+
+def read_changes(entity: str, since: datetime | None = None, after_id: int = 0,
+                 limit: int = DEFAULT_LIMIT) -> dict:
+    """
+    Ambil maksimal ``limit`` perubahan sesudah kursor (since, after_id).
+
+    Hasil berisi daftar ``changes`` dan kursor ``next`` yang bisa dikirim
+    kembali apa adanya untuk halaman berikutnya. ``has_more`` False berarti
+    klien sudah mengejar kondisi terkini.
+    """
+
+    limit = max(1, min(int(limit), MAX_LIMIT))
+
+    if entity == TOMBSTONE_ENTITY:
+        from .models import ChangeTombstone
+
+        rows = list(
+            ChangeTombstone.objects.filter(_cursor_filter("dihapus_pada", since, after_id))
+            .order_by("dihapus_pada", "id")
+            .values("id", "entity", "object_id", "dihapus_pada")[: limit + 1]
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        changes = [
+            {
+                "entity": row["entity"],
+                "op": "delete",
+                "id": row["object_id"],
+                "timestamp": row["dihapus_pada"],
+            }
+            for row in rows
+        ]
+        last = rows[-1] if rows else None
+        next_cursor = (
+            {"since": last["dihapus_pada"], "after_id": last["id"]}
+            if last
+            else {"since": since, "after_id": after_id}
+        )
+        return {"entity": entity, "changes": changes, "next": next_cursor, "has_more": has_more}
+
+    if entity not in FEED_SOURCES:
+        raise ValueError(f"Entitas change feed tidak dikenal: {entity}")
+
+    model_label, ts_field, created_field = FEED_SOURCES[entity]
+    model = apps.get_model(model_label)
+
+    rows = list(
+        model.objects.filter(_cursor_filter(ts_field, since, after_id))
+        .order_by(ts_field, "pk")
+        .values()[: limit + 1]
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    changes = []
+    for row in rows:
+        if created_field is None:
+            op = "upsert"
+        elif since is None or row[created_field] > since:
+            op = "insert"
+        else:
+            op = "update"
+        changes.append(
+            {"entity": entity, "op": op, "id": row["id"], "timestamp": row[ts_field], "data": row}
+        )
+
+    last = rows[-1] if rows else None
+    next_cursor = (
+        {"since": last[ts_field], "after_id": last["id"]}
+        if last
+        else {"since": since, "after_id": after_id}
+    )
+    return {"entity": entity, "changes": changes, "next": next_cursor, "has_more": has_more}
+
+
+def cursor_as_json(cursor: dict) -> dict:
+    """
+    Kursor dalam bentuk siap-JSON dengan presisi mikrodetik.
+
+    DjangoJSONEncoder memotong datetime ke milidetik, sehingga kursor yang
+    diserialisasi begitu saja akan mengulang baris yang sama di halaman berikutnya.
+    """
+
+    since = cursor["since"]
+    return {"since": since.isoformat() if since else None, "after_id": cursor["after_id"]}
+
+
+def iter_pages(entity: str, since: datetime | None = None, after_id: int = 0,
+               page_size: int = DEFAULT_LIMIT):
+    """Generator halaman demi halaman sampai feed habis."""
+
+    while True:
+        page = read_changes(entity, since=since, after_id=after_id, limit=page_size)
+        yield page
+        since, after_id = page["next"]["since"], page["next"]["after_id"]
+        if not page["has_more"]:
+            return
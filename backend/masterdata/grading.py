@@ -0,0 +1,235 @@
+# backend/masterdata/grading.py
+"""
+Mesin penilaian seminar PKL.
+
+Tabel batas huruf (``settings.PKL_GRADE_BANDS``) dan bobot aspek
+(``settings.PKL_ASPEK_BOBOT``) bisa dikonfigurasi. Nilai satu baris
+(``SeminarAssessment.save``) dan re-grading massal (``manage.py
+regrade_penilaian``) memakai fungsi yang sama, ``hitung_massal``, sehingga
+hasilnya identik:
+
+- rata-rata berbobot dihitung per baris atas aspek yang terisi (bobot
+  dinormalisasi ulang bila ada aspek kosong), dibulatkan 2 desimal;
+- huruf dicari dengan ``searchsorted``/``bisect`` pada batas bawah tiap huruf.
+
+NumPy dipakai jika terpasang (vektorisasi untuk ribuan baris); tanpa NumPy
+perhitungan jatuh ke loop Python biasa dengan ``bisect``.
+
+Nilai akhir seminar (``SeminarHasilPKL.nilai_akhir``) disimpan, bukan dihitung
+per view: rata-rata nilai per peran (penguji, pembimbing) digabung dengan
+bobot ``settings.PKL_NILAI_AKHIR_BOBOT``; peran yang belum menilai tidak ikut
+dan bobot sisanya dinormalisasi ulang. ``perbarui_nilai_akhir`` dipanggil
+sinyal SeminarAssessment di dalam transaksi yang sama dengan penyimpanannya.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models import Avg
+from django.dispatch import receiver
+from django.utils import timezone
+
+try:  # dependensi opsional
+    import numpy as _np
+except ModuleNotFoundError:  # pragma: no cover - tergantung lingkungan
+    _np = None
+
+
+ASPEK_FIELDS = (
+    "pemahaman_materi",
+    "kualitas_laporan",
+    "presentasi",
+    "penguasaan_lapangan",
+    "sikap_profesional",
+)
+
+# (batas bawah, huruf), urut dari nilai tertinggi
+DEFAULT_GRADE_BANDS = (
+    (81, "A"),
+    (76, "A-"),
+    (72, "B+"),
+    (68, "B"),
+    (64, "B-"),
+    (58, "C+"),
+    (54, "C"),
+    (50, "C-"),
+    (46, "D+"),
+    (42, "D"),
+    (0, "E"),
+)
+
+DEFAULT_BOBOT_PERAN = {"PENGUJI": 0.5, "PEMBIMBING": 0.5}
+
+
+@dataclass(frozen=True)
+class SkemaNilai:
+    batas: tuple[float, ...]  # batas bawah naik, tanpa huruf terendah
+    huruf: tuple[str, ...]  # len(batas) + 1, dari huruf terendah
+    bobot: tuple[float, ...]  # sejajar ASPEK_FIELDS
+
+    def huruf_untuk(self, nilai: float) -> str:
+        return self.huruf[bisect_right(self.batas, nilai)]
+
+
+@lru_cache(maxsize=1)
+def skema_aktif() -> SkemaNilai:
+    bands = sorted(getattr(settings, "PKL_GRADE_BANDS", DEFAULT_GRADE_BANDS), reverse=True)
+    if not bands:
+        raise ImproperlyConfigured("PKL_GRADE_BANDS tidak boleh kosong.")
+    batas = [float(b) for b, _ in bands]
+    if len(set(batas)) != len(batas):
+        raise ImproperlyConfigured("PKL_GRADE_BANDS: batas bawah tidak boleh ganda.")
+
+    bobot_cfg = getattr(settings, "PKL_ASPEK_BOBOT", {}) or {}
+    tidak_dikenal = set(bobot_cfg) - set(ASPEK_FIELDS)
+    if tidak_dikenal:
+        raise ImproperlyConfigured(f"PKL_ASPEK_BOBOT: aspek tidak dikenal {sorted(tidak_dikenal)}.")
+    bobot = tuple(float(bobot_cfg.get(f, 1.0)) for f in ASPEK_FIELDS)
+    if any(b < 0 for b in bobot) or not any(bobot):
+        raise ImproperlyConfigured("PKL_ASPEK_BOBOT: bobot harus >= 0 dan tidak semuanya 0.")
+
+    # huruf terendah berlaku untuk semua nilai di bawah batas kedua terendah
+    naik = list(reversed(bands))
+    return SkemaNilai(
+        batas=tuple(float(b) for b, _ in naik[1:]),
+        huruf=tuple(h for _, h in naik),
+        bobot=bobot,
+    )
+
+
+def konversi_huruf(nilai: float) -> str:
+    return skema_aktif().huruf_untuk(nilai)
+
+
+def _hitung_numpy(baris, skema):
+    m = _np.array(
+        [[_np.nan if v is None else v for v in row] for row in baris], dtype=float
+    ).reshape(-1, len(skema.bobot))
+    terisi = ~_np.isnan(m)
+    w = terisi * _np.asarray(skema.bobot)
+    total_bobot = w.sum(axis=1)
+    with _np.errstate(invalid="ignore", divide="ignore"):
+        rata = (_np.where(terisi, m, 0.0) * w).sum(axis=1) / total_bobot
+    rata = _np.round(rata, 2)
+    idx = _np.searchsorted(_np.asarray(skema.batas), rata, side="right")
+    huruf = _np.asarray(skema.huruf, dtype=object)[idx]
+    kosong = total_bobot == 0
+    return [
+        (None, None) if k else (float(a), h) for a, h, k in zip(rata.tolist(), huruf.tolist(), kosong)
+    ]
+
+
+def _hitung_python(baris, skema):
+    hasil = []
+    for row in baris:
+        pasangan = [(v, b) for v, b in zip(row, skema.bobot) if v is not None]
+        total_bobot = sum(b for _, b in pasangan)
+        if not total_bobot:
+            hasil.append((None, None))
+            continue
+        rata = round(sum(v * b for v, b in pasangan) / total_bobot, 2)
+        hasil.append((rata, skema.huruf_untuk(rata)))
+    return hasil
+
+
+def hitung_massal(baris) -> list[tuple[float | None, str | None]]:
+    """
+    ``baris``: iterable berisi nilai 5 aspek (urut ASPEK_FIELDS, None = kosong).
+    Menghasilkan ``(nilai_angka, nilai_huruf)`` per baris.
+    """
+
+    baris = list(baris)
+    if not baris:
+        return []
+    skema = skema_aktif()
+    if _np is not None:
+        return _hitung_numpy(baris, skema)
+    return _hitung_python(baris, skema)
+
+
+def nilai_penilaian(obj) -> tuple[float | None, str | None]:
+    """Nilai satu objek yang punya atribut ASPEK_FIELDS (mis. SeminarAssessment)."""
+
+    return hitung_massal([[getattr(obj, f, None) for f in ASPEK_FIELDS]])[0]
+
+
+@lru_cache(maxsize=1)
+def bobot_peran() -> dict[str, float]:
+    bobot = dict(getattr(settings, "PKL_NILAI_AKHIR_BOBOT", DEFAULT_BOBOT_PERAN))
+    if any(b < 0 for b in bobot.values()) or not any(bobot.values()):
+        raise ImproperlyConfigured("PKL_NILAI_AKHIR_BOBOT: bobot harus >= 0 dan tidak semuanya 0.")
+    return bobot
+
+
+@receiver(setting_changed)
+def _reset_skema(setting, **kwargs):
+    if setting in {"PKL_GRADE_BANDS", "PKL_ASPEK_BOBOT"}:
+        skema_aktif.cache_clear()
+    elif setting == "PKL_NILAI_AKHIR_BOBOT":
+        bobot_peran.cache_clear()
+
+
+def nilai_akhir(rata_per_peran: dict[str, float]) -> tuple[float | None, str | None]:
+    """Gabungkan rata-rata nilai per peran menjadi (nilai akhir, huruf)."""
+
+    bobot = bobot_peran()
+    pasangan = [(v, bobot.get(peran, 0.0)) for peran, v in rata_per_peran.items() if v is not None]
+    total_bobot = sum(b for _, b in pasangan)
+    if not total_bobot:
+        return None, None
+    angka = round(sum(v * b for v, b in pasangan) / total_bobot, 2)
+    return angka, konversi_huruf(angka)
+
+
+def perbarui_nilai_akhir(seminar_ids) -> int:
+    """
+    Hitung ulang ``nilai_akhir``/``nilai_huruf_akhir`` seminar yang diberikan
+    dengan satu query agregat; hanya baris yang berubah yang ditulis.
+    """
+
+    from .models import SeminarAssessment, SeminarHasilPKL
+
+    ids = sorted(set(seminar_ids))
+    if not ids:
+        return 0
+
+    with transaction.atomic():
+        # kunci baris seminar: dua penilai yang menyimpan bersamaan tidak saling menimpa
+        sekarang = {
+            pk: (angka, huruf)
+            for pk, angka, huruf in SeminarHasilPKL.objects.select_for_update()
+            .filter(pk__in=ids)
+            .values_list("pk", "nilai_akhir", "nilai_huruf_akhir")
+        }
+        rata = defaultdict(dict)
+        for seminar_id, peran, avg in (
+            SeminarAssessment.objects.filter(seminar_id__in=sekarang)
+            .values("seminar_id", "role")
+            .annotate(avg=Avg("nilai_angka"))
+            .values_list("seminar_id", "role", "avg")
+            .order_by()
+        ):
+            rata[seminar_id][peran] = None if avg is None else float(avg)
+
+        now = timezone.now()
+        objs = []
+        for pk, lama in sekarang.items():
+            angka, huruf = nilai_akhir(rata.get(pk, {}))
+            baru = (None if angka is None else Decimal(f"{angka:.2f}"), huruf or "")
+            if baru != lama:
+                # bulk_update melewati auto_now: updated_at diisi manual (change feed)
+                objs.append(
+                    SeminarHasilPKL(pk=pk, nilai_akhir=baru[0], nilai_huruf_akhir=baru[1], updated_at=now)
+                )
+        if objs:
+            SeminarHasilPKL.objects.bulk_update(
+                objs, ["nilai_akhir", "nilai_huruf_akhir", "updated_at"], batch_size=500
+            )
+    return len(objs)
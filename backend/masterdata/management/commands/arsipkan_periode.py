@@ -0,0 +1,43 @@
+# backend/masterdata/management/commands/arsipkan_periode.py
+from django.core.management.base import BaseCommand, CommandError
+
+from masterdata.archive import ArsipError, arsipkan_periode, periode_siap_arsip
+from masterdata.models import PeriodePKL
+
+
+class Command(BaseCommand):
+    help = (
+        "Pindahkan logbook, bimbingan, pendaftaran, dan seminar periode PKL nonaktif "
+        "yang melewati PKL_ARSIP_RETENSI_HARI ke tabel arsip. Pulihkan dengan "
+        "pulihkan_periode."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--periode", type=int, action="append",
+            help="Arsipkan periode (id) ini saja, tanpa memeriksa masa retensi. Boleh diulang.",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Tampilkan periode yang akan diarsipkan.")
+
+    def handle(self, *args, **options):
+        if options["periode"]:
+            daftar = list(PeriodePKL.objects.filter(pk__in=options["periode"]).order_by("tanggal_selesai"))
+            if len(daftar) != len(set(options["periode"])):
+                raise CommandError("Ada id periode yang tidak ditemukan.")
+        else:
+            daftar = list(periode_siap_arsip())
+
+        if not daftar:
+            self.stdout.write("Tidak ada periode yang perlu diarsipkan.")
+            return
+
+        for periode in daftar:
+            if options["dry_run"]:
+                self.stdout.write(f"[dry-run] {periode}")
+                continue
+            try:
+                jumlah = arsipkan_periode(periode)
+            except ArsipError as exc:
+                raise CommandError(str(exc)) from exc
+            rincian = ", ".join(f"{label.split('.')[-1]}: {n}" for label, n in jumlah.items())
+            self.stdout.write(self.style.SUCCESS(f"{periode} diarsipkan ({rincian})."))
@@ -0,0 +1,74 @@
+# backend/masterdata/management/commands/bench_db_connections.py
+import copy
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.utils import load_backend
+
+
+class Command(BaseCommand):
+    help = (
+        "Micro-benchmark overhead koneksi per request: membandingkan koneksi baru "
+        "per request (CONN_MAX_AGE=0, tanpa pool) dengan konfigurasi aktif "
+        "(CONN_MAX_AGE/CONN_HEALTH_CHECKS/pool dari settings)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=300)
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        base = copy.deepcopy(connections.settings[options["database"]])
+
+        sebelum = copy.deepcopy(base)
+        sebelum["CONN_MAX_AGE"] = 0
+        sebelum["CONN_HEALTH_CHECKS"] = False
+        sebelum["OPTIONS"].pop("pool", None)
+
+        sesudah = copy.deepcopy(base)
+        if not sesudah["CONN_MAX_AGE"] and not sesudah["OPTIONS"].get("pool"):
+            # konfigurasi aktif tidak persisten (mis. development): ukur nilai production
+            sesudah["CONN_MAX_AGE"] = 60
+            sesudah["CONN_HEALTH_CHECKS"] = True
+
+        self.stdout.write(f"Engine: {base['ENGINE']}, {options['requests']} request/skenario")
+        self.stdout.write(f"{'skenario':<32} {'p50 (ms)':>10} {'p95 (ms)':>10} {'total (s)':>10}")
+        for name, settings_dict in (
+            ("koneksi baru per request", sebelum),
+            (self._label(sesudah), sesudah),
+        ):
+            durations = self._run(settings_dict, options)
+            durations.sort()
+            p95 = durations[int(len(durations) * 0.95) - 1]
+            self.stdout.write(
+                f"{name:<32} {statistics.median(durations) * 1000:>10.3f} "
+                f"{p95 * 1000:>10.3f} {sum(durations):>10.3f}"
+            )
+
+    def _label(self, settings_dict):
+        if settings_dict["OPTIONS"].get("pool"):
+            return "connection pool"
+        return f"CONN_MAX_AGE={settings_dict['CONN_MAX_AGE']}"
+
+    def _run(self, settings_dict, options):
+        backend = load_backend(settings_dict["ENGINE"])
+        wrapper = backend.DatabaseWrapper(settings_dict, options["database"])
+        durations = []
+        try:
+            for _ in range(options["requests"]):
+                started = time.perf_counter()
+                # siklus yang sama dengan request_started/request_finished
+                # (django.db.close_old_connections)
+                wrapper.close_if_unusable_or_obsolete()
+                with wrapper.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+                wrapper.close_if_unusable_or_obsolete()
+                durations.append(time.perf_counter() - started)
+        finally:
+            wrapper.close()
+            if hasattr(wrapper, "close_pool"):
+                wrapper.close_pool()
+        return durations
@@ -0,0 +1,88 @@
+# backend/masterdata/management/commands/bench_sqlite_writes.py
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from pkl_backend.db import apply_sqlite_pragmas
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark penulisan paralel ke SQLite: membandingkan konfigurasi bawaan "
+        "(journal DELETE + BEGIN DEFERRED) dengan profil PRAGMA + BEGIN IMMEDIATE. "
+        "Pola transaksi meniru pengiriman logbook: baca dulu, lalu tulis."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--writes", type=int, default=200, help="Jumlah transaksi per thread.")
+
+    def handle(self, *args, **options):
+        scenarios = [
+            ("bawaan", {}, "DEFERRED"),
+            ("profil", settings.SQLITE_PRAGMAS, "IMMEDIATE"),
+        ]
+        self.stdout.write(
+            f"{'skenario':<10} {'sukses':>8} {'gagal':>8} {'detik':>8} {'tx/detik':>10}"
+        )
+        for name, pragmas, begin in scenarios:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                result = self._run(Path(tmpdir) / "bench.sqlite3", pragmas, begin, options)
+            self.stdout.write(
+                f"{name:<10} {result['ok']:>8} {result['failed']:>8} "
+                f"{result['seconds']:>8.2f} {result['ok'] / result['seconds']:>10.1f}"
+            )
+
+    def _connect(self, path, pragmas):
+        timeout = settings.SQLITE_BUSY_TIMEOUT_MS / 1000
+        conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        apply_sqlite_pragmas(conn.cursor(), pragmas)
+        return conn
+
+    def _run(self, path, pragmas, begin, options):
+        setup = self._connect(path, pragmas)
+        setup.execute(
+            "CREATE TABLE logbook (id INTEGER PRIMARY KEY, mahasiswa INTEGER, urutan INTEGER, aktivitas TEXT)"
+        )
+        setup.close()
+
+        counters = {"ok": 0, "failed": 0}
+        lock = threading.Lock()
+
+        def worker(mahasiswa_id):
+            conn = self._connect(path, pragmas)
+            ok = failed = 0
+            for _ in range(options["writes"]):
+                try:
+                    conn.execute(f"BEGIN {begin}")
+                    (urutan,) = conn.execute(
+                        "SELECT COUNT(*) FROM logbook WHERE mahasiswa = ?", (mahasiswa_id,)
+                    ).fetchone()
+                    conn.execute(
+                        "INSERT INTO logbook (mahasiswa, urutan, aktivitas) VALUES (?, ?, ?)",
+                        (mahasiswa_id, urutan + 1, "x" * 200),
+                    )
+                    conn.execute("COMMIT")
+                    ok += 1
+                except sqlite3.OperationalError:
+                    failed += 1
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+            conn.close()
+            with lock:
+                counters["ok"] += ok
+                counters["failed"] += failed
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(options["threads"])]
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        counters["seconds"] = time.perf_counter() - started
+        return counters
@@ -0,0 +1,72 @@
+# backend/masterdata/management/commands/export_changes.py
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from masterdata.changefeed import DEFAULT_LIMIT, cursor_as_json, feed_entities, iter_pages
+
+
+class Command(BaseCommand):
+    help = (
+        "Ekspor perubahan (insert/update/delete) entitas PKL sejak kursor terakhir "
+        "dalam format JSON Lines. Dengan --state, kursor disimpan sehingga "
+        "eksekusi berikutnya hanya mengirim delta."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--entity",
+            action="append",
+            choices=feed_entities(),
+            help="Entitas yang diekspor (boleh diulang). Default: semua entitas.",
+        )
+        parser.add_argument("--since", help="Timestamp ISO-8601 awal (diabaikan jika --state berisi kursor).")
+        parser.add_argument("--state", help="Berkas JSON untuk membaca/menyimpan kursor per entitas.")
+        parser.add_argument("--output", help="Berkas keluaran JSON Lines. Default: stdout.")
+        parser.add_argument("--page-size", type=int, default=DEFAULT_LIMIT)
+
+    def handle(self, *args, **options):
+        entities = options["entity"] or feed_entities()
+
+        since = None
+        if options["since"]:
+            since = parse_datetime(options["since"])
+            if since is None:
+                raise CommandError("Format --since harus ISO-8601.")
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+
+        state_path = Path(options["state"]) if options["state"] else None
+        state = {}
+        if state_path and state_path.exists():
+            state = json.loads(state_path.read_text())
+
+        out = open(options["output"], "a", encoding="utf-8") if options["output"] else self.stdout
+
+        total = 0
+        try:
+            for entity in entities:
+                cursor = state.get(entity)
+                entity_since = parse_datetime(cursor["since"]) if cursor and cursor["since"] else since
+                after_id = cursor["after_id"] if cursor else 0
+
+                for page in iter_pages(
+                    entity, since=entity_since, after_id=after_id, page_size=options["page_size"]
+                ):
+                    for change in page["changes"]:
+                        out.write(json.dumps(change, cls=DjangoJSONEncoder) + "\n")
+                    total += len(page["changes"])
+                    state[entity] = cursor_as_json(page["next"])
+
+                    # simpan kursor per halaman supaya ekspor yang terputus bisa dilanjutkan
+                    if state_path:
+                        state_path.write_text(json.dumps(state, indent=2))
+        finally:
+            if options["output"]:
+                out.close()
+
+        self.stderr.write(f"{total} perubahan diekspor dari {len(entities)} entitas.")
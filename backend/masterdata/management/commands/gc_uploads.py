@@ -0,0 +1,104 @@
+# backend/masterdata/management/commands/gc_uploads.py
+import os
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from masterdata.models import ArsipBaris
+from masterdata.storage import CAS_FIELDS, TEMP_DIRNAME, content_storage
+
+
+class Command(BaseCommand):
+    help = (
+        "Hapus berkas unggahan yatim (tidak dirujuk baris mana pun) di folder "
+        "ContentAddressedStorage, beserta file sementara unggahan yang gagal "
+        "dan sesi unggahan bertahap yang kedaluwarsa."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age", type=int, default=3600,
+            help="Hanya hapus file yang lebih tua dari N detik (hindari unggahan yang sedang berjalan).",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def _referenced(self, folders):
+        referenced = set()
+        for model_label, field_name in CAS_FIELDS:
+            model = apps.get_model(model_label)
+            folders.add(model._meta.get_field(field_name).upload_to.strip("/"))
+            names = (
+                model._base_manager.exclude(**{field_name: ""})
+                .values_list(field_name, flat=True)
+                .iterator(chunk_size=2000)
+            )
+            referenced.update(names)
+            # berkas milik baris periode yang diarsipkan tetap dirujuk
+            referenced.update(
+                name
+                for name in ArsipBaris.objects.filter(model=model._meta.label)
+                .values_list(f"data__fields__{field_name}", flat=True)
+                .iterator(chunk_size=2000)
+                if name
+            )
+        return referenced
+
+    def _unggahan_aktif(self, dry_run):
+        """Batalkan sesi unggahan bertahap yang kedaluwarsa; sisanya tetap dilindungi."""
+        UnggahanLaporan = apps.get_model("masterdata", "UnggahanLaporan")
+        batas = timezone.now() - timedelta(hours=settings.PKL_UPLOAD_EXPIRY_HOURS)
+        aktif = UnggahanLaporan.objects.filter(status="AKTIF")
+        if not dry_run:
+            kedaluwarsa = aktif.filter(diupdate_pada__lt=batas).update(
+                status="DIBATALKAN", diupdate_pada=timezone.now()
+            )
+            if kedaluwarsa:
+                self.stdout.write(f"{kedaluwarsa} sesi unggahan kedaluwarsa dibatalkan.")
+        else:
+            aktif = aktif.filter(diupdate_pada__gte=batas)
+        return {upload.temp_name for upload in aktif.only("id")}
+
+    def handle(self, *args, **options):
+        root = content_storage.location
+        cutoff = time.time() - options["min_age"]
+        folders = set()
+        referenced = self._referenced(folders)
+        # file .part sesi yang masih bisa dilanjutkan tidak boleh ikut terhapus
+        protected = referenced | self._unggahan_aktif(options["dry_run"])
+
+        candidates = []
+        for folder in sorted(folders | {TEMP_DIRNAME}):
+            base = os.path.join(root, folder)
+            for dirpath, _, filenames in os.walk(base):
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    name = os.path.relpath(path, root).replace(os.sep, "/")
+                    if name in protected:
+                        continue
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    if stat.st_mtime < cutoff:
+                        candidates.append((name, path, stat.st_size))
+
+        freed = 0
+        for name, path, size in candidates:
+            if options["dry_run"]:
+                self.stdout.write(f"[dry-run] {name}")
+            else:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+            freed += size
+
+        verb = "akan dihapus" if options["dry_run"] else "dihapus"
+        self.stdout.write(
+            f"{len(candidates)} file yatim {verb} ({freed / 1024 / 1024:.1f} MB), "
+            f"{len(referenced)} file masih dirujuk."
+        )
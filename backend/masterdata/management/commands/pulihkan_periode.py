@@ -0,0 +1,23 @@
+# backend/masterdata/management/commands/pulihkan_periode.py
+from django.core.management.base import BaseCommand, CommandError
+
+from masterdata.archive import ArsipError, pulihkan_periode
+from masterdata.models import PeriodePKL
+
+
+class Command(BaseCommand):
+    help = "Kembalikan data periode PKL yang diarsipkan (arsipkan_periode) ke tabel utama."
+
+    def add_arguments(self, parser):
+        parser.add_argument("periode", type=int, help="Id periode PKL.")
+
+    def handle(self, *args, **options):
+        periode = PeriodePKL.objects.filter(pk=options["periode"]).first()
+        if periode is None:
+            raise CommandError("Periode tidak ditemukan.")
+        try:
+            jumlah = pulihkan_periode(periode)
+        except ArsipError as exc:
+            raise CommandError(str(exc)) from exc
+        rincian = ", ".join(f"{label.split('.')[-1]}: {n}" for label, n in jumlah.items())
+        self.stdout.write(self.style.SUCCESS(f"{periode} dipulihkan ({rincian})."))
@@ -0,0 +1,85 @@
+# backend/masterdata/management/commands/regrade_penilaian.py
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from masterdata import grading
+from masterdata.analytics import namespace_penilaian
+from masterdata.cache_versions import bump_version
+from masterdata.models import SeminarAssessment, SeminarHasilPKL
+
+
+class Command(BaseCommand):
+    help = (
+        "Hitung ulang nilai_angka & nilai_huruf semua penilaian seminar dengan "
+        "PKL_GRADE_BANDS / PKL_ASPEK_BOBOT saat ini (dihitung per chunk sebagai "
+        "array, disimpan dengan bulk_update), lalu nilai akhir seminarnya."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument("--periode", type=int, help="Hanya penilaian seminar pada periode (id) ini.")
+        parser.add_argument("--dry-run", action="store_true", help="Hitung saja, jangan simpan.")
+
+    def _chunks(self, qs, size):
+        # keyset pagination: tidak ada OFFSET yang makin lambat di tabel besar
+        last_pk = 0
+        fields = ("pk", *grading.ASPEK_FIELDS, "nilai_angka", "nilai_huruf")
+        while True:
+            rows = list(qs.filter(pk__gt=last_pk).order_by("pk").values_list(*fields)[:size])
+            if not rows:
+                return
+            yield rows
+            last_pk = rows[-1][0]
+
+    def handle(self, *args, **options):
+        qs = SeminarAssessment.objects.all()
+        if options["periode"]:
+            qs = qs.filter(seminar__periode_id=options["periode"])
+
+        n_aspek = len(grading.ASPEK_FIELDS)
+        total = berubah = 0
+        for rows in self._chunks(qs, max(1, options["chunk_size"])):
+            hasil = grading.hitung_massal(row[1:1 + n_aspek] for row in rows)
+            now = timezone.now()
+            objs = []
+            for row, (angka, huruf) in zip(rows, hasil):
+                angka = None if angka is None else Decimal(f"{angka:.2f}")
+                if (angka, huruf) != (row[-2], row[-1]):
+                    # bulk_update melewati auto_now: updated_at diisi manual
+                    # agar change feed ikut mengirim baris yang berubah
+                    objs.append(
+                        SeminarAssessment(pk=row[0], nilai_angka=angka, nilai_huruf=huruf, updated_at=now)
+                    )
+            total += len(rows)
+            berubah += len(objs)
+            if objs and not options["dry_run"]:
+                with transaction.atomic():
+                    SeminarAssessment.objects.bulk_update(
+                        objs, ["nilai_angka", "nilai_huruf", "updated_at"], batch_size=500
+                    )
+
+        verb = "akan berubah" if options["dry_run"] else "diperbarui"
+        self.stdout.write(f"{total} penilaian diperiksa, {berubah} {verb}.")
+        if options["dry_run"]:
+            return
+
+        # bulk_update tidak memicu sinyal; nilai akhir juga bergantung pada
+        # tabel huruf & PKL_NILAI_AKHIR_BOBOT, jadi semua seminar dihitung ulang
+        seminar_ids = list(qs.values_list("seminar_id", flat=True).distinct().order_by("seminar_id"))
+        akhir = 0
+        size = max(1, options["chunk_size"])
+        for i in range(0, len(seminar_ids), size):
+            akhir += grading.perbarui_nilai_akhir(seminar_ids[i:i + size])
+        self.stdout.write(f"Nilai akhir {akhir} dari {len(seminar_ids)} seminar diperbarui.")
+
+        # cache analitik penilaian (masterdata.analytics) per periode
+        periode_ids = (
+            SeminarHasilPKL.objects.filter(pk__in=seminar_ids)
+            .exclude(periode_id=None)
+            .values_list("periode_id", flat=True)
+            .distinct()
+        )
+        bump_version(*(namespace_penilaian(p) for p in periode_ids))
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('masterdata', '0011_alter_pendaftaranpkl_mitra'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(max_length=30)),
+                ('object_id', models.BigIntegerField()),
+                ('dihapus_pada', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Jejak Penghapusan',
+                'verbose_name_plural': 'Jejak Penghapusan',
+            },
+        ),
+        migrations.AddField(
+            model_name='dosen',
+            name='diupdate_pada',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='mahasiswa',
+            name='diupdate_pada',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='mitra',
+            name='diupdate_pada',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='periodepkl',
+            name='diupdate_pada',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='dosen',
+            index=models.Index(fields=['diupdate_pada', 'id'], name='masterdata__diupdat_3f1f8b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mahasiswa',
+            index=models.Index(fields=['diupdate_pada', 'id'], name='masterdata__diupdat_2f5da8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mitra',
+            index=models.Index(fields=['diupdate_pada', 'id'], name='masterdata__diupdat_8324d5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pendaftaranpkl',
+            index=models.Index(fields=['tanggal_update', 'id'], name='masterdata__tanggal_23b96a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='periodepkl',
+            index=models.Index(fields=['diupdate_pada', 'id'], name='masterdata__diupdat_3cc63d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seminarassessment',
+            index=models.Index(fields=['updated_at', 'id'], name='masterdata__updated_7c6e66_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='seminarhasilpkl',
+            index=models.Index(fields=['updated_at', 'id'], name='masterdata__updated_6d9a90_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='changetombstone',
+            index=models.Index(fields=['dihapus_pada', 'id'], name='masterdata__dihapus_c9f528_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:47
+
+import masterdata.models
+import masterdata.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('masterdata', '0012_changefeed_timestamps_dan_tombstone'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pendaftaranpkl',
+            name='surat_penerimaan',
+            field=models.FileField(help_text='Upload surat penerimaan (PDF/JPG/PNG, maks. 2 MB).', storage=masterdata.storage.ContentAddressedStorage(), upload_to='surat_penerimaan/', validators=[masterdata.models.validate_surat_penerimaan_file]),
+        ),
+        migrations.AlterField(
+            model_name='seminarhasilpkl',
+            name='file_laporan',
+            field=models.FileField(help_text='Upload laporan PKL (PDF).', storage=masterdata.storage.ContentAddressedStorage(), upload_to='laporan_pkl/', validators=[masterdata.models.validate_laporan_file]),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:52
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('masterdata', '0013_content_addressed_uploads'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnggahanLaporan',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('nama_file', models.CharField(max_length=255)),
+                ('ukuran_total', models.PositiveBigIntegerField()),
+                ('diterima', models.PositiveBigIntegerField(default=0)),
+                ('status', models.CharField(choices=[('AKTIF', 'Sedang diunggah'), ('SELESAI', 'Selesai'), ('DIBATALKAN', 'Dibatalkan')], default='AKTIF', max_length=12)),
+                ('dibuat_pada', models.DateTimeField(auto_now_add=True)),
+                ('diupdate_pada', models.DateTimeField(auto_now=True)),
+                ('mahasiswa', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='unggahan_laporan', to='masterdata.mahasiswa')),
+                ('seminar', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='unggahan', to='masterdata.seminarhasilpkl')),
+            ],
+            options={
+                'verbose_name': 'Unggahan Laporan',
+                'verbose_name_plural': 'Unggahan Laporan',
+                'indexes': [models.Index(fields=['status', 'diupdate_pada'], name='masterdata__status_e78f1f_idx')],
+            },
+        ),
+    ]
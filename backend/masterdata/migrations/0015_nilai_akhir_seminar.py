@@ -0,0 +1,69 @@
+# Generated by Django 5.2.8 on 2026-10-19 17:02
+
+from bisect import bisect_right
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Avg
+
+# Salinan beku rumus saat migrasi ini dibuat (masterdata/grading.py, nilai
+# default settings); jangan impor kode live agar hasilnya tidak bergantung
+# pada settings/kode saat `migrate` dijalankan.
+BOBOT_PERAN = {"PENGUJI": 0.5, "PEMBIMBING": 0.5}
+# batas bawah naik (tanpa huruf terendah) dan huruf dari yang terendah
+BATAS = (42.0, 46.0, 50.0, 54.0, 58.0, 64.0, 68.0, 72.0, 76.0, 81.0)
+HURUF = ("E", "D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A")
+
+
+def nilai_akhir(rata_per_peran):
+    pasangan = [(v, BOBOT_PERAN.get(peran, 0.0)) for peran, v in rata_per_peran.items() if v is not None]
+    total_bobot = sum(b for _, b in pasangan)
+    if not total_bobot:
+        return None, None
+    angka = round(sum(v * b for v, b in pasangan) / total_bobot, 2)
+    return angka, HURUF[bisect_right(BATAS, angka)]
+
+
+def isi_nilai_akhir(apps, schema_editor):
+    SeminarAssessment = apps.get_model("masterdata", "SeminarAssessment")
+    SeminarHasilPKL = apps.get_model("masterdata", "SeminarHasilPKL")
+
+    rata = defaultdict(dict)
+    for seminar_id, peran, avg in (
+        SeminarAssessment.objects.values("seminar_id", "role")
+        .annotate(avg=Avg("nilai_angka"))
+        .values_list("seminar_id", "role", "avg")
+        .order_by()
+    ):
+        rata[seminar_id][peran] = None if avg is None else float(avg)
+
+    objs = []
+    for seminar_id, per_peran in rata.items():
+        angka, huruf = nilai_akhir(per_peran)
+        if angka is not None:
+            objs.append(
+                SeminarHasilPKL(pk=seminar_id, nilai_akhir=Decimal(f"{angka:.2f}"), nilai_huruf_akhir=huruf)
+            )
+    SeminarHasilPKL.objects.bulk_update(objs, ["nilai_akhir", "nilai_huruf_akhir"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('masterdata', '0014_unggahan_laporan'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seminarhasilpkl',
+            name='nilai_akhir',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=5, null=True),
+        ),
+        migrations.AddField(
+            model_name='seminarhasilpkl',
+            name='nilai_huruf_akhir',
+            field=models.CharField(blank=True, editable=False, max_length=2),
+        ),
+        migrations.RunPython(isi_nilai_akhir, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.8 on 2026-10-19 17:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def salin_penguji_ke_panel(apps, schema_editor):
+    """dosen_penguji (FK lama) menjadi slot Penguji 1."""
+    SeminarHasilPKL = apps.get_model("masterdata", "SeminarHasilPKL")
+    SeminarPenguji = apps.get_model("masterdata", "SeminarPenguji")
+    SeminarPenguji.objects.bulk_create(
+        [
+            SeminarPenguji(seminar_id=seminar_id, dosen_id=dosen_id, urutan=1)
+            for seminar_id, dosen_id in SeminarHasilPKL.objects.exclude(dosen_penguji_lama=None)
+            .values_list("pk", "dosen_penguji_lama")
+            .iterator()
+        ],
+        batch_size=500,
+    )
+
+
+def salin_panel_ke_penguji(apps, schema_editor):
+    SeminarHasilPKL = apps.get_model("masterdata", "SeminarHasilPKL")
+    SeminarPenguji = apps.get_model("masterdata", "SeminarPenguji")
+    for seminar_id, dosen_id in SeminarPenguji.objects.filter(urutan=1).values_list("seminar_id", "dosen_id"):
+        SeminarHasilPKL.objects.filter(pk=seminar_id).update(dosen_penguji_lama=dosen_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('masterdata', '0015_nilai_akhir_seminar'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeminarPenguji',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('urutan', models.PositiveSmallIntegerField(default=1)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('dosen', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='slot_penguji', to='masterdata.dosen')),
+                ('seminar', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='panel_penguji', to='masterdata.seminarhasilpkl')),
+            ],
+            options={
+                'verbose_name': 'Dosen Penguji Seminar',
+                'verbose_name_plural': 'Dosen Penguji Seminar',
+                'ordering': ['seminar', 'urutan'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='seminarpenguji',
+            index=models.Index(fields=['created_at', 'id'], name='masterdata__created_b817da_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='seminarpenguji',
+            constraint=models.UniqueConstraint(fields=('seminar', 'dosen'), name='uniq_penguji_per_seminar'),
+        ),
+        migrations.AddConstraint(
+            model_name='seminarpenguji',
+            constraint=models.UniqueConstraint(fields=('seminar', 'urutan'), name='uniq_slot_penguji_per_seminar'),
+        ),
+        # FK lama diganti nama dulu agar M2M bisa memakai nama dosen_penguji
+        migrations.RenameField(
+            model_name='seminarhasilpkl',
+            old_name='dosen_penguji',
+            new_name='dosen_penguji_lama',
+        ),
+        migrations.RunPython(salin_penguji_ke_panel, salin_panel_ke_penguji),
+        migrations.RemoveField(
+            model_name='seminarhasilpkl',
+            name='dosen_penguji_lama',
+        ),
+        migrations.AddField(
+            model_name='seminarhasilpkl',
+            name='dosen_penguji',
+            field=models.ManyToManyField(blank=True, help_text='Panel dosen penguji (maks. PKL_MAX_PENGUJI), tidak boleh dosen pembimbing.', related_name='seminar_pkl_diuji', through='masterdata.SeminarPenguji', to='masterdata.dosen'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-19 17:23
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('masterdata', '0016_panel_penguji_seminar'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='periodepkl',
+            name='diarsipkan_pada',
+            field=models.DateTimeField(blank=True, editable=False, help_text='Diisi perintah arsipkan_periode; data aktivitas periode ini ada di ArsipBaris.', null=True),
+        ),
+        migrations.CreateModel(
+            name='ArsipBaris',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=50)),
+                ('object_id', models.BigIntegerField()),
+                ('mahasiswa_id', models.BigIntegerField(null=True)),
+                ('dosen_pembimbing_id', models.BigIntegerField(null=True)),
+                ('data', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('periode', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='arsip_baris', to='masterdata.periodepkl')),
+            ],
+            options={
+                'verbose_name': 'Arsip Baris',
+                'verbose_name_plural': 'Arsip Baris',
+                'indexes': [models.Index(fields=['periode', 'model', 'mahasiswa_id'], name='masterdata__periode_d67b37_idx'), models.Index(fields=['periode', 'model', 'dosen_pembimbing_id'], name='masterdata__periode_8c2f0d_idx')],
+                'constraints': [models.UniqueConstraint(fields=('model', 'object_id'), name='uniq_arsip_per_objek')],
+            },
+        ),
+    ]
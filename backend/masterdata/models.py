@@ -2,15 +2,31 @@
 # backend/masterdata/models.py
 import os
 
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 
 
 import os
+import uuid
 from django.conf import settings
 
+from . import grading
+from .access import MahasiswaQuerySet, PenilaianQuerySet
+from .periode import AktivitasQuerySet, SeminarPeriodeQuerySet, manager_berjalan
+from .storage import TEMP_DIRNAME, content_storage
+
+
+def _berkas_tersimpan(file_obj) -> bool:
+    """
+    True untuk FieldFile yang sudah tersimpan (bukan unggahan baru). Validator
+    field ikut jalan di setiap full_clean, mis. saat admin hanya mengubah
+    status; berkas lama tidak perlu dibuka lagi (dan mungkin sudah tidak ada).
+    """
+    return getattr(file_obj, "_committed", False)
+
 
 def validate_surat_penerimaan_file(file_obj):
     """
@@ -19,6 +35,9 @@ def validate_surat_penerimaan_file(file_obj):
     - membatasi ukuran maksimum berdasarkan konfigurasi settings.SURAT_PENERIMAAN_MAX_SIZE_MB
     """
 
+    if _berkas_tersimpan(file_obj):
+        return
+
     # 1) Validasi ekstensi
     allowed_extensions = [".pdf"]
     ext = os.path.splitext(file_obj.name)[1].lower()
@@ -36,6 +55,45 @@ def validate_surat_penerimaan_file(file_obj):
             f"Ukuran file terlalu besar. Maksimal {max_mb:.0f} MB."
         )
 
+    # 3) Validasi isi: benar-benar PDF (cek magic bytes, bukan hanya ekstensi)
+    validate_pdf_magic(file_obj)
+
+
+PDF_MAGIC = b"%PDF-"
+
+
+def validate_pdf_magic(file_obj):
+    """
+    Pastikan berkas diawali header PDF. Hanya 1 KB pertama yang dibaca
+    (spesifikasi PDF mengizinkan header di dalam 1024 byte pertama), jadi
+    unggahan besar tidak pernah dimuat utuh ke memori.
+    """
+    if _berkas_tersimpan(file_obj):
+        return
+    try:
+        file_obj.seek(0)
+        head = file_obj.read(1024)
+        file_obj.seek(0)
+    except (OSError, ValueError):
+        raise ValidationError("File tidak dapat dibaca.")
+    if PDF_MAGIC not in head:
+        raise ValidationError("Isi file bukan PDF yang valid.")
+
+
+def validate_laporan_file(file_obj):
+    """Validasi file laporan PKL: ekstensi .pdf, ukuran maksimum, dan isi PDF."""
+
+    if _berkas_tersimpan(file_obj):
+        return
+    if os.path.splitext(file_obj.name)[1].lower() != ".pdf":
+        raise ValidationError("Format file tidak didukung. Unggah laporan dalam bentuk PDF.")
+
+    max_mb = getattr(settings, "LAPORAN_MAX_SIZE_MB", 20.0)
+    if file_obj.size > int(max_mb * 1024 * 1024):
+        raise ValidationError(f"Ukuran file terlalu besar. Maksimal {max_mb:.0f} MB.")
+
+    validate_pdf_magic(file_obj)
+
 
 
 class Dosen(models.Model):
@@ -68,9 +126,12 @@ class Dosen(models.Model):
         help_text="Centang jika dosen ini bertindak sebagai koordinator PKL.",
         )
 
+    diupdate_pada = models.DateTimeField(auto_now=True)
+
     class Meta:
         verbose_name = "Dosen"
         verbose_name_plural = "Dosen"
+        indexes = [models.Index(fields=["diupdate_pada", "id"])]
 
     def __str__(self) -> str:
         return f"{self.nama} ({self.nidn})"
@@ -97,9 +158,12 @@ class Mitra(models.Model):
         help_text="Perkiraan maksimal mahasiswa PKL yang dapat diterima per periode."
     )
 
+    diupdate_pada = models.DateTimeField(auto_now=True)
+
     class Meta:
         verbose_name = "Mitra"
         verbose_name_plural = "Mitra"
+        indexes = [models.Index(fields=["diupdate_pada", "id"])]
 
     def __str__(self):
         return self.nama
@@ -131,10 +195,19 @@ class PeriodePKL(models.Model):
         default=True,
         help_text="Centang jika periode ini sedang berjalan."
     )
+    diarsipkan_pada = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Diisi perintah arsipkan_periode; data aktivitas periode ini ada di ArsipBaris.",
+    )
+
+    diupdate_pada = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Periode PKL"
         verbose_name_plural = "Periode PKL"
+        indexes = [models.Index(fields=["diupdate_pada", "id"])]
 
     def __str__(self):
         return f"{self.nama_periode} ({self.tahun_ajaran})"
@@ -198,9 +271,14 @@ class Mahasiswa(models.Model):
         related_name="mahasiswa_pkl",
     )
 
+    diupdate_pada = models.DateTimeField(auto_now=True)
+
+    objects = MahasiswaQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Mahasiswa"
         verbose_name_plural = "Mahasiswa"
+        indexes = [models.Index(fields=["diupdate_pada", "id"])]
 
     def __str__(self):
         return f"{self.nama} ({self.nim})"
@@ -248,6 +326,7 @@ class PendaftaranPKL(models.Model):
     )
     surat_penerimaan = models.FileField(
         upload_to="surat_penerimaan/",
+        storage=content_storage,
         validators=[validate_surat_penerimaan_file],
         help_text="Upload surat penerimaan (PDF/JPG/PNG, maks. 2 MB).",
     )
@@ -271,34 +350,67 @@ class PendaftaranPKL(models.Model):
     tanggal_pengajuan = models.DateTimeField(auto_now_add=True)
     tanggal_update = models.DateTimeField(auto_now=True)
 
-    
+    objects = AktivitasQuerySet.as_manager()
+    berjalan = manager_berjalan(AktivitasQuerySet)
 
     class Meta:
         verbose_name = "Pendaftaran PKL"
         verbose_name_plural = "Pendaftaran PKL"
         unique_together = ("mahasiswa", "periode")
+        indexes = [models.Index(fields=["tanggal_update", "id"])]
 
     def __str__(self):
         return f"Pendaftaran PKL {self.mahasiswa.nim} - {self.periode}"
 
-    def sinkron_ke_mahasiswa(self):
+    SINKRON_FIELDS = ["periode", "mitra", "dosen_pembimbing", "status_pkl"]
+
+    def _terapkan_ke_mahasiswa(self):
         mhs = self.mahasiswa
-        if self.status != "DISETUJUI":
-            return
 
         # contoh logika sinkron:
-        if self.periode is not None:
-            mhs.periode = self.periode
-        if self.mitra is not None:
-            mhs.mitra = self.mitra
-        if self.dosen_pembimbing is not None:
-            mhs.dosen_pembimbing = self.dosen_pembimbing
+        if self.periode_id is not None:
+            mhs.periode_id = self.periode_id
+        if self.mitra_id is not None:
+            mhs.mitra_id = self.mitra_id
+        if self.dosen_pembimbing_id is not None:
+            mhs.dosen_pembimbing_id = self.dosen_pembimbing_id
 
         # misalnya: set status PKL mahasiswa
         if mhs.status_pkl in (None, "", "BELUM"):
             mhs.status_pkl = "SEDANG"
+        return mhs
+
+    def sinkron_ke_mahasiswa(self):
+        if self.status != "DISETUJUI":
+            return
 
-        mhs.save(update_fields=["periode", "mitra", "dosen_pembimbing", "status_pkl"])
+        mhs = self._terapkan_ke_mahasiswa()
+        # diupdate_pada (auto_now) hanya ikut tersimpan jika disebut di update_fields
+        mhs.save(update_fields=[*self.SINKRON_FIELDS, "diupdate_pada"])
+
+    @classmethod
+    def sinkron_massal_ke_mahasiswa(cls, pendaftaran_list):
+        """
+        Versi massal sinkron_ke_mahasiswa untuk pendaftaran yang diubah lewat
+        bulk_update (sinyal post_save tidak terpanggil). Satu query UPDATE
+        untuk semua mahasiswa; cache peran pemilik akun ikut dihapus.
+        """
+        from django.utils import timezone
+
+        from .roles import invalidate_role
+
+        now = timezone.now()
+        mahasiswa_list = []
+        for pendaftaran in pendaftaran_list:
+            if pendaftaran.status != "DISETUJUI":
+                continue
+            mhs = pendaftaran._terapkan_ke_mahasiswa()
+            mhs.diupdate_pada = now
+            mahasiswa_list.append(mhs)
+
+        Mahasiswa.objects.bulk_update(mahasiswa_list, [*cls.SINKRON_FIELDS, "diupdate_pada"])
+        invalidate_role(*(mhs.user_id for mhs in mahasiswa_list))
+        return len(mahasiswa_list)
 
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
@@ -387,40 +499,27 @@ class SeminarAssessment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PenilaianQuerySet.as_manager()
+
     class Meta:
         unique_together = ("seminar", "penguji", "role")
         verbose_name = "Penilaian Seminar PKL"
         verbose_name_plural = "Penilaian Seminar PKL"
+        indexes = [models.Index(fields=["updated_at", "id"])]
 
     def __str__(self):
         return f"{self.seminar} - {self.penguji} ({self.role}/{self.nilai_huruf})"
 
     # ---- util internal ----
     def hitung_rata_rata(self):
-        aspek_fields = [
-            "pemahaman_materi",
-            "kualitas_laporan",
-            "presentasi",
-            "penguasaan_lapangan",
-            "sikap_profesional",
-        ]
-        
-        scores = []
-
-        for fname in aspek_fields:
-            value = getattr(self, fname, None)
-            if value is not None:
-                scores.append(value)
-
-        if not scores:
-            return None
-        
-        return sum(scores)/len(scores)
+        """Rata-rata berbobot aspek yang terisi (lihat masterdata.grading)."""
+        return grading.nilai_penilaian(self)[0]
 
     @staticmethod
     def konversi_nilai_huruf(nilai: float) -> str:
         """
-        Konversi 0–100 ke huruf berdasarkan tabel yang Bapak kirim:
+        Konversi 0–100 ke huruf berdasarkan ``settings.PKL_GRADE_BANDS``.
+        Tabel default (sesuai yang Bapak kirim):
         A  : 81–100
         A- : 76–80
         B+ : 72–75
@@ -433,46 +532,39 @@ class SeminarAssessment(models.Model):
         D  : 42–45
         E  : 0–41
         """
-        if nilai >= 81:
-            return "A"
-        elif nilai >= 76:
-            return "A-"
-        elif nilai >= 72:
-            return "B+"
-        elif nilai >= 68:
-            return "B"
-        elif nilai >= 64:
-            return "B-"
-        elif nilai >= 58:
-            return "C+"
-        elif nilai >= 54:
-            return "C"
-        elif nilai >= 50:
-            return "C-"
-        elif nilai >= 46:
-            return "D+"
-        elif nilai >= 42:
-            return "D"
-        else:
-            return "E"
+        return grading.konversi_huruf(nilai)
 
     def save(self, *args, **kwargs):
-        avg = self.hitung_rata_rata()
-
-        if avg is not None:
-            # pastikan dibulatkan hanya jika sudah ada nilai
-            avg = round(float(avg), 2)
-            self.nilai_angka = avg
-            self.nilai_huruf = self.konversi_nilai_huruf(avg)
-        else:
-            # belum ada nilai yang diisi → kosongkan field nilai
-            self.nilai_angka = None
-            self.nilai_huruf = None
+        # perhitungan sama persis dengan re-grading massal (regrade_penilaian);
+        # belum ada nilai yang diisi → field nilai dikosongkan
+        self.nilai_angka, self.nilai_huruf = grading.nilai_penilaian(self)
 
-        super().save(*args, **kwargs)
+        # post_save (masterdata.signals) memperbarui nilai akhir seminar di
+        # dalam transaksi yang sama
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
 
 
+class SeminarHasilPKLQuerySet(SeminarPeriodeQuerySet):
+    def dengan_panel(self):
+        """
+        Prefetch panel penguji (urut slot) dan semua penilaian beserta dosennya:
+        halaman daftar/detail seminar cukup 2 query tambahan berapa pun
+        jumlah penguji per seminar.
+        """
+        return self.prefetch_related(
+            models.Prefetch(
+                "panel_penguji",
+                queryset=SeminarPenguji.objects.select_related("dosen").order_by("urutan"),
+            ),
+            models.Prefetch(
+                "assessments",
+                queryset=SeminarAssessment.objects.select_related("penguji").order_by("role", "penguji__nama"),
+            ),
+        )
+
+
 class SeminarHasilPKL(models.Model):
     STATUS_CHOICES = [
         ("DIKIRIM", "Diajukan"),
@@ -503,6 +595,8 @@ class SeminarHasilPKL(models.Model):
     judul_laporan = models.CharField(max_length=255)
     file_laporan = models.FileField(
         upload_to="laporan_pkl/",
+        storage=content_storage,
+        validators=[validate_laporan_file],
         help_text="Upload laporan PKL (PDF).",
     )
 
@@ -512,13 +606,12 @@ class SeminarHasilPKL(models.Model):
         default="DIKIRIM",
     )
 
-    dosen_penguji = models.ForeignKey(
+    dosen_penguji = models.ManyToManyField(
         Dosen,
-        on_delete=models.SET_NULL,
-        null=True,
+        through="SeminarPenguji",
         blank=True,
         related_name="seminar_pkl_diuji",
-        help_text="Hanya satu dosen penguji, tidak boleh dosen pembimbing.",
+        help_text="Panel dosen penguji (maks. PKL_MAX_PENGUJI), tidak boleh dosen pembimbing.",
     )
     jadwal = models.DateTimeField(
         null=True,
@@ -531,13 +624,232 @@ class SeminarHasilPKL(models.Model):
         help_text="Ruang ujian / link meeting.",
     )
 
+    # diisi otomatis dari SeminarAssessment (masterdata.grading.perbarui_nilai_akhir)
+    nilai_akhir = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    nilai_huruf_akhir = models.CharField(
+        max_length=2,
+        blank=True,
+        editable=False,
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SeminarHasilPKLQuerySet.as_manager()
+    berjalan = manager_berjalan(SeminarHasilPKLQuerySet)
+
     class Meta:
         verbose_name = "Seminar Hasil PKL"
         verbose_name_plural = "Seminar Hasil PKL"
         unique_together = ("mahasiswa", "periode")
+        indexes = [models.Index(fields=["updated_at", "id"])]
 
     def __str__(self):
         return f"Seminar {self.mahasiswa.nim} - {self.periode}"
+
+    # Helper di bawah membaca ``panel_penguji.all()`` / ``assessments.all()``
+    # sehingga memakai hasil ``dengan_panel()`` bila sudah di-prefetch.
+    def panel(self) -> list:
+        return list(self.panel_penguji.all())
+
+    def penguji_ids(self) -> set:
+        return {slot.dosen_id for slot in self.panel_penguji.all()}
+
+    def is_penguji(self, dosen) -> bool:
+        return dosen is not None and dosen.pk in self.penguji_ids()
+
+    def is_pembimbing(self, dosen) -> bool:
+        return dosen is not None and self.dosen_pembimbing_id == dosen.pk
+
+    def penilaian_penguji(self) -> list:
+        return [a for a in self.assessments.all() if a.role == "PENGUJI"]
+
+    def penilaian_pembimbing(self):
+        return next((a for a in self.assessments.all() if a.role == "PEMBIMBING"), None)
+
+    def slot_penilaian(self) -> list:
+        """(slot panel, penilaian penguji slot itu atau None), urut slot."""
+        per_dosen = {a.penguji_id: a for a in self.penilaian_penguji()}
+        return [(slot, per_dosen.get(slot.dosen_id)) for slot in self.panel_penguji.all()]
+
+    def atur_panel(self, dosen_list) -> None:
+        """
+        Ganti panel penguji; slot diberi nomor sesuai urutan ``dosen_list``.
+        Penilaian penguji yang dikeluarkan dari panel ikut dihapus dan nilai
+        akhir dihitung ulang, agar nilainya tidak lagi terhitung.
+        """
+        from .grading import perbarui_nilai_akhir
+
+        dosen_list = list(dosen_list)
+        dosen_ids = [d.pk for d in dosen_list]
+        sekarang = list(
+            SeminarPenguji.objects.filter(seminar=self).order_by("urutan").values_list("dosen_id", flat=True)
+        )
+        if sekarang == dosen_ids:
+            return
+        with transaction.atomic():
+            SeminarPenguji.objects.filter(seminar=self).delete()
+            SeminarPenguji.objects.bulk_create(
+                SeminarPenguji(seminar=self, dosen=dosen, urutan=i)
+                for i, dosen in enumerate(dosen_list, start=1)
+            )
+            yatim, _ = (
+                SeminarAssessment.objects.filter(seminar=self, role="PENGUJI")
+                .exclude(penguji_id__in=dosen_ids)
+                .delete()
+            )
+            if yatim:
+                perbarui_nilai_akhir([self.pk])
+        if yatim:
+            self.refresh_from_db(fields=["nilai_akhir", "nilai_huruf_akhir", "updated_at"])
+        # cache prefetch lama tidak berlaku lagi
+        cache = getattr(self, "_prefetched_objects_cache", {})
+        cache.pop("panel_penguji", None)
+        cache.pop("assessments", None)
+
+
+class SeminarPenguji(models.Model):
+    """Slot dosen penguji pada satu seminar (Penguji 1, Penguji 2, ...)."""
+
+    seminar = models.ForeignKey(
+        SeminarHasilPKL,
+        on_delete=models.CASCADE,
+        related_name="panel_penguji",
+    )
+    dosen = models.ForeignKey(
+        Dosen,
+        on_delete=models.CASCADE,
+        related_name="slot_penguji",
+    )
+    urutan = models.PositiveSmallIntegerField(default=1)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Dosen Penguji Seminar"
+        verbose_name_plural = "Dosen Penguji Seminar"
+        ordering = ["seminar", "urutan"]
+        indexes = [models.Index(fields=["created_at", "id"])]
+        constraints = [
+            models.UniqueConstraint(fields=["seminar", "dosen"], name="uniq_penguji_per_seminar"),
+            models.UniqueConstraint(fields=["seminar", "urutan"], name="uniq_slot_penguji_per_seminar"),
+        ]
+
+    def __str__(self):
+        return f"Penguji {self.urutan}: {self.dosen}"
+
+
+class UnggahanLaporan(models.Model):
+    """
+    Sesi unggahan bertahap (chunked, bisa dilanjutkan) untuk file laporan PKL.
+
+    Potongan ditulis langsung ke ``temp_path`` (di folder sementara
+    ContentAddressedStorage); ``diterima`` adalah offset byte berikutnya yang
+    diharapkan server. Setelah lengkap dan checksum cocok, file dirakit ke
+    ``SeminarHasilPKL.file_laporan`` (lihat portal/views_upload.py).
+    """
+
+    STATUS_CHOICES = [
+        ("AKTIF", "Sedang diunggah"),
+        ("SELESAI", "Selesai"),
+        ("DIBATALKAN", "Dibatalkan"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    mahasiswa = models.ForeignKey(
+        Mahasiswa,
+        on_delete=models.CASCADE,
+        related_name="unggahan_laporan",
+    )
+    nama_file = models.CharField(max_length=255)
+    ukuran_total = models.PositiveBigIntegerField()
+    diterima = models.PositiveBigIntegerField(default=0)
+    status = models.CharField(max_length=12, choices=STATUS_CHOICES, default="AKTIF")
+    seminar = models.ForeignKey(
+        SeminarHasilPKL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="unggahan",
+    )
+
+    dibuat_pada = models.DateTimeField(auto_now_add=True)
+    diupdate_pada = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Unggahan Laporan"
+        verbose_name_plural = "Unggahan Laporan"
+        indexes = [models.Index(fields=["status", "diupdate_pada"])]
+
+    def __str__(self):
+        return f"{self.nama_file} ({self.diterima}/{self.ukuran_total} byte)"
+
+    @property
+    def temp_name(self) -> str:
+        """Nama relatif terhadap root ContentAddressedStorage (dipakai gc_uploads)."""
+        return f"{TEMP_DIRNAME}/uploads/{self.pk}.part"
+
+    @property
+    def temp_path(self) -> str:
+        return content_storage.path(self.temp_name)
+
+
+class ChangeTombstone(models.Model):
+    """
+    Jejak penghapusan baris untuk change feed (lihat masterdata.changefeed).
+    Diisi oleh sinyal post_delete sehingga sinkronisasi inkremental
+    bisa ikut menghapus data di sisi data warehouse.
+    """
+
+    entity = models.CharField(max_length=30)
+    object_id = models.BigIntegerField()
+    dihapus_pada = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Jejak Penghapusan"
+        verbose_name_plural = "Jejak Penghapusan"
+        indexes = [models.Index(fields=["dihapus_pada", "id"])]
+
+    def __str__(self):
+        return f"{self.entity}#{self.object_id} dihapus {self.dihapus_pada}"
+
+
+class ArsipBaris(models.Model):
+    """
+    Satu baris aktivitas PKL (logbook, bimbingan, pendaftaran, seminar) dari
+    periode yang sudah diarsipkan, disimpan sebagai hasil serializer Django.
+
+    Kolom ``mahasiswa_id``/``dosen_pembimbing_id`` disalin dari data supaya
+    pembacaan arsip bisa difilter dengan indeks. Lihat masterdata/archive.py.
+    """
+
+    periode = models.ForeignKey(
+        PeriodePKL,
+        on_delete=models.PROTECT,
+        related_name="arsip_baris",
+    )
+    model = models.CharField(max_length=50)
+    object_id = models.BigIntegerField()
+    mahasiswa_id = models.BigIntegerField(null=True)
+    dosen_pembimbing_id = models.BigIntegerField(null=True)
+    data = models.JSONField(encoder=DjangoJSONEncoder)
+
+    class Meta:
+        verbose_name = "Arsip Baris"
+        verbose_name_plural = "Arsip Baris"
+        constraints = [
+            models.UniqueConstraint(fields=["model", "object_id"], name="uniq_arsip_per_objek"),
+        ]
+        indexes = [
+            models.Index(fields=["periode", "model", "mahasiswa_id"]),
+            models.Index(fields=["periode", "model", "dosen_pembimbing_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.model}#{self.object_id} ({self.periode})"
@@ -0,0 +1,84 @@
+# backend/masterdata/periode.py
+"""
+Periode PKL berjalan dan QuerySet aktivitas yang dibatasi per periode.
+
+``periode_berjalan()`` (periode aktif dengan tanggal mulai terbaru) dan
+``daftar_periode()`` (isi pilihan periode di halaman daftar) disimpan di cache
+di bawah versi namespace "periode"; sinyal PeriodePKL menaikkan versinya,
+jadi view tidak perlu query PeriodePKL di setiap request.
+
+Logbook, bimbingan, pendaftaran, dan seminar memakai QuerySet dengan
+``untuk_periode(periode)`` / ``di_periode_berjalan()`` dan manager kedua
+``berjalan`` yang langsung terbatas pada periode berjalan. Manager default
+``objects`` tetap mencakup semua periode (admin, arsip, change feed).
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+
+from .access import DibimbingQuerySet, SeminarQuerySet
+from .cache_versions import get_version
+
+NAMESPACE = "periode"
+
+
+def _cached(nama, hitung):
+    key = f"pkl_{nama}:{get_version(NAMESPACE)}"
+    hit = cache.get(key)
+    if hit is None:
+        # dibungkus tuple agar hasil None ("tidak ada periode aktif") juga ter-cache
+        hit = (hitung(),)
+        cache.set(key, hit, settings.PKL_FRAGMENT_CACHE_TIMEOUT)
+    return hit[0]
+
+
+def periode_berjalan():
+    """PeriodePKL aktif terbaru, atau None; di-cache sampai ada PeriodePKL yang berubah."""
+
+    from .models import PeriodePKL
+
+    return _cached(
+        "periode_berjalan",
+        lambda: PeriodePKL.objects.filter(aktif=True).order_by("-tanggal_mulai").first(),
+    )
+
+
+def daftar_periode() -> list:
+    """Semua PeriodePKL, terbaru dulu (untuk pilihan periode)."""
+
+    from .models import PeriodePKL
+
+    return _cached("daftar_periode", lambda: list(PeriodePKL.objects.order_by("-tanggal_mulai")))
+
+
+class PeriodeQuerySetMixin:
+    def untuk_periode(self, periode):
+        """Baris pada ``periode``; None berarti semua periode."""
+        if periode is None:
+            return self.all()
+        return self.filter(periode=periode)
+
+    def di_periode_berjalan(self):
+        periode = periode_berjalan()
+        if periode is None:
+            return self.none()
+        return self.filter(periode=periode)
+
+
+class AktivitasQuerySet(PeriodeQuerySetMixin, DibimbingQuerySet):
+    """Logbook, bimbingan, dan pendaftaran PKL."""
+
+
+class SeminarPeriodeQuerySet(PeriodeQuerySetMixin, SeminarQuerySet):
+    pass
+
+
+class PeriodeBerjalanManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().di_periode_berjalan()
+
+
+def manager_berjalan(queryset_class):
+    """Manager ``berjalan`` untuk model dengan QuerySet turunan PeriodeQuerySetMixin."""
+    return PeriodeBerjalanManager.from_queryset(queryset_class)()
@@ -0,0 +1,124 @@
+# backend/masterdata/roles.py
+"""
+Resolusi peran (dosen / koordinator / mahasiswa) untuk satu user.
+
+Yang di-cache per user hanya id profil Dosen/Mahasiswa dan flag
+koordinator, sehingga request berikutnya tidak perlu query hanya untuk
+menentukan peran. Objek profilnya sendiri dimuat ulang dari database
+(sekali per request, saat pertama diakses) agar field seperti
+``dosen_pembimbing_id`` atau ``periode_id`` tidak pernah basi. Cache dihapus
+oleh sinyal di masterdata/signals.py setiap kali Dosen atau Mahasiswa milik
+user berubah, sekali lagi setelah transaksinya commit.
+"""
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Dosen, Mahasiswa
+
+
+class RoleContext:
+    """Peran PKL milik user yang sedang login; profil dimuat lazy dari id-nya."""
+
+    __slots__ = ("dosen_id", "mahasiswa_id", "is_koordinator", "_user", "_dosen", "_mahasiswa")
+
+    def __init__(
+        self,
+        dosen=None,
+        mahasiswa=None,
+        *,
+        dosen_id=None,
+        mahasiswa_id=None,
+        is_koordinator=None,
+        user=None,
+    ):
+        self._dosen = dosen
+        self._mahasiswa = mahasiswa
+        self.dosen_id = dosen.pk if dosen is not None else dosen_id
+        self.mahasiswa_id = mahasiswa.pk if mahasiswa is not None else mahasiswa_id
+        if is_koordinator is None:
+            is_koordinator = dosen is not None and dosen.is_koordinator_pkl
+        self.is_koordinator = bool(is_koordinator)
+        self._user = user
+
+    @property
+    def dosen(self):
+        if self._dosen is None and self.dosen_id is not None:
+            self._dosen = Dosen.objects.filter(pk=self.dosen_id).first()
+            if self._user is not None:
+                User.dosen_profile.related.set_cached_value(self._user, self._dosen)
+        return self._dosen
+
+    @property
+    def mahasiswa(self):
+        if self._mahasiswa is None and self.mahasiswa_id is not None:
+            self._mahasiswa = Mahasiswa.objects.filter(pk=self.mahasiswa_id).first()
+            if self._user is not None:
+                User.mahasiswa_profile.related.set_cached_value(self._user, self._mahasiswa)
+        return self._mahasiswa
+
+    @property
+    def is_dosen(self) -> bool:
+        return self.dosen_id is not None
+
+    @property
+    def is_mahasiswa(self) -> bool:
+        return self.mahasiswa_id is not None
+
+    def muat_profil(self) -> "RoleContext":
+        """Muat profil sekarang juga (dipakai view async sebelum kembali ke event loop)."""
+        self._dosen = self.dosen
+        self._mahasiswa = self.mahasiswa
+        return self
+
+    def __repr__(self):
+        return f"<RoleContext dosen_id={self.dosen_id!r} mahasiswa_id={self.mahasiswa_id!r}>"
+
+
+ANONYMOUS_ROLE = RoleContext()
+
+
+def role_cache_key(user_id) -> str:
+    return f"pkl_role:{user_id}"
+
+
+def invalidate_role(*user_ids) -> None:
+    """
+    Hapus cache peran sekarang dan sekali lagi setelah commit: request lain
+    yang sempat mengisi cache dari data lama sebelum commit ikut terbuang.
+    """
+    keys = [role_cache_key(uid) for uid in user_ids if uid is not None]
+    if keys:
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def _prime_user_profiles(user, role: RoleContext) -> None:
+    # Profil yang memang tidak ada langsung diisi None di objek user supaya
+    # kode lama yang memakai hasattr(user, "dosen_profile") tidak memicu query.
+    if role.dosen_id is None:
+        User.dosen_profile.related.set_cached_value(user, None)
+    if role.mahasiswa_id is None:
+        User.mahasiswa_profile.related.set_cached_value(user, None)
+
+
+def resolve_role(user) -> RoleContext:
+    if user is None or not user.is_authenticated:
+        return ANONYMOUS_ROLE
+
+    key = role_cache_key(user.pk)
+    data = cache.get(key)
+    if data is None:
+        dosen = Dosen.objects.filter(user_id=user.pk).values_list("pk", "is_koordinator_pkl").first()
+        mahasiswa_id = Mahasiswa.objects.filter(user_id=user.pk).values_list("pk", flat=True).first()
+        data = (dosen[0] if dosen else None, mahasiswa_id, bool(dosen and dosen[1]))
+        cache.set(key, data, getattr(settings, "PKL_ROLE_CACHE_TIMEOUT", 300))
+
+    dosen_id, mahasiswa_id, is_koordinator = data
+    role = RoleContext(
+        dosen_id=dosen_id, mahasiswa_id=mahasiswa_id, is_koordinator=is_koordinator, user=user
+    )
+    _prime_user_profiles(user, role)
+    return role
@@ -1,9 +1,26 @@
 # backend/masterdata/signals.py
 
-from django.db.models.signals import post_save
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .models import PendaftaranPKL
+from .analytics import namespace_penilaian
+from .archive import sedang_mengarsipkan
+from .cache_versions import bump_version
+from .changefeed import FEED_SOURCES, entity_for_model
+from .grading import perbarui_nilai_akhir
+from .models import (
+    ChangeTombstone,
+    Dosen,
+    Mahasiswa,
+    PendaftaranPKL,
+    PeriodePKL,
+    SeminarAssessment,
+    SeminarHasilPKL,
+)
+from .periode import NAMESPACE as NAMESPACE_PERIODE
+from .roles import invalidate_role
 
 
 @receiver(post_save, sender=PendaftaranPKL)
@@ -14,3 +31,68 @@ def sync_mahasiswa_when_pendaftaran_approved(sender, instance, created, **kwargs
     """
     if instance.status == "DISETUJUI":
         instance.sinkron_ke_mahasiswa()
+
+
+def catat_tombstone(sender, instance, **kwargs):
+    """Catat penghapusan baris entitas PKL agar terbaca di change feed."""
+    if sedang_mengarsipkan():
+        # baris dipindah ke arsip, bukan dihapus: klien sinkron tidak perlu membuangnya
+        return
+    entity = entity_for_model(sender)
+    if entity is None or instance.pk is None:
+        return
+    ChangeTombstone.objects.create(entity=entity, object_id=instance.pk)
+
+
+for _model_label, _, _ in FEED_SOURCES.values():
+    post_delete.connect(
+        catat_tombstone,
+        sender=apps.get_model(_model_label),
+        dispatch_uid=f"changefeed_tombstone_{_model_label}",
+    )
+
+
+@receiver(pre_save, sender=Dosen)
+@receiver(pre_save, sender=Mahasiswa)
+def ingat_user_lama_profil(sender, instance, update_fields=None, **kwargs):
+    """Simpan user_id lama bila profil dipindah ke akun lain (cache peran keduanya dihapus)."""
+    instance._user_id_lama = None
+    if instance.pk is None or (update_fields is not None and "user" not in update_fields):
+        return
+    instance._user_id_lama = (
+        sender.objects.filter(pk=instance.pk).values_list("user_id", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Dosen)
+@receiver(post_save, sender=Mahasiswa)
+@receiver(post_delete, sender=Dosen)
+@receiver(post_delete, sender=Mahasiswa)
+def hapus_cache_peran(sender, instance, **kwargs):
+    invalidate_role(instance.user_id, getattr(instance, "_user_id_lama", None))
+    # fragmen navigasi per peran (templates/portal/base.html)
+    bump_version("peran")
+
+
+@receiver(post_save, sender=PeriodePKL)
+@receiver(post_delete, sender=PeriodePKL)
+def naikkan_versi_periode(sender, **kwargs):
+    # periode_berjalan() yang di-cache ikut kedaluwarsa
+    bump_version(NAMESPACE_PERIODE)
+
+
+@receiver(post_save, sender=SeminarAssessment)
+@receiver(post_delete, sender=SeminarAssessment)
+def hitung_ulang_nilai_akhir(sender, instance, **kwargs):
+    """Simpan ulang nilai akhir seminar (SeminarAssessment.save & delete sudah atomic)."""
+    if sedang_mengarsipkan():
+        # seminarnya ikut dipindah ke arsip dengan nilai akhir yang sudah tersimpan
+        return
+    perbarui_nilai_akhir([instance.seminar_id])
+    periode_id = (
+        SeminarHasilPKL.objects.filter(pk=instance.seminar_id).values_list("periode_id", flat=True).first()
+    )
+    if periode_id is not None:
+        # setelah commit: pembaca yang masih melihat data lama tidak menyimpan
+        # hasilnya di bawah versi baru
+        transaction.on_commit(lambda: bump_version(namespace_penilaian(periode_id)))
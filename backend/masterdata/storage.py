@@ -0,0 +1,90 @@
+# backend/masterdata/storage.py
+"""
+Penyimpanan berbasis isi (content-addressed) untuk berkas unggahan PKL.
+
+Berkas ditulis bertahap (per chunk) ke file sementara sambil dihitung
+SHA-256-nya, lalu dipindahkan secara atomik ke ``<folder>/<aa>/<sha256><ext>``.
+Jika isi yang sama sudah ada (mis. mahasiswa mengunggah ulang PDF yang sama),
+file sementara dibuang dan nama yang sudah ada dipakai ulang.
+
+Karena satu file bisa dirujuk beberapa baris, file TIDAK dihapus saat baris
+berubah/dihapus; gunakan ``manage.py gc_uploads`` untuk membersihkan file
+yatim (tidak dirujuk baris mana pun).
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+
+# (label model, nama field) yang memakai ContentAddressedStorage; dipakai gc_uploads
+CAS_FIELDS = [
+    ("masterdata.PendaftaranPKL", "surat_penerimaan"),
+    ("masterdata.SeminarHasilPKL", "file_laporan"),
+]
+
+TEMP_DIRNAME = ".tmp"
+
+_HASH_NAME_RE = re.compile(r"(?:^|/)[0-9a-f]{2}/([0-9a-f]{64})(?:\.[\w]+)?$")
+
+
+def sha256_from_name(name: str) -> str | None:
+    """SHA-256 yang tertanam di nama file CAS (None untuk file lama)."""
+
+    match = _HASH_NAME_RE.search(name or "")
+    return match.group(1) if match else None
+
+
+@deconstructible(path="masterdata.storage.ContentAddressedStorage")
+class ContentAddressedStorage(FileSystemStorage):
+    chunk_size = 64 * 1024
+
+    def temp_dir(self) -> str:
+        path = os.path.join(self.location, TEMP_DIRNAME)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def hashed_name(self, name: str, digest: str) -> str:
+        folder = os.path.dirname(name)
+        ext = os.path.splitext(name)[1].lower()
+        return "/".join(part for part in (folder, digest[:2], f"{digest}{ext}") if part)
+
+    def get_available_name(self, name, max_length=None):
+        # nama akhir ditentukan isi berkas di _save, bukan nama asli
+        return name
+
+    def _save(self, name, content):
+        hasher = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self.temp_dir(), suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                if hasattr(content, "seek"):
+                    content.seek(0)
+                for chunk in content.chunks(self.chunk_size):
+                    hasher.update(chunk)
+                    tmp.write(chunk)
+
+            final_name = self.hashed_name(name, hasher.hexdigest())
+            final_path = self.path(final_name)
+            if os.path.exists(final_path):
+                os.remove(tmp_path)  # duplikat: pakai file yang sudah ada
+                # segarkan mtime: blob yatim lama yang dipakai ulang tidak boleh
+                # dihapus gc_uploads sebelum baris barunya commit
+                os.utime(final_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(tmp_path, self.file_permissions_mode)
+                os.replace(tmp_path, final_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return final_name
+
+
+content_storage = ContentAddressedStorage()
@@ -0,0 +1,24 @@
+# backend/masterdata/testing.py
+"""Bantuan bersama untuk tests.py tiap app (tidak dipakai kode produksi)."""
+
+import tempfile
+
+from django.test import override_settings
+
+
+class MediaSementaraMixin:
+    """
+    Arahkan ``MEDIA_ROOT`` ke direktori sementara per test, lalu hapus setelahnya.
+
+    Taruh sebelum ``TestCase`` di daftar base class; ``setUp`` turunan wajib
+    memanggil ``super().setUp()``. Path-nya tersedia sebagai ``self.media_root``.
+    """
+
+    def setUp(self):
+        super().setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.media_root = tmpdir.name
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
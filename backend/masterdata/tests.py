@@ -1,12 +1,45 @@
-from django.test import TestCase
-from django.test import TestCase
-from django.contrib.auth.models import User
-from django.core.files.uploadedfile import SimpleUploadedFile
+import datetime
+import hashlib
+import io
+import itertools
+import os
+import random
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
+from guidance.models import GuidanceSession
+from logbook.models import LogbookEntry
+from masterdata import grading
+from masterdata.access import DOSEN, boleh_lihat, lingkup
+from masterdata.analytics import analitik_periode, hitung_analitik
+from masterdata.archive import arsipkan_periode, baca_periode, periode_siap_arsip
+from masterdata.changefeed import read_changes
 from masterdata.models import (
+    ArsipBaris,
+    ChangeTombstone,
+    Dosen,
+    Mahasiswa,
+    Mitra,
+    PendaftaranPKL,
+    PeriodePKL,
+    SeminarAssessment,
+    SeminarHasilPKL,
+    SeminarPenguji,
+    validate_pdf_magic,
     validate_surat_penerimaan_file,
 )
+from masterdata.periode import daftar_periode, periode_berjalan
+from masterdata.testing import MediaSementaraMixin
+from pkl_backend.db import sqlite_pragma_statements
 
 
 # Create your tests here.
@@ -25,4 +58,567 @@ class ValidatorSuratPenerimaanTests(TestCase):
         )
         with self.assertRaises(ValidationError):
             validate_surat_penerimaan_file(file_obj)
-            
\ No newline at end of file
+            
+
+class ChangeFeedTests(TestCase):
+    def setUp(self):
+        self.periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal",
+            tahun_ajaran="2025/2026",
+            semester="GASAL",
+            tanggal_mulai="2025-01-01",
+            tanggal_selesai="2025-06-30",
+        )
+        self.mitra_a = Mitra.objects.create(nama="Mitra A")
+        self.mitra_b = Mitra.objects.create(nama="Mitra B")
+
+    def test_feed_urut_timestamp_dan_id_dengan_kursor(self):
+        page = read_changes("mitra", limit=1)
+        self.assertEqual([c["id"] for c in page["changes"]], [self.mitra_a.pk])
+        self.assertTrue(page["has_more"])
+
+        page = read_changes("mitra", limit=1, **page["next"])
+        self.assertEqual([c["id"] for c in page["changes"]], [self.mitra_b.pk])
+        self.assertFalse(page["has_more"])
+
+        # update membuat baris muncul lagi sesudah kursor terakhir
+        self.mitra_a.kota = "Surabaya"
+        self.mitra_a.save()
+        page = read_changes("mitra", **page["next"])
+        self.assertEqual([c["id"] for c in page["changes"]], [self.mitra_a.pk])
+        self.assertEqual(page["changes"][0]["data"]["kota"], "Surabaya")
+
+    def test_penghapusan_tercatat_sebagai_tombstone(self):
+        mitra_id = self.mitra_b.pk
+        self.mitra_b.delete()
+
+        page = read_changes("tombstone")
+        self.assertEqual(
+            [(c["entity"], c["op"], c["id"]) for c in page["changes"]],
+            [("mitra", "delete", mitra_id)],
+        )
+
+
+class SqlitePragmaProfileTests(TestCase):
+    def test_profil_pragma_diterapkan_pada_koneksi(self):
+        if connection.vendor != "sqlite" or not settings.SQLITE_PRAGMAS:
+            self.skipTest("Profil PRAGMA hanya untuk SQLite.")
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(cursor.fetchone()[0], settings.SQLITE_PRAGMAS["busy_timeout"])
+
+    def test_nilai_pragma_tidak_boleh_menyisipkan_sql(self):
+        self.assertEqual(
+            sqlite_pragma_statements({"journal_mode": "WAL", "foreign_keys": "OFF"}),
+            ["PRAGMA journal_mode = WAL"],
+        )
+        with self.assertRaises(ValueError):
+            sqlite_pragma_statements({"synchronous": "OFF; DROP TABLE x"})
+
+
+class ContentAddressedStorageTests(MediaSementaraMixin, TestCase):
+    def _pendaftaran(self, nim, isi):
+        periode = PeriodePKL.objects.first() or PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal",
+            tahun_ajaran="2025/2026",
+            semester="GASAL",
+            tanggal_mulai="2025-01-01",
+            tanggal_selesai="2025-06-30",
+        )
+        return PendaftaranPKL.objects.create(
+            mahasiswa=Mahasiswa.objects.create(nim=nim, nama=nim, angkatan=2022),
+            periode=periode,
+            mitra=Mitra.objects.create(nama=f"Mitra {nim}"),
+            jenis_pkl="INDIVIDU",
+            surat_penerimaan=SimpleUploadedFile("Surat Saya.PDF", isi),
+        )
+
+    def test_unggahan_sama_disimpan_sekali_berdasarkan_sha256(self):
+        isi = b"%PDF-1.4 isi surat"
+        p1 = self._pendaftaran("2008104001", isi)
+        p2 = self._pendaftaran("2008104002", isi)
+        p3 = self._pendaftaran("2008104003", b"%PDF-1.4 surat lain")
+
+        digest = hashlib.sha256(isi).hexdigest()
+        self.assertEqual(p1.surat_penerimaan.name, f"surat_penerimaan/{digest[:2]}/{digest}.pdf")
+        self.assertEqual(p1.surat_penerimaan.name, p2.surat_penerimaan.name)
+        self.assertNotEqual(p1.surat_penerimaan.name, p3.surat_penerimaan.name)
+
+        folder = os.path.join(self.media_root, "surat_penerimaan")
+        files = [f for _, _, names in os.walk(folder) for f in names]
+        self.assertEqual(len(files), 2)
+        # tidak ada file sementara yang tertinggal
+        self.assertEqual(os.listdir(os.path.join(self.media_root, ".tmp")), [])
+
+    def test_validasi_magic_pdf_hanya_membaca_awal_file(self):
+        with self.assertRaises(ValidationError):
+            validate_pdf_magic(SimpleUploadedFile("palsu.pdf", b"MZ\x90\x00 bukan pdf"))
+        validate_pdf_magic(SimpleUploadedFile("asli.pdf", b"%PDF-1.7\n" + b"x" * 4096))
+
+    def test_full_clean_baris_lama_tidak_membuka_berkas_lagi(self):
+        pendaftaran = self._pendaftaran("2008104010", b"%PDF-1.4 berkas lama")
+        # berkas warisan yang sudah hilang dari disk
+        os.remove(pendaftaran.surat_penerimaan.path)
+        pendaftaran.status = "DISETUJUI"
+        pendaftaran.full_clean()
+
+    def test_unggahan_duplikat_menyegarkan_mtime_blob(self):
+        lama = self._pendaftaran("2008104020", b"%PDF-1.4 dipakai ulang")
+        path = lama.surat_penerimaan.path
+        os.utime(path, (0, 0))
+        self._pendaftaran("2008104021", b"%PDF-1.4 dipakai ulang")
+        self.assertGreater(os.path.getmtime(path), 0)
+
+    def test_gc_uploads_menghapus_file_yatim(self):
+        dipakai = self._pendaftaran("2008104004", b"%PDF-1.4 dipakai")
+        yatim = self._pendaftaran("2008104005", b"%PDF-1.4 yatim")
+        path_yatim = yatim.surat_penerimaan.path
+        yatim.delete()
+
+        call_command("gc_uploads", "--min-age", "0", stdout=open(os.devnull, "w"))
+        self.assertFalse(os.path.exists(path_yatim))
+        self.assertTrue(os.path.exists(dipakai.surat_penerimaan.path))
+
+
+class GradingEngineTests(MediaSementaraMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal", tahun_ajaran="2025/2026", semester="GASAL",
+            tanggal_mulai="2025-01-01", tanggal_selesai="2025-06-30",
+        )
+        self.dosen = Dosen.objects.create(nidn="0404", nama="Dosen Nilai")
+        mhs = Mahasiswa.objects.create(nim="2008108000", nama="Mhs Nilai", angkatan=2022)
+        self.seminar = SeminarHasilPKL.objects.create(
+            mahasiswa=mhs, periode=periode, judul_laporan="Laporan",
+            file_laporan=SimpleUploadedFile("laporan.pdf", b"%PDF-1.4 nilai"),
+        )
+
+    def test_jalur_numpy_dan_python_identik_dengan_tabel_lama(self):
+        rng = random.Random(40)
+        baris = [[rng.choice([None] + list(range(0, 101))) for _ in range(5)] for _ in range(2000)]
+        baris.append([None] * 5)
+        with self.settings(PKL_ASPEK_BOBOT={"kualitas_laporan": 2, "presentasi": 0.5}):
+            referensi = grading._hitung_python(baris, grading.skema_aktif())
+            with mock.patch.object(grading, "_np", None):
+                self.assertEqual(grading.hitung_massal(baris), referensi)
+            if grading._np is not None:
+                self.assertEqual(grading.hitung_massal(baris), referensi)
+        self.assertEqual(referensi[-1], (None, None))
+
+        def if_chain(n):
+            for batas, huruf in grading.DEFAULT_GRADE_BANDS:
+                if n >= batas:
+                    return huruf
+
+        for n in [x / 4 for x in range(0, 401)]:
+            self.assertEqual(grading.konversi_huruf(n), if_chain(n), n)
+
+    def test_regrade_massal_mengikuti_tabel_dan_bobot_baru(self):
+        a = SeminarAssessment.objects.create(
+            seminar=self.seminar, penguji=self.dosen, pemahaman_materi=80,
+            kualitas_laporan=60, presentasi=80, penguasaan_lapangan=80, sikap_profesional=80,
+        )
+        self.assertEqual((float(a.nilai_angka), a.nilai_huruf), (76.0, "A-"))
+        updated_at = a.updated_at
+
+        with self.settings(
+            PKL_ASPEK_BOBOT={"kualitas_laporan": 3},
+            PKL_GRADE_BANDS=[(80, "A"), (70, "B"), (0, "E")],
+        ):
+            out = io.StringIO()
+            call_command("regrade_penilaian", dry_run=True, stdout=out)
+            self.assertIn("1 akan berubah", out.getvalue())
+            a.refresh_from_db()
+            self.assertEqual(a.nilai_huruf, "A-")
+
+            call_command("regrade_penilaian", chunk_size=1, stdout=io.StringIO())
+            a.refresh_from_db()
+            # (4 * 80 + 3 * 60) / 7
+            self.assertEqual((float(a.nilai_angka), a.nilai_huruf), (71.43, "B"))
+            self.assertGreater(a.updated_at, updated_at)
+            self.seminar.refresh_from_db()
+            self.assertEqual((float(self.seminar.nilai_akhir), self.seminar.nilai_huruf_akhir), (71.43, "B"))
+
+            out = io.StringIO()
+            call_command("regrade_penilaian", stdout=out)
+            self.assertIn("0 diperbarui", out.getvalue())
+
+    def test_nilai_akhir_tersimpan_dan_mengikuti_penilaian(self):
+        def aspek(n):
+            return {f: n for f in ("pemahaman_materi", "kualitas_laporan", "presentasi",
+                                   "penguasaan_lapangan", "sikap_profesional")}
+
+        pembimbing = Dosen.objects.create(nidn="0405", nama="Pembimbing")
+        penguji_2 = Dosen.objects.create(nidn="0406", nama="Penguji 2")
+        SeminarAssessment.objects.create(seminar=self.seminar, penguji=self.dosen, **aspek(80))
+        SeminarAssessment.objects.create(seminar=self.seminar, penguji=penguji_2, **aspek(70))
+        self.seminar.refresh_from_db()
+        self.assertEqual((float(self.seminar.nilai_akhir), self.seminar.nilai_huruf_akhir), (75.0, "B+"))
+
+        bimbingan = SeminarAssessment.objects.create(
+            seminar=self.seminar, penguji=pembimbing, role="PEMBIMBING", **aspek(90)
+        )
+        self.seminar.refresh_from_db()
+        # 0.5 * rata-rata penguji (75) + 0.5 * pembimbing (90)
+        self.assertEqual((float(self.seminar.nilai_akhir), self.seminar.nilai_huruf_akhir), (82.5, "A"))
+
+        with self.settings(PKL_NILAI_AKHIR_BOBOT={"PENGUJI": 0.75, "PEMBIMBING": 0.25}):
+            bimbingan.save()
+        self.seminar.refresh_from_db()
+        self.assertEqual(float(self.seminar.nilai_akhir), 78.75)
+
+        SeminarAssessment.objects.filter(seminar=self.seminar).delete()
+        self.seminar.refresh_from_db()
+        self.assertEqual((self.seminar.nilai_akhir, self.seminar.nilai_huruf_akhir), (None, ""))
+
+    def test_ganti_penguji_yang_sudah_menilai_membuang_nilainya(self):
+        def aspek(n):
+            return {f: n for f in ("pemahaman_materi", "kualitas_laporan", "presentasi",
+                                   "penguasaan_lapangan", "sikap_profesional")}
+
+        penguji_2 = Dosen.objects.create(nidn="0407", nama="Penguji Diganti")
+        pengganti = Dosen.objects.create(nidn="0408", nama="Penguji Pengganti")
+        self.seminar.atur_panel([self.dosen, penguji_2])
+        SeminarAssessment.objects.create(seminar=self.seminar, penguji=self.dosen, **aspek(80))
+        SeminarAssessment.objects.create(seminar=self.seminar, penguji=penguji_2, **aspek(40))
+        self.seminar.refresh_from_db()
+        self.assertEqual(float(self.seminar.nilai_akhir), 60.0)
+
+        self.seminar.atur_panel([self.dosen, pengganti])
+        self.assertFalse(SeminarAssessment.objects.filter(penguji=penguji_2).exists())
+        self.assertEqual((float(self.seminar.nilai_akhir), self.seminar.nilai_huruf_akhir), (80.0, "A-"))
+        slot = [(s.dosen_id, a and a.penguji_id) for s, a in self.seminar.slot_penilaian()]
+        self.assertEqual(slot, [(self.dosen.pk, self.dosen.pk), (pengganti.pk, None)])
+
+
+class AnalitikPenilaianTests(MediaSementaraMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal", tahun_ajaran="2025/2026", semester="GASAL",
+            tanggal_mulai="2025-01-01", tanggal_selesai="2025-06-30",
+        )
+        self.penguji = Dosen.objects.create(nidn="0501", nama="Penguji Murah Hati")
+        self.pembimbing = Dosen.objects.create(nidn="0502", nama="Pembimbing")
+        self.seminar = []
+        # penguji selalu memberi 10 poin di atas pembimbing
+        for i, dasar in enumerate([60, 70, 80]):
+            mhs = Mahasiswa.objects.create(nim=f"200810900{i}", nama=f"Mhs {i}", angkatan=2022)
+            seminar = SeminarHasilPKL.objects.create(
+                mahasiswa=mhs, periode=self.periode, judul_laporan="Laporan",
+                file_laporan=SimpleUploadedFile("laporan.pdf", b"%PDF-1.4 analitik"),
+            )
+            self.seminar.append(seminar)
+            for dosen, role, nilai in (
+                (self.penguji, "PENGUJI", dasar + 10),
+                (self.pembimbing, "PEMBIMBING", dasar),
+            ):
+                SeminarAssessment.objects.create(
+                    seminar=seminar, penguji=dosen, role=role, pemahaman_materi=nilai,
+                    kualitas_laporan=nilai, presentasi=nilai, penguasaan_lapangan=nilai,
+                    sikap_profesional=nilai,
+                )
+
+    def test_statistik_sebaran_kalibrasi_dan_kesepakatan(self):
+        data = hitung_analitik(self.periode.pk)
+        self.assertEqual((data["jumlah_penilaian"], data["jumlah_seminar"]), (6, 3))
+
+        akhir = data["sebaran"]["SEMUA"][-1]
+        self.assertEqual(akhir["aspek"], "nilai_angka")
+        self.assertEqual((akhir["rata"], akhir["min"], akhir["maks"], akhir["median"]), (75.0, 60.0, 90.0, 75.0))
+        self.assertEqual(data["sebaran"]["PENGUJI"][-1]["rata"], 80.0)
+        self.assertEqual(sum(h["jumlah"] for h in data["sebaran_huruf"]), 6)
+
+        penguji, pembimbing = data["penilai"]
+        self.assertEqual(penguji["dosen_id"], self.penguji.pk)
+        self.assertEqual(penguji["selisih_rekan"], 10.0)
+        self.assertEqual(pembimbing["selisih_rekan"], -10.0)
+        self.assertGreater(penguji["z_rata"], 0)
+        self.assertAlmostEqual(penguji["z_rata"], -pembimbing["z_rata"])
+
+        k = data["kesepakatan"]
+        self.assertEqual((k["n_seminar"], k["bias_pembimbing"], k["selisih_absolut"]), (3, -10.0, 10.0))
+        self.assertEqual(k["korelasi"][0]["r"], 1.0)  # urutan sama, hanya bergeser
+        self.assertLess(k["icc"], 1.0)  # kesepakatan absolut turun karena bias
+
+    def test_cache_per_periode_diperbarui_saat_penilaian_berubah(self):
+        self.assertEqual(analitik_periode(self.periode.pk)["jumlah_penilaian"], 6)
+        with self.assertNumQueries(0):
+            analitik_periode(self.periode.pk)
+
+        a = SeminarAssessment.objects.filter(seminar=self.seminar[0], role="PENGUJI").get()
+        with self.captureOnCommitCallbacks(execute=True):
+            a.delete()
+        data = analitik_periode(self.periode.pk)
+        self.assertEqual(data["jumlah_penilaian"], 5)
+        self.assertEqual(data["kesepakatan"]["n_seminar"], 2)
+
+    def test_halaman_analitik_koordinator(self):
+        koor = Dosen.objects.create(
+            user=User.objects.create_user(username="koor_analitik", password="test"),
+            nidn="0503", nama="Koor Analitik", is_koordinator_pkl=True,
+        )
+        self.client.force_login(koor.user)
+        response = self.client.get(f"/koor/analitik/penilaian/?periode={self.periode.pk}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["koordinator"], koor)
+        self.assertContains(response, "<strong>Koor Analitik</strong> (Koordinator PKL)", html=False)
+        self.assertContains(response, "Penguji Murah Hati")
+
+        # pilihan periode dari cache masterdata.periode, bukan query per request
+        self.client.get("/koor/analitik/penilaian/")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/koor/analitik/penilaian/")
+        self.assertEqual(response.context["periode"], self.periode)
+        self.assertEqual(response.context["periode_list"], daftar_periode())
+        self.assertFalse([q for q in ctx.captured_queries if 'FROM "masterdata_periodepkl"' in q["sql"]])
+
+
+class AksesBarisPropertyTests(TestCase):
+    """
+    visible_to() (SQL) dan boleh_lihat() (Python) harus selalu sepakat.
+    Data dan user diacak dengan seed tetap agar kegagalan bisa diulang.
+    """
+
+    SEEDS = (1, 7, 42)
+
+    def _bangun_acak(self, rng):
+        periode = PeriodePKL.objects.create(
+            nama_periode="PKL Acak", tahun_ajaran="2025/2026", semester="GASAL",
+            tanggal_mulai="2025-01-01", tanggal_selesai="2025-06-30",
+        )
+        mitra = Mitra.objects.create(nama="Mitra Acak")
+        users = [User.objects.create_user(f"u{i}") for i in range(8)]
+        users.append(User.objects.create_user("staf", is_staff=True))
+
+        dosen = [
+            Dosen.objects.create(
+                nidn=f"09{i}", nama=f"Dosen {i}", is_koordinator_pkl=(i == 0),
+                user=users[i] if i < 3 else None,
+            )
+            for i in range(5)
+        ]
+        mahasiswa = []
+        for i in range(6):
+            # u2 dosen sekaligus mahasiswa; u3..u7 mahasiswa; sebagian tanpa akun
+            user = users[i + 2] if i < 5 and rng.random() < 0.8 else None
+            mahasiswa.append(Mahasiswa.objects.create(
+                nim=f"2008{i:04d}", nama=f"Mhs {i}", angkatan=2022, user=user,
+                dosen_pembimbing=rng.choice(dosen + [None]), periode=periode,
+            ))
+
+        tanggal = datetime.date(2025, 2, 1)
+        for mhs in mahasiswa:
+            for _ in range(rng.randint(0, 3)):
+                LogbookEntry.objects.create(mahasiswa=mhs, tanggal=tanggal, aktivitas="x")
+                GuidanceSession.objects.create(
+                    mahasiswa=mhs, tanggal=tanggal, topik="t", ringkasan_diskusi="r",
+                    dosen_pembimbing=rng.choice(dosen),  # boleh beda dari profil
+                )
+            if rng.random() < 0.6:
+                PendaftaranPKL.objects.create(
+                    mahasiswa=mhs, periode=periode, mitra=mitra, jenis_pkl="MANDIRI",
+                    dosen_pembimbing=mhs.dosen_pembimbing,
+                )
+            if rng.random() < 0.7:
+                seminar = SeminarHasilPKL.objects.create(
+                    mahasiswa=mhs, periode=periode, judul_laporan="L",
+                    dosen_pembimbing=mhs.dosen_pembimbing,
+                )
+                panel = rng.sample(
+                    [d for d in dosen if d.pk != mhs.dosen_pembimbing_id], rng.randint(0, 3)
+                )
+                seminar.atur_panel(panel)
+                for d in panel[:1]:
+                    SeminarAssessment.objects.create(
+                        seminar=seminar, penguji=d, role="PENGUJI", pemahaman_materi=80,
+                        kualitas_laporan=80, presentasi=80, penguasaan_lapangan=80,
+                        sikap_profesional=80,
+                    )
+        return users
+
+    def test_visible_to_sama_dengan_boleh_lihat(self):
+        querysets = {
+            LogbookEntry: LogbookEntry.objects.all(),
+            GuidanceSession: GuidanceSession.objects.all(),
+            PendaftaranPKL: PendaftaranPKL.objects.all(),
+            Mahasiswa: Mahasiswa.objects.all(),
+            SeminarHasilPKL: SeminarHasilPKL.objects.dengan_panel(),
+            SeminarAssessment: SeminarAssessment.objects.select_related("seminar").prefetch_related(
+                "seminar__panel_penguji"
+            ),
+        }
+        for seed in self.SEEDS:
+            with self.subTest(seed=seed), transaction.atomic():
+                cache.clear()
+                users = self._bangun_acak(random.Random(seed))
+                for user in users + [AnonymousUser()]:
+                    lingkup(user, DOSEN)  # memanaskan cache peran (staf juga)
+                    for (model, qs), peran in itertools.product(querysets.items(), (None, DOSEN)):
+                        semua = list(qs.all())
+                        with self.assertNumQueries(0):
+                            harapan = {o.pk for o in semua if boleh_lihat(user, o, peran)}
+                        terlihat = list(model.objects.visible_to(user, peran).values_list("pk", flat=True))
+                        self.assertEqual(len(terlihat), len(set(terlihat)))  # EXISTS: tanpa duplikat
+                        self.assertEqual(set(terlihat), harapan, f"{model.__name__} / {user} / {peran}")
+                transaction.set_rollback(True)
+
+
+class ArsipPeriodeTests(TestCase):
+    def setUp(self):
+        self.lama = PeriodePKL.objects.create(
+            nama_periode="PKL 2020 Gasal", tahun_ajaran="2020/2021", semester="GASAL",
+            tanggal_mulai="2020-08-01", tanggal_selesai="2020-12-31", aktif=False,
+        )
+        self.berjalan = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal", tahun_ajaran="2025/2026", semester="GASAL",
+            tanggal_mulai="2025-08-01", tanggal_selesai="2025-12-31",
+        )
+        mitra = Mitra.objects.create(nama="Mitra Arsip")
+        self.pembimbing = Dosen.objects.create(nidn="0801", nama="Pembimbing")
+        self.penguji = [Dosen.objects.create(nidn=f"081{i}", nama=f"Penguji {i}") for i in range(2)]
+        self.mhs = Mahasiswa.objects.create(
+            nim="2008108001", nama="Alumni", angkatan=2017, dosen_pembimbing=self.pembimbing,
+        )
+
+        for periode in (self.lama, self.berjalan):
+            PendaftaranPKL.objects.create(
+                mahasiswa=self.mhs, periode=periode, mitra=mitra, jenis_pkl="MANDIRI",
+                dosen_pembimbing=self.pembimbing,
+            )
+            LogbookEntry.objects.create(
+                mahasiswa=self.mhs, periode=periode, tanggal=periode.tanggal_mulai, aktivitas="Kerja",
+            )
+        self.logbook_lama = LogbookEntry.objects.get(periode=self.lama)
+        self.logbook_lama.dibuat_pada = datetime.datetime(2020, 8, 2, tzinfo=datetime.timezone.utc)
+        LogbookEntry.objects.bulk_update([self.logbook_lama], ["dibuat_pada"])
+        GuidanceSession.objects.create(
+            mahasiswa=self.mhs, periode=self.lama, tanggal="2020-09-01", topik="t", ringkasan_diskusi="r",
+        )
+
+        self.seminar = SeminarHasilPKL.objects.create(
+            mahasiswa=self.mhs, periode=self.lama, dosen_pembimbing=self.pembimbing,
+            judul_laporan="Laporan Lama", jadwal="2020-12-01T08:00+07:00", status="SELESAI",
+        )
+        self.seminar.atur_panel(self.penguji)
+        for dosen in self.penguji:
+            SeminarAssessment.objects.create(
+                seminar=self.seminar, penguji=dosen, role="PENGUJI", pemahaman_materi=80,
+                kualitas_laporan=80, presentasi=80, penguasaan_lapangan=80, sikap_profesional=80,
+            )
+        self.seminar.refresh_from_db()
+
+    def test_arsip_lalu_pulihkan_mengembalikan_data_utuh(self):
+        self.assertEqual(list(periode_siap_arsip()), [self.lama])
+        tombstone_awal = ChangeTombstone.objects.count()
+        call_command("arsipkan_periode", stdout=io.StringIO())
+        # pengarsipan bukan penghapusan: change feed tidak menerima tombstone
+        self.assertEqual(ChangeTombstone.objects.count(), tombstone_awal)
+
+        self.lama.refresh_from_db()
+        self.assertIsNotNone(self.lama.diarsipkan_pada)
+        self.assertEqual(ArsipBaris.objects.filter(periode=self.lama).count(), 4)
+        self.assertFalse(SeminarHasilPKL.objects.exists())
+        self.assertFalse(SeminarPenguji.objects.exists())
+        self.assertEqual(LogbookEntry.objects.get().periode, self.berjalan)
+        self.assertEqual(PendaftaranPKL.objects.get().periode, self.berjalan)
+
+        call_command("pulihkan_periode", self.lama.pk, stdout=io.StringIO())
+
+        self.lama.refresh_from_db()
+        self.assertIsNone(self.lama.diarsipkan_pada)
+        self.assertFalse(ArsipBaris.objects.exists())
+        seminar = SeminarHasilPKL.objects.dengan_panel().get(pk=self.seminar.pk)
+        self.assertEqual(seminar.nilai_akhir, self.seminar.nilai_akhir)
+        self.assertEqual([slot.dosen_id for slot in seminar.panel()], [d.pk for d in self.penguji])
+        self.assertEqual(SeminarAssessment.objects.filter(seminar=seminar).count(), 2)
+        self.assertEqual(GuidanceSession.objects.get().periode, self.lama)
+        self.assertEqual(
+            LogbookEntry.objects.get(pk=self.logbook_lama.pk).dibuat_pada, self.logbook_lama.dibuat_pada
+        )
+
+    def test_periode_arsip_tetap_terbaca_read_only(self):
+        arsipkan_periode(self.lama)
+        self.lama.refresh_from_db()
+
+        qs = SeminarHasilPKL.objects.select_related("mahasiswa", "dosen_pembimbing").order_by("jadwal")
+        # arsip + dosen panel + penilai + mahasiswa + pembimbing, berapa pun jumlah seminarnya
+        with self.assertNumQueries(5):
+            seminars = baca_periode(qs, self.lama, status="SELESAI")
+            seminar = seminars[0]
+            self.assertTrue(seminar.diarsipkan)
+            self.assertEqual(seminar.mahasiswa.nama, "Alumni")
+            self.assertEqual([s.dosen.nama for s in seminar.panel()], ["Penguji 0", "Penguji 1"])
+            self.assertEqual(len(seminar.penilaian_penguji()), 2)
+        self.assertEqual(baca_periode(qs, self.lama, status="DIKIRIM"), [])
+        # periode berjalan tetap memakai queryset biasa
+        self.assertFalse(baca_periode(qs, self.berjalan).exists())
+
+        user = User.objects.create_user(username="koor_arsip", password="test")
+
+        Dosen.objects.create(user=user, nidn="0899", nama="Koor", is_koordinator_pkl=True)
+        self.client.force_login(user)
+        response = self.client.get(f"/koor/seminar/?periode={self.lama.pk}")
+        self.assertContains(response, "Laporan Lama")
+        self.assertContains(response, "Arsip")
+        response = self.client.get(f"/koor/pendaftaran/?periode={self.lama.pk}")
+        self.assertContains(response, "Alumni")
+
+
+class PeriodeBerjalanTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.lama = PeriodePKL.objects.create(
+            nama_periode="PKL 2024 Gasal", tahun_ajaran="2024/2025", semester="GASAL",
+            tanggal_mulai="2024-08-01", tanggal_selesai="2024-12-31",
+        )
+        self.berjalan = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal", tahun_ajaran="2025/2026", semester="GASAL",
+            tanggal_mulai="2025-08-01", tanggal_selesai="2025-12-31",
+        )
+        self.dosen = Dosen.objects.create(
+            user=User.objects.create_user(username="dosen_periode", password="test"),
+            nidn="0901", nama="Pembimbing",
+        )
+        mhs = Mahasiswa.objects.create(nim="2008109001", nama="Mhs", angkatan=2022, dosen_pembimbing=self.dosen)
+        for periode, topik in ((self.lama, "Topik Lama"), (self.berjalan, "Topik Baru")):
+            GuidanceSession.objects.create(
+                mahasiswa=mhs, periode=periode, tanggal=periode.tanggal_mulai, topik=topik,
+                ringkasan_diskusi="r",
+            )
+
+    def test_periode_berjalan_di_cache_dan_diperbarui_saat_periode_berubah(self):
+        self.assertEqual(periode_berjalan(), self.berjalan)
+        with self.assertNumQueries(0):
+            self.assertEqual(periode_berjalan(), self.berjalan)
+
+        self.berjalan.aktif = False
+        self.berjalan.save()
+        self.assertEqual(periode_berjalan(), self.lama)
+        self.lama.delete()
+        self.assertIsNone(periode_berjalan())
+
+    def test_manager_berjalan_dan_untuk_periode(self):
+        self.assertEqual(
+            list(GuidanceSession.berjalan.values_list("topik", flat=True)), ["Topik Baru"]
+        )
+        self.assertEqual(GuidanceSession.objects.untuk_periode(self.lama).get().topik, "Topik Lama")
+        self.assertEqual(GuidanceSession.objects.untuk_periode(None).count(), 2)
+        # manager berjalan tetap membawa lapisan akses baris
+        self.assertEqual(GuidanceSession.berjalan.visible_to(self.dosen.user).count(), 1)
+
+    def test_daftar_bimbingan_bawaan_hanya_periode_berjalan(self):
+        self.client.force_login(self.dosen.user)
+
+        response = self.client.get("/dosen/bimbingan/")
+        self.assertContains(response, "Topik Baru")
+        self.assertNotContains(response, "Topik Lama")
+
+        response = self.client.get("/dosen/bimbingan/?periode=semua")
+        self.assertContains(response, "Topik Lama")
+        response = self.client.get(f"/dosen/bimbingan/?periode={self.lama.pk}")
+        self.assertContains(response, "Topik Lama")
+        self.assertNotContains(response, "Topik Baru")
@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import Notifikasi
+
+
+@admin.register(Notifikasi)
+class NotifikasiAdmin(admin.ModelAdmin):
+    list_display = ("email", "jenis", "judul", "dibuat_pada", "dikirim_pada")
+    list_filter = ("jenis", ("dikirim_pada", admin.EmptyFieldListFilter))
+    search_fields = ("email", "nama", "judul")
+    readonly_fields = ("dibuat_pada", "dikirim_pada")
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class NotificationsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'notifications'
+    verbose_name = "Notifikasi"
+
+    def ready(self):
+        # event logbook/seminar/pendaftaran -> outbox
+        from . import signals  # noqa: F401
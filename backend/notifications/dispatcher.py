@@ -0,0 +1,75 @@
+# backend/notifications/dispatcher.py
+"""
+Pengirim digest notifikasi.
+
+Semua notifikasi tertunda dikelompokkan per alamat email menjadi satu
+email ringkasan, lalu seluruh email dikirim lewat SATU koneksi backend
+(``send_messages``), sehingga 500 penerima = 500 email dalam satu sesi
+SMTP, bukan 500+ handshake. Tiap batch diklaim (``dikirim_pada`` diisi)
+sebelum dikirim, sehingga run yang tumpang tindih tidak mengirim ulang.
+"""
+
+from itertools import groupby
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import Notifikasi
+
+
+def _digest(email: str, items: list) -> EmailMessage:
+    if len(items) == 1:
+        subject = f"[PKL Sains Data] {items[0].judul}"
+    else:
+        subject = f"[PKL Sains Data] {len(items)} pemberitahuan baru"
+    body = render_to_string(
+        "notifications/digest.txt", {"nama": items[0].nama, "items": items}
+    )
+    return EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [email])
+
+
+def kirim_digest(batch_size: int | None = None) -> dict:
+    """Kirim semua notifikasi tertunda; kembalikan jumlah email & notifikasi."""
+
+    batch_size = batch_size or settings.NOTIF_BATCH_SIZE
+    total_email = total_notif = 0
+
+    connection = get_connection()
+    connection.open()
+    try:
+        while True:
+            # klaim dulu, baru kirim: baris yang sudah ditandai tidak terbaca
+            # oleh run lain (cron + manual, atau dua worker) yang berjalan bersamaan
+            with transaction.atomic():
+                pending = list(
+                    Notifikasi.objects.select_for_update(skip_locked=True)
+                    .filter(dikirim_pada__isnull=True)
+                    .order_by("email", "dibuat_pada", "id")[:batch_size]
+                )
+                if not pending:
+                    break
+
+                per_email = [(email, list(items)) for email, items in groupby(pending, key=lambda n: n.email)]
+                if len(pending) == batch_size and len(per_email) > 1:
+                    # penerima terakhir mungkin terpotong batch: kirim di putaran berikutnya
+                    per_email.pop()
+
+                klaim = Notifikasi.objects.filter(pk__in=[n.pk for _, items in per_email for n in items])
+                klaim.update(dikirim_pada=timezone.now())
+
+            try:
+                connection.send_messages([_digest(email, items) for email, items in per_email])
+            except Exception:
+                # gagal kirim: lepas klaim agar dicoba lagi pada run berikutnya
+                klaim.update(dikirim_pada=None)
+                raise
+
+            total_email += len(per_email)
+            total_notif += sum(len(items) for _, items in per_email)
+    finally:
+        connection.close()
+
+    return {"email": total_email, "notifikasi": total_notif}
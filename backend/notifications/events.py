@@ -0,0 +1,52 @@
+# backend/notifications/events.py
+"""Pembentuk notifikasi per jenis event (dipakai sinyal dan aksi massal)."""
+
+from django.utils import formats
+
+from .outbox import pesan_untuk
+
+
+def logbook_direview(entry) -> list:
+    judul = f"Logbook {formats.date_format(entry.tanggal, 'd M Y')}: {entry.get_status_display()}"
+    return [pesan_untuk(entry.mahasiswa, "LOGBOOK_REVIEW", judul, entry.catatan_dosen or "")]
+
+
+def logbook_direview_massal(entries) -> list:
+    """Satu notifikasi ringkasan untuk beberapa logbook satu mahasiswa yang direview sekaligus."""
+
+    if len(entries) == 1:
+        return logbook_direview(entries[0])
+    entry = entries[0]
+    judul = f"{len(entries)} logbook: {entry.get_status_display()}"
+    tanggal = ", ".join(formats.date_format(e.tanggal, "d M Y") for e in sorted(entries, key=lambda e: e.tanggal))
+    pesan = f"Tanggal: {tanggal}."
+    if entry.catatan_dosen:
+        pesan += f"\n\n{entry.catatan_dosen}"
+    return [pesan_untuk(entry.mahasiswa, "LOGBOOK_REVIEW", judul, pesan)]
+
+
+def seminar_dijadwalkan(seminar) -> list:
+    jadwal = formats.date_format(seminar.jadwal, "d M Y H:i") if seminar.jadwal else "-"
+    judul = f"Seminar hasil PKL {seminar.mahasiswa.nama} dijadwalkan"
+    pesan = f"Jadwal: {jadwal}, ruang: {seminar.ruang or '-'}."
+    panel = [slot.dosen for slot in seminar.panel_penguji.select_related("dosen")]
+    penerima = [seminar.mahasiswa, seminar.dosen_pembimbing, *panel]
+    return [pesan_untuk(profil, "SEMINAR_JADWAL", judul, pesan) for profil in penerima if profil]
+
+
+def pendaftaran_diproses(pendaftaran) -> list:
+    judul = f"Pendaftaran PKL Anda {pendaftaran.get_status_display().lower()}"
+    return [
+        pesan_untuk(
+            pendaftaran.mahasiswa, "PENDAFTARAN_STATUS", judul, pendaftaran.catatan_koordinator or ""
+        )
+    ]
+
+
+def pembimbing_ditetapkan(pendaftaran) -> list:
+    dosen = pendaftaran.dosen_pembimbing
+    mahasiswa = pendaftaran.mahasiswa
+    return [
+        pesan_untuk(mahasiswa, "PEMBIMBING", f"Dosen pembimbing PKL Anda: {dosen.nama}"),
+        pesan_untuk(dosen, "PEMBIMBING", f"Mahasiswa bimbingan baru: {mahasiswa.nama} ({mahasiswa.nim})"),
+    ]
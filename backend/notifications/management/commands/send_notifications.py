@@ -0,0 +1,17 @@
+# backend/notifications/management/commands/send_notifications.py
+from django.core.management.base import BaseCommand
+
+from notifications.dispatcher import kirim_digest
+
+
+class Command(BaseCommand):
+    help = "Kirim semua notifikasi tertunda sebagai digest per penerima (tanpa worker)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        result = kirim_digest(options["batch_size"])
+        self.stdout.write(
+            f"{result['email']} email digest terkirim ({result['notifikasi']} notifikasi)."
+        )
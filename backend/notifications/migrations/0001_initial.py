@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notifikasi',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('email', models.EmailField(max_length=254)),
+                ('nama', models.CharField(blank=True, max_length=100)),
+                ('jenis', models.CharField(choices=[('LOGBOOK_REVIEW', 'Review logbook'), ('SEMINAR_JADWAL', 'Jadwal seminar'), ('PENDAFTARAN_STATUS', 'Status pendaftaran PKL'), ('PEMBIMBING', 'Penetapan dosen pembimbing')], max_length=30)),
+                ('judul', models.CharField(max_length=200)),
+                ('pesan', models.TextField(blank=True)),
+                ('dibuat_pada', models.DateTimeField(auto_now_add=True)),
+                ('dikirim_pada', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Notifikasi',
+                'verbose_name_plural': 'Notifikasi',
+                'ordering': ['-dibuat_pada'],
+                'indexes': [models.Index(fields=['dikirim_pada', 'email'], name='notificatio_dikirim_6aa8df_idx')],
+            },
+        ),
+    ]
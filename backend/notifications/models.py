@@ -0,0 +1,38 @@
+from django.db import models
+
+
+class Notifikasi(models.Model):
+    """
+    Outbox notifikasi email.
+
+    Baris dibuat oleh sinyal/aksi massal, lalu dikirim oleh dispatcher
+    (notifications.dispatcher) sebagai satu email ringkasan per penerima.
+    """
+
+    JENIS_CHOICES = [
+        ("LOGBOOK_REVIEW", "Review logbook"),
+        ("SEMINAR_JADWAL", "Jadwal seminar"),
+        ("PENDAFTARAN_STATUS", "Status pendaftaran PKL"),
+        ("PEMBIMBING", "Penetapan dosen pembimbing"),
+    ]
+
+    email = models.EmailField()
+    nama = models.CharField(max_length=100, blank=True)
+    jenis = models.CharField(max_length=30, choices=JENIS_CHOICES)
+    judul = models.CharField(max_length=200)
+    pesan = models.TextField(blank=True)
+
+    dibuat_pada = models.DateTimeField(auto_now_add=True)
+    dikirim_pada = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Notifikasi"
+        verbose_name_plural = "Notifikasi"
+        ordering = ["-dibuat_pada"]
+        indexes = [
+            # dispatcher: dikirim_pada IS NULL, dikelompokkan per email
+            models.Index(fields=["dikirim_pada", "email"]),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - representasi sederhana
+        return f"{self.email}: {self.judul}"
@@ -0,0 +1,61 @@
+# backend/notifications/outbox.py
+"""
+Pencatatan notifikasi ke outbox.
+
+Tidak ada email yang dikirim di sini: baris ``Notifikasi`` dibuat, lalu
+(setelah transaksi commit) satu job ``notifications.kirim_digest``
+dijadwalkan dengan jeda ``NOTIF_DIGEST_DELAY`` agar event yang berdekatan
+terkumpul menjadi satu email ringkasan per penerima.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Notifikasi
+
+
+def alamat_email(profil) -> str:
+    """Email profil Dosen/Mahasiswa, atau email akun login-nya."""
+
+    if profil is None:
+        return ""
+    if profil.email:
+        return profil.email
+    user = profil.user if profil.user_id else None
+    return user.email if user is not None else ""
+
+
+def pesan_untuk(profil, jenis: str, judul: str, pesan: str = "") -> Notifikasi | None:
+    """Objek Notifikasi (belum disimpan) untuk profil, atau None jika tanpa email."""
+
+    email = alamat_email(profil)
+    if not email:
+        return None
+    return Notifikasi(email=email, nama=profil.nama, jenis=jenis, judul=judul, pesan=pesan)
+
+
+def catat(items) -> int:
+    """Simpan notifikasi (None diabaikan) dan jadwalkan pengiriman digest."""
+
+    items = [item for item in items if item is not None]
+    if not items:
+        return 0
+    Notifikasi.objects.bulk_create(items, batch_size=500)
+    transaction.on_commit(jadwalkan_pengiriman)
+    return len(items)
+
+
+def jadwalkan_pengiriman() -> None:
+    from jobs.models import Job
+    from jobs.registry import enqueue
+
+    # satu job antre sudah cukup: ia akan mengirim semua yang tertunda
+    if Job.objects.filter(task="notifications.kirim_digest", status="ANTRI").exists():
+        return
+    enqueue(
+        "notifications.kirim_digest",
+        run_at=timezone.now() + timedelta(seconds=settings.NOTIF_DIGEST_DELAY),
+    )
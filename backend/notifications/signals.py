@@ -0,0 +1,68 @@
+# backend/notifications/signals.py
+
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from logbook.models import LogbookEntry
+from masterdata.models import PendaftaranPKL, SeminarHasilPKL
+
+from . import events
+from .outbox import catat
+
+
+_PANTAU = {
+    LogbookEntry: ("status", "catatan_dosen"),
+    SeminarHasilPKL: ("status", "jadwal", "ruang"),
+    PendaftaranPKL: ("status", "dosen_pembimbing_id"),
+}
+
+
+def _nilai_lama(instance) -> dict:
+    return getattr(instance, "_notif_lama", None) or {}
+
+
+@receiver(pre_save, sender=LogbookEntry)
+@receiver(pre_save, sender=SeminarHasilPKL)
+@receiver(pre_save, sender=PendaftaranPKL)
+def ingat_nilai_lama(sender, instance, update_fields=None, **kwargs):
+    """Simpan nilai field yang dipantau sebelum disimpan (untuk deteksi perubahan)."""
+    fields = _PANTAU[sender]
+    instance._notif_lama = None
+    if instance.pk is None:
+        return
+    if update_fields is not None and not {f.removesuffix("_id") for f in fields} & set(update_fields):
+        return
+    instance._notif_lama = sender.objects.filter(pk=instance.pk).values(*fields).first()
+
+
+@receiver(post_save, sender=LogbookEntry)
+def notifikasi_review_logbook(sender, instance, created, **kwargs):
+    lama = _nilai_lama(instance)
+    if instance.status not in {"REVISI", "DISETUJUI"} or not lama:
+        return
+    if lama["status"] != instance.status or lama["catatan_dosen"] != instance.catatan_dosen:
+        catat(events.logbook_direview(instance))
+
+
+@receiver(post_save, sender=SeminarHasilPKL)
+def notifikasi_jadwal_seminar(sender, instance, created, **kwargs):
+    if instance.status != "DIJADWALKAN":
+        return
+    lama = _nilai_lama(instance)
+    if created or not lama or any(
+        lama[field] != getattr(instance, field) for field in ("status", "jadwal", "ruang")
+    ):
+        catat(events.seminar_dijadwalkan(instance))
+
+
+@receiver(post_save, sender=PendaftaranPKL)
+def notifikasi_pendaftaran(sender, instance, created, **kwargs):
+    lama = _nilai_lama(instance)
+    if not lama:
+        return
+    items = []
+    if instance.status in {"DISETUJUI", "DITOLAK"} and lama["status"] != instance.status:
+        items += events.pendaftaran_diproses(instance)
+    if instance.dosen_pembimbing_id and lama["dosen_pembimbing_id"] != instance.dosen_pembimbing_id:
+        items += events.pembimbing_ditetapkan(instance)
+    catat(items)
@@ -0,0 +1,10 @@
+# backend/notifications/tasks.py
+
+from jobs.registry import task
+
+from .dispatcher import kirim_digest
+
+
+@task("notifications.kirim_digest")
+def kirim_digest_task() -> dict:
+    return kirim_digest()
@@ -0,0 +1,123 @@
+import datetime
+from unittest import mock
+
+from django.contrib.admin.sites import site
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.test import TestCase
+
+from jobs.models import Job
+from logbook.models import LogbookEntry
+from masterdata.models import Dosen, Mahasiswa, Mitra, PendaftaranPKL, PeriodePKL
+from . import dispatcher
+from .dispatcher import kirim_digest
+from .models import Notifikasi
+
+
+class NotifikasiDigestTests(TestCase):
+    def setUp(self):
+        self.dosen = Dosen.objects.create(nidn="5050", nama="Dosen Notif", email="dosen@example.com")
+        self.periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal",
+            tahun_ajaran="2025/2026",
+            semester="GASAL",
+            tanggal_mulai="2025-01-01",
+            tanggal_selesai="2025-06-30",
+        )
+        self.mitra = Mitra.objects.create(nama="Mitra Notif")
+        self.mahasiswa = [
+            Mahasiswa.objects.create(
+                user=User.objects.create_user(username=f"mhs_n{i}", email=f"mhs{i}@example.com"),
+                nim=f"2008103000{i}",
+                nama=f"Mhs {i}",
+                angkatan=2022,
+                dosen_pembimbing=self.dosen,
+            )
+            for i in range(3)
+        ]
+
+    def test_review_logbook_masuk_outbox_dan_menjadwalkan_digest(self):
+        entry = LogbookEntry.objects.create(
+            mahasiswa=self.mahasiswa[0],
+            dosen_pembimbing=self.dosen,
+            periode=self.periode,
+            tanggal=datetime.date(2025, 2, 3),
+            aktivitas="Cleaning data",
+            status="SUBMIT",
+        )
+        self.assertFalse(Notifikasi.objects.exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            entry.status = "REVISI"
+            entry.catatan_dosen = "Lengkapi output."
+            entry.save()
+
+        notif = Notifikasi.objects.get()
+        self.assertEqual(notif.email, "mhs0@example.com")
+        self.assertEqual(notif.jenis, "LOGBOOK_REVIEW")
+        self.assertTrue(Job.objects.filter(task="notifications.kirim_digest", status="ANTRI").exists())
+
+        # simpan ulang tanpa perubahan review: tidak ada notifikasi baru
+        entry.save()
+        self.assertEqual(Notifikasi.objects.count(), 1)
+
+    def test_persetujuan_massal_satu_digest_per_penerima_satu_koneksi(self):
+        daftar = [
+            PendaftaranPKL.objects.create(
+                mahasiswa=mhs,
+                periode=self.periode,
+                mitra=self.mitra,
+                jenis_pkl="INDIVIDU",
+                surat_penerimaan="surat_penerimaan/x.pdf",
+                dosen_pembimbing=self.dosen,
+            )
+            for mhs in self.mahasiswa
+        ]
+        model_admin = site._registry[PendaftaranPKL]
+        request = mock.Mock()
+        with mock.patch.object(model_admin, "message_user"):
+            model_admin.setujui_pendaftaran(request, PendaftaranPKL.objects.filter(pk__in=[p.pk for p in daftar]))
+        # mahasiswa 0 juga mendapat notifikasi lain sebelum digest dikirim
+        Notifikasi.objects.create(email="mhs0@example.com", jenis="PEMBIMBING", judul="Info lain")
+
+        with mock.patch.object(dispatcher, "get_connection", wraps=dispatcher.get_connection) as conn:
+            result = kirim_digest()
+
+        conn.assert_called_once()
+        self.assertEqual(result, {"email": 3, "notifikasi": 4})
+        self.assertEqual(len(mail.outbox), 3)
+        digest_mhs0 = next(m for m in mail.outbox if m.to == ["mhs0@example.com"])
+        self.assertIn("2 pemberitahuan", digest_mhs0.subject)
+        self.assertFalse(Notifikasi.objects.filter(dikirim_pada__isnull=True).exists())
+        self.assertEqual(Mahasiswa.objects.filter(status_pkl="SEDANG").count(), 3)
+
+    def test_run_kedua_yang_tumpang_tindih_tidak_mengirim_ulang(self):
+        for mhs in self.mahasiswa[:2]:
+            Notifikasi.objects.create(email=mhs.user.email, jenis="PEMBIMBING", judul="Info")
+        kedua = []
+        kirim_asli = locmem.EmailBackend.send_messages
+
+        def kirim(backend, messages):
+            if not kedua:
+                # run lain dimulai saat run pertama sedang mengirim
+                kedua.append(None)
+                kedua[0] = kirim_digest()
+            return kirim_asli(backend, messages)
+
+        with mock.patch.object(locmem.EmailBackend, "send_messages", autospec=True, side_effect=kirim):
+            pertama = kirim_digest()
+
+        self.assertEqual(pertama, {"email": 2, "notifikasi": 2})
+        self.assertEqual(kedua, [{"email": 0, "notifikasi": 0}])
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_klaim_dilepas_bila_pengiriman_gagal(self):
+        Notifikasi.objects.create(email="mhs0@example.com", jenis="PEMBIMBING", judul="Info")
+
+        with mock.patch.object(locmem.EmailBackend, "send_messages", side_effect=ConnectionError):
+            with self.assertRaises(ConnectionError):
+                kirim_digest()
+
+        self.assertTrue(Notifikasi.objects.filter(dikirim_pada__isnull=True).exists())
+        self.assertEqual(kirim_digest(), {"email": 1, "notifikasi": 1})
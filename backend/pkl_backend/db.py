@@ -0,0 +1,53 @@
+"""Tuning koneksi database (profil PRAGMA SQLite)."""
+
+import re
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+# Hanya PRAGMA yang aman diatur per koneksi; nilai dari environment
+# tidak boleh dipakai untuk menyisipkan SQL lain.
+ALLOWED_SQLITE_PRAGMAS = (
+    "journal_mode",
+    "synchronous",
+    "busy_timeout",
+    "mmap_size",
+    "cache_size",
+    "temp_store",
+)
+_PRAGMA_VALUE_RE = re.compile(r"^-?\w+$")
+
+
+def sqlite_pragma_statements(pragmas: dict) -> list[str]:
+    statements = []
+    for name in ALLOWED_SQLITE_PRAGMAS:
+        value = pragmas.get(name)
+        if value in (None, ""):
+            continue
+        if not _PRAGMA_VALUE_RE.match(str(value)):
+            raise ValueError(f"Nilai PRAGMA {name} tidak valid: {value!r}")
+        statements.append(f"PRAGMA {name} = {value}")
+    return statements
+
+
+def apply_sqlite_pragmas(cursor, pragmas: dict) -> None:
+    """Jalankan profil PRAGMA pada cursor DB-API sqlite3."""
+    for statement in sqlite_pragma_statements(pragmas):
+        cursor.execute(statement)
+
+
+@receiver(connection_created, dispatch_uid="pkl_backend_sqlite_pragmas")
+def apply_sqlite_profile(sender, connection, **kwargs):
+    """Terapkan settings.SQLITE_PRAGMAS setiap kali koneksi SQLite baru dibuka."""
+    if connection.vendor != "sqlite":
+        return
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", None)
+    if not pragmas:
+        return
+    cursor = connection.connection.cursor()
+    try:
+        apply_sqlite_pragmas(cursor, pragmas)
+    finally:
+        cursor.close()
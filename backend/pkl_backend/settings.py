@@ -76,7 +76,9 @@ INSTALLED_APPS = [
     'logbook',
     'guidance',
     'portal',
-    
+    'jobs',
+    'notifications',
+    'search',
 ]
 
 MIDDLEWARE = [
@@ -85,31 +87,53 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'portal.middleware.PklRoleMiddleware',
+    'portal.profiling.TemplateProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
 ROOT_URLCONF = 'pkl_backend.urls'
 
+# Template dikompilasi sekali lalu di-cache (cached.Loader) di semua environment,
+# kecuali saat autoreload template aktif (default: mengikuti DEBUG).
+TEMPLATE_AUTORELOAD = os.getenv("DJANGO_TEMPLATE_AUTORELOAD", str(DEBUG)).lower() == "true"
+_template_loaders = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+if not TEMPLATE_AUTORELOAD:
+    _template_loaders = [("django.template.loaders.cached.Loader", _template_loaders)]
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR.parent / "templates"],  # <— tambahkan ini
-        "APP_DIRS": True,
         "OPTIONS": {
+            "loaders": _template_loaders,
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
+                "portal.context_processors.portal_cache",
             ],
         },
     },
 ]
 
+# Profiling render template per request (lihat portal/profiling.py).
+# Hasil: header Server-Timing + log "portal.profiling". Jangan aktifkan di production.
+TEMPLATE_PROFILING = os.getenv("DJANGO_TEMPLATE_PROFILING", "False").lower() == "true"
+
 
 
 WSGI_APPLICATION = 'pkl_backend.wsgi.application'
+ASGI_APPLICATION = 'pkl_backend.asgi.application'
+
+# Dashboard dosen/koordinator/mahasiswa memakai view async (portal/views_async.py).
+# Aktifkan saat dijalankan di server ASGI, mis. `uvicorn pkl_backend.asgi:application`.
+PKL_ASYNC_DASHBOARDS = os.getenv("DJANGO_ASYNC_DASHBOARDS", "False").lower() == "true"
 
 
 # Database
@@ -117,14 +141,57 @@ WSGI_APPLICATION = 'pkl_backend.wsgi.application'
 
 DB_ENGINE = os.getenv("DJANGO_DB_ENGINE", "django.db.backends.sqlite3")
 
+# Profil PRAGMA SQLite yang diterapkan di setiap koneksi baru (lihat pkl_backend/db.py).
+# WAL + busy_timeout mencegah "database is locked" saat banyak logbook dikirim bersamaan.
+# Set DJANGO_SQLITE_PRAGMAS=off untuk kembali ke perilaku bawaan SQLite.
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("DJANGO_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+if os.getenv("DJANGO_SQLITE_PRAGMAS", "on").lower() in ("off", "false", "0"):
+    SQLITE_PRAGMAS: dict[str, str | int] = {}
+else:
+    SQLITE_PRAGMAS = {
+        "journal_mode": os.getenv("DJANGO_SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.getenv("DJANGO_SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+        "mmap_size": int(os.getenv("DJANGO_SQLITE_MMAP_SIZE", str(128 * 1024 * 1024))),
+        # nilai negatif = ukuran dalam KiB (di sini ~20 MB)
+        "cache_size": int(os.getenv("DJANGO_SQLITE_CACHE_SIZE", "-20000")),
+        "temp_store": os.getenv("DJANGO_SQLITE_TEMP_STORE", "MEMORY"),
+    }
+
 if DB_ENGINE == "django.db.backends.sqlite3":
     DATABASES = {
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / os.getenv("DJANGO_DB_NAME", "db.sqlite3"),
+            "OPTIONS": {
+                # BEGIN IMMEDIATE: kunci tulis diambil di awal transaksi sehingga
+                # transaksi paralel menunggu (busy_timeout), bukan gagal saat upgrade kunci.
+                "transaction_mode": os.getenv("DJANGO_SQLITE_TRANSACTION_MODE", "IMMEDIATE"),
+                "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+            },
         }
     }
 else:
+    # Koneksi persisten: default 60 detik di production/staging, 0 (tutup per request)
+    # di development supaya perubahan skema/DB lokal langsung terasa.
+    DB_CONN_MAX_AGE = int(
+        os.getenv("DJANGO_DB_CONN_MAX_AGE", "0" if ENVIRONMENT == "development" else "60")
+    )
+    DB_CONN_HEALTH_CHECKS = os.getenv(
+        "DJANGO_DB_CONN_HEALTH_CHECKS", "False" if ENVIRONMENT == "development" else "True"
+    ).lower() == "true"
+
+    db_options: dict = {}
+    # Connection pool psycopg (butuh `pip install "psycopg[pool]"`). Pool dan
+    # koneksi persisten saling eksklusif di Django, jadi CONN_MAX_AGE dipaksa 0.
+    if os.getenv("DJANGO_DB_POOL", "False").lower() == "true":
+        db_options["pool"] = {
+            "min_size": int(os.getenv("DJANGO_DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DJANGO_DB_POOL_MAX_SIZE", "10")),
+            "timeout": float(os.getenv("DJANGO_DB_POOL_TIMEOUT", "10")),
+        }
+        DB_CONN_MAX_AGE = 0
+
     DATABASES = {
         "default": {
             "ENGINE": DB_ENGINE,
@@ -133,11 +200,66 @@ else:
             "PASSWORD": os.getenv("DJANGO_DB_PASSWORD", ""),
             "HOST": os.getenv("DJANGO_DB_HOST", "localhost"),
             "PORT": os.getenv("DJANGO_DB_PORT", "5432"),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": DB_CONN_HEALTH_CHECKS,
+            "OPTIONS": db_options,
         }
     }
 
 
 
+# Cache & session
+# Default LocMemCache hanya cocok untuk satu proses. Untuk deployment multi-worker
+# gunakan cache bersama, mis. FileBasedCache (LOCATION=/var/tmp/pkl_cache) atau
+# DatabaseCache (LOCATION=nama_tabel, lalu `manage.py createcachetable`).
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", "pkl-sainsdata"),
+    }
+}
+
+# cached_db: sesi dibaca dari cache, DB hanya sebagai cadangan/penyimpanan tetap.
+SESSION_ENGINE = os.getenv(
+    "DJANGO_SESSION_ENGINE", "django.contrib.sessions.backends.cached_db"
+)
+
+# Lama cache peran (dosen/koordinator/mahasiswa) per user, dalam detik.
+PKL_ROLE_CACHE_TIMEOUT = int(os.getenv("PKL_ROLE_CACHE_TIMEOUT", "300"))
+
+# Lama cache fragmen template (navigasi, pengumuman, FAQ), dalam detik. Kunci
+# fragmen memuat versi data sehingga perubahan langsung terlihat.
+PKL_FRAGMENT_CACHE_TIMEOUT = int(os.getenv("PKL_FRAGMENT_CACHE_TIMEOUT", "86400"))
+
+# Antrean job berbasis database (app jobs, `manage.py runworker`).
+JOBS_WORKER_PROCESSES = int(os.getenv("JOBS_WORKER_PROCESSES", "2"))
+JOBS_POLL_INTERVAL = float(os.getenv("JOBS_POLL_INTERVAL", "1.0"))
+JOBS_MAX_ATTEMPTS = int(os.getenv("JOBS_MAX_ATTEMPTS", "3"))
+JOBS_RETRY_BACKOFF_BASE = int(os.getenv("JOBS_RETRY_BACKOFF_BASE", "10"))  # detik
+JOBS_RETRY_BACKOFF_MAX = int(os.getenv("JOBS_RETRY_BACKOFF_MAX", "3600"))
+# job BERJALAN lebih lama dari ini dianggap ditinggal worker yang mati
+JOBS_LOCK_TIMEOUT = int(os.getenv("JOBS_LOCK_TIMEOUT", "900"))
+
+# Email. Development: console (atau filebased + EMAIL_FILE_PATH); production: SMTP.
+# Notifikasi dikirim sebagai digest lewat satu koneksi (notifications.dispatcher).
+EMAIL_BACKEND = os.getenv("DJANGO_EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
+EMAIL_HOST = os.getenv("DJANGO_EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.getenv("DJANGO_EMAIL_PORT", "25"))
+EMAIL_HOST_USER = os.getenv("DJANGO_EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.getenv("DJANGO_EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = os.getenv("DJANGO_EMAIL_USE_TLS", "False").lower() == "true"
+EMAIL_TIMEOUT = int(os.getenv("DJANGO_EMAIL_TIMEOUT", "30"))
+EMAIL_FILE_PATH = os.getenv("DJANGO_EMAIL_FILE_PATH", str(BASE_DIR / "sent_emails"))
+DEFAULT_FROM_EMAIL = os.getenv("DJANGO_DEFAULT_FROM_EMAIL", "PKL Sains Data <noreply@localhost>")
+
+# Jeda (detik) sebelum digest dikirim, agar event berdekatan tergabung.
+NOTIF_DIGEST_DELAY = int(os.getenv("NOTIF_DIGEST_DELAY", "300"))
+# Jumlah notifikasi yang diproses per putaran dispatcher.
+NOTIF_BATCH_SIZE = int(os.getenv("NOTIF_BATCH_SIZE", "1000"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -169,6 +291,37 @@ USE_TZ = True
 SURAT_PENERIMAAN_MAX_SIZE_MB = float(
     os.getenv("SURAT_PENERIMAAN_MAX_SIZE_MB", "2")  # default 2 MB
 )
+LAPORAN_MAX_SIZE_MB = float(os.getenv("LAPORAN_MAX_SIZE_MB", "20"))
+
+# Penilaian seminar (masterdata/grading.py). Setelah mengubah tabel/bobot,
+# jalankan `python manage.py regrade_penilaian` untuk menghitung ulang data lama.
+# (batas bawah, huruf), urut dari tertinggi
+PKL_GRADE_BANDS = [
+    (81, "A"), (76, "A-"), (72, "B+"), (68, "B"), (64, "B-"), (58, "C+"),
+    (54, "C"), (50, "C-"), (46, "D+"), (42, "D"), (0, "E"),
+]
+# bobot per aspek; aspek yang tidak disebut berbobot 1
+PKL_ASPEK_BOBOT = {}
+# nilai akhir seminar = rata-rata berbobot dari rata-rata nilai tiap peran;
+# peran yang belum menilai diabaikan (bobot lainnya dinormalisasi ulang)
+PKL_NILAI_AKHIR_BOBOT = {"PENGUJI": 0.5, "PEMBIMBING": 0.5}
+# jumlah maksimal dosen penguji dalam satu panel seminar
+PKL_MAX_PENGUJI = int(os.getenv("PKL_MAX_PENGUJI", "3"))
+# periode nonaktif yang selesai lebih dari N hari lalu dipindah ke arsip
+# (python manage.py arsipkan_periode; dipulihkan dengan pulihkan_periode)
+PKL_ARSIP_RETENSI_HARI = int(os.getenv("PKL_ARSIP_RETENSI_HARI", "365"))
+
+# Unggahan di atas batas ini langsung di-stream ke file sementara di disk
+# (bukan ditahan di memori) sebelum disalin + di-hash oleh ContentAddressedStorage.
+FILE_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv("FILE_UPLOAD_MAX_MEMORY_SIZE", str(512 * 1024)))
+
+# Unggahan laporan bertahap (portal/views_upload.py): batas satu potongan, dan
+# sesi yang tidak disentuh selama N jam dibatalkan oleh gc_uploads.
+PKL_UPLOAD_CHUNK_MAX_MB = float(os.getenv("PKL_UPLOAD_CHUNK_MAX_MB", "5"))
+PKL_UPLOAD_EXPIRY_HOURS = int(os.getenv("PKL_UPLOAD_EXPIRY_HOURS", "24"))
+
+# Kiriman logbook massal/offline (mhs/logbook/batch/): jumlah entri maksimal per request.
+PKL_LOGBOOK_BATCH_MAX = int(os.getenv("PKL_LOGBOOK_BATCH_MAX", "100"))
 
 
 
@@ -186,3 +339,24 @@ LOGIN_URL = "/login/"
 LOGIN_REDIRECT_URL = "/after-login/"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+
+# Berkas surat/laporan diunduh lewat view terproteksi (portal/views_files.py).
+# Di production, folder media TIDAK boleh dilayani publik oleh web server;
+# isi PKL_SENDFILE_BACKEND agar transfer byte ditangani nginx/Apache:
+#   "nginx"     -> X-Accel-Redirect ke PKL_SENDFILE_URL_PREFIX (location internal)
+#   "xsendfile" -> X-Sendfile (Apache mod_xsendfile / lighttpd)
+#   ""          -> FileResponse Django (mendukung Range), untuk development
+PKL_SENDFILE_BACKEND = os.getenv("PKL_SENDFILE_BACKEND", "")
+PKL_SENDFILE_URL_PREFIX = os.getenv("PKL_SENDFILE_URL_PREFIX", "/protected-media/")
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "portal.profiling": {"handlers": ["console"], "level": "INFO", "propagate": False},
+        "jobs": {"handlers": ["console"], "level": "INFO", "propagate": False},
+    },
+}
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class PortalConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'portal'
+
+    def ready(self):
+        # versi cache pengumuman/FAQ dinaikkan setiap kali datanya berubah
+        from . import signals  # noqa: F401
@@ -0,0 +1,57 @@
+# backend/portal/content.py
+"""
+Konten portal yang jarang berubah (pengumuman & FAQ), disajikan dari cache.
+
+Kunci cache memuat versi namespace (masterdata.cache_versions) yang dinaikkan
+oleh portal/signals.py setiap kali Announcement/FAQ disimpan atau dihapus.
+Pengumuman yang tampil juga bergantung pada tanggal, sehingga daftarnya
+di-cache per hari (bucket tanggal) dan kedaluwarsa saat tengah malam.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from masterdata.cache_versions import get_version
+
+from .models import Announcement, FrequentlyAskedQuestion
+
+
+def _detik_sampai_besok() -> int:
+    now = timezone.localtime()
+    besok = timezone.make_aware(datetime.combine(now.date() + timedelta(days=1), time.min))
+    return max(60, int((besok - now).total_seconds()))
+
+
+def published_announcements_query(today: date):
+    return Announcement.objects.filter(
+        Q(tanggal_selesai__isnull=True) | Q(tanggal_selesai__gte=today),
+        is_published=True,
+        tanggal_mulai__lte=today,
+    )
+
+
+def published_announcements(today: date | None = None) -> list:
+    """Pengumuman yang sedang tayang pada ``today`` (default: hari ini)."""
+
+    if today is None:
+        today = timezone.localdate()
+    key = f"pkl_pengumuman:{get_version('pengumuman')}:{today.isoformat()}"
+    items = cache.get(key)
+    if items is None:
+        items = list(published_announcements_query(today))
+        timeout = _detik_sampai_besok() if today == timezone.localdate() else settings.PKL_FRAGMENT_CACHE_TIMEOUT
+        cache.set(key, items, timeout)
+    return items
+
+
+def active_faqs() -> list:
+    key = f"pkl_faq:{get_version('faq')}"
+    items = cache.get(key)
+    if items is None:
+        items = list(FrequentlyAskedQuestion.objects.filter(aktif=True))
+        cache.set(key, items, settings.PKL_FRAGMENT_CACHE_TIMEOUT)
+    return items
@@ -0,0 +1,32 @@
+# backend/portal/context_processors.py
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+
+from masterdata.cache_versions import get_versions
+
+from .content import active_faqs, published_announcements
+
+
+def portal_cache(request):
+    """
+    Variabel untuk ``{% cache %}`` di template portal.
+
+    ``pkl_cache`` berisi versi tiap namespace + tanggal hari ini (bucket
+    pengumuman); semuanya lazy sehingga template yang tidak memakainya tidak
+    menyentuh cache sama sekali. ``pengumuman_aktif``/``faq_aktif`` berupa
+    callable dan baru dievaluasi jika fragmen-nya tidak ada di cache.
+    """
+
+    def _build():
+        versions = get_versions("peran", "pengumuman", "faq")
+        versions["hari_ini"] = timezone.localdate().isoformat()
+        versions["timeout"] = settings.PKL_FRAGMENT_CACHE_TIMEOUT
+        return versions
+
+    return {
+        "pkl_cache": SimpleLazyObject(_build),
+        "pengumuman_aktif": published_announcements,
+        "faq_aktif": active_faqs,
+    }
@@ -10,7 +10,12 @@ Form dikelompokkan per domain:
 """
 
 from .forms_base import DateInput, TimeInput
-from .forms_logbook import LogbookReviewForm, MahasiswaLogbookForm
+from .forms_logbook import (
+    LogbookBatchItemForm,
+    LogbookReviewForm,
+    LogbookReviewMassalForm,
+    MahasiswaLogbookForm,
+)
 from .forms_guidance import (
     GuidanceSessionCreateForm,
     MahasiswaGuidanceForm,
@@ -29,7 +34,9 @@ __all__ = [
     "DateInput",
     "TimeInput",
     # logbook
+    "LogbookBatchItemForm",
     "LogbookReviewForm",
+    "LogbookReviewMassalForm",
     "MahasiswaLogbookForm",
     # guidance
     "GuidanceSessionCreateForm",
@@ -18,6 +18,28 @@ class LogbookReviewForm(forms.ModelForm):
         }
 
 
+class LogbookReviewMassalForm(forms.Form):
+    """Satu keputusan review (setujui/revisi) untuk beberapa logbook SUBMIT sekaligus."""
+
+    logbook = forms.ModelMultipleChoiceField(
+        queryset=LogbookEntry.objects.none(),
+        error_messages={"required": "Pilih minimal satu logbook."},
+    )
+    status = forms.ChoiceField(
+        choices=[("DISETUJUI", "Setujui"), ("REVISI", "Minta revisi")],
+    )
+    catatan_dosen = forms.CharField(
+        required=False,
+        label="Catatan untuk semua logbook terpilih",
+        widget=forms.Textarea(attrs={"class": "form-control", "rows": 3}),
+    )
+
+    def __init__(self, *args, queryset, **kwargs):
+        super().__init__(*args, **kwargs)
+        # hanya antrean dosen ini: id milik dosen lain / yang sudah direview ditolak
+        self.fields["logbook"].queryset = queryset
+
+
 class MahasiswaLogbookForm(forms.ModelForm):
     class Meta:
         model = LogbookEntry
@@ -43,3 +65,12 @@ class MahasiswaLogbookForm(forms.ModelForm):
                 attrs={"class": "form-control", "rows": 3}
             ),
         }
+
+
+class LogbookBatchItemForm(MahasiswaLogbookForm):
+    """Satu entri kiriman massal (JSON); kunci idempotensi wajib dari klien."""
+
+    idempotency_key = forms.UUIDField()
+
+    class Meta(MahasiswaLogbookForm.Meta):
+        fields = [*MahasiswaLogbookForm.Meta.fields, "idempotency_key"]
@@ -1,6 +1,7 @@
 # backend/portal/forms_seminar.py
 
 from django import forms
+from django.conf import settings
 from django.core.exceptions import ValidationError
 
 from masterdata.models import SeminarHasilPKL, Dosen, SeminarAssessment
@@ -91,6 +92,24 @@ RUANG_SEMINAR_CHOICES = [
 ]
 
 
+class PanelPengujiField(forms.ModelMultipleChoiceField):
+    """Pilihan banyak dosen penguji; satu nilai tunggal (form lama) juga diterima."""
+
+    def clean(self, value):
+        if value not in self.empty_values and not isinstance(value, (list, tuple)):
+            value = [value]
+        return super().clean(value)
+
+
+def _raw_list(data, name) -> list[str]:
+    if hasattr(data, "getlist"):
+        values = data.getlist(name)
+    else:
+        values = data.get(name)
+        values = values if isinstance(values, (list, tuple)) else [values]
+    return [str(v) for v in values if v not in (None, "")]
+
+
 class SeminarPenjadwalanForm(forms.ModelForm):
     # Ruang dibatasi ke pilihan tertentu
     ruang = forms.ChoiceField(
@@ -99,32 +118,46 @@ class SeminarPenjadwalanForm(forms.ModelForm):
         label="Ruang Seminar",
         widget=forms.Select(attrs={"class": "form-select"}),
     )
+    # urutan pilihan = urutan slot (Penguji 1, Penguji 2, ...)
+    dosen_penguji = PanelPengujiField(
+        queryset=Dosen.objects.order_by("nama"),
+        required=False,
+        label="Dosen Penguji",
+        widget=forms.SelectMultiple(attrs={"class": "form-select", "size": 6}),
+    )
 
     class Meta:
         model = SeminarHasilPKL
-        fields = ["dosen_penguji", "jadwal", "ruang"]
+        fields = ["jadwal", "ruang"]
         widgets = {
-            "dosen_penguji": forms.Select(attrs={"class": "form-select"}),
             "jadwal": forms.DateTimeInput(
                 attrs={"class": "form-control", "type": "datetime-local"}
             ),
-            # ruang pakai field di atas
+            # ruang & dosen_penguji pakai field di atas
         }
 
     def __init__(self, *args, **kwargs):
         seminar = kwargs.get("instance", None)
         super().__init__(*args, **kwargs)
 
-        self.fields["dosen_penguji"].required = True
+        self.max_penguji = settings.PKL_MAX_PENGUJI
+        self.fields["dosen_penguji"].help_text = (
+            f"Pilih 1–{self.max_penguji} dosen; urutan pilihan menjadi urutan slot penguji."
+        )
 
         # Kalau sudah ada pembimbing → exclude dari pilihan penguji
         if seminar and seminar.dosen_pembimbing_id:
-            qs = Dosen.objects.exclude(pk=seminar.dosen_pembimbing_id)
-            self.fields["dosen_penguji"].queryset = qs
+            self.fields["dosen_penguji"].queryset = Dosen.objects.exclude(
+                pk=seminar.dosen_pembimbing_id
+            ).order_by("nama")
+        if seminar and seminar.pk and not self.is_bound:
+            self.initial["dosen_penguji"] = [slot.dosen_id for slot in seminar.panel()]
 
     def clean(self):
         cleaned = super().clean()
-        raw_dosen = str(self.data.get("dosen_penguji") or "")
+        raw_penguji = _raw_list(self.data, self.add_prefix("dosen_penguji"))
+        # dosen yang sama dikirim dua kali dihitung sekali untuk batas panel
+        penguji_unik = list(dict.fromkeys(raw_penguji))
 
         dosen_penguji = cleaned.get("dosen_penguji")
         jadwal = cleaned.get("jadwal")
@@ -135,13 +168,19 @@ class SeminarPenjadwalanForm(forms.ModelForm):
 
         if not dosen_penguji:
             errors.append("Dosen penguji wajib dipilih.")
+        elif len(penguji_unik) < len(raw_penguji):
+            errors.append("Dosen penguji yang sama tidak boleh dipilih lebih dari sekali.")
+        elif len(penguji_unik) > self.max_penguji:
+            errors.append(f"Maksimal {self.max_penguji} dosen penguji.")
+        else:
+            # queryset field tidak menjamin urutan; ikuti urutan input
+            per_id = {str(d.pk): d for d in dosen_penguji}
+            cleaned["dosen_penguji"] = [per_id[r] for r in penguji_unik if r in per_id]
 
         # Tidak boleh dosen pembimbing
         if seminar and seminar.dosen_pembimbing_id:
-            pembimbing_id = seminar.dosen_pembimbing_id
-
-            if str(pembimbing_id) in (raw_d1, raw_d2):
-                errors.append("Dosen pembimibng tidak boleh menjadi dosen penguji.")
+            if str(seminar.dosen_pembimbing_id) in raw_penguji:
+                errors.append("Dosen pembimbing tidak boleh menjadi dosen penguji.")
 
         if not jadwal:
             errors.append("Jadwal seminar wajib diisi.")
@@ -153,3 +192,7 @@ class SeminarPenjadwalanForm(forms.ModelForm):
             raise ValidationError(errors)
 
         return cleaned
+
+    def _save_m2m(self):
+        super()._save_m2m()
+        self.instance.atur_panel(self.cleaned_data["dosen_penguji"])
@@ -0,0 +1,159 @@
+# backend/portal/management/commands/loadtest_dashboards.py
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from masterdata.roles import resolve_role
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test dashboard dalam proses: N user virtual paralel membuka dashboard "
+        "sesuai perannya. Mode mengikuti settings.PKL_ASYNC_DASHBOARDS (WSGI + thread "
+        "atau ASGI + view async); --compare menjalankan keduanya di proses terpisah."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--username", action="append", required=True,
+            help="User yang dipakai user virtual (bisa diulang; dipakai bergiliran).",
+        )
+        parser.add_argument("--users", type=int, default=20, help="Jumlah user virtual paralel.")
+        parser.add_argument("--requests", type=int, default=10, help="Request per user virtual.")
+        parser.add_argument("--compare", action="store_true")
+        parser.add_argument("--json", action="store_true", help="Cetak hasil sebagai JSON.")
+
+    def handle(self, *args, **options):
+        if options["compare"]:
+            return self._compare(options)
+
+        targets = self._targets(options["username"])
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            if settings.PKL_ASYNC_DASHBOARDS:
+                mode = "asgi"
+                durations, errors, seconds = asyncio.run(self._run_asgi(targets, options))
+            else:
+                mode = "wsgi"
+                durations, errors, seconds = self._run_wsgi(targets, options)
+
+        result = self._summary(mode, durations, errors, seconds)
+        if options["json"]:
+            self.stdout.write(json.dumps(result))
+        else:
+            self._print_table([result])
+
+    # ------------------------------------------------------------------
+
+    def _targets(self, usernames):
+        targets = []
+        for username in usernames:
+            user = User.objects.filter(username=username).first()
+            if user is None:
+                raise CommandError(f"User '{username}' tidak ditemukan.")
+            role = resolve_role(user)
+            if role.is_koordinator:
+                url = reverse("portal:koordinator_dashboard")
+            elif role.is_dosen:
+                url = reverse("portal:dosen_dashboard")
+            elif role.is_mahasiswa:
+                url = reverse("portal:mahasiswa_dashboard")
+            else:
+                raise CommandError(f"User '{username}' bukan dosen/mahasiswa.")
+            targets.append((user, url))
+        return targets
+
+    def _run_wsgi(self, targets, options):
+        durations, errors = [], []
+        lock = threading.Lock()
+
+        def virtual_user(i):
+            user, url = targets[i % len(targets)]
+            client = Client()
+            client.force_login(user)
+            for _ in range(options["requests"]):
+                started = time.perf_counter()
+                response = client.get(url)
+                elapsed = time.perf_counter() - started
+                with lock:
+                    durations.append(elapsed)
+                    if response.status_code != 200:
+                        errors.append(response.status_code)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["users"]) as pool:
+            list(pool.map(virtual_user, range(options["users"])))
+        return durations, errors, time.perf_counter() - started
+
+    async def _run_asgi(self, targets, options):
+        durations, errors = [], []
+
+        async def virtual_user(i):
+            user, url = targets[i % len(targets)]
+            client = AsyncClient()
+            await client.aforce_login(user)
+            for _ in range(options["requests"]):
+                started = time.perf_counter()
+                response = await client.get(url)
+                durations.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors.append(response.status_code)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(virtual_user(i) for i in range(options["users"])))
+        return durations, errors, time.perf_counter() - started
+
+    def _summary(self, mode, durations, errors, seconds):
+        durations.sort()
+        p95 = durations[max(0, int(len(durations) * 0.95) - 1)] if durations else 0.0
+        return {
+            "mode": mode,
+            "requests": len(durations),
+            "errors": len(errors),
+            "p50_ms": round(statistics.median(durations) * 1000, 2) if durations else 0.0,
+            "p95_ms": round(p95 * 1000, 2),
+            "rps": round(len(durations) / seconds, 1) if seconds else 0.0,
+        }
+
+    def _print_table(self, results):
+        self.stdout.write(
+            f"{'mode':<6} {'request':>8} {'error':>6} {'p50 (ms)':>10} {'p95 (ms)':>10} {'req/s':>8}"
+        )
+        for r in results:
+            self.stdout.write(
+                f"{r['mode']:<6} {r['requests']:>8} {r['errors']:>6} "
+                f"{r['p50_ms']:>10.2f} {r['p95_ms']:>10.2f} {r['rps']:>8.1f}"
+            )
+
+    def _compare(self, options):
+        # urls.py membaca PKL_ASYNC_DASHBOARDS saat import, jadi tiap mode
+        # dijalankan di proses baru dengan environment yang berbeda.
+        args = [sys.executable, sys.argv[0], "loadtest_dashboards", "--json",
+                "--users", str(options["users"]), "--requests", str(options["requests"])]
+        for username in options["username"]:
+            args += ["--username", username]
+
+        results = []
+        for flag in ("False", "True"):
+            env = {**os.environ, "DJANGO_ASYNC_DASHBOARDS": flag}
+            proc = subprocess.run(args, env=env, capture_output=True, text=True)
+            if proc.returncode != 0:
+                raise CommandError(proc.stderr.strip())
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results))
+        else:
+            self._print_table(results)
@@ -0,0 +1,388 @@
+# backend/portal/management/commands/loadtest_portal.py
+import datetime
+import json
+import math
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from guidance.models import GuidanceSession
+from logbook.models import LogbookEntry
+from masterdata.models import Dosen, Mahasiswa, Mitra, PendaftaranPKL, PeriodePKL, SeminarHasilPKL
+from portal.forms_seminar import RUANG_SEMINAR_CHOICES
+
+PREFIX = "lt_"
+PERAN = ("mahasiswa", "dosen", "koordinator")
+
+
+class _TanpaRedirect(urllib.request.HTTPRedirectHandler):
+    # 302 setelah POST dicatat sebagai respons endpoint itu sendiri
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class Sesi:
+    """Satu browser virtual: cookie sesi + CSRF, tanpa mengikuti redirect."""
+
+    def __init__(self, base_url, catat, timeout):
+        self.base_url = base_url.rstrip("/")
+        self.catat = catat
+        self.timeout = timeout
+        self.cookies = CookieJar()
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookies), _TanpaRedirect()
+        )
+
+    def _csrf(self):
+        for cookie in self.cookies:
+            if cookie.name == "csrftoken":
+                return cookie.value
+        return ""
+
+    def kirim(self, nama, path, data=None):
+        if data is not None:
+            data = urllib.parse.urlencode({**data, "csrfmiddlewaretoken": self._csrf()}, doseq=True).encode()
+        request = urllib.request.Request(self.base_url + path, data=data)
+        metode = "GET" if data is None else "POST"
+        started = time.perf_counter()
+        try:
+            with self.opener.open(request, timeout=self.timeout) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as exc:
+            status = exc.code
+        except OSError:
+            status = 0  # koneksi ditolak / timeout
+        self.catat(f"{metode} {nama}", time.perf_counter() - started, status)
+        return status
+
+    def login(self, username, password):
+        path = reverse("portal:login")
+        self.kirim("login", path)
+        return self.kirim("login", path, {"username": username, "password": password})
+
+
+class Command(BaseCommand):
+    help = (
+        "Uji beban lewat HTTP terhadap server lokal (runserver/gunicorn). "
+        "--siapkan membuat dataset sintetis (user berawalan 'lt_', periode nonaktif) "
+        "dan sebaiknya dijalankan pada database sekali pakai; tanpa itu, "
+        "user virtual mahasiswa/dosen/koordinator login lalu menjalankan skenario "
+        "perannya sambil konkurensi dinaikkan bertahap (--ramp). Hasil per tahap "
+        "dan per endpoint (throughput, p50/p95/p99, error rate) dicetak sebagai JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--siapkan", action="store_true", help="Buat dataset sintetis lalu keluar.")
+        parser.add_argument("--mahasiswa", type=int, default=200, help="Jumlah mahasiswa sintetis.")
+        parser.add_argument("--dosen", type=int, default=20, help="Jumlah dosen sintetis.")
+        parser.add_argument("--password", default="loadtest", help="Password semua user sintetis.")
+
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument(
+            "--ramp", default="1,5,10,25,50", help="Tahap konkurensi, dipisah koma (mis. 1,5,10)."
+        )
+        parser.add_argument("--durasi", type=float, default=30.0, help="Detik per tahap.")
+        parser.add_argument(
+            "--campuran", default="mahasiswa=7,dosen=2,koordinator=1",
+            help="Bobot peran user virtual.",
+        )
+        parser.add_argument("--jeda", type=float, default=0.0, help="Jeda (detik) antar request per user.")
+        parser.add_argument("--timeout", type=float, default=30.0)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--output", help="Tulis JSON ke berkas ini (ringkasan tabel ke stdout).")
+
+    def handle(self, *args, **options):
+        if options["siapkan"]:
+            return self._siapkan(options)
+
+        ramp = self._parse_ramp(options["ramp"])
+        campuran = self._parse_campuran(options["campuran"])
+        data = self._data_skenario()
+        for peran in campuran:
+            if not data[peran]:
+                raise CommandError(f"Tidak ada user '{peran}' sintetis; jalankan dulu --siapkan.")
+
+        hasil = {
+            "base_url": options["base_url"],
+            "durasi_per_tahap": options["durasi"],
+            "campuran": campuran,
+            "tahap": [],
+        }
+        rng = random.Random(options["seed"])
+        for konkurensi in ramp:
+            hasil["tahap"].append(self._tahap(konkurensi, campuran, data, rng, options))
+
+        teks = json.dumps(hasil, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as fh:
+                fh.write(teks)
+            self._cetak_tabel(hasil)
+        else:
+            self.stdout.write(teks)
+
+    # ------------------------------------------------------------------
+    # Dataset sintetis
+    # ------------------------------------------------------------------
+
+    def _siapkan(self, options):
+        if User.objects.filter(username=f"{PREFIX}koor").exists():
+            self.stdout.write("Dataset uji beban sudah ada.")
+            return
+
+        today = timezone.localdate()
+        # satu hash untuk semua user: PBKDF2 per user terlalu lambat untuk ratusan akun
+        password = make_password(options["password"])
+        with transaction.atomic():
+            # nonaktif: periode sintetis tidak boleh menggeser periode_berjalan() aplikasi
+            periode = PeriodePKL.objects.create(
+                nama_periode="PKL Uji Beban", tahun_ajaran=f"{today.year}/{today.year + 1}",
+                semester="GASAL", tanggal_mulai=today - datetime.timedelta(days=30),
+                tanggal_selesai=today + datetime.timedelta(days=120), aktif=False,
+            )
+            mitra = [Mitra.objects.create(nama=f"Mitra Uji Beban {i}") for i in range(10)]
+
+            usernames = [f"{PREFIX}koor"]
+            usernames += [f"{PREFIX}dosen_{i}" for i in range(options["dosen"])]
+            usernames += [f"{PREFIX}mhs_{i}" for i in range(options["mahasiswa"])]
+            User.objects.bulk_create(User(username=u, password=password) for u in usernames)
+            users = User.objects.filter(username__startswith=PREFIX).in_bulk(field_name="username")
+
+            Dosen.objects.create(
+                user=users[f"{PREFIX}koor"], nidn="LT0000", nama="Koordinator Uji Beban",
+                is_koordinator_pkl=True,
+            )
+            dosen = [
+                Dosen.objects.create(user=users[f"{PREFIX}dosen_{i}"], nidn=f"LT1{i:04d}", nama=f"Dosen Uji {i}")
+                for i in range(options["dosen"])
+            ]
+
+            logbook, bimbingan = [], []
+            for i in range(options["mahasiswa"]):
+                # tiap mahasiswa ke-10 belum punya pembimbing (antrean halaman pemetaan)
+                pembimbing = None if i % 10 == 9 or not dosen else dosen[i % len(dosen)]
+                mhs = Mahasiswa.objects.create(
+                    user=users[f"{PREFIX}mhs_{i}"], nim=f"LT{i:08d}", nama=f"Mahasiswa Uji {i}",
+                    angkatan=today.year - 3, dosen_pembimbing=pembimbing, periode=periode,
+                    mitra=mitra[i % len(mitra)], status_pkl="SEDANG",
+                )
+                PendaftaranPKL.objects.create(
+                    mahasiswa=mhs, periode=periode, mitra=mhs.mitra, jenis_pkl="INDIVIDU",
+                    tanggal_mulai_pkl=periode.tanggal_mulai, tanggal_selesai_pkl=periode.tanggal_selesai,
+                    surat_penerimaan="surat_penerimaan/uji-beban.pdf", status="DISETUJUI",
+                    dosen_pembimbing=pembimbing,
+                )
+                for hari in range(5):
+                    tanggal = periode.tanggal_mulai + datetime.timedelta(days=hari)
+                    logbook.append(LogbookEntry(
+                        mahasiswa=mhs, dosen_pembimbing=pembimbing, periode=periode, tanggal=tanggal,
+                        aktivitas="Aktivitas harian uji beban", status="SUBMIT",
+                    ))
+                    bimbingan.append(GuidanceSession(
+                        mahasiswa=mhs, dosen_pembimbing=pembimbing, periode=periode, tanggal=tanggal,
+                        topik="Bimbingan uji beban", ringkasan_diskusi="Ringkasan",
+                    ))
+                if pembimbing is not None and i % 4 == 0:
+                    SeminarHasilPKL.objects.create(
+                        mahasiswa=mhs, periode=periode, dosen_pembimbing=pembimbing,
+                        judul_laporan=f"Laporan Uji Beban {i}", file_laporan="laporan/uji-beban.pdf",
+                    )
+            LogbookEntry.objects.bulk_create(logbook, batch_size=500)
+            GuidanceSession.objects.bulk_create(bimbingan, batch_size=500)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Dataset uji beban dibuat: {options['mahasiswa']} mahasiswa, {options['dosen']} dosen, "
+            f"1 koordinator (password '{options['password']}')."
+        ))
+
+    # ------------------------------------------------------------------
+    # Skenario
+    # ------------------------------------------------------------------
+
+    def _data_skenario(self):
+        """Username per peran + id yang dipakai skenario, dibaca sekali sebelum uji."""
+
+        mahasiswa = list(
+            Mahasiswa.objects.filter(user__username__startswith=f"{PREFIX}mhs_")
+            .values_list("user__username", flat=True)
+        )
+        dosen = {}
+        for username, logbook_id in LogbookEntry.objects.filter(
+            dosen_pembimbing__user__username__startswith=f"{PREFIX}dosen_"
+        ).values_list("dosen_pembimbing__user__username", "pk"):
+            dosen.setdefault(username, []).append(logbook_id)
+        koordinator = list(
+            Dosen.objects.filter(user__username__startswith=PREFIX, is_koordinator_pkl=True)
+            .values_list("user__username", flat=True)
+        )
+        seminar = list(
+            SeminarHasilPKL.objects.filter(mahasiswa__user__username__startswith=PREFIX)
+            .order_by("pk").values_list("pk", "dosen_pembimbing_id")
+        )
+        penguji = list(
+            Dosen.objects.filter(user__username__startswith=f"{PREFIX}dosen_").values_list("pk", flat=True)
+        )
+        return {
+            "mahasiswa": mahasiswa,
+            "dosen": list(dosen.items()),
+            "koordinator": koordinator if seminar and len(penguji) > 1 else [],
+            "seminar": seminar,
+            "penguji": penguji,
+        }
+
+    def _skenario_mahasiswa(self, sesi, rng, data, urutan):
+        sesi.kirim("mahasiswa_dashboard", reverse("portal:mahasiswa_dashboard"))
+        path = reverse("portal:mahasiswa_logbook_add")
+        sesi.kirim("mahasiswa_logbook_add", path)
+        sesi.kirim("mahasiswa_logbook_add", path, {
+            "tanggal": timezone.localdate().isoformat(),
+            "jam_mulai": "08:00",
+            "jam_selesai": "16:00",
+            "aktivitas": f"Aktivitas uji beban #{urutan}",
+            "tools_yang_digunakan": "Python",
+            "output": "Notebook",
+        })
+
+    def _skenario_dosen(self, sesi, rng, data, urutan, logbook_ids):
+        sesi.kirim("dosen_dashboard", reverse("portal:dosen_dashboard"))
+        sesi.kirim("dosen_logbook_review", reverse("portal:dosen_logbook_review", args=[rng.choice(logbook_ids)]))
+        sesi.kirim("dosen_logbook_export", reverse("portal:dosen_logbook_export"))
+
+    def _skenario_koordinator(self, sesi, rng, data, urutan):
+        sesi.kirim("koordinator_pendaftaran_list", reverse("portal:koordinator_pendaftaran_list"))
+        sesi.kirim("koordinator_pemetaan", reverse("portal:koordinator_pemetaan"))
+
+        k = rng.randrange(len(data["seminar"]))
+        seminar_id, pembimbing_id = data["seminar"][k]
+        path = reverse("portal:koordinator_seminar_detail", args=[seminar_id])
+        sesi.kirim("koordinator_seminar_detail", path)
+        # slot tetap per seminar supaya penjadwalan ulang tidak bentrok dengan seminar lain
+        jadwal = datetime.datetime.combine(
+            timezone.localdate() + datetime.timedelta(days=7 + k // 8), datetime.time(8 + k % 8)
+        )
+        penguji = next(p for p in data["penguji"][k % len(data["penguji"]):] + data["penguji"] if p != pembimbing_id)
+        sesi.kirim("koordinator_seminar_detail", path, {
+            "jadwal": jadwal.strftime("%Y-%m-%dT%H:%M"),
+            "ruang": RUANG_SEMINAR_CHOICES[k % len(RUANG_SEMINAR_CHOICES)][0],
+            "dosen_penguji": [penguji],
+        })
+
+    # ------------------------------------------------------------------
+    # Eksekusi
+    # ------------------------------------------------------------------
+
+    def _tahap(self, konkurensi, campuran, data, rng, options):
+        catatan = defaultdict(list)
+        lock = threading.Lock()
+
+        def catat(endpoint, detik, status):
+            with lock:
+                catatan[endpoint].append((detik, status))
+
+        peran = rng.choices(list(campuran), weights=list(campuran.values()), k=konkurensi)
+        seeds = [rng.randrange(2**32) for _ in range(konkurensi)]
+        batas = time.perf_counter() + options["durasi"]
+
+        def user_virtual(i):
+            vrng = random.Random(seeds[i])
+            sesi = Sesi(options["base_url"], catat, options["timeout"])
+            extra = ()
+            if peran[i] == "dosen":
+                username, logbook_ids = vrng.choice(data["dosen"])
+                extra = (logbook_ids,)
+            else:
+                username = vrng.choice(data[peran[i]])
+            if sesi.login(username, options["password"]) != 302:
+                return
+            skenario = getattr(self, f"_skenario_{peran[i]}")
+            urutan = 0
+            while time.perf_counter() < batas:
+                skenario(sesi, vrng, data, urutan, *extra)
+                urutan += 1
+                if options["jeda"]:
+                    time.sleep(options["jeda"])
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=konkurensi) as pool:
+            list(pool.map(user_virtual, range(konkurensi)))
+        detik = time.perf_counter() - started
+
+        semua = [x for rows in catatan.values() for x in rows]
+        return {
+            "konkurensi": konkurensi,
+            "peran": {p: peran.count(p) for p in campuran},
+            "detik": round(detik, 2),
+            **self._ringkas(semua, detik),
+            "endpoint": {nama: self._ringkas(rows, detik) for nama, rows in sorted(catatan.items())},
+        }
+
+    @staticmethod
+    def _persentil(urut, p):
+        # nearest-rank
+        return urut[max(0, math.ceil(p / 100 * len(urut)) - 1)] if urut else 0.0
+
+    def _ringkas(self, rows, detik):
+        urut = sorted(d for d, _ in rows)
+        errors = sum(1 for _, status in rows if status == 0 or status >= 400)
+        return {
+            "requests": len(rows),
+            "errors": errors,
+            "error_rate": round(errors / len(rows), 4) if rows else 0.0,
+            "rps": round(len(rows) / detik, 2) if detik else 0.0,
+            "p50_ms": round(self._persentil(urut, 50) * 1000, 2),
+            "p95_ms": round(self._persentil(urut, 95) * 1000, 2),
+            "p99_ms": round(self._persentil(urut, 99) * 1000, 2),
+        }
+
+    def _cetak_tabel(self, hasil):
+        self.stdout.write(
+            f"{'konk':>5} {'endpoint':<40} {'request':>8} {'error%':>7} {'req/s':>8} "
+            f"{'p50':>8} {'p95':>8} {'p99':>8}"
+        )
+        for tahap in hasil["tahap"]:
+            for nama, r in [("(semua)", tahap), *tahap["endpoint"].items()]:
+                self.stdout.write(
+                    f"{tahap['konkurensi']:>5} {nama:<40} {r['requests']:>8} "
+                    f"{r['error_rate'] * 100:>7.2f} {r['rps']:>8.2f} "
+                    f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f}"
+                )
+
+    # ------------------------------------------------------------------
+
+    def _parse_ramp(self, value):
+        try:
+            ramp = [int(x) for x in value.split(",") if x.strip()]
+        except ValueError:
+            raise CommandError("--ramp harus berisi bilangan bulat dipisah koma.")
+        if not ramp or min(ramp) < 1:
+            raise CommandError("--ramp harus berisi bilangan bulat positif.")
+        return ramp
+
+    def _parse_campuran(self, value):
+        campuran = {}
+        for bagian in value.split(","):
+            peran, _, bobot = bagian.partition("=")
+            peran = peran.strip()
+            if peran not in PERAN:
+                raise CommandError(f"Peran tidak dikenal di --campuran: '{peran}'.")
+            try:
+                campuran[peran] = float(bobot)
+            except ValueError:
+                raise CommandError(f"Bobot '{peran}' di --campuran harus angka.")
+        campuran = {p: b for p, b in campuran.items() if b > 0}
+        if not campuran:
+            raise CommandError("--campuran tidak berisi peran berbobot positif.")
+        return campuran
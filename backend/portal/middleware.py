@@ -0,0 +1,43 @@
+# backend/portal/middleware.py
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.utils.functional import SimpleLazyObject
+
+from masterdata.roles import resolve_role
+
+
+class PklRoleMiddleware:
+    """
+    Pasang ``request.pkl_role`` (masterdata.roles.RoleContext).
+
+    Peran di-resolve sekali per request (lazy, baru saat pertama dipakai) dan
+    diambil dari cache per user; ``request.pkl_role.dosen`` / ``.mahasiswa``
+    dimuat sekali per request sehingga selalu segar.
+    Harus dipasang sesudah AuthenticationMiddleware.
+
+    Mendukung mode sync dan async agar di ASGI tidak memaksa pergantian
+    thread; view async sebaiknya memakai ``resolve_role`` lewat
+    ``sync_to_async`` (lihat views_async.py) alih-alih atribut lazy ini.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def _attach(self, request):
+        request.pkl_role = SimpleLazyObject(lambda: resolve_role(request.user))
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        self._attach(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        self._attach(request)
+        return await self.get_response(request)
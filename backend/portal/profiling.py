@@ -0,0 +1,146 @@
+# backend/portal/profiling.py
+"""
+Profiling render template per request.
+
+Saat ``settings.TEMPLATE_PROFILING`` aktif, setiap ``Template.render``,
+``{% block %}`` dan ``{% include %}`` diukur durasinya (inklusif) beserta
+jumlah query yang dieksekusi selama node itu dirender. Query semacam ini
+biasanya berasal dari queryset lazy / relasi yang baru dievaluasi di
+template, yaitu kandidat utama untuk select_related/prefetch_related.
+
+Ringkasan per request dikirim lewat header ``Server-Timing`` (terlihat di
+tab Network browser) dan logger ``portal.profiling``.
+"""
+
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.template.base import Template
+from django.template.loader_tags import BlockNode, IncludeNode
+
+
+logger = logging.getLogger("portal.profiling")
+
+_current_profile: ContextVar["RenderProfile | None"] = ContextVar("pkl_render_profile", default=None)
+
+
+class RenderProfile:
+    """Catatan render template untuk satu request."""
+
+    def __init__(self):
+        self.entries = []  # [kind, name, depth, durasi_detik, jumlah_query]
+        self._stack = []
+        self.total_queries = 0
+        self.template_queries = 0
+
+    @contextmanager
+    def measure(self, kind: str, name: str):
+        entry = [kind, name, len(self._stack), 0.0, 0]
+        self.entries.append(entry)
+        self._stack.append(entry)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry[3] = time.perf_counter() - started
+            self._stack.pop()
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        self.total_queries += 1
+        if self._stack:
+            self.template_queries += 1
+            for entry in self._stack:
+                entry[4] += 1
+        return execute(sql, params, many, context)
+
+    def server_timing(self, limit: int = 20) -> str:
+        items = [f'tpl-queries;desc="{self.template_queries}/{self.total_queries} query di template"']
+        slowest = sorted(self.entries, key=lambda e: e[3], reverse=True)[:limit]
+        for i, (kind, name, _, duration, queries) in enumerate(slowest):
+            label = f"{kind} {name} ({queries}q)".replace('"', "'")
+            items.append(f'tpl{i};dur={duration * 1000:.2f};desc="{label}"')
+        return ", ".join(items)
+
+    def report(self) -> str:
+        lines = [f"{self.template_queries} dari {self.total_queries} query dieksekusi saat render template"]
+        for kind, name, depth, duration, queries in self.entries:
+            lines.append(f"{'  ' * depth}{kind} {name}: {duration * 1000:.2f} ms, {queries} query")
+        return "\n".join(lines)
+
+
+def _profiled(original, kind, get_name):
+    def render(self, context):
+        profile = _current_profile.get()
+        if profile is None:
+            return original(self, context)
+        with profile.measure(kind, get_name(self)):
+            return original(self, context)
+
+    return render
+
+
+def _include_name(node):
+    template = node.template
+    var = getattr(template, "var", template)
+    return str(getattr(var, "name", var))
+
+
+_TARGETS = (
+    (Template, "template", lambda t: t.name or "<string>"),
+    (BlockNode, "block", lambda n: n.name),
+    (IncludeNode, "include", _include_name),
+)
+_originals = {}
+
+
+def install() -> None:
+    """Bungkus method render template (idempoten); kembalikan dengan ``uninstall``."""
+
+    if _originals:
+        return
+    for cls, kind, get_name in _TARGETS:
+        _originals[cls] = cls.render
+        cls.render = _profiled(cls.render, kind, get_name)
+
+
+def uninstall() -> None:
+    """Pulihkan method render asli (mis. di cleanup test)."""
+
+    for cls, render in _originals.items():
+        cls.render = render
+    _originals.clear()
+
+
+class TemplateProfilingMiddleware:
+    """
+    Aktif hanya jika ``settings.TEMPLATE_PROFILING`` True; jika tidak,
+    middleware dilepas dari chain sejak startup (tanpa overhead). Pembungkus
+    render berlaku untuk seluruh proses sampai ``uninstall()`` dipanggil.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "TEMPLATE_PROFILING", False):
+            raise MiddlewareNotUsed
+        install()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = RenderProfile()
+        token = _current_profile.set(profile)
+        try:
+            with ExitStack() as stack:
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(profile.query_wrapper))
+                response = self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+
+        if profile.entries:
+            response["Server-Timing"] = profile.server_timing()
+            logger.info("Render %s %s\n%s", request.method, request.path, profile.report())
+        return response
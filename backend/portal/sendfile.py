@@ -0,0 +1,156 @@
+# backend/portal/sendfile.py
+"""
+Pengiriman berkas terproteksi.
+
+View hanya melakukan otorisasi; transfer byte diserahkan ke web server depan:
+
+- ``PKL_SENDFILE_BACKEND = "nginx"``: header ``X-Accel-Redirect`` ke lokasi
+  ``internal`` (``PKL_SENDFILE_URL_PREFIX`` + nama file), contoh nginx::
+
+      location /protected-media/ {
+          internal;
+          alias /srv/pkl/backend/media/;
+      }
+
+- ``"xsendfile"``: header ``X-Sendfile`` berisi path absolut (Apache
+  mod_xsendfile, lighttpd).
+- kosong (default, development): ``FileResponse`` dari Django dengan dukungan
+  header ``Range`` sehingga unduhan yang terputus bisa dilanjutkan.
+
+ETag diambil dari SHA-256 di nama file (masterdata.storage), jadi permintaan
+ulang cukup dijawab 304 tanpa membuka file sama sekali.
+"""
+
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+
+from masterdata.storage import sha256_from_name
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class _RangeFile:
+    """File-like yang hanya membaca ``length`` byte mulai dari ``start``."""
+
+    def __init__(self, fileobj, start: int, length: int):
+        self.fileobj = fileobj
+        self.remaining = length
+        fileobj.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.fileobj.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.fileobj.close()
+
+
+def _parse_range(header: str, size: int):
+    """(start, end) inklusif, None jika header diabaikan, atau "invalid" (416)."""
+
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        # multi-range / format lain: layani file utuh (diizinkan RFC 9110)
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return "invalid"
+    if not first:  # suffix: N byte terakhir
+        length = int(last)
+        if length == 0:
+            return "invalid"
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        return "invalid"
+    return start, min(end, size - 1)
+
+
+def _content_disposition(filename: str, attachment: bool) -> str:
+    disposition = "attachment" if attachment else "inline"
+    return f"{disposition}; filename*=UTF-8''{quote(filename)}"
+
+
+class StoredFile:
+    """Berkas di storage tanpa model (mis. hasil job), dengan antarmuka FieldFile yang dipakai di sini."""
+
+    def __init__(self, storage, name: str):
+        self.storage = storage
+        self.name = name
+
+    @property
+    def path(self) -> str:
+        return self.storage.path(self.name)
+
+    @property
+    def size(self) -> int:
+        return self.storage.size(self.name)
+
+    def exists(self) -> bool:
+        return self.storage.exists(self.name)
+
+
+def send_protected_file(request, fieldfile, filename: str, *, attachment: bool = False):
+    name = fieldfile.name
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+    digest = sha256_from_name(name)
+    etag = f'"{digest}"' if digest else None
+    if_none_match = [tag.strip() for tag in request.headers.get("If-None-Match", "").split(",")]
+    if etag and (etag in if_none_match or "*" in if_none_match):
+        response = HttpResponseNotModified()
+        response["ETag"] = etag
+        return response
+
+    backend = getattr(settings, "PKL_SENDFILE_BACKEND", "")
+    if backend:
+        response = HttpResponse(content_type=content_type)
+        if backend == "nginx":
+            prefix = settings.PKL_SENDFILE_URL_PREFIX.rstrip("/")
+            response["X-Accel-Redirect"] = quote(f"{prefix}/{name}")
+        elif backend == "xsendfile":
+            response["X-Sendfile"] = fieldfile.path
+        else:
+            raise ValueError(f"PKL_SENDFILE_BACKEND tidak dikenal: {backend}")
+        # Content-Length & Range ditangani web server depan
+    else:
+        size = fieldfile.size
+        byte_range = None
+        if "Range" in request.headers and request.headers.get("If-Range", etag) == etag:
+            byte_range = _parse_range(request.headers["Range"], size)
+
+        if byte_range == "invalid":
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+        fileobj = open(fieldfile.path, "rb")
+        if byte_range:
+            start, end = byte_range
+            response = FileResponse(
+                _RangeFile(fileobj, start, end - start + 1), status=206, content_type=content_type
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+            response["Content-Length"] = str(end - start + 1)
+        else:
+            response = FileResponse(fileobj, content_type=content_type)
+            response["Content-Length"] = str(size)
+        response["Accept-Ranges"] = "bytes"
+
+    response["Content-Disposition"] = _content_disposition(os.path.basename(filename), attachment)
+    response["Cache-Control"] = "private, max-age=3600"
+    response["X-Content-Type-Options"] = "nosniff"
+    if etag:
+        response["ETag"] = etag
+    return response
@@ -0,0 +1,42 @@
+# backend/portal/services/__init__.py
+"""
+Lapisan layanan portal: satu implementasi per use case, dipanggil oleh view,
+task latar belakang, dan management command.
+
+View cukup mengurus HTTP (peran, form, redirect, pesan); query dan
+perhitungan ada di sini. Setiap layanan diberi ``@anggaran_query(n)``, yaitu
+batas atas query per pemanggilan yang tidak bergantung jumlah baris. Batas
+itu diuji di portal/tests.py (ServiceQueryBudgetTests).
+"""
+
+from .budget import anggaran_query, periksa_anggaran
+from .dashboard import statistik_dosen, statistik_koordinator, statistik_mahasiswa
+from .exports import (
+    write_guidance_dosen_csv,
+    write_logbook_dosen_csv,
+    write_logbook_mahasiswa_csv,
+)
+from .logbook import (
+    antrean_review,
+    antrean_review_per_minggu,
+    kirim_logbook_massal,
+    review_logbook_massal,
+)
+from .seminar import bentrok_jadwal, detail_seminar
+
+__all__ = [
+    "anggaran_query",
+    "periksa_anggaran",
+    "statistik_dosen",
+    "statistik_koordinator",
+    "statistik_mahasiswa",
+    "write_guidance_dosen_csv",
+    "write_logbook_dosen_csv",
+    "write_logbook_mahasiswa_csv",
+    "antrean_review",
+    "antrean_review_per_minggu",
+    "kirim_logbook_massal",
+    "review_logbook_massal",
+    "bentrok_jadwal",
+    "detail_seminar",
+]
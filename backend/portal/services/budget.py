@@ -0,0 +1,34 @@
+# backend/portal/services/budget.py
+"""Anggaran query per operasi layanan."""
+
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def anggaran_query(n: int):
+    """Tandai batas atas jumlah query satu pemanggilan layanan."""
+
+    def decorator(func):
+        func.anggaran_query = n
+        return func
+
+    return decorator
+
+
+@contextmanager
+def periksa_anggaran(func):
+    """
+    Jalankan blok dan gagal (AssertionError) bila query melebihi anggaran
+    ``func``. Dipakai di test dan skrip profiling.
+    """
+
+    with CaptureQueriesContext(connection) as ctx:
+        yield ctx
+    batas = func.anggaran_query
+    if len(ctx) > batas:
+        daftar = "\n".join(q["sql"] for q in ctx.captured_queries)
+        raise AssertionError(
+            f"{func.__module__}.{func.__name__}: {len(ctx)} query, anggaran {batas}\n{daftar}"
+        )
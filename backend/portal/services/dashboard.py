@@ -0,0 +1,147 @@
+# backend/portal/services/dashboard.py
+"""Ringkasan dashboard dosen, koordinator, dan mahasiswa."""
+
+from django.db.models import Count, Q
+
+from guidance.models import GuidanceSession
+from logbook.models import LogbookEntry
+from masterdata.models import (
+    Mahasiswa,
+    Mitra,
+    PendaftaranPKL,
+    SeminarAssessment,
+    SeminarHasilPKL,
+)
+
+from .budget import anggaran_query
+
+JUMLAH_TERBARU = 10
+
+
+def _per_status(qs) -> dict:
+    return {row["status"]: row["jumlah"] for row in qs.values("status").annotate(jumlah=Count("id"))}
+
+
+@anggaran_query(5)
+def statistik_dosen(dosen) -> dict:
+    """Mahasiswa bimbingan, rekap status, dan aktivitas terbaru satu dosen."""
+
+    logbook = LogbookEntry.objects.filter(dosen_pembimbing=dosen)
+    guidance = GuidanceSession.objects.filter(dosen_pembimbing=dosen)
+    return {
+        "mahasiswa_list": list(
+            Mahasiswa.objects.filter(dosen_pembimbing=dosen)
+            .select_related("periode", "mitra")
+            .order_by("nim")
+        ),
+        "logbook_by_status": _per_status(logbook),
+        "guidance_by_status": _per_status(guidance),
+        "recent_logbooks": list(
+            logbook.select_related("mahasiswa").order_by("-tanggal", "-dibuat_pada")[:JUMLAH_TERBARU]
+        ),
+        "recent_guidances": list(
+            guidance.select_related("mahasiswa").order_by("-tanggal", "-dibuat_pada")[:JUMLAH_TERBARU]
+        ),
+    }
+
+
+@anggaran_query(9)
+def statistik_koordinator(koor) -> dict:
+    """
+    Angka ringkasan seluruh program + ringkasan koordinator sebagai pembimbing.
+    Hitungan per status digabung dalam satu ``aggregate`` per tabel.
+    """
+
+    mhs = Mahasiswa.objects.aggregate(
+        total=Count("pk"), bimbingan=Count("pk", filter=Q(dosen_pembimbing=koor))
+    )
+    pendaftaran = PendaftaranPKL.objects.aggregate(
+        total=Count("pk"),
+        dikirim=Count("pk", filter=Q(status="DIKIRIM")),
+        disetujui=Count("pk", filter=Q(status="DISETUJUI")),
+        ditolak=Count("pk", filter=Q(status="DITOLAK")),
+    )
+    seminar = SeminarHasilPKL.objects.aggregate(
+        dikirim=Count("pk", filter=Q(status="DIKIRIM")),
+        dijadwalkan=Count("pk", filter=Q(status="DIJADWALKAN")),
+        selesai=Count("pk", filter=Q(status="SELESAI")),
+        dibimbing=Count("pk", filter=Q(dosen_pembimbing=koor)),
+    )
+
+    return {
+        "total_mahasiswa": mhs["total"],
+        "total_mitra": Mitra.objects.count(),
+        "total_pendaftaran": pendaftaran["total"],
+        "total_pendaftaran_dikirim": pendaftaran["dikirim"],
+        "total_pendaftaran_disetujui": pendaftaran["disetujui"],
+        "total_pendaftaran_ditolak": pendaftaran["ditolak"],
+        "total_seminar_dikirim": seminar["dikirim"],
+        "total_seminar_dijadwalkan": seminar["dijadwalkan"],
+        "total_seminar_selesai": seminar["selesai"],
+        "recent_pendaftaran": list(
+            PendaftaranPKL.objects.select_related("mahasiswa", "mitra", "periode", "dosen_pembimbing")
+            .order_by("-tanggal_pengajuan")[:JUMLAH_TERBARU]
+        ),
+        "recent_seminar": list(
+            SeminarHasilPKL.objects.select_related("mahasiswa", "periode", "dosen_pembimbing")
+            .order_by("-created_at")[:JUMLAH_TERBARU]
+        ),
+        "as_pembimbing": {
+            "jumlah_mhs_bimbingan": mhs["bimbingan"],
+            "mhs_bimbingan": list(
+                Mahasiswa.objects.filter(dosen_pembimbing=koor)
+                .select_related("periode", "mitra")[:JUMLAH_TERBARU]
+            ),
+            "jumlah_seminar_dibimbing": seminar["dibimbing"],
+            "seminar_dibimbing": list(
+                SeminarHasilPKL.objects.filter(dosen_pembimbing=koor)
+                .select_related("mahasiswa", "periode")
+                .order_by("-created_at")[:JUMLAH_TERBARU]
+            ),
+            "jumlah_penilaian_pembimbing": SeminarAssessment.objects.filter(
+                penguji=koor, role="PEMBIMBING"
+            ).count(),
+        },
+    }
+
+
+@anggaran_query(6)
+def statistik_mahasiswa(mhs) -> dict:
+    """Ringkasan logbook/bimbingan, pendaftaran, dan seminar terakhir mahasiswa."""
+
+    recent_logbooks = list(
+        LogbookEntry.objects.filter(mahasiswa=mhs).order_by("-tanggal", "-dibuat_pada")[:JUMLAH_TERBARU]
+    )
+    recent_guidances = list(
+        GuidanceSession.objects.filter(mahasiswa=mhs).order_by("-tanggal", "-dibuat_pada")[:JUMLAH_TERBARU]
+    )
+    # total dihitung hanya bila daftar terbaru penuh
+    total_logbook = len(recent_logbooks)
+    if total_logbook == JUMLAH_TERBARU:
+        total_logbook = LogbookEntry.objects.filter(mahasiswa=mhs).count()
+    total_guidances = len(recent_guidances)
+    if total_guidances == JUMLAH_TERBARU:
+        total_guidances = GuidanceSession.objects.filter(mahasiswa=mhs).count()
+
+    return {
+        "summary": {
+            "total_logbook": total_logbook,
+            "total_guidances": total_guidances,
+            "last_logbook": recent_logbooks[0] if recent_logbooks else None,
+            "last_guidance": recent_guidances[0] if recent_guidances else None,
+        },
+        "recent_logbooks": recent_logbooks,
+        "recent_guidances": recent_guidances,
+        "pendaftaran": (
+            PendaftaranPKL.objects.filter(mahasiswa=mhs)
+            .select_related("periode", "mitra", "dosen_pembimbing")
+            .order_by("-tanggal_pengajuan")
+            .first()
+        ),
+        "seminar": (
+            SeminarHasilPKL.objects.filter(mahasiswa=mhs)
+            .select_related("periode", "dosen_pembimbing")
+            .order_by("-created_at")
+            .first()
+        ),
+    }
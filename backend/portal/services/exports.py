@@ -0,0 +1,172 @@
+# backend/portal/services/exports.py
+"""Penulis CSV yang dipakai bersama oleh view ekspor dan task latar belakang."""
+
+import csv
+
+from guidance.models import GuidanceSession
+from logbook.models import LogbookEntry
+
+from .budget import anggaran_query
+
+
+LOGBOOK_DOSEN_HEADER = [
+    "NIM",
+    "Nama Mahasiswa",
+    "Periode",
+    "Tanggal",
+    "Jam Mulai",
+    "Jam Selesai",
+    "Aktivitas",
+    "Tools",
+    "Output",
+    "Status",
+    "Catatan Dosen",
+    "Dibuat Pada",
+    "Diupdate Pada",
+]
+
+
+def _satu_baris(teks) -> str:
+    return (teks or "").replace("\n", " ")
+
+
+@anggaran_query(1)
+def write_logbook_dosen_csv(target, dosen) -> int:
+    """Tulis semua logbook mahasiswa bimbingan ``dosen`` ke ``target``; kembalikan jumlah baris."""
+
+    entries = (
+        LogbookEntry.objects.filter(dosen_pembimbing=dosen)
+        .select_related("mahasiswa", "periode")
+        .order_by("mahasiswa__nim", "tanggal")
+    )
+
+    writer = csv.writer(target)
+    writer.writerow(LOGBOOK_DOSEN_HEADER)
+
+    rows = 0
+    for e in entries.iterator(chunk_size=1000):
+        writer.writerow(
+            [
+                e.mahasiswa.nim,
+                e.mahasiswa.nama,
+                e.periode.nama_periode if e.periode else "",
+                e.tanggal,
+                e.jam_mulai or "",
+                e.jam_selesai or "",
+                _satu_baris(e.aktivitas),
+                e.tools_yang_digunakan or "",
+                _satu_baris(e.output),
+                e.get_status_display(),
+                _satu_baris(e.catatan_dosen),
+                e.dibuat_pada,
+                e.diupdate_pada,
+            ]
+        )
+        rows += 1
+    return rows
+
+
+LOGBOOK_MAHASISWA_HEADER = [
+    "Tanggal",
+    "Jam Mulai",
+    "Jam Selesai",
+    "Periode",
+    "Aktivitas",
+    "Tools",
+    "Output",
+    "Status",
+    "Catatan Dosen",
+    "Dibuat Pada",
+    "Diupdate Pada",
+]
+
+
+@anggaran_query(1)
+def write_logbook_mahasiswa_csv(target, mahasiswa) -> int:
+    """Logbook milik satu mahasiswa, urut tanggal."""
+
+    entries = (
+        LogbookEntry.objects.filter(mahasiswa=mahasiswa)
+        .select_related("periode")
+        .order_by("tanggal", "dibuat_pada")
+    )
+
+    writer = csv.writer(target)
+    writer.writerow(LOGBOOK_MAHASISWA_HEADER)
+
+    rows = 0
+    for e in entries.iterator(chunk_size=1000):
+        writer.writerow(
+            [
+                e.tanggal,
+                e.jam_mulai or "",
+                e.jam_selesai or "",
+                e.periode.nama_periode if e.periode else "",
+                _satu_baris(e.aktivitas),
+                e.tools_yang_digunakan or "",
+                _satu_baris(e.output),
+                e.get_status_display(),
+                _satu_baris(e.catatan_dosen),
+                e.dibuat_pada,
+                e.diupdate_pada,
+            ]
+        )
+        rows += 1
+    return rows
+
+
+GUIDANCE_DOSEN_HEADER = [
+    "NIM",
+    "Nama Mahasiswa",
+    "Periode",
+    "Pertemuan Ke",
+    "Tanggal",
+    "Jam Mulai",
+    "Jam Selesai",
+    "Metode",
+    "Platform",
+    "Topik",
+    "Ringkasan Diskusi",
+    "Tindak Lanjut",
+    "Status",
+    "Dibuat Pada",
+    "Diupdate Pada",
+]
+
+
+@anggaran_query(1)
+def write_guidance_dosen_csv(target, dosen) -> int:
+    """Semua sesi bimbingan yang ditangani ``dosen``."""
+
+    sessions = (
+        GuidanceSession.objects.filter(dosen_pembimbing=dosen)
+        .select_related("mahasiswa", "periode")
+        .order_by("mahasiswa__nim", "tanggal", "pertemuan_ke")
+    )
+
+    writer = csv.writer(target)
+    writer.writerow(GUIDANCE_DOSEN_HEADER)
+
+    rows = 0
+    for s in sessions.iterator(chunk_size=1000):
+        writer.writerow(
+            [
+                s.mahasiswa.nim,
+                s.mahasiswa.nama,
+                s.periode.nama_periode if s.periode else "",
+                s.pertemuan_ke or "",
+                s.tanggal,
+                s.jam_mulai or "",
+                s.jam_selesai or "",
+                s.get_metode_display(),
+                s.platform or "",
+                _satu_baris(s.topik),
+                _satu_baris(s.ringkasan_diskusi),
+                _satu_baris(s.tindak_lanjut),
+                s.get_status_display(),
+                s.dibuat_pada,
+                s.diupdate_pada,
+            ]
+        )
+        rows += 1
+    return rows
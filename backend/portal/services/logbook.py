@@ -0,0 +1,202 @@
+# backend/portal/services/logbook.py
+"""Antrean review logbook dosen, review massal, dan kiriman massal mahasiswa."""
+
+import datetime
+from itertools import groupby
+
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from logbook.models import LogbookEntry
+from masterdata.models import Mahasiswa, PendaftaranPKL
+from notifications import events as notif_events
+from notifications.outbox import catat
+
+from ..forms_logbook import LogbookBatchItemForm
+from .budget import anggaran_query
+
+STATUS_REVIEW = ("DISETUJUI", "REVISI")
+
+
+def antrean_review(dosen, periode=None):
+    """Logbook SUBMIT bimbingan ``dosen`` (None = semua periode), urut per mahasiswa lalu tanggal."""
+
+    return (
+        LogbookEntry.objects.untuk_periode(periode)
+        .filter(dosen_pembimbing=dosen, status="SUBMIT")
+        .select_related("mahasiswa__user")
+        .order_by("mahasiswa__nim", "tanggal", "jam_mulai", "pk")
+    )
+
+
+@anggaran_query(1)
+def antrean_review_per_minggu(dosen, periode=None) -> list:
+    """
+    Antrean review dikelompokkan ``[(mahasiswa, [(senin, [entry, ...]), ...]), ...]``
+    dengan minggu dimulai hari Senin.
+    """
+
+    hasil = []
+    for _, entries in groupby(antrean_review(dosen, periode), key=lambda e: e.mahasiswa_id):
+        entries = list(entries)
+        minggu = [
+            (senin, list(rows))
+            for senin, rows in groupby(
+                entries, key=lambda e: e.tanggal - datetime.timedelta(days=e.tanggal.weekday())
+            )
+        ]
+        hasil.append((entries[0].mahasiswa, minggu))
+    return hasil
+
+
+@anggaran_query(5)
+def review_logbook_massal(entries, status: str, catatan_dosen: str = "") -> int:
+    """
+    Terapkan satu keputusan review ke banyak logbook sekaligus: satu
+    ``bulk_update`` dan satu notifikasi ringkasan per mahasiswa, dalam satu
+    transaksi. ``catatan_dosen`` kosong berarti catatan lama tiap entri
+    dipertahankan.
+
+    ``entries`` (list atau queryset) hanya menentukan id yang dipilih: baris
+    dimuat ulang dengan ``select_for_update`` di dalam transaksi dan hanya yang
+    masih SUBMIT yang diubah, sehingga review satu per satu yang terjadi di
+    sela-selanya tidak tertimpa. Mengembalikan jumlah logbook yang diubah.
+    """
+
+    if status not in STATUS_REVIEW:
+        raise ValueError(f"Status review tidak dikenal: {status}")
+
+    fields = ["status", "diupdate_pada"]
+    if catatan_dosen:
+        fields.append("catatan_dosen")
+
+    # queryset menjadi subquery (tidak dievaluasi di luar transaksi)
+    ids = entries.values("pk") if isinstance(entries, QuerySet) else [e.pk for e in entries]
+    with transaction.atomic():
+        entries = list(
+            # of=self: join ke mahasiswa/user (nullable) tidak ikut dikunci
+            LogbookEntry.objects.select_for_update(of=("self",))
+            .filter(pk__in=ids, status="SUBMIT")
+            .select_related("mahasiswa__user")
+            .order_by("mahasiswa_id", "pk")
+        )
+        if not entries:
+            return 0
+
+        # bulk_update melewati save() dan auto_now: isi manual agar terbaca change feed
+        now = timezone.now()
+        for entry in entries:
+            entry.status = status
+            entry.diupdate_pada = now
+            if catatan_dosen:
+                entry.catatan_dosen = catatan_dosen
+        LogbookEntry.objects.bulk_update(entries, fields)
+        # sinyal post_save tidak jalan untuk bulk_update: notifikasi dibuat di sini
+        catat([
+            item
+            for _, rows in groupby(entries, key=lambda e: e.mahasiswa_id)
+            for item in notif_events.logbook_direview_massal(list(rows))
+        ])
+    return len(entries)
+
+
+def _rentang_pkl(mahasiswa):
+    """(mulai, selesai) dari pendaftaran PKL disetujui terbaru; None bila belum ada/diisi."""
+
+    rentang = (
+        PendaftaranPKL.objects.filter(mahasiswa=mahasiswa, status="DISETUJUI")
+        .order_by("-tanggal_pengajuan")
+        .values_list("tanggal_mulai_pkl", "tanggal_selesai_pkl")
+        .first()
+    )
+    if rentang is None or None in rentang:
+        return None
+    return rentang
+
+
+@anggaran_query(6)
+def kirim_logbook_massal(mahasiswa, items) -> dict:
+    """
+    Validasi lalu simpan sekumpulan entri logbook (status SUBMIT) sekaligus.
+
+    Semua entri divalidasi dalam satu lintasan: isian form, tanggal di dalam
+    rentang PKL pada pendaftaran yang disetujui, dan kunci idempotensi unik di
+    dalam batch. Bila ada yang gagal, tidak ada yang disimpan dan hasilnya
+    ``{"errors": {indeks: {field: [pesan]}}}``; tanpa pendaftaran disetujui
+    yang tanggal PKL-nya lengkap, seluruh batch ditolak lewat ``"__all__"``.
+
+    Entri yang kuncinya sudah pernah tersimpan (kiriman ulang setelah koneksi
+    putus) dilewati dan dilaporkan ``SUDAH_ADA`` beserta id-nya, sehingga
+    klien boleh mengulang batch yang sama kapan saja.
+    """
+
+    errors = {}
+    valid = []
+    for i, item in enumerate(items):
+        form = LogbookBatchItemForm(data=item if isinstance(item, dict) else {})
+        if form.is_valid():
+            valid.append((i, form))
+        else:
+            errors[i] = form.errors.get_json_data()
+
+    rentang = _rentang_pkl(mahasiswa)
+    if rentang is None:
+        errors[NON_FIELD_ERRORS] = [{
+            "message": "Belum ada pendaftaran PKL disetujui dengan tanggal mulai dan selesai.",
+            "code": "masa_pkl_kosong",
+        }]
+    dilihat = set()
+    for i, form in valid:
+        data = form.cleaned_data
+        if rentang and not rentang[0] <= data["tanggal"] <= rentang[1]:
+            errors.setdefault(i, {})["tanggal"] = [{
+                "message": f"Tanggal harus di antara {rentang[0]:%d-%m-%Y} dan {rentang[1]:%d-%m-%Y} (masa PKL).",
+                "code": "di_luar_masa_pkl",
+            }]
+        if data["idempotency_key"] in dilihat:
+            errors.setdefault(i, {})["idempotency_key"] = [{
+                "message": "Kunci idempotensi dipakai lebih dari sekali dalam batch.",
+                "code": "duplikat",
+            }]
+        dilihat.add(data["idempotency_key"])
+    if errors:
+        return {"errors": errors}
+
+    keys = [form.cleaned_data["idempotency_key"] for _, form in valid]
+    with transaction.atomic():
+        # kiriman ulang yang bersamaan diserialkan lewat baris mahasiswa: kunci
+        # yang belum ada saat dibaca di bawah kunci ini pasti disimpan oleh
+        # request ini, bukan oleh kiriman lain
+        list(Mahasiswa.objects.select_for_update().filter(pk=mahasiswa.pk).values_list("pk"))
+        sudah_ada = dict(
+            LogbookEntry.objects.filter(mahasiswa=mahasiswa, idempotency_key__in=keys)
+            .values_list("idempotency_key", "pk")
+        )
+        baru = []
+        for _, form in valid:
+            if form.cleaned_data["idempotency_key"] in sudah_ada:
+                continue
+            # bulk_create melewati save(): isi pembimbing & periode seperti mahasiswa_logbook_add
+            entry = form.save(commit=False)
+            entry.mahasiswa = mahasiswa
+            entry.dosen_pembimbing_id = mahasiswa.dosen_pembimbing_id
+            entry.periode_id = mahasiswa.periode_id
+            entry.status = "SUBMIT"
+            baru.append(entry)
+        # pk diisi dari RETURNING (SQLite >= 3.35, PostgreSQL)
+        LogbookEntry.objects.bulk_create(baru)
+    dibuat = {entry.idempotency_key: entry.pk for entry in baru}
+
+    return {
+        "hasil": [
+            {
+                "idempotency_key": str(key),
+                "id": sudah_ada.get(key) or dibuat.get(key),
+                "status": "SUDAH_ADA" if key in sudah_ada else "DIBUAT",
+            }
+            for key in keys
+        ],
+        "dibuat": len(dibuat),
+    }
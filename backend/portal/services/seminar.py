@@ -0,0 +1,66 @@
+# backend/portal/services/seminar.py
+"""Detail seminar (dosen, koordinator, PDF) dan cek bentrok penjadwalan."""
+
+from django.db.models import Exists, OuterRef
+from django.shortcuts import get_object_or_404
+
+from masterdata.models import SeminarHasilPKL, SeminarPenguji
+
+from .budget import anggaran_query
+
+
+@anggaran_query(3)
+def detail_seminar(pk: int) -> dict:
+    """
+    Seminar + panel + penilaian dalam tiga query (seminar, panel, penilaian),
+    berapa pun ukuran panelnya. Http404 bila seminar tidak ada.
+    """
+
+    seminar = get_object_or_404(
+        SeminarHasilPKL.objects.select_related(
+            "mahasiswa", "mahasiswa__mitra", "periode", "dosen_pembimbing"
+        ).dengan_panel(),
+        pk=pk,
+    )
+    return {
+        "seminar": seminar,
+        "panel": seminar.panel(),
+        "slot_penilaian": seminar.slot_penilaian(),
+        "assessments": seminar.penilaian_penguji(),
+        "pembimbing_assessment": seminar.penilaian_pembimbing(),
+    }
+
+
+@anggaran_query(1)
+def bentrok_jadwal(seminar, jadwal, ruang, penguji) -> dict:
+    """
+    Seminar lain pada jam yang sama yang memakai ruang ini atau salah satu
+    ``penguji``. Kembalikan ``{field_form: pesan}``; kosong bila aman.
+    """
+
+    if jadwal is None:
+        return {}
+
+    penguji_ids = [d.pk for d in penguji]
+    lain = (
+        SeminarHasilPKL.objects.filter(jadwal=jadwal)
+        .exclude(pk=seminar.pk)
+        .annotate(
+            penguji_bentrok=Exists(
+                SeminarPenguji.objects.filter(seminar_id=OuterRef("pk"), dosen_id__in=penguji_ids)
+            )
+        )
+    )
+    ruang_terpakai = penguji_terpakai = False
+    for ruang_lain, bentrok in lain.values_list("ruang", "penguji_bentrok"):
+        ruang_terpakai |= bool(ruang) and ruang_lain == ruang
+        penguji_terpakai |= bentrok
+
+    errors = {}
+    if ruang_terpakai:
+        errors["ruang"] = "Ruang ini sudah digunakan untuk seminar lain pada jam tersebut."
+    if penguji_terpakai:
+        errors["dosen_penguji"] = (
+            "Salah satu dosen penguji sudah dijadwalkan menguji mahasiswa lain pada jam tersebut."
+        )
+    return errors
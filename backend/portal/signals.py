@@ -0,0 +1,20 @@
+# backend/portal/signals.py
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from masterdata.cache_versions import bump_version
+
+from .models import Announcement, FrequentlyAskedQuestion
+
+
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+def naikkan_versi_pengumuman(sender, **kwargs):
+    bump_version("pengumuman")
+
+
+@receiver(post_save, sender=FrequentlyAskedQuestion)
+@receiver(post_delete, sender=FrequentlyAskedQuestion)
+def naikkan_versi_faq(sender, **kwargs):
+    bump_version("faq")
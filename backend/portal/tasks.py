@@ -0,0 +1,30 @@
+# backend/portal/tasks.py
+"""Task latar belakang portal (dijalankan oleh `manage.py runworker`)."""
+
+import io
+import uuid
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from jobs.registry import task
+from masterdata.models import Dosen
+
+from .services import write_logbook_dosen_csv
+
+
+@task("portal.export_logbook_dosen")
+def export_logbook_dosen(dosen_id: int) -> dict:
+    dosen = Dosen.objects.get(pk=dosen_id)
+    buffer = io.StringIO()
+    rows = write_logbook_dosen_csv(buffer, dosen)
+
+    stamp = timezone.now().strftime("%Y%m%d%H%M%S")
+    # nama acak (tidak bisa ditebak dari NIDN/waktu); unduhan hanya lewat
+    # portal:job_download yang memeriksa pemilik job
+    name = default_storage.save(
+        f"exports/{uuid.uuid4().hex}.csv",
+        ContentFile(buffer.getvalue().encode("utf-8")),
+    )
+    return {"file": name, "nama": f"logbook_dosen_{dosen.nidn}_{stamp}.csv", "baris": rows}
@@ -1,10 +1,36 @@
 # backend/masterdata/tests.py
 
-from django.test import TestCase
+import datetime
+import hashlib
+import io
+import json
+import os
+import tempfile
+import uuid
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import (
+    AsyncRequestFactory,
+    Client,
+    LiveServerTestCase,
+    RequestFactory,
+    TestCase,
+    override_settings,
+)
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse, QueryDict
+from django.template.base import Template
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
+from guidance.models import GuidanceSession
+from logbook.models import LogbookEntry
 from masterdata.models import (
     Dosen,
     Mahasiswa,
@@ -13,14 +39,23 @@ from masterdata.models import (
     PendaftaranPKL,
     SeminarAssessment,
     SeminarHasilPKL,
+    UnggahanLaporan,
 )
+from masterdata.roles import resolve_role, role_cache_key
+from masterdata.testing import MediaSementaraMixin
+from notifications.models import Notifikasi
+from portal import services
 
+from . import profiling, views_async, views_dosen, views_mahasiswa, views_upload
+from .content import published_announcements
+from .models import Announcement, FrequentlyAskedQuestion
+from .views_async import dosen_dashboard_async, koordinator_dashboard_async
+from .views_dosen import koordinator_dashboard
 
 
-
-
-class PendaftaranPKLModelTests(TestCase):
+class PendaftaranPKLModelTests(MediaSementaraMixin, TestCase):
     def setUp(self):
+        super().setUp()
         self.user_mhs = User.objects.create_user(
             username="mhs1", password="test"
         )
@@ -72,8 +107,9 @@ class PendaftaranPKLModelTests(TestCase):
         self.assertEqual(self.mhs.status_pkl, "SEDANG")
 
 
-class SeminarAssessmentTests(TestCase):
+class SeminarAssessmentTests(MediaSementaraMixin, TestCase):
     def setUp(self):
+        super().setUp()
         self.user_mhs = User.objects.create_user(
             username="mhs2", password="test"
         )
@@ -163,8 +199,9 @@ from .forms import (
 )
 
 
-class PendaftaranPKLMahasiswaFormTests(TestCase):
+class PendaftaranPKLMahasiswaFormTests(MediaSementaraMixin, TestCase):
     def setUp(self):
+        super().setUp()
         self.periode = PeriodePKL.objects.create(
             nama_periode="PKL 2025 Gasal",
             tahun_ajaran="2025/2026",
@@ -183,7 +220,7 @@ class PendaftaranPKLMahasiswaFormTests(TestCase):
             angkatan=2022,
         )
         self.file_obj = SimpleUploadedFile(
-            "surat.pdf", b"dummy", content_type="application/pdf"
+            "surat.pdf", b"%PDF-1.4 dummy", content_type="application/pdf"
         )
 
     def test_error_jika_tidak_pilih_mitra_dan_tidak_isi_mitra_baru(self):
@@ -236,8 +273,9 @@ class PendaftaranPKLMahasiswaFormTests(TestCase):
 
 
 
-class SeminarPenjadwalanFormTests(TestCase):
+class SeminarPenjadwalanFormTests(MediaSementaraMixin, TestCase):
     def setUp(self):
+        super().setUp()
         self.user_mhs = User.objects.create_user(
             username="mhs2", password="test"
         )
@@ -309,6 +347,231 @@ class SeminarPenjadwalanFormTests(TestCase):
         )
         self.assertTrue(form.is_valid())
 
+    def test_panel_beberapa_penguji_disimpan_sesuai_urutan(self):
+        ketiga = Dosen.objects.create(nidn="9012", nama="Dosen Penguji 2")
+        data = QueryDict(mutable=True)
+        data.setlist("dosen_penguji", [str(ketiga.pk), str(self.dosen_lain.pk)])
+        data.update({"jadwal": "2025-01-10T08:00", "ruang": "Ruang Rapat Prodi"})
+
+        form = SeminarPenjadwalanForm(data=data, instance=self.seminar)
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        self.assertEqual(
+            [(slot.urutan, slot.dosen_id) for slot in self.seminar.panel()],
+            [(1, ketiga.pk), (2, self.dosen_lain.pk)],
+        )
+        self.assertTrue(self.seminar.is_penguji(ketiga))
+        self.assertFalse(self.seminar.is_penguji(self.dosen_pembimbing))
+
+        with self.settings(PKL_MAX_PENGUJI=1):
+            form = SeminarPenjadwalanForm(data=data, instance=self.seminar)
+            self.assertFalse(form.is_valid())
+            self.assertIn("Maksimal 1 dosen penguji.", form.non_field_errors())
+
+    def test_penguji_ganda_ditolak_dan_tidak_dihitung_ke_batas(self):
+        data = QueryDict(mutable=True)
+        data.setlist("dosen_penguji", [str(self.dosen_lain.pk), str(self.dosen_lain.pk)])
+        data.update({"jadwal": "2025-01-10T08:00", "ruang": "Ruang Rapat Prodi"})
+
+        with self.settings(PKL_MAX_PENGUJI=1):
+            form = SeminarPenjadwalanForm(data=data, instance=self.seminar)
+            self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.non_field_errors(),
+            ["Dosen penguji yang sama tidak boleh dipilih lebih dari sekali."],
+        )
+
+
+class SeminarPanelQueryTests(MediaSementaraMixin, TestCase):
+    """Halaman seminar memakai Prefetch: jumlah query tidak bergantung ukuran panel."""
+
+    def setUp(self):
+        super().setUp()
+
+        self.periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal",
+            tahun_ajaran="2025/2026",
+            semester="GASAL",
+            tanggal_mulai="2025-01-01",
+            tanggal_selesai="2025-06-30",
+        )
+        self.user_koor = User.objects.create_user(username="koor_panel", password="test")
+        Dosen.objects.create(user=self.user_koor, nidn="7000", nama="Koor", is_koordinator_pkl=True)
+        self.user_dsn = User.objects.create_user(username="dsn_panel", password="test")
+        self.pembimbing = Dosen.objects.create(user=self.user_dsn, nidn="7001", nama="Pembimbing")
+        self.penguji = [Dosen.objects.create(nidn=f"71{i}", nama=f"Penguji {i}") for i in range(3)]
+        self.seminar = [self._seminar(i) for i in range(2)]
+
+    def _seminar(self, i):
+        mhs = Mahasiswa.objects.create(nim=f"20081060{i:02d}", nama=f"Mhs {i}", angkatan=2022)
+        seminar = SeminarHasilPKL.objects.create(
+            mahasiswa=mhs,
+            periode=self.periode,
+            dosen_pembimbing=self.pembimbing,
+            judul_laporan="Laporan",
+            file_laporan=SimpleUploadedFile("laporan.pdf", b"%PDF-1.4 panel"),
+        )
+        seminar.atur_panel(self.penguji[:1])
+        return seminar
+
+    def _jumlah_query(self, user, url):
+        self.client.force_login(user)
+        self.client.get(url)  # hangatkan cache peran/fragmen
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx)
+
+    def _perbesar_panel(self):
+        for seminar in self.seminar:
+            seminar.atur_panel(self.penguji)
+            for dosen in self.penguji:
+                SeminarAssessment.objects.create(
+                    seminar=seminar, penguji=dosen, role="PENGUJI", pemahaman_materi=80,
+                    kualitas_laporan=80, presentasi=80, penguasaan_lapangan=80, sikap_profesional=80,
+                )
+        self.seminar.append(self._seminar(2))
+
+    def test_jumlah_query_konstan_untuk_panel_berapa_pun(self):
+        halaman = [
+            (self.user_koor, "/koor/seminar/"),
+            (self.user_koor, f"/koor/seminar/{self.seminar[0].pk}/"),
+            (self.user_dsn, "/dosen/seminar/"),
+            (self.user_dsn, f"/dosen/seminar/{self.seminar[0].pk}/"),
+        ]
+        sebelum = [self._jumlah_query(user, url) for user, url in halaman]
+        self._perbesar_panel()
+        sesudah = [self._jumlah_query(user, url) for user, url in halaman]
+        self.assertEqual(sebelum, sesudah)
+
+        response = self.client.get(f"/dosen/seminar/{self.seminar[0].pk}/")
+        for dosen in self.penguji:
+            self.assertContains(response, dosen.nama)
+
+    def test_hanya_anggota_panel_yang_boleh_menilai(self):
+        user = User.objects.create_user(username="penguji_panel", password="test")
+        Dosen.objects.filter(pk=self.penguji[0].pk).update(user=user)
+        bukan = User.objects.create_user(username="bukan_panel", password="test")
+        self.penguji[1].user = bukan
+        self.penguji[1].save()
+
+        url = f"/dosen/seminar/{self.seminar[0].pk}/penilaian/"
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.client.force_login(bukan)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_halaman_dosen_tidak_memakai_hak_koordinator(self):
+        seminar = self.seminar[0]
+        self.client.force_login(self.user_koor)
+        # koordinator bukan pembimbing/penguji seminar ini: halaman /dosen/ menolak
+        self.assertEqual(self.client.get(f"/dosen/seminar/{seminar.pk}/").status_code, 403)
+        self.assertEqual(self.client.get(f"/dosen/seminar/{seminar.pk}/penilaian/pdf/").status_code, 403)
+        self.assertNotContains(self.client.get("/dosen/seminar/?periode=semua"), seminar.mahasiswa.nim)
+        self.assertEqual(self.client.get(f"/koor/seminar/{seminar.pk}/").status_code, 200)
+
+        self.client.force_login(self.user_dsn)
+        self.assertEqual(self.client.get(f"/dosen/seminar/{seminar.pk}/").status_code, 200)
+        self.assertContains(self.client.get("/dosen/seminar/?periode=semua"), seminar.mahasiswa.nim)
+
+
+class ServiceQueryBudgetTests(TestCase):
+    """Setiap layanan portal/services tetap dalam anggaran query-nya, berapa pun jumlah barisnya."""
+
+    def setUp(self):
+        self.periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal",
+            tahun_ajaran="2025/2026",
+            semester="GASAL",
+            tanggal_mulai="2025-01-01",
+            tanggal_selesai="2025-06-30",
+        )
+        self.mitra = Mitra.objects.create(nama="Mitra Anggaran")
+        self.koor = Dosen.objects.create(nidn="7500", nama="Koor", is_koordinator_pkl=True)
+        self.penguji = [Dosen.objects.create(nidn=f"76{i}", nama=f"Penguji {i}") for i in range(3)]
+        self.mahasiswa = []
+        self.seminar = []
+
+    def _tambah_data(self, n):
+        for _ in range(n):
+            i = len(self.mahasiswa)
+            mhs = Mahasiswa.objects.create(
+                nim=f"20081075{i:02d}", nama=f"Mhs {i}", angkatan=2022,
+                dosen_pembimbing=self.koor, periode=self.periode, mitra=self.mitra,
+            )
+            self.mahasiswa.append(mhs)
+            for hari in range(1, 13):
+                LogbookEntry.objects.create(mahasiswa=mhs, tanggal=f"2025-02-{hari:02d}", aktivitas="a\nb")
+                GuidanceSession.objects.create(
+                    mahasiswa=mhs, tanggal=f"2025-02-{hari:02d}", topik="t", ringkasan_diskusi="r"
+                )
+            PendaftaranPKL.objects.create(
+                mahasiswa=mhs, periode=self.periode, mitra=self.mitra, jenis_pkl="MANDIRI",
+                dosen_pembimbing=self.koor,
+            )
+            seminar = SeminarHasilPKL.objects.create(
+                mahasiswa=mhs, periode=self.periode, dosen_pembimbing=self.koor, judul_laporan="L",
+            )
+            seminar.atur_panel(self.penguji[: len(self.seminar) % 3 + 1])
+            for dosen in seminar.dosen_penguji.all():
+                SeminarAssessment.objects.create(
+                    seminar=seminar, penguji=dosen, role="PENGUJI", pemahaman_materi=80,
+                    kualitas_laporan=80, presentasi=80, penguasaan_lapangan=80, sikap_profesional=80,
+                )
+            self.seminar.append(seminar)
+
+    def _panggil_semua(self):
+        jadwal = timezone.make_aware(datetime.datetime(2025, 3, 1, 8, 0))
+
+        pemanggilan = [
+            (services.statistik_dosen, (self.koor,)),
+            (services.statistik_koordinator, (self.koor,)),
+            (services.statistik_mahasiswa, (self.mahasiswa[0],)),
+            (services.detail_seminar, (self.seminar[-1].pk,)),
+            (services.bentrok_jadwal, (self.seminar[0], jadwal, "Ruang Rapat Prodi", self.penguji)),
+            (services.write_logbook_dosen_csv, (io.StringIO(), self.koor)),
+            (services.write_logbook_mahasiswa_csv, (io.StringIO(), self.mahasiswa[0])),
+            (services.write_guidance_dosen_csv, (io.StringIO(), self.koor)),
+        ]
+        for func, args in pemanggilan:
+            with self.subTest(layanan=func.__name__), services.periksa_anggaran(func):
+                func(*args)
+
+    def test_anggaran_query_tidak_bergantung_jumlah_baris(self):
+        self._tambah_data(1)
+        self._panggil_semua()
+        self._tambah_data(4)
+        self._panggil_semua()
+
+    def test_penjadwalan_menolak_ruang_dan_penguji_yang_bentrok(self):
+        self._tambah_data(2)
+        user = User.objects.create_user(username="koor_bentrok", password="test")
+        self.koor.user = user
+        self.koor.save()
+        self.client.force_login(user)
+
+        lain = self.seminar[1]
+        lain.jadwal = "2025-03-01T08:00+07:00"
+        lain.ruang = "Ruang Rapat Prodi"
+        lain.save()
+        lain.atur_panel([self.penguji[0]])
+
+        def jadwalkan(ruang, penguji):
+            data = QueryDict(mutable=True)
+            data.setlist("dosen_penguji", [str(d.pk) for d in penguji])
+            data.update({"jadwal": "2025-03-01T08:00", "ruang": ruang})
+            return self.client.post(f"/koor/seminar/{self.seminar[0].pk}/", data)
+
+        response = jadwalkan("Ruang Rapat Prodi", [self.penguji[1]])
+        self.assertContains(response, "Ruang ini sudah digunakan")
+        response = jadwalkan("10.2 Twin Tower", [self.penguji[0]])
+        self.assertContains(response, "sudah dijadwalkan menguji")
+        self.seminar[0].refresh_from_db()
+        self.assertEqual(self.seminar[0].status, "DIKIRIM")
+
+        response = jadwalkan("10.2 Twin Tower", [self.penguji[1]])
+        self.assertEqual(response.status_code, 302)
+
 
 class MahasiswaGuidanceFormTests(TestCase):
     def setUp(self):
@@ -482,4 +745,682 @@ class LogbookEntryModelTests(TestCase):
         )
 
         self.assertEqual(entry.dosen_pembimbing, self.dosen)
-        self.assertEqual(entry.periode, self.periode)
\ No newline at end of file
+        self.assertEqual(entry.periode, self.periode)
+
+
+class RoleContextTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user_dsn = User.objects.create_user(username="dsn_role", password="test")
+        self.dosen = Dosen.objects.create(
+            user=self.user_dsn,
+            nidn="7070",
+            nama="Dosen Peran",
+        )
+
+    def test_peran_di_cache_dan_dihapus_saat_dosen_berubah(self):
+        role = resolve_role(self.user_dsn)
+        self.assertTrue(role.is_dosen)
+        self.assertFalse(role.is_koordinator)
+
+        with self.assertNumQueries(0):
+            role = resolve_role(self.user_dsn)
+            self.assertEqual(role.dosen_id, self.dosen.pk)
+            self.assertFalse(role.is_mahasiswa)
+            # profil yang tidak ada langsung terisi None di objek user
+            self.assertFalse(hasattr(self.user_dsn, "mahasiswa_profile"))
+
+        # profil dimuat sekali per RoleContext dan mengisi relasi one-to-one user
+        with self.assertNumQueries(1):
+            self.assertEqual(role.dosen.pk, self.dosen.pk)
+            self.assertEqual(self.user_dsn.dosen_profile.pk, self.dosen.pk)
+
+        self.dosen.is_koordinator_pkl = True
+        self.dosen.save()
+        self.assertTrue(resolve_role(self.user_dsn).is_koordinator)
+
+    def test_profil_tidak_basi_dan_cache_dihapus_lagi_setelah_commit(self):
+        resolve_role(self.user_dsn)
+        # update massal tidak memicu sinyal, tetapi profil selalu dimuat ulang
+        Dosen.objects.filter(pk=self.dosen.pk).update(nama="Nama Baru")
+        self.assertEqual(resolve_role(self.user_dsn).dosen.nama, "Nama Baru")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.dosen.is_koordinator_pkl = True
+            self.dosen.save()
+            # request lain sempat mengisi cache sebelum commit
+            cache.set(role_cache_key(self.user_dsn.pk), (self.dosen.pk, None, False))
+        self.assertTrue(resolve_role(self.user_dsn).is_koordinator)
+
+    def test_after_login_mengarahkan_sesuai_peran(self):
+        self.dosen.is_koordinator_pkl = True
+        self.dosen.save()
+        self.client.force_login(self.user_dsn)
+
+        response = self.client.get("/after-login/")
+        self.assertRedirects(
+            response, "/koor/dashboard/", fetch_redirect_response=False
+        )
+
+
+class KoordinatorPemetaanTests(TestCase):
+    def setUp(self):
+        self.koor = Dosen.objects.create(
+            user=User.objects.create_user(username="koor_map", password="test"),
+            nidn="8080",
+            nama="Koordinator",
+            is_koordinator_pkl=True,
+        )
+        self.dosen = Dosen.objects.create(nidn="8081", nama="Dosen Pembimbing")
+        self.periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal",
+            tahun_ajaran="2025/2026",
+            semester="GASAL",
+            tanggal_mulai="2025-01-01",
+            tanggal_selesai="2025-06-30",
+        )
+        self.mitra = Mitra.objects.create(nama="Mitra Pemetaan")
+        self.pendaftaran = []
+        for i in range(3):
+            mhs = Mahasiswa.objects.create(nim=f"2008101800{i}", nama=f"Mhs {i}", angkatan=2022)
+            self.pendaftaran.append(
+                PendaftaranPKL.objects.create(
+                    mahasiswa=mhs,
+                    periode=self.periode,
+                    mitra=self.mitra,
+                    jenis_pkl="INDIVIDU",
+                    surat_penerimaan="surat_penerimaan/x.pdf",
+                    status="DISETUJUI",
+                )
+            )
+        self.client.force_login(self.koor.user)
+
+    def test_halaman_pemetaan_jumlah_query_tidak_tumbuh_per_pendaftaran(self):
+        # request pertama mengisi cache peran, periode berjalan, dan daftar periode
+        self.client.get("/koor/pemetaan/")
+        # user + profil koordinator + dosen + 2 daftar pendaftaran
+        with self.assertNumQueries(5):
+            response = self.client.get("/koor/pemetaan/")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'id="dosen-options"')
+        self.assertContains(response, '<select name="dosen_', count=3)
+
+        # periode pilihan dicari di daftar periode yang sudah di-cache
+        with self.assertNumQueries(5):
+            self.client.get(f"/koor/pemetaan/?periode={self.periode.pk}")
+
+    def test_jumlah_bimbingan_mengikuti_periode_terpilih(self):
+        lama = PeriodePKL.objects.create(
+            nama_periode="PKL 2024 Genap", tahun_ajaran="2024/2025", semester="GENAP",
+            tanggal_mulai="2024-07-01", tanggal_selesai="2024-12-31",
+        )
+        PendaftaranPKL.objects.filter(pk=self.pendaftaran[0].pk).update(dosen_pembimbing=self.dosen)
+        PendaftaranPKL.objects.create(
+            mahasiswa=Mahasiswa.objects.create(nim="20081018099", nama="Mhs Lama", angkatan=2021),
+            periode=lama, mitra=self.mitra, jenis_pkl="INDIVIDU",
+            surat_penerimaan="surat_penerimaan/x.pdf", status="DISETUJUI", dosen_pembimbing=self.dosen,
+        )
+
+        def jumlah(query):
+            response = self.client.get(f"/koor/pemetaan/?periode={query}")
+            return next(d.jumlah_bimbingan for d in response.context["dosen_list"] if d.pk == self.dosen.pk)
+
+        self.assertEqual(jumlah(self.periode.pk), 1)
+        self.assertEqual(jumlah(lama.pk), 1)
+        self.assertEqual(jumlah("semua"), 2)
+
+    def test_simpan_pemetaan_massal_sinkron_ke_mahasiswa(self):
+        data = {f"dosen_{p.pk}": self.dosen.pk for p in self.pendaftaran[:2]}
+        data[f"dosen_{self.pendaftaran[2].pk}"] = ""
+        response = self.client.post("/koor/pemetaan/", data)
+        self.assertRedirects(response, "/koor/pemetaan/", fetch_redirect_response=False)
+
+        for p in self.pendaftaran[:2]:
+            p.refresh_from_db()
+            p.mahasiswa.refresh_from_db()
+            self.assertEqual(p.dosen_pembimbing, self.dosen)
+            self.assertEqual(p.mahasiswa.dosen_pembimbing, self.dosen)
+            self.assertEqual(p.mahasiswa.status_pkl, "SEDANG")
+        self.pendaftaran[2].refresh_from_db()
+        self.assertIsNone(self.pendaftaran[2].dosen_pembimbing)
+
+        url = f"/koor/pemetaan/?periode={self.periode.pk}"
+        response = self.client.post(url, {f"dosen_{self.pendaftaran[2].pk}": self.dosen.pk})
+        self.assertRedirects(response, url, fetch_redirect_response=False)
+
+    def test_profiling_template_mengirim_server_timing(self):
+        render_asli = Template.render
+        self.addCleanup(profiling.uninstall)
+        with override_settings(TEMPLATE_PROFILING=True):
+            client = Client()
+            client.force_login(self.koor.user)
+            # laporan ditangkap di sini, tidak tercetak ke konsol test
+            with self.assertLogs("portal.profiling", "INFO") as logs:
+                response = client.get("/koor/pemetaan/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Render GET /koor/pemetaan/", logs.output[0])
+        self.assertIn("tpl-queries", response["Server-Timing"])
+        self.assertIn("portal/koordinator_pemetaan.html", response["Server-Timing"])
+
+        # tanpa flag, middleware tidak dipasang sama sekali
+        self.assertFalse(self.client.get("/koor/pemetaan/").has_header("Server-Timing"))
+
+        profiling.uninstall()
+        self.assertIs(Template.render, render_asli)
+
+
+class PortalFragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _buat_pengumuman(self, slug, mulai, selesai=None, **extra):
+        return Announcement.objects.create(
+            judul=f"Pengumuman {slug}",
+            slug=slug,
+            konten="Isi",
+            tanggal_mulai=mulai,
+            tanggal_selesai=selesai,
+            **extra,
+        )
+
+    def test_pengumuman_per_tanggal_dan_versi_naik_saat_disimpan(self):
+        hari = datetime.date(2025, 3, 10)
+        self._buat_pengumuman("lama", datetime.date(2025, 1, 1), datetime.date(2025, 2, 1))
+        self._buat_pengumuman("aktif", datetime.date(2025, 3, 1))
+        self._buat_pengumuman("draft", datetime.date(2025, 3, 1), is_published=False)
+
+        self.assertEqual([a.slug for a in published_announcements(hari)], ["aktif"])
+        with self.assertNumQueries(0):
+            published_announcements(hari)
+
+        baru = self._buat_pengumuman("baru", datetime.date(2025, 3, 5))
+        self.assertEqual(
+            [a.slug for a in published_announcements(hari)], ["baru", "aktif"]
+        )
+        # bucket tanggal lain dihitung terpisah
+        self.assertEqual(
+            [a.slug for a in published_announcements(datetime.date(2025, 1, 15))], ["lama"]
+        )
+
+        baru.delete()
+        self.assertEqual([a.slug for a in published_announcements(hari)], ["aktif"])
+
+    def test_fragmen_faq_di_dashboard_mahasiswa(self):
+        user = User.objects.create_user(username="mhs_faq", password="test")
+        Mahasiswa.objects.create(user=user, nim="2008101900", nama="Mhs FAQ", angkatan=2022)
+        faq = FrequentlyAskedQuestion.objects.create(pertanyaan="Kapan seminar?", jawaban="Akhir periode.")
+        self.client.force_login(user)
+
+        self.assertContains(self.client.get("/mhs/dashboard/"), "Kapan seminar?")
+
+        faq.pertanyaan = "Kapan jadwal seminar?"
+        faq.save()
+        self.assertContains(self.client.get("/mhs/dashboard/"), "Kapan jadwal seminar?")
+
+
+class AsyncDashboardTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="koor_async", password="test")
+        self.koor = Dosen.objects.create(
+            user=self.user, nidn="9090", nama="Koor Async", is_koordinator_pkl=True
+        )
+        Mahasiswa.objects.create(
+            nim="2008102000", nama="Mhs Async", angkatan=2022, dosen_pembimbing=self.koor
+        )
+
+    def _request(self, user=None):
+        user = user or self.user
+        request = AsyncRequestFactory().get("/koor/dashboard/")
+        request.user = user
+
+        async def auser():
+            return user
+
+        request.auser = auser
+        return request
+
+    async def test_dashboard_koordinator_async_sama_dengan_sync(self):
+        response = await koordinator_dashboard_async(self._request())
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Dashboard Koordinator PKL")
+
+        def render_sync():
+            request = RequestFactory().get("/koor/dashboard/")
+            request.user = self.user
+            request.pkl_role = resolve_role(self.user)
+            return koordinator_dashboard(request)
+
+        expected = await sync_to_async(render_sync)()
+        self.assertEqual(response.content, expected.content)
+
+    async def test_dashboard_dosen_async_menolak_mahasiswa(self):
+        mhs_user = await User.objects.acreate_user(username="mhs_async", password="test")
+        response = await dosen_dashboard_async(self._request(mhs_user))
+        self.assertEqual(response.status_code, 403)
+
+    async def test_konteks_async_sama_dengan_sync_untuk_semua_peran(self):
+        mhs_user = await User.objects.acreate_user(username="mhs_konteks", password="test")
+        await Mahasiswa.objects.filter(nim="2008102000").aupdate(user=mhs_user)
+
+        konteks = []
+
+        def rekam(request, template_name, context):
+            konteks.append((template_name, context))
+            return HttpResponse()
+
+        def panggil_sync(view, user):
+            request = RequestFactory().get("/")
+            request.user = user
+            request.pkl_role = resolve_role(user)
+            return view(request)
+
+        pasangan = [
+            (self.user, views_dosen.dosen_dashboard, views_async.dosen_dashboard_async),
+            (self.user, views_dosen.koordinator_dashboard, views_async.koordinator_dashboard_async),
+            (mhs_user, views_mahasiswa.mahasiswa_dashboard, views_async.mahasiswa_dashboard_async),
+        ]
+        with mock.patch.object(views_async, "render", rekam), \
+                mock.patch.object(views_dosen, "render", rekam), \
+                mock.patch.object(views_mahasiswa, "render", rekam):
+            for user, view_sync, view_async in pasangan:
+                await view_async(self._request(user))
+                await sync_to_async(panggil_sync)(view_sync, user)
+
+        self.assertEqual(len(konteks), 6)
+        for hasil_async, hasil_sync in zip(konteks[::2], konteks[1::2]):
+            self.assertEqual(hasil_async, hasil_sync)
+
+
+@override_settings(PKL_SENDFILE_BACKEND="")
+class ProtectedDownloadTests(MediaSementaraMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal",
+            tahun_ajaran="2025/2026",
+            semester="GASAL",
+            tanggal_mulai="2025-01-01",
+            tanggal_selesai="2025-06-30",
+        )
+        self.user_mhs = User.objects.create_user(username="mhs_unduh", password="test")
+        self.mhs = Mahasiswa.objects.create(
+            user=self.user_mhs, nim="2008105000", nama="Mhs Unduh", angkatan=2022
+        )
+        self.isi = b"%PDF-1.4\n" + bytes(range(256)) * 8
+        self.seminar = SeminarHasilPKL.objects.create(
+            mahasiswa=self.mhs,
+            periode=periode,
+            judul_laporan="Laporan",
+            file_laporan=SimpleUploadedFile("laporan.pdf", self.isi),
+        )
+        self.url = f"/berkas/laporan/{self.seminar.pk}/"
+
+    def test_pemilik_bisa_unduh_dengan_range_dan_etag(self):
+        self.client.force_login(self.user_mhs)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.isi)
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("laporan_pkl_2008105000.pdf", response["Content-Disposition"])
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=9-18")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 9-18/{len(self.isi)}")
+        self.assertEqual(b"".join(response.streaming_content), self.isi[9:19])
+
+        response = self.client.get(self.url, HTTP_RANGE=f"bytes={len(self.isi)}-")
+        self.assertEqual(response.status_code, 416)
+
+        etag = self.client.get(self.url)["ETag"]
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_mahasiswa_lain_ditolak_dan_nginx_mendapat_x_accel_redirect(self):
+        lain = User.objects.create_user(username="mhs_lain_unduh", password="test")
+        Mahasiswa.objects.create(user=lain, nim="2008105001", nama="Lain", angkatan=2022)
+        self.client.force_login(lain)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+        self.client.force_login(self.user_mhs)
+        with self.settings(PKL_SENDFILE_BACKEND="nginx", PKL_SENDFILE_URL_PREFIX="/protected-media/"):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["X-Accel-Redirect"], f"/protected-media/{self.seminar.file_laporan.name}"
+        )
+        self.assertEqual(response.content, b"")
+
+
+@override_settings(PKL_UPLOAD_CHUNK_MAX_MB=0.001)
+class ChunkedLaporanUploadTests(MediaSementaraMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal",
+            tahun_ajaran="2025/2026",
+            semester="GASAL",
+            tanggal_mulai="2025-01-01",
+            tanggal_selesai="2025-06-30",
+        )
+        dosen = Dosen.objects.create(nidn="0099", nama="Dosen Unggah")
+        self.user = User.objects.create_user(username="mhs_unggah", password="test")
+        self.mhs = Mahasiswa.objects.create(
+            user=self.user, nim="2008106000", nama="Mhs Unggah", angkatan=2022,
+            periode=periode, dosen_pembimbing=dosen,
+        )
+        for ke in range(1, 6):
+            GuidanceSession.objects.create(
+                mahasiswa=self.mhs, pertemuan_ke=ke, tanggal="2025-01-05",
+                topik="Topik", ringkasan_diskusi="Diskusi", status="DONE",
+            )
+        self.client.force_login(self.user)
+        # potongan ±1 KB agar file uji kecil tetap terbagi beberapa kali PUT
+        self.isi = b"%PDF-1.4\n" + bytes(range(256)) * 10
+
+    def _init(self):
+        response = self.client.post(
+            "/mhs/seminar/unggah/", {"nama_file": "laporan akhir.pdf", "ukuran": len(self.isi)}
+        )
+        self.assertEqual(response.status_code, 201)
+        return response.json()
+
+    def _put(self, sesi, offset, data):
+        return self.client.put(
+            f"{sesi['url']}?offset={offset}", data=data, content_type="application/octet-stream"
+        )
+
+    def test_unggah_bertahap_bisa_dilanjutkan_dan_dirakit_ke_seminar(self):
+        sesi = self._init()
+        step = sesi["chunk_max"]
+        self.assertEqual(self._put(sesi, 0, self.isi[:step]).json()["offset"], step)
+
+        # potongan terlalu besar / offset lama ditolak, offset server dikembalikan
+        self.assertEqual(self._put(sesi, step, self.isi[step:step * 3]).status_code, 413)
+        response = self._put(sesi, 0, self.isi[:step])
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["offset"], step)
+
+        # "koneksi putus": klien menanyakan offset lalu melanjutkan
+        offset = self.client.get(sesi["url"]).json()["offset"]
+        while offset < len(self.isi):
+            offset = self._put(sesi, offset, self.isi[offset:offset + step]).json()["offset"]
+
+        response = self.client.post(sesi["selesai_url"], {"sha256": "0" * 64, "judul_laporan": "Judul"})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["offset"], 0)
+
+        offset = 0
+        while offset < len(self.isi):
+            offset = self._put(sesi, offset, self.isi[offset:offset + step]).json()["offset"]
+        response = self.client.post(
+            sesi["selesai_url"],
+            {"sha256": hashlib.sha256(self.isi).hexdigest(), "judul_laporan": "Judul Akhir"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        seminar = SeminarHasilPKL.objects.get(mahasiswa=self.mhs)
+        self.assertEqual(seminar.status, "DIKIRIM")
+        self.assertEqual(seminar.judul_laporan, "Judul Akhir")
+        self.assertEqual(seminar.periode, self.mhs.periode)
+        with seminar.file_laporan.open("rb") as fh:
+            self.assertEqual(fh.read(), self.isi)
+        upload = UnggahanLaporan.objects.get(pk=sesi["id"])
+        self.assertEqual((upload.status, upload.seminar_id), ("SELESAI", seminar.pk))
+        self.assertFalse(os.path.exists(upload.temp_path))
+        self.assertEqual(self.client.post(sesi["selesai_url"], {}).status_code, 409)
+
+    def test_finalisasi_bersamaan_memakai_seminar_yang_sudah_dibuat(self):
+        sesi = self._init()
+        offset = 0
+        while offset < len(self.isi):
+            offset = self._put(sesi, offset, self.isi[offset:offset + sesi["chunk_max"]]).json()["offset"]
+        # tab lain sudah membuat seminar setelah request ini membaca status seminarnya
+        lebih_dulu = SeminarHasilPKL.objects.create(
+            mahasiswa=self.mhs, periode=self.mhs.periode, judul_laporan="Tab Lain",
+            file_laporan="laporan_pkl/tab-lain.pdf",
+        )
+        with mock.patch.object(views_upload, "_status_seminar", return_value=(None, 5, True, False)):
+            response = self.client.post(
+                sesi["selesai_url"],
+                {"sha256": hashlib.sha256(self.isi).hexdigest(), "judul_laporan": "Judul Akhir"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["seminar_id"], lebih_dulu.pk)
+        lebih_dulu.refresh_from_db()
+        self.assertEqual((lebih_dulu.judul_laporan, lebih_dulu.status), ("Judul Akhir", "DIKIRIM"))
+
+    def test_batas_ukuran_format_dan_kepemilikan(self):
+        response = self.client.post("/mhs/seminar/unggah/", {"nama_file": "a.pdf", "ukuran": 10**9})
+        self.assertEqual(response.status_code, 413)
+        response = self.client.post("/mhs/seminar/unggah/", {"nama_file": "a.docx", "ukuran": 10})
+        self.assertEqual(response.status_code, 400)
+
+        sesi = self._init()
+        self.assertEqual(self._put(sesi, 0, b"x" * (len(self.isi) + 1)).status_code, 413)
+
+        lain = User.objects.create_user(username="mhs_lain_unggah", password="test")
+        Mahasiswa.objects.create(user=lain, nim="2008106001", nama="Lain", angkatan=2022)
+        self.client.force_login(lain)
+        self.assertEqual(self.client.get(sesi["url"]).status_code, 404)
+
+
+class LoadtestPortalTests(LiveServerTestCase):
+    def _jalankan(self, campuran):
+        with tempfile.NamedTemporaryFile("r", suffix=".json") as fh:
+            call_command(
+                "loadtest_portal", base_url=self.live_server_url, ramp="1", durasi=1.5,
+                campuran=campuran, output=fh.name, stdout=io.StringIO(),
+            )
+            return json.load(fh)["tahap"][0]
+
+    def test_dataset_sintetis_dan_laporan_per_endpoint(self):
+        call_command("loadtest_portal", siapkan=True, mahasiswa=4, dosen=2, stdout=io.StringIO())
+        self.assertFalse(PeriodePKL.objects.get(nama_periode="PKL Uji Beban").aktif)
+
+        tahap = self._jalankan("mahasiswa=1")
+        self.assertEqual(tahap["konkurensi"], 1)
+        self.assertEqual(tahap["errors"], 0)
+        kirim = tahap["endpoint"]["POST mahasiswa_logbook_add"]
+        self.assertGreater(kirim["requests"], 0)
+        self.assertLessEqual(kirim["p50_ms"], kirim["p95_ms"])
+        self.assertLessEqual(kirim["p95_ms"], kirim["p99_ms"])
+        self.assertTrue(LogbookEntry.objects.filter(aktivitas__startswith="Aktivitas uji beban #").exists())
+
+        tahap = self._jalankan("koordinator=1")
+        self.assertEqual(tahap["errors"], 0)
+        self.assertIn("POST koordinator_seminar_detail", tahap["endpoint"])
+        self.assertTrue(SeminarHasilPKL.objects.filter(status="DIJADWALKAN").exists())
+
+
+class LogbookReviewMassalTests(TestCase):
+    def setUp(self):
+        self.dosen = Dosen.objects.create(
+            user=User.objects.create_user(username="dosen_massal", password="test"),
+            nidn="9100", nama="Pembimbing Massal",
+        )
+        lain = Dosen.objects.create(nidn="9101", nama="Dosen Lain")
+        periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal", tahun_ajaran="2025/2026", semester="GASAL",
+            tanggal_mulai="2025-08-04", tanggal_selesai="2025-12-31",
+        )
+        self.mhs = [
+            Mahasiswa.objects.create(
+                nim=f"200810910{i}", nama=f"Mhs Massal {i}", angkatan=2022, email=f"mhs{i}@example.com",
+                dosen_pembimbing=self.dosen, periode=periode,
+            )
+            for i in range(2)
+        ]
+        senin = datetime.date(2025, 8, 4)
+        self.entries = []
+        for mhs in self.mhs:
+            for hari in (0, 1, 7):  # dua minggu
+                self.entries.append(LogbookEntry.objects.create(
+                    mahasiswa=mhs, tanggal=senin + datetime.timedelta(days=hari), aktivitas="a",
+                    status="SUBMIT", catatan_dosen="lama",
+                ))
+        self.sudah = LogbookEntry.objects.create(
+            mahasiswa=self.mhs[0], tanggal=senin, aktivitas="a", status="DISETUJUI",
+        )
+        mhs_lain = Mahasiswa.objects.create(nim="2008109199", nama="Lain", angkatan=2022, dosen_pembimbing=lain)
+        self.milik_lain = LogbookEntry.objects.create(
+            mahasiswa=mhs_lain, tanggal=senin, aktivitas="a", status="SUBMIT",
+        )
+        self.client.force_login(self.dosen.user)
+
+    def test_antrean_dikelompokkan_per_mahasiswa_dan_minggu(self):
+        response = self.client.get("/dosen/logbook/review/")
+        self.assertEqual(response.status_code, 200)
+        antrean = response.context["antrean"]
+        self.assertEqual([m for m, _ in antrean], self.mhs)
+        minggu = antrean[0][1]
+        self.assertEqual([len(rows) for _, rows in minggu], [2, 1])
+        self.assertEqual(minggu[1][0].isoformat(), "2025-08-11")
+        self.assertNotContains(response, f'name="logbook" value="{self.milik_lain.pk}"')
+
+    def test_setujui_massal_satu_transaksi_dan_notifikasi_per_mahasiswa(self):
+        dipilih = self.entries[:4]  # 3 milik mhs 0, 1 milik mhs 1
+        with services.periksa_anggaran(services.review_logbook_massal):
+            jumlah = services.review_logbook_massal(
+                services.antrean_review(self.dosen).filter(pk__in=[e.pk for e in dipilih]),
+                "DISETUJUI", "Bagus",
+            )
+        self.assertEqual(jumlah, 4)
+        for entry in dipilih:
+            entry.refresh_from_db()
+            self.assertEqual((entry.status, entry.catatan_dosen), ("DISETUJUI", "Bagus"))
+            self.assertGreater(entry.diupdate_pada, self.entries[-1].diupdate_pada)
+        self.assertEqual(LogbookEntry.objects.filter(status="SUBMIT", dosen_pembimbing=self.dosen).count(), 2)
+        notif = Notifikasi.objects.filter(jenis="LOGBOOK_REVIEW").order_by("email")
+        self.assertEqual([n.email for n in notif], ["mhs0@example.com", "mhs1@example.com"])
+        self.assertTrue(notif[0].judul.startswith("3 logbook"))
+
+    def test_entri_yang_direview_di_sela_batch_tidak_ditimpa(self):
+        dipilih = self.entries[:2]
+        # review satu per satu selesai setelah form batch divalidasi
+        LogbookEntry.objects.filter(pk=dipilih[0].pk).update(status="DISETUJUI", catatan_dosen="sudah")
+
+        jumlah = services.review_logbook_massal(dipilih, "REVISI", "Perbaiki")
+        self.assertEqual(jumlah, 1)
+        for entry in dipilih:
+            entry.refresh_from_db()
+        self.assertEqual((dipilih[0].status, dipilih[0].catatan_dosen), ("DISETUJUI", "sudah"))
+        self.assertEqual((dipilih[1].status, dipilih[1].catatan_dosen), ("REVISI", "Perbaiki"))
+        self.assertEqual(Notifikasi.objects.filter(jenis="LOGBOOK_REVIEW").count(), 1)
+
+    def test_post_revisi_tanpa_catatan_mempertahankan_catatan_lama(self):
+        response = self.client.post(
+            "/dosen/logbook/review/", {"logbook": [self.entries[0].pk], "status": "REVISI"}
+        )
+        self.assertRedirects(response, "/dosen/logbook/review/", fetch_redirect_response=False)
+        self.entries[0].refresh_from_db()
+        self.assertEqual((self.entries[0].status, self.entries[0].catatan_dosen), ("REVISI", "lama"))
+
+    def test_menolak_logbook_dosen_lain_atau_yang_sudah_direview(self):
+        for pk in (self.milik_lain.pk, self.sudah.pk):
+            response = self.client.post(
+                "/dosen/logbook/review/", {"logbook": [self.entries[0].pk, pk], "status": "DISETUJUI"}
+            )
+            self.assertEqual(response.status_code, 200)
+        self.entries[0].refresh_from_db()
+        self.milik_lain.refresh_from_db()
+        self.assertEqual((self.entries[0].status, self.milik_lain.status), ("SUBMIT", "SUBMIT"))
+
+    def test_review_satu_logbook_tetap_bisa_dibuka(self):
+        response = self.client.get(f"/dosen/logbook/{self.entries[0].pk}/review/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(f"/dosen/logbook/{self.milik_lain.pk}/review/").status_code, 404)
+
+
+class LogbookBatchTests(TestCase):
+    def setUp(self):
+        self.dosen = Dosen.objects.create(nidn="9200", nama="Pembimbing Batch")
+        self.periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal", tahun_ajaran="2025/2026", semester="GASAL",
+            tanggal_mulai="2025-08-01", tanggal_selesai="2025-12-31",
+        )
+        mitra = Mitra.objects.create(nama="Mitra Batch")
+        self.mhs = Mahasiswa.objects.create(
+            user=User.objects.create_user(username="mhs_batch", password="test"),
+            nim="2008109200", nama="Mhs Batch", angkatan=2022,
+            dosen_pembimbing=self.dosen, periode=self.periode,
+        )
+        PendaftaranPKL.objects.create(
+            mahasiswa=self.mhs, periode=self.periode, mitra=mitra, jenis_pkl="MANDIRI",
+            tanggal_mulai_pkl="2025-08-04", tanggal_selesai_pkl="2025-08-29", status="DISETUJUI",
+        )
+        self.client.force_login(self.mhs.user)
+
+    def _entri(self, tanggal="2025-08-04", **extra):
+        return {
+            "idempotency_key": str(uuid.uuid4()), "tanggal": tanggal, "jam_mulai": "08:00",
+            "jam_selesai": "16:00", "aktivitas": "Membersihkan data", **extra,
+        }
+
+    def _kirim(self, items):
+        return self.client.post("/mhs/logbook/batch/", json.dumps(items), content_type="application/json")
+
+    def test_kirim_ulang_batch_tidak_menggandakan_entri(self):
+        items = [self._entri(f"2025-08-{d:02d}") for d in (4, 5, 6)]
+        response = self._kirim(items)
+        self.assertEqual(response.status_code, 201)
+        pertama = response.json()
+        self.assertEqual(pertama["dibuat"], 3)
+        entry = LogbookEntry.objects.get(pk=pertama["hasil"][0]["id"])
+        self.assertEqual(
+            (entry.status, entry.dosen_pembimbing, entry.periode), ("SUBMIT", self.dosen, self.periode)
+        )
+
+        response = self._kirim(items)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([h["status"] for h in response.json()["hasil"]], ["SUDAH_ADA"] * 3)
+        self.assertEqual(
+            [h["id"] for h in response.json()["hasil"]], [h["id"] for h in pertama["hasil"]]
+        )
+
+        response = self._kirim(items + [self._entri("2025-08-07")])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["dibuat"], 1)
+        self.assertEqual(LogbookEntry.objects.filter(mahasiswa=self.mhs).count(), 4)
+
+    def test_batch_ditolak_utuh_bila_ada_entri_tidak_valid(self):
+        valid = self._entri()
+        items = [
+            valid,
+            self._entri("2025-09-01"),  # setelah masa PKL
+            {**self._entri(), "idempotency_key": valid["idempotency_key"]},
+            self._entri(aktivitas=""),
+            self._entri(idempotency_key="bukan-uuid"),
+        ]
+        response = self._kirim(items)
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertEqual(sorted(errors), ["1", "2", "3", "4"])
+        self.assertEqual(errors["1"]["tanggal"][0]["code"], "di_luar_masa_pkl")
+        self.assertEqual(errors["2"]["idempotency_key"][0]["code"], "duplikat")
+        self.assertIn("aktivitas", errors["3"])
+        self.assertFalse(LogbookEntry.objects.filter(mahasiswa=self.mhs).exists())
+
+        self.assertEqual(self._kirim({"bukan": "array"}).status_code, 400)
+        with self.settings(PKL_LOGBOOK_BATCH_MAX=2):
+            self.assertEqual(self._kirim([self._entri()] * 3).status_code, 413)
+
+    def test_batch_ditolak_tanpa_masa_pkl_yang_lengkap(self):
+        PendaftaranPKL.objects.filter(mahasiswa=self.mhs).update(tanggal_selesai_pkl=None)
+        response = self._kirim([self._entri("2030-01-01")])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["errors"]["__all__"][0]["code"], "masa_pkl_kosong")
+
+        PendaftaranPKL.objects.filter(mahasiswa=self.mhs).delete()
+        self.assertEqual(self._kirim([self._entri()]).status_code, 400)
+        self.assertFalse(LogbookEntry.objects.filter(mahasiswa=self.mhs).exists())
+
+    def test_anggaran_query_tidak_bergantung_jumlah_entri(self):
+        for jumlah in (1, 20):
+            items = [self._entri(f"2025-08-{4 + i % 20:02d}") for i in range(jumlah)]
+            with services.periksa_anggaran(services.kirim_logbook_massal):
+                hasil = services.kirim_logbook_massal(self.mhs, items)
+            self.assertEqual(hasil["dibuat"], jumlah)
@@ -6,6 +6,16 @@ from django.urls import path
 from . import views
 app_name = "portal"
 
+# Di deployment ASGI dashboard dilayani varian async (views_async.py).
+if settings.PKL_ASYNC_DASHBOARDS:
+    _dosen_dashboard = views.dosen_dashboard_async
+    _koordinator_dashboard = views.koordinator_dashboard_async
+    _mahasiswa_dashboard = views.mahasiswa_dashboard_async
+else:
+    _dosen_dashboard = views.dosen_dashboard
+    _koordinator_dashboard = views.koordinator_dashboard
+    _mahasiswa_dashboard = views.mahasiswa_dashboard
+
 urlpatterns = [
     # Auth
     path(
@@ -18,17 +28,22 @@ urlpatterns = [
 
     # Dosen
     path("dosen/", views.dosen_list, name="dosen_list"),
-    path("dosen/dashboard/", views.dosen_dashboard, name="dosen_dashboard"),
+    path("dosen/dashboard/", _dosen_dashboard, name="dosen_dashboard"),
     path(
         "dosen/mahasiswa/<int:mahasiswa_id>/",
         views.dosen_mahasiswa_detail,
         name="dosen_mahasiswa_detail",
     ),
     path(
-        "dosen/logbook/<int:logbook_id>/review/",
+        "dosen/logbook/<int:pk>/review/",
         views.dosen_logbook_review,
         name="dosen_logbook_review",
     ),
+    path(
+        "dosen/logbook/review/",
+        views.dosen_logbook_review_massal,
+        name="dosen_logbook_review_massal",
+    ),
     path(
         "dosen/logbook/export/",
         views.dosen_logbook_export,
@@ -83,7 +98,7 @@ urlpatterns = [
     # Koordinator PKL
     path(
         "koor/dashboard/",
-        views.koordinator_dashboard,
+        _koordinator_dashboard,
         name="koordinator_dashboard",
     ),
     path(
@@ -106,6 +121,16 @@ urlpatterns = [
         views.koordinator_seminar_list,
         name="koordinator_seminar_list",
     ),
+    path(
+        "koor/laporan/cari/",
+        views.koordinator_laporan_cari,
+        name="koordinator_laporan_cari",
+    ),
+    path(
+        "koor/analitik/penilaian/",
+        views.koordinator_analitik_penilaian,
+        name="koordinator_analitik_penilaian",
+    ),
     path(
         "koor/seminar/<int:pk>/",
         views.koordinator_seminar_detail,
@@ -130,12 +155,17 @@ urlpatterns = [
 
 
     # Mahasiswa
-    path("mhs/dashboard/", views.mahasiswa_dashboard, name="mahasiswa_dashboard"),
+    path("mhs/dashboard/", _mahasiswa_dashboard, name="mahasiswa_dashboard"),
     path(
         "mhs/logbook/add/",
         views.mahasiswa_logbook_add,
         name="mahasiswa_logbook_add",
     ),
+    path(
+        "mhs/logbook/batch/",
+        views.mahasiswa_logbook_batch,
+        name="mahasiswa_logbook_batch",
+    ),
     path(
         "mhs/logbook/export/",
         views.mahasiswa_logbook_export,
@@ -151,6 +181,22 @@ urlpatterns = [
         views.mahasiswa_seminar_pendaftaran,
         name="mahasiswa_seminar_pendaftaran",
     ),
+    # Unggahan laporan bertahap (lihat views_upload.py)
+    path(
+        "mhs/seminar/unggah/",
+        views.laporan_upload_init,
+        name="mahasiswa_laporan_upload_init",
+    ),
+    path(
+        "mhs/seminar/unggah/<uuid:upload_id>/",
+        views.laporan_upload_chunk,
+        name="mahasiswa_laporan_upload",
+    ),
+    path(
+        "mhs/seminar/unggah/<uuid:upload_id>/selesai/",
+        views.laporan_upload_finalize,
+        name="mahasiswa_laporan_upload_selesai",
+    ),
     path(
         "mhs/bimbingan/",
         views.mahasiswa_guidance_list,
@@ -162,6 +208,19 @@ urlpatterns = [
         name="mahasiswa_guidance_create",
     ),
 
+    # Sinkronisasi data (change feed)
+    path("sync/changes/", views.change_feed, name="change_feed"),
+    path("jobs/<int:pk>/", views.job_status, name="job_status"),
+    path("jobs/<int:pk>/berkas/", views.job_download, name="job_download"),
+
+    # Berkas terproteksi (otorisasi per peran, transfer oleh web server)
+    path(
+        "berkas/surat-penerimaan/<int:pk>/",
+        views.download_surat_penerimaan,
+        name="download_surat_penerimaan",
+    ),
+    path("berkas/laporan/<int:pk>/", views.download_laporan, name="download_laporan"),
+
 ]
 
 if settings.DEBUG:
@@ -4,6 +4,7 @@ from .views_dosen import (
     dosen_dashboard,
     dosen_mahasiswa_detail,
     dosen_logbook_review,
+    dosen_logbook_review_massal,
     dosen_logbook_export,
     dosen_guidance_list,
     dosen_guidance_detail,
@@ -26,12 +27,28 @@ from .views_dosen import (
 from .views_mahasiswa import (
     mahasiswa_dashboard,
     mahasiswa_logbook_add,
+    mahasiswa_logbook_batch,
     mahasiswa_logbook_export,
     mahasiswa_guidance_list,
     mahasiswa_guidance_create,
     mahasiswa_pendaftaran_pkl,
     mahasiswa_seminar_pendaftaran,
 )
+from .views_sync import change_feed
+from .views_jobs import job_download, job_status
+from .views_files import download_laporan, download_surat_penerimaan
+from .views_search import koordinator_laporan_cari
+from .views_analitik import koordinator_analitik_penilaian
+from .views_upload import (
+    laporan_upload_chunk,
+    laporan_upload_finalize,
+    laporan_upload_init,
+)
+from .views_async import (
+    dosen_dashboard_async,
+    koordinator_dashboard_async,
+    mahasiswa_dashboard_async,
+)
 
 __all__ = [
     # Auth
@@ -42,6 +59,7 @@ __all__ = [
     "dosen_dashboard",
     "dosen_mahasiswa_detail",
     "dosen_logbook_review",
+    "dosen_logbook_review_massal",
     "dosen_logbook_export",
     "dosen_guidance_list",
     "dosen_guidance_detail",
@@ -59,14 +77,32 @@ __all__ = [
     "koordinator_seminar_list",
     "koordinator_seminar_detail",
     "koordinator_dosen_kuota",
+    "koordinator_laporan_cari",
+    "koordinator_analitik_penilaian",
     "koor_as_dosen_dashboard",
-    "dosen_as_koordinator_dashboard"
+    "dosen_as_koordinator_dashboard",
     # Mahasiswa
     "mahasiswa_dashboard",
     "mahasiswa_logbook_add",
+    "mahasiswa_logbook_batch",
     "mahasiswa_logbook_export",
     "mahasiswa_guidance_list",
     "mahasiswa_guidance_create",
     "mahasiswa_pendaftaran_pkl",
     "mahasiswa_seminar_pendaftaran",
+    "laporan_upload_init",
+    "laporan_upload_chunk",
+    "laporan_upload_finalize",
+    # Sinkronisasi
+    "change_feed",
+    # Job latar belakang
+    "job_status",
+    "job_download",
+    # Berkas terproteksi
+    "download_surat_penerimaan",
+    "download_laporan",
+    # Dashboard async (ASGI)
+    "dosen_dashboard_async",
+    "koordinator_dashboard_async",
+    "mahasiswa_dashboard_async",
 ]
@@ -0,0 +1,62 @@
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import render
+
+from masterdata.analytics import AMBANG_KALIBRASI, AnalitikTidakTersedia, analitik_periode
+from masterdata.models import SeminarAssessment
+from masterdata.periode import daftar_periode, periode_berjalan
+
+from .views_dosen import _require_koordinator
+
+
+def _label_kolom(nama: str) -> str:
+    if nama == "nilai_angka":
+        return "Nilai Akhir"
+    return SeminarAssessment._meta.get_field(nama).verbose_name.capitalize()
+
+
+@login_required
+def koordinator_analitik_penilaian(request):
+    """Sebaran nilai seminar, kalibrasi penilai, dan kesepakatan penguji-pembimbing per periode."""
+    koor, error = _require_koordinator(request)
+    if error:
+        return error
+
+    # daftar & periode berjalan dari cache masterdata.periode (tanpa query per request)
+    periode_list = daftar_periode()
+    try:
+        periode_id = int(request.GET.get("periode") or 0) or None
+    except ValueError:
+        periode_id = None
+    periode = next((p for p in periode_list if p.pk == periode_id), None)
+    if periode is None:
+        # default: periode aktif terbaru, atau periode terbaru bila tidak ada yang aktif
+        periode = periode_berjalan() or next(iter(periode_list), None)
+
+    analitik = None
+    if periode is not None:
+        try:
+            analitik = analitik_periode(periode.pk)
+        except AnalitikTidakTersedia as exc:
+            messages.error(request, str(exc))
+
+    kolom = []
+    if analitik and analitik["jumlah_penilaian"]:
+        kolom = [_label_kolom(nama) for nama in analitik["aspek"]]
+        for p in analitik["penilai"]:
+            p["per_aspek"] = list(zip(p["rata"], p["z"]))
+        for r in analitik["kesepakatan"].get("korelasi", []):
+            r["label"] = _label_kolom(r["aspek"])
+        for peran, ringkas in analitik["sebaran"].items():
+            for label, baris in zip(kolom, ringkas):
+                baris["label"] = label
+
+    context = {
+        "koordinator": koor,
+        "periode": periode,
+        "periode_list": periode_list,
+        "analitik": analitik,
+        "kolom": kolom,
+        "ambang": AMBANG_KALIBRASI,
+    }
+    return render(request, "portal/koordinator_analitik_penilaian.html", context)
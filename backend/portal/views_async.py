@@ -0,0 +1,66 @@
+# backend/portal/views_async.py
+"""
+Varian async dashboard untuk deployment ASGI (settings.PKL_ASYNC_DASHBOARDS).
+
+Isi dashboard dihitung oleh layanan yang sama dengan view sync
+(``portal.services.statistik_*``), dipanggil lewat ``sync_to_async`` sehingga
+event loop tidak terblokir selama query berjalan. Query-nya tetap berurutan:
+semua pemanggilan ORM lewat ``sync_to_async`` memakai satu executor
+thread-sensitive, jadi ``asyncio.gather`` atas query tidak memberi paralelisme.
+Render juga dijalankan di thread sync karena template (context processor,
+request.user) masih boleh menyentuh database.
+"""
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.decorators import login_required
+from django.http import HttpResponseForbidden
+from django.shortcuts import render
+
+from masterdata.roles import resolve_role
+
+from .services import statistik_dosen, statistik_koordinator, statistik_mahasiswa
+
+
+async def _aresolve_role(request):
+    user = await request.auser()
+    # profil dimuat di thread sync: atribut lazy-nya tidak boleh query di event loop
+    return await sync_to_async(lambda: resolve_role(user).muat_profil())()
+
+
+async def _arender(request, template_name, context):
+    return await sync_to_async(render)(request, template_name, context)
+
+
+@login_required
+async def dosen_dashboard_async(request):
+    role = await _aresolve_role(request)
+    dosen = role.dosen
+    if dosen is None:
+        return HttpResponseForbidden("Akun ini tidak terhubung dengan data Dosen.")
+
+    context = {"dosen": dosen, **await sync_to_async(statistik_dosen)(dosen)}
+    return await _arender(request, "portal/dosen_dashboard.html", context)
+
+
+@login_required
+async def mahasiswa_dashboard_async(request):
+    role = await _aresolve_role(request)
+    mhs = role.mahasiswa
+    if mhs is None:
+        return HttpResponseForbidden("Akun ini tidak terhubung dengan data Mahasiswa.")
+
+    context = {"mahasiswa": mhs, **await sync_to_async(statistik_mahasiswa)(mhs)}
+    return await _arender(request, "portal/mahasiswa_dashboard.html", context)
+
+
+@login_required
+async def koordinator_dashboard_async(request):
+    role = await _aresolve_role(request)
+    koor = role.dosen
+    if koor is None:
+        return HttpResponseForbidden("Akun ini tidak terhubung dengan data Dosen.")
+    if not koor.is_koordinator_pkl:
+        return HttpResponseForbidden("Anda bukan koordinator PKL.")
+
+    context = {"koordinator": koor, **await sync_to_async(statistik_koordinator)(koor)}
+    return await _arender(request, "portal/koordinator_dashboard.html", context)
@@ -11,17 +11,16 @@ def portal_logout(request):
 
 @login_required
 def after_login(request):
-    user = request.user
+    role = request.pkl_role
 
     # Jika akun dosen
-    if hasattr(user, "dosen_profile"):
-        dosen = user.dosen_profile
-        if dosen.is_koordinator_pkl:
+    if role.is_dosen:
+        if role.is_koordinator:
             return redirect("portal:koordinator_dashboard")
         return redirect("portal:dosen_dashboard")
 
     # Jika akun mahasiswa
-    if hasattr(user, "mahasiswa_profile"):
+    if role.is_mahasiswa:
         return redirect("portal:mahasiswa_dashboard")
 
     # Jika bukan keduanya
@@ -1,17 +1,35 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.db.models import Count, Max, Q
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseForbidden, HttpResponse
+from django.http import HttpResponseForbidden, HttpResponse, JsonResponse
+from django.urls import reverse
 from django.contrib import messages
-import csv
+from django.db import transaction
+from django.utils import timezone
 
 from logbook.models import LogbookEntry
 from guidance.models import GuidanceSession
+from jobs.registry import enqueue
+from notifications import events as notif_events
+from notifications.outbox import catat
 from .pdf_utils import render_to_pdf
+from .services import (
+    antrean_review,
+    antrean_review_per_minggu,
+    bentrok_jadwal,
+    detail_seminar,
+    review_logbook_massal,
+    statistik_dosen,
+    statistik_koordinator,
+    write_guidance_dosen_csv,
+    write_logbook_dosen_csv,
+)
+from masterdata.access import DOSEN, boleh_lihat
+from masterdata.archive import baca_periode
+from masterdata.periode import daftar_periode, periode_berjalan
 from masterdata.models import (
     Dosen,
     Mahasiswa,
-    Mitra,
     PendaftaranPKL,
     SeminarHasilPKL,
     SeminarAssessment,
@@ -19,6 +37,7 @@ from masterdata.models import (
 from .forms import (
     GuidanceSessionCreateForm,
     LogbookReviewForm,
+    LogbookReviewMassalForm,
     MahasiswaGuidanceForm,      # boleh tidak dipakai, tidak apa-apa
     DosenGuidanceValidationForm,
     PembimbingAssessmentForm,
@@ -32,11 +51,12 @@ from .forms import (
 # =========================
 
 def _require_dosen(request):
-    if not hasattr(request.user, "dosen_profile"):
+    dosen = request.pkl_role.dosen
+    if dosen is None:
         return None, HttpResponseForbidden(
             "Akun ini tidak terhubung dengan data Dosen."
         )
-    return request.user.dosen_profile, None
+    return dosen, None
 
 
 def _require_koordinator(request):
@@ -48,6 +68,44 @@ def _require_koordinator(request):
     return dosen, None
 
 
+def _terlihat(request, model):
+    """
+    Baris ``model`` yang boleh dilihat akun ini sebagai dosen (bimbingan dan
+    seminar yang ia uji); hak lihat-semua koordinator tidak berlaku di sini.
+    """
+    return model.objects.visible_to(request.pkl_role, peran=DOSEN)
+
+
+def _baca_periode_dosen(request, queryset, periode):
+    """``baca_periode`` untuk queryset ``_terlihat``; baris arsip disaring dengan aturan yang sama."""
+    hasil = baca_periode(queryset, periode)
+    if isinstance(hasil, list):
+        # arsip tidak membawa filter visible_to(); panel seminar sudah terisi dari data arsip
+        hasil = [obj for obj in hasil if boleh_lihat(request.pkl_role, obj, peran=DOSEN)]
+    return hasil
+
+
+SEMUA_PERIODE = "semua"
+
+
+def _periode_diminta(request):
+    """
+    Periode dari ``?periode=<id>``; tanpa parameter (atau id tidak dikenal)
+    berarti periode berjalan (semua periode bila tidak ada yang aktif),
+    ``?periode=semua`` berarti semua periode di tabel utama. Periode yang
+    sudah diarsipkan dibaca dari arsip (masterdata.archive.baca_periode).
+    """
+    periode_id = request.GET.get("periode", "")
+    if periode_id == SEMUA_PERIODE:
+        return None
+    if periode_id.isdigit():
+        # dari daftar yang sudah di-cache: tanpa query PeriodePKL per request
+        periode = next((p for p in daftar_periode() if p.pk == int(periode_id)), None)
+        if periode is not None:
+            return periode
+    return periode_berjalan()
+
+
 # =========================
 # Dosen – umum & dashboard
 # =========================
@@ -72,64 +130,19 @@ def dosen_dashboard(request):
     if error:
         return error
 
-    # Mahasiswa bimbingan
-    mahasiswa_list = (
-        Mahasiswa.objects.filter(dosen_pembimbing=dosen)
-        .select_related("periode", "mitra")
-        .order_by("nim")
-    )
-
-    # Ringkasan logbook
-    logbook_stats = (
-        LogbookEntry.objects.filter(dosen_pembimbing=dosen)
-        .values("status")
-        .annotate(jumlah=Count("id"))
-    )
-    logbook_by_status = {row["status"]: row["jumlah"] for row in logbook_stats}
-
-    # Ringkasan bimbingan
-    guidance_stats = (
-        GuidanceSession.objects.filter(dosen_pembimbing=dosen)
-        .values("status")
-        .annotate(jumlah=Count("id"))
-    )
-    guidance_by_status = {row["status"]: row["jumlah"] for row in guidance_stats}
-
-    # Logbook terbaru
-    recent_logbooks = (
-        LogbookEntry.objects.filter(dosen_pembimbing=dosen)
-        .select_related("mahasiswa")
-        .order_by("-tanggal", "-dibuat_pada")[:10]
-    )
-
-    # Bimbingan terbaru
-    recent_guidances = (
-        GuidanceSession.objects.filter(dosen_pembimbing=dosen)
-        .select_related("mahasiswa")
-        .order_by("-tanggal", "-dibuat_pada")[:10]
-    )
-
-    context = {
-        "dosen": dosen,
-        "mahasiswa_list": mahasiswa_list,
-        "logbook_by_status": logbook_by_status,
-        "guidance_by_status": guidance_by_status,
-        "recent_logbooks": recent_logbooks,
-        "recent_guidances": recent_guidances,
-    }
+    context = {"dosen": dosen, **statistik_dosen(dosen)}
     return render(request, "portal/dosen_dashboard.html", context)
 
 @login_required
 def koor_as_dosen_dashboard(request):
-    dosen_login = getattr(request.user, "dosen_profile", None)
-    if not dosen_login or not dosen_login.is_koordinator_pkl:
+    if not request.pkl_role.is_koordinator:
         return HttpResponseForbidden("Bukan koordinator PKL.")
     # langsung delegasi ke dashboard dosen
     return dosen_dashboard(request)
 
 @login_required
 def dosen_as_koordinator_dashboard(request):
-    dosen_login = getattr(request.user, "dosen_profile", None)
+    dosen_login = request.pkl_role.dosen
     if not dosen_login:
         return HttpResponseForbidden("Akun ini bukan dosen.")
     if not dosen_login.is_koordinator_pkl:
@@ -143,16 +156,16 @@ def dosen_mahasiswa_detail(request, mahasiswa_id: int):
         return error
 
     mahasiswa = get_object_or_404(
-        Mahasiswa.objects.select_related("periode", "mitra"),
+        _terlihat(request, Mahasiswa).select_related("periode", "mitra"),
         pk=mahasiswa_id,
-        dosen_pembimbing=dosen,
     )
 
-    logbooks = LogbookEntry.objects.filter(mahasiswa=mahasiswa).order_by(
-        "-tanggal", "-dibuat_pada"
+    periode = _periode_diminta(request)
+    logbooks = baca_periode(
+        LogbookEntry.objects.order_by("-tanggal", "-dibuat_pada"), periode, mahasiswa=mahasiswa
     )
-    guidances = GuidanceSession.objects.filter(mahasiswa=mahasiswa).order_by(
-        "-tanggal", "-dibuat_pada"
+    guidances = baca_periode(
+        GuidanceSession.objects.order_by("-tanggal", "-dibuat_pada"), periode, mahasiswa=mahasiswa
     )
 
     context = {
@@ -160,6 +173,8 @@ def dosen_mahasiswa_detail(request, mahasiswa_id: int):
         "mahasiswa": mahasiswa,
         "logbooks": logbooks,
         "guidances": guidances,
+        "periode": periode,
+        "periode_list": daftar_periode(),
     }
     return render(request, "portal/dosen_mahasiswa_detail.html", context)
 
@@ -175,9 +190,8 @@ def dosen_logbook_review(request, pk: int):
         return error
 
     entry = get_object_or_404(
-        LogbookEntry.objects.select_related("mahasiswa"),
+        _terlihat(request, LogbookEntry).select_related("mahasiswa"),
         pk=pk,
-        dosen_pembimbing=dosen,
     )
 
     if request.method == "POST":
@@ -195,59 +209,57 @@ def dosen_logbook_review(request, pk: int):
 
 
 @login_required
-def dosen_logbook_export(request):
+def dosen_logbook_review_massal(request):
+    """Antrean logbook SUBMIT per mahasiswa dan minggu; satu keputusan untuk banyak entri."""
+
     dosen, error = _require_dosen(request)
     if error:
         return error
 
-    entries = (
-        LogbookEntry.objects.filter(dosen_pembimbing=dosen)
-        .select_related("mahasiswa", "periode")
-        .order_by("mahasiswa__nim", "tanggal")
-    )
+    periode = _periode_diminta(request)
+    if request.method == "POST":
+        form = LogbookReviewMassalForm(request.POST, queryset=antrean_review(dosen))
+        if form.is_valid():
+            status = form.cleaned_data["status"]
+            jumlah = review_logbook_massal(
+                form.cleaned_data["logbook"], status, form.cleaned_data["catatan_dosen"]
+            )
+            label = "disetujui" if status == "DISETUJUI" else "dikembalikan untuk revisi"
+            messages.success(request, f"{jumlah} logbook {label}.")
+            return redirect(request.get_full_path())
+        messages.error(request, " ".join(e for errors in form.errors.values() for e in errors))
+    else:
+        form = LogbookReviewMassalForm(queryset=antrean_review(dosen, periode))
 
-    response = HttpResponse(content_type="text/csv")
-    filename = f"logbook_dosen_{dosen.nidn}.csv"
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    context = {
+        "dosen": dosen,
+        "form": form,
+        "antrean": antrean_review_per_minggu(dosen, periode),
+        "dipilih": request.POST.getlist("logbook"),
+        "periode": periode,
+        "periode_list": daftar_periode(),
+    }
+    return render(request, "portal/dosen_logbook_review_massal.html", context)
 
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "NIM",
-            "Nama Mahasiswa",
-            "Periode",
-            "Tanggal",
-            "Jam Mulai",
-            "Jam Selesai",
-            "Aktivitas",
-            "Tools",
-            "Output",
-            "Status",
-            "Catatan Dosen",
-            "Dibuat Pada",
-            "Diupdate Pada",
-        ]
-    )
 
-    for e in entries:
-        writer.writerow(
-            [
-                e.mahasiswa.nim,
-                e.mahasiswa.nama,
-                e.periode.nama_periode if e.periode else "",
-                e.tanggal,
-                e.jam_mulai or "",
-                e.jam_selesai or "",
-                (e.aktivitas or "").replace("\n", " "),
-                e.tools_yang_digunakan or "",
-                (e.output or "").replace("\n", " "),
-                e.get_status_display(),
-                (e.catatan_dosen or "").replace("\n", " "),
-                e.dibuat_pada,
-                e.diupdate_pada,
-            ]
+@login_required
+def dosen_logbook_export(request):
+    dosen, error = _require_dosen(request)
+    if error:
+        return error
+
+    if request.GET.get("background"):
+        # ekspor besar: kerjakan di worker, klien memantau lewat job_status
+        job = enqueue("portal.export_logbook_dosen", {"dosen_id": dosen.pk}, user=request.user)
+        return JsonResponse(
+            {"job_id": job.pk, "status_url": reverse("portal:job_status", args=[job.pk])},
+            status=202,
         )
 
+    response = HttpResponse(content_type="text/csv")
+    filename = f"logbook_dosen_{dosen.nidn}.csv"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    write_logbook_dosen_csv(response, dosen)
     return response
 
 
@@ -261,13 +273,19 @@ def dosen_guidance_list(request):
     if error:
         return error
 
-    sessions = (
-        GuidanceSession.objects.filter(dosen_pembimbing=dosen)
-        .select_related("mahasiswa")
-        .order_by("-tanggal", "-dibuat_pada")
+    periode = _periode_diminta(request)
+    sessions = _baca_periode_dosen(
+        request,
+        _terlihat(request, GuidanceSession).select_related("mahasiswa").order_by("-tanggal", "-dibuat_pada"),
+        periode,
     )
 
-    context = {"dosen": dosen, "sessions": sessions}
+    context = {
+        "dosen": dosen,
+        "sessions": sessions,
+        "periode": periode,
+        "periode_list": daftar_periode(),
+    }
     return render(request, "portal/dosen_guidance_list.html", context)
 
 
@@ -278,9 +296,8 @@ def dosen_guidance_detail(request, pk: int):
         return error
 
     session = get_object_or_404(
-        GuidanceSession.objects.select_related("mahasiswa"),
+        _terlihat(request, GuidanceSession).select_related("mahasiswa"),
         pk=pk,
-        dosen_pembimbing=dosen,
     )
 
     if request.method == "POST":
@@ -303,58 +320,10 @@ def dosen_guidance_export(request):
     if error:
         return error
 
-    sessions = (
-        GuidanceSession.objects.filter(dosen_pembimbing=dosen)
-        .select_related("mahasiswa", "periode")
-        .order_by("mahasiswa__nim", "tanggal", "pertemuan_ke")
-    )
-
     response = HttpResponse(content_type="text/csv")
     filename = f"bimbingan_dosen_{dosen.nidn}.csv"
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "NIM",
-            "Nama Mahasiswa",
-            "Periode",
-            "Pertemuan Ke",
-            "Tanggal",
-            "Jam Mulai",
-            "Jam Selesai",
-            "Metode",
-            "Platform",
-            "Topik",
-            "Ringkasan Diskusi",
-            "Tindak Lanjut",
-            "Status",
-            "Dibuat Pada",
-            "Diupdate Pada",
-        ]
-    )
-
-    for s in sessions:
-        writer.writerow(
-            [
-                s.mahasiswa.nim,
-                s.mahasiswa.nama,
-                s.periode.nama_periode if s.periode else "",
-                s.pertemuan_ke or "",
-                s.tanggal,
-                s.jam_mulai or "",
-                s.jam_selesai or "",
-                s.get_metode_display(),
-                s.platform or "",
-                (s.topik or "").replace("\n", " "),
-                (s.ringkasan_diskusi or "").replace("\n", " "),
-                (s.tindak_lanjut or "").replace("\n", " "),
-                s.get_status_display(),
-                s.dibuat_pada,
-                s.diupdate_pada,
-            ]
-        )
-
+    write_guidance_dosen_csv(response, dosen)
     return response
 
 
@@ -368,15 +337,26 @@ def dosen_seminar_list(request):
     if error:
         return error
 
-    seminars = (
-        SeminarHasilPKL.objects.filter(
-            Q(dosen_pembimbing=dosen) | Q(dosen_penguji=dosen)
+    periode = _periode_diminta(request)
+    seminars = list(
+        _baca_periode_dosen(
+            request,
+            _terlihat(request, SeminarHasilPKL)
+            .select_related("mahasiswa", "dosen_pembimbing", "periode")
+            .dengan_panel()
+            .order_by("jadwal", "mahasiswa__nim"),
+            periode,
         )
-        .select_related("mahasiswa", "dosen_pembimbing", "periode")
-        .order_by("jadwal", "mahasiswa__nim")
     )
+    for s in seminars:
+        s.saya_penguji = s.is_penguji(dosen)
 
-    context = {"dosen": dosen, "seminars": seminars}
+    context = {
+        "dosen": dosen,
+        "seminars": seminars,
+        "periode": periode,
+        "periode_list": daftar_periode(),
+    }
     return render(request, "portal/dosen_seminar_list.html", context)
 
 
@@ -386,37 +366,15 @@ def dosen_seminar_detail(request, pk: int):
     if error:
         return error
 
-    seminar = get_object_or_404(
-        SeminarHasilPKL.objects.select_related("mahasiswa", "periode", "dosen_pembimbing"),
-        pk=pk,
-    )
+    bundle = detail_seminar(pk)
+    seminar = bundle["seminar"]
 
-    if seminar.dosen_pembimbing != dosen and seminar.dosen_penguji != dosen:
+    # panel sudah di-prefetch: pemeriksaan ini tanpa query tambahan
+    if not boleh_lihat(request.pkl_role, seminar, peran=DOSEN):
         return HttpResponseForbidden("Anda tidak berhak mengakses seminar ini.")
 
-    assessments = SeminarAssessment.objects.filter(
-        seminar=seminar, role="PENGUJI"
-    ).select_related("penguji")
-    pembimbing_assessment = SeminarAssessment.objects.filter(
-        seminar=seminar, role="PEMBIMBING"
-    ).select_related("penguji").first()
-
-    final_score = None
-    final_grade = None
-    if assessments.exists():
-        total = sum(float(a.nilai_angka) for a in assessments if a.nilai_angka is not None)
-        if assessments.count():
-            final_score = round(total / assessments.count(), 2)
-            final_grade = SeminarAssessment.konversi_nilai_huruf(final_score)
-
-    context = {
-        "dosen": dosen,
-        "seminar": seminar,
-        "assessments": assessments,
-        "pembimbing_assessment": pembimbing_assessment,
-        "final_score": final_score,
-        "final_grade": final_grade,
-    }
+    # nilai akhir sudah tersimpan di seminar (masterdata.grading.perbarui_nilai_akhir)
+    context = {"dosen": dosen, "saya_penguji": seminar.is_penguji(dosen), **bundle}
     return render(request, "portal/dosen_seminar_detail.html", context)
 
 
@@ -426,9 +384,12 @@ def dosen_seminar_penilaian(request, pk: int):
     if error:
         return error
 
-    seminar = get_object_or_404(SeminarHasilPKL, pk=pk)
+    seminar = get_object_or_404(
+        SeminarHasilPKL.objects.select_related("mahasiswa").dengan_panel(), pk=pk
+    )
 
-    if seminar.dosen_penguji != dosen:
+    # lebih sempit dari visible_to(): hanya anggota panel yang menilai sebagai penguji
+    if not seminar.is_penguji(dosen):
         return HttpResponseForbidden("Anda bukan dosen penguji pada seminar ini.")
 
     assessment = SeminarAssessment.objects.filter(
@@ -467,9 +428,11 @@ def dosen_pembimbing_penilaian(request, pk: int):
     if error:
         return error
 
-    seminar = get_object_or_404(SeminarHasilPKL, pk=pk)
+    seminar = get_object_or_404(SeminarHasilPKL.objects.select_related("mahasiswa"), pk=pk)
 
-    if seminar.dosen_pembimbing != dosen:
+    # lebih sempit dari visible_to(): penguji boleh melihat seminar ini, tetapi
+    # tidak menilai sebagai pembimbing
+    if not seminar.is_pembimbing(dosen):
         return HttpResponseForbidden("Anda bukan dosen pembimbing pada seminar ini.")
 
     assessment = SeminarAssessment.objects.filter(
@@ -508,27 +471,12 @@ def seminar_penilaian_pdf(request, pk: int):
     if error:
         return error
 
-    seminar = get_object_or_404(
-        SeminarHasilPKL.objects.select_related("mahasiswa", "periode", "dosen_pembimbing"),
-        pk=pk,
-    )
+    bundle = detail_seminar(pk)
 
-    if seminar.dosen_pembimbing != dosen and seminar.dosen_penguji != dosen:
+    if not boleh_lihat(request.pkl_role, bundle["seminar"], peran=DOSEN):
         return HttpResponseForbidden("Anda tidak berhak mengakses seminar ini.")
 
-    assessments = SeminarAssessment.objects.filter(
-        seminar=seminar, role="PENGUJI"
-    ).select_related("penguji")
-    pembimbing_assessment = SeminarAssessment.objects.filter(
-        seminar=seminar, role="PEMBIMBING"
-    ).select_related("penguji").first()
-
-    context = {
-        "seminar": seminar,
-        "assessments": assessments,
-        "pembimbing_assessment": pembimbing_assessment,
-    }
-    pdf_bytes = render_to_pdf("portal/seminar_penilaian_pdf.html", context)
+    pdf_bytes = render_to_pdf("portal/seminar_penilaian_pdf.html", bundle)
     return HttpResponse(pdf_bytes, content_type="application/pdf")
 
 
@@ -542,74 +490,7 @@ def koordinator_dashboard(request):
     if error:
         return error
 
-    total_mahasiswa = Mahasiswa.objects.count()
-    total_mitra = Mitra.objects.count()
-    total_pendaftaran = PendaftaranPKL.objects.count()
-
-    total_pendaftaran_dikirim = PendaftaranPKL.objects.filter(status="DIKIRIM").count()
-    total_pendaftaran_disetujui = PendaftaranPKL.objects.filter(status="DISETUJUI").count()
-    total_pendaftaran_ditolak = PendaftaranPKL.objects.filter(status="DITOLAK").count()
-
-    total_seminar_dikirim = SeminarHasilPKL.objects.filter(status="DIKIRIM").count()
-    total_seminar_dijadwalkan = SeminarHasilPKL.objects.filter(status="DIJADWALKAN").count()
-    total_seminar_selesai = SeminarHasilPKL.objects.filter(status="SELESAI").count()
-
-    recent_pendaftaran = (
-        PendaftaranPKL.objects.select_related(
-            "mahasiswa", "mitra", "periode", "dosen_pembimbing"
-        )
-        .order_by("-tanggal_pengajuan")[:10]
-    )
-    recent_seminar = (
-        SeminarHasilPKL.objects.select_related(
-            "mahasiswa", "periode", "dosen_pembimbing"
-        )
-        .order_by("-created_at")[:10]
-    )
-
-    context = {
-        "koordinator": koor,
-        "total_mahasiswa": total_mahasiswa,
-        "total_mitra": total_mitra,
-        "total_pendaftaran": total_pendaftaran,
-        "total_pendaftaran_dikirim": total_pendaftaran_dikirim,
-        "total_pendaftaran_disetujui": total_pendaftaran_disetujui,
-        "total_pendaftaran_ditolak": total_pendaftaran_ditolak,
-        "total_seminar_dikirim": total_seminar_dikirim,
-        "total_seminar_dijadwalkan": total_seminar_dijadwalkan,
-        "total_seminar_selesai": total_seminar_selesai,
-        "recent_pendaftaran": recent_pendaftaran,
-        "recent_seminar": recent_seminar,
-    }
-    dosen_login = getattr(request.user, "dosen_profile", None)
-    if not dosen_login or not dosen_login.is_koordinator_pkl:
-        return HttpResponseForbidden("Bukan Koordinator Dosen PKL.")
-    
-    pembimbing = dosen_login
-    mhs_bimbingan = (
-        Mahasiswa.objects
-        .filter(dosen_pembimbing = pembimbing)
-        .select_related("periode", "mitra")
-    )
-    seminar_dibimbing = (
-        SeminarHasilPKL.objects
-        .filter(dosen_pembimbing=pembimbing)
-        .select_related("mahasiswa", "periode")
-        .order_by("-created_at")
-    )
-    nilai_pembimbing = SeminarAssessment.objects.filter(
-        penguji=pembimbing, role="PEMBIMBING"
-    )
-
-    context.update({
-        "as_pembimbing": {
-            "jumlah_mhs_bimbingan": mhs_bimbingan.count(),
-            "mhs_bimbingan": mhs_bimbingan[:10],
-            "jumlah_seminar_dibimbing": seminar_dibimbing.count(),
-            "seminar_dibimbing": seminar_dibimbing[:10],
-            "jumlah_penilaian_pembimbing": nilai_pembimbing.count(),
-        }
-    })
+    context = {"koordinator": koor, **statistik_koordinator(koor)}
     return render(request, "portal/koordinator_dashboard.html", context)
 
 
@@ -620,17 +501,22 @@ def koordinator_pendaftaran_list(request):
         return error
 
     status = request.GET.get("status")
-    qs = PendaftaranPKL.objects.select_related(
-        "mahasiswa", "mitra", "periode", "dosen_pembimbing"
-    ).order_by("-tanggal_pengajuan")
-
-    if status in {"DIKIRIM", "DISETUJUI", "DITOLAK"}:
-        qs = qs.filter(status=status)
+    filters = {"status": status} if status in {"DIKIRIM", "DISETUJUI", "DITOLAK"} else {}
+    periode = _periode_diminta(request)
+    qs = baca_periode(
+        PendaftaranPKL.objects.select_related(
+            "mahasiswa", "mitra", "periode", "dosen_pembimbing"
+        ).order_by("-tanggal_pengajuan"),
+        periode,
+        **filters,
+    )
 
     context = {
         "koordinator": koor,
         "pendaftaran_list": qs,
         "filter_status": status,
+        "periode": periode,
+        "periode_list": daftar_periode(),
     }
     return render(request, "portal/koordinator_pendaftaran_list.html", context)
 
@@ -678,48 +564,125 @@ def koordinator_pendaftaran_detail(request, pk: int):
     return render(request, "portal/koordinator_pendaftaran_detail.html", context)
 
 
-@login_required
+def _simpan_pemetaan_massal(request):
+    """
+    Terapkan semua pilihan dosen pembimbing dari form pemetaan sekaligus.
+    Field POST berbentuk ``dosen_<pendaftaran_id>`` = id dosen (kosong = lewati).
+    """
+    assignments = {}
+    for key, value in request.POST.items():
+        if not key.startswith("dosen_") or not value:
+            continue
+        try:
+            assignments[int(key.removeprefix("dosen_"))] = int(value)
+        except ValueError:
+            continue
+
+    if not assignments:
+        messages.warning(request, "Belum ada dosen pembimbing yang dipilih.")
+        return
+
+    dosen_map = Dosen.objects.select_related("user").in_bulk(set(assignments.values()))
+    now = timezone.now()
+
+    with transaction.atomic():
+        pendaftaran_list = list(
+            PendaftaranPKL.objects.select_for_update(of=("self",))
+            .select_related("mahasiswa__user")
+            .filter(
+                pk__in=assignments,
+                status="DISETUJUI",
+                dosen_pembimbing__isnull=True,
+            )
+        )
+        diperbarui = []
+        for pendaftaran in pendaftaran_list:
+            dosen = dosen_map.get(assignments[pendaftaran.pk])
+            if dosen is None:
+                continue
+            pendaftaran.dosen_pembimbing = dosen
+            pendaftaran.tanggal_update = now
+            diperbarui.append(pendaftaran)
+
+        PendaftaranPKL.objects.bulk_update(
+            diperbarui, ["dosen_pembimbing", "tanggal_update"]
+        )
+        PendaftaranPKL.sinkron_massal_ke_mahasiswa(diperbarui)
+        # bulk_update tidak memicu sinyal: catat notifikasinya langsung
+        catat([item for p in diperbarui for item in notif_events.pembimbing_ditetapkan(p)])
+
+    dilewati = len(assignments) - len(diperbarui)
+    messages.success(
+        request, f"{len(diperbarui)} mahasiswa berhasil dipetakan ke dosen pembimbing."
+    )
+    if dilewati:
+        messages.warning(
+            request,
+            f"{dilewati} pilihan dilewati (pendaftaran sudah dipetakan, "
+            "tidak disetujui, atau dosen tidak ditemukan).",
+        )
+
+
 @login_required
 def koordinator_pemetaan(request):
     koor, error = _require_koordinator(request)
     if error:
         return error
 
+    if request.method == "POST":
+        _simpan_pemetaan_massal(request)
+        # kembali ke periode yang sedang dipilih (?periode= ikut di URL form)
+        return redirect(request.get_full_path())
+
+    periode = _periode_diminta(request)
+
     # Ringkasan dosen + jumlah mahasiswa bimbingan (berdasarkan pendaftaran disetujui)
-    dosen_list = (
+    # pada periode yang sama dengan tabel pemetaan.
+    # Dievaluasi sekali lalu dipakai untuk tabel ringkasan dan opsi <select>.
+    bimbingan = Q(pendaftaran_pkl__status="DISETUJUI")
+    if periode is not None:
+        bimbingan &= Q(pendaftaran_pkl__periode=periode)
+    dosen_list = list(
         Dosen.objects.order_by("nama")
-        .annotate(
-            mahasiswa_saat_ini=Count(
-                "pendaftaran_pkl",  # sesuaikan related_name FK PendaftaranPKL->Dosen
-                filter=(
-                    Q(pendaftaran_pkl__status="DISETUJUI")
-                ),
-                distinct=True,
-            )
-        )
-    )
+        .annotate(jumlah_bimbingan=Count("pendaftaran_pkl", filter=bimbingan, distinct=True))
+    )
+    dosen_options = [
+        {
+            "id": d.pk,
+            "label": f"{d.nama} ({d.jumlah_bimbingan}/{d.kuota_bimbingan} mhs)",
+            "jumlah": d.jumlah_bimbingan,
+            "kuota": d.kuota_bimbingan,
+        }
+        for d in dosen_list
+    ]
 
     # Data mahasiswa menunggu pemetaan (disetujui tapi belum ada pembimbing)
-    pendaftaran_tanpa_pembimbing = (
-        PendaftaranPKL.objects.filter(status="DISETUJUI", dosen_pembimbing__isnull=True)
+    pendaftaran_tanpa_pembimbing = list(
+        PendaftaranPKL.objects.untuk_periode(periode)
+        .filter(status="DISETUJUI", dosen_pembimbing__isnull=True)
         .select_related("mahasiswa", "mitra", "periode")
         .order_by("-tanggal_pengajuan")
     )
 
     # Data mahasiswa sudah punya pembimbing (disetujui + pembimbing terisi)
-    pendaftaran_sudah_pembimbing = (
-        PendaftaranPKL.objects.filter(status="DISETUJUI", dosen_pembimbing__isnull=False)
+    pendaftaran_sudah_pembimbing = list(
+        PendaftaranPKL.objects.untuk_periode(periode)
+        .filter(status="DISETUJUI", dosen_pembimbing__isnull=False)
         .select_related("mahasiswa", "mitra", "periode", "dosen_pembimbing")
         .order_by("-tanggal_pengajuan")
     )
 
     context = {
         "koordinator": koor,
+        "dosen": koor,
         "dosen_list": dosen_list,
+        "dosen_options": dosen_options,
         "pendaftaran_tanpa_pembimbing": pendaftaran_tanpa_pembimbing,
         "pendaftaran_sudah_pembimbing": pendaftaran_sudah_pembimbing,
-        "jumlah_tanpa_pembimbing": pendaftaran_tanpa_pembimbing.count(),
-        "jumlah_sudah_pembimbing": pendaftaran_sudah_pembimbing.count(),
+        "jumlah_tanpa_pembimbing": len(pendaftaran_tanpa_pembimbing),
+        "jumlah_sudah_pembimbing": len(pendaftaran_sudah_pembimbing),
+        "periode": periode,
+        "periode_list": daftar_periode(),
     }
     return render(request, "portal/koordinator_pemetaan.html", context)
 
@@ -735,20 +698,24 @@ def koordinator_seminar_list(request):
         return error
 
     status = request.GET.get("status")
-    seminars = (
+    filters = {"status": status} if status in {"DIKIRIM", "DIJADWALKAN", "SELESAI", "DITOLAK"} else {}
+    periode = _periode_diminta(request)
+    seminars = baca_periode(
         SeminarHasilPKL.objects.select_related(
             "mahasiswa", "periode", "dosen_pembimbing"
         )
-        .order_by("jadwal", "mahasiswa__nim")
+        .dengan_panel()
+        .order_by("jadwal", "mahasiswa__nim"),
+        periode,
+        **filters,
     )
 
-    if status in {"DIKIRIM", "DIJADWALKAN", "SELESAI", "DITOLAK"}:
-        seminars = seminars.filter(status=status)
-
     context = {
         "koordinator": koor,
         "seminars": seminars,
         "filter_status": status,
+        "periode": periode,
+        "periode_list": daftar_periode(),
     }
     return render(request, "portal/koordinator_seminar_list.html", context)
 
@@ -759,35 +726,32 @@ def koordinator_seminar_detail(request, pk: int):
     if error:
         return error
 
-    seminar = get_object_or_404(
-        SeminarHasilPKL.objects.select_related(
-            "mahasiswa", "periode", "dosen_pembimbing"
-        ),
-        pk=pk,
-    )
+    bundle = detail_seminar(pk)
+    seminar = bundle["seminar"]
 
     if request.method == "POST":
         form = SeminarPenjadwalanForm(request.POST, instance=seminar)
         if form.is_valid():
-            seminar = form.save(commit=False)
-            seminar.status = "DIJADWALKAN"
-            seminar.save()
+            cleaned = form.cleaned_data
+            bentrok = bentrok_jadwal(
+                seminar, cleaned["jadwal"], cleaned["ruang"], cleaned["dosen_penguji"]
+            )
+            for field, pesan in bentrok.items():
+                form.add_error(field, pesan)
+        if form.is_valid():
+            with transaction.atomic():
+                seminar = form.save(commit=False)
+                # panel dulu: notifikasi jadwal (post_save seminar) membaca panel
+                form.save_m2m()
+                seminar.status = "DIJADWALKAN"
+                seminar.save()
             messages.success(request, "Jadwal seminar berhasil disimpan.")
             return redirect("portal:koordinator_seminar_detail", pk=seminar.pk)
         messages.error(request, "Silakan periksa kembali isian penjadwalan.")
     else:
         form = SeminarPenjadwalanForm(instance=seminar)
 
-    assessments = SeminarAssessment.objects.filter(seminar=seminar).select_related(
-        "penguji"
-    )
-
-    context = {
-        "koordinator": koor,
-        "seminar": seminar,
-        "form": form,
-        "assessments": assessments,
-    }
+    context = {"koordinator": koor, "form": form, **bundle}
     return render(request, "portal/koordinator_seminar_detail.html", context)
 
 
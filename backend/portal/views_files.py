@@ -0,0 +1,44 @@
+from django.contrib.auth.decorators import login_required
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+
+from masterdata.models import PendaftaranPKL, SeminarHasilPKL
+from .sendfile import send_protected_file
+
+# Hak akses lewat visible_to() (masterdata/access.py): pemilik, dosen terkait,
+# koordinator, atau staf. Baris di luar lingkup menjadi 404 sehingga tidak
+# membocorkan keberadaan berkas.
+
+
+@login_required
+def download_surat_penerimaan(request, pk: int):
+    pendaftaran = get_object_or_404(
+        PendaftaranPKL.objects.visible_to(request.user).select_related("mahasiswa").only(
+            "surat_penerimaan", "mahasiswa_id", "dosen_pembimbing_id", "mahasiswa__nim"
+        ),
+        pk=pk,
+    )
+    if not pendaftaran.surat_penerimaan:
+        raise Http404("Berkas tidak ditemukan.")
+    return send_protected_file(
+        request,
+        pendaftaran.surat_penerimaan,
+        f"surat_penerimaan_{pendaftaran.mahasiswa.nim}.pdf",
+    )
+
+
+@login_required
+def download_laporan(request, pk: int):
+    seminar = get_object_or_404(
+        SeminarHasilPKL.objects.visible_to(request.user).select_related("mahasiswa").only(
+            "file_laporan", "mahasiswa_id", "dosen_pembimbing_id", "mahasiswa__nim",
+        ),
+        pk=pk,
+    )
+    if not seminar.file_laporan:
+        raise Http404("Berkas tidak ditemukan.")
+    return send_protected_file(
+        request,
+        seminar.file_laporan,
+        f"laporan_pkl_{seminar.mahasiswa.nim}.pdf",
+    )
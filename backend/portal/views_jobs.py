@@ -0,0 +1,61 @@
+from django.contrib.auth.decorators import login_required
+from django.core.files.storage import default_storage
+from django.http import Http404, JsonResponse
+from django.urls import reverse
+
+from jobs.models import Job
+from .sendfile import StoredFile, send_protected_file
+
+
+def _job_milik(request, pk: int) -> Job:
+    """Job milik user yang login (staf boleh semua); selain itu 404."""
+    job = Job.objects.filter(pk=pk).first()
+    if job is None or (job.dibuat_oleh_id != request.user.pk and not request.user.is_staff):
+        raise Http404("Job tidak ditemukan.")
+    return job
+
+
+@login_required
+def job_status(request, pk: int):
+    """Status job latar belakang milik user yang login (staf boleh melihat semua)."""
+    job = _job_milik(request, pk)
+
+    error = None
+    if job.status == "GAGAL" and job.error_terakhir:
+        # baris terakhir traceback sudah cukup untuk ditampilkan ke user
+        error = job.error_terakhir.strip().splitlines()[-1]
+
+    hasil = None
+    if job.status == "SELESAI":
+        hasil = dict(job.hasil or {})
+        if hasil.get("file"):
+            # berkas hasil tidak punya URL publik; unduh lewat view terproteksi
+            hasil["url"] = reverse("portal:job_download", args=[job.pk])
+
+    return JsonResponse(
+        {
+            "id": job.pk,
+            "task": job.task,
+            "status": job.status,
+            "status_display": job.get_status_display(),
+            "percobaan": job.percobaan,
+            "maks_percobaan": job.maks_percobaan,
+            "jalankan_pada": job.jalankan_pada,
+            "selesai_pada": job.selesai_pada,
+            "hasil": hasil,
+            "error": error,
+        }
+    )
+
+
+@login_required
+def job_download(request, pk: int):
+    """Berkas hasil job (mis. ekspor CSV), hanya untuk pembuat job atau staf."""
+    job = _job_milik(request, pk)
+    hasil = job.hasil or {}
+    if job.status != "SELESAI" or not hasil.get("file"):
+        raise Http404("Berkas tidak ditemukan.")
+    berkas = StoredFile(default_storage, hasil["file"])
+    if not berkas.exists():
+        raise Http404("Berkas tidak ditemukan.")
+    return send_protected_file(request, berkas, hasil.get("nama") or hasil["file"], attachment=True)
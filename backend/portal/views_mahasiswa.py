@@ -1,14 +1,16 @@
+import json
+
+from django.conf import settings
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseForbidden, HttpResponse
+from django.http import HttpResponseForbidden, HttpResponse, JsonResponse
 from django.contrib import messages
 from django.utils import timezone
-import csv
-
+from django.views.decorators.http import require_POST
 
-from masterdata.models import PendaftaranPKL, PeriodePKL, SeminarHasilPKL
+from masterdata.models import PendaftaranPKL, SeminarHasilPKL
+from masterdata.periode import periode_berjalan
 
-from logbook.models import LogbookEntry
 from guidance.models import GuidanceSession
 from .forms import (
     MahasiswaLogbookForm,
@@ -16,14 +18,16 @@ from .forms import (
     SeminarHasilMahasiswaForm,
     MahasiswaGuidanceForm,
 )
+from .services import kirim_logbook_massal, statistik_mahasiswa, write_logbook_mahasiswa_csv
 
 
 def _require_mahasiswa(request):
-    if not hasattr(request.user, "mahasiswa_profile"):
+    mhs = request.pkl_role.mahasiswa
+    if mhs is None:
         return None, HttpResponseForbidden(
             "Akun ini tidak terhubung dengan data Mahasiswa."
         )
-    return request.user.mahasiswa_profile, None
+    return mhs, None
 
 
 # =========================
@@ -36,56 +40,7 @@ def mahasiswa_dashboard(request):
     if error:
         return error
 
-    total_logbook = LogbookEntry.objects.filter(mahasiswa=mhs).count()
-    total_guidances = GuidanceSession.objects.filter(mahasiswa=mhs).count()
-
-    last_logbook = (
-        LogbookEntry.objects.filter(mahasiswa=mhs)
-        .order_by("-tanggal", "-dibuat_pada")
-        .first()
-    )
-    last_guidance = (
-        GuidanceSession.objects.filter(mahasiswa=mhs)
-        .order_by("-tanggal", "-dibuat_pada")
-        .first()
-    )
-
-    recent_logbooks = (
-        LogbookEntry.objects.filter(mahasiswa=mhs)
-        .order_by("-tanggal", "-dibuat_pada")[:10]
-    )
-    recent_guidances = (
-        GuidanceSession.objects.filter(mahasiswa=mhs)
-        .order_by("-tanggal", "-dibuat_pada")[:10]
-    )
-
-    pendaftaran = (
-        PendaftaranPKL.objects.filter(mahasiswa=mhs)
-        .select_related("periode", "mitra", "dosen_pembimbing")
-        .order_by("-tanggal_pengajuan")
-        .first()
-    )
-
-    seminar = (
-        SeminarHasilPKL.objects.filter(mahasiswa=mhs)
-        .select_related("periode", "dosen_pembimbing")
-        .order_by("-created_at")
-        .first()
-    )
-
-    context = {
-        "mahasiswa": mhs,
-        "summary": {
-            "total_logbook": total_logbook,
-            "total_guidances": total_guidances,
-            "last_logbook": last_logbook,
-            "last_guidance": last_guidance,
-        },
-        "recent_logbooks": recent_logbooks,
-        "recent_guidances": recent_guidances,
-        "pendaftaran": pendaftaran,
-        "seminar": seminar,
-    }
+    context = {"mahasiswa": mhs, **statistik_mahasiswa(mhs)}
     return render(request, "portal/mahasiswa_dashboard.html", context)
 
 
@@ -95,50 +50,10 @@ def mahasiswa_logbook_export(request):
     if error:
         return error
 
-    entries = (
-        LogbookEntry.objects.filter(mahasiswa=mhs)
-        .select_related("periode")
-        .order_by("tanggal")
-    )
-
     response = HttpResponse(content_type="text/csv")
     filename = f"logbook_{mhs.nim}.csv"
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "Tanggal",
-            "Jam Mulai",
-            "Jam Selesai",
-            "Periode",
-            "Aktivitas",
-            "Tools",
-            "Output",
-            "Status",
-            "Catatan Dosen",
-            "Dibuat Pada",
-            "Diupdate Pada",
-        ]
-    )
-
-    for e in entries:
-        writer.writerow(
-            [
-                e.tanggal,
-                e.jam_mulai or "",
-                e.jam_selesai or "",
-                e.periode.nama_periode if e.periode else "",
-                (e.aktivitas or "").replace("\n", " "),
-                e.tools_yang_digunakan or "",
-                (e.output or "").replace("\n", " "),
-                e.get_status_display(),
-                (e.catatan_dosen or "").replace("\n", " "),
-                e.dibuat_pada,
-                e.diupdate_pada,
-            ]
-        )
-
+    write_logbook_mahasiswa_csv(response, mhs)
     return response
 
 
@@ -173,6 +88,39 @@ def mahasiswa_logbook_add(request):
     return render(request, "portal/mahasiswa_logbook_add.html", context)
 
 
+@login_required
+@require_POST
+def mahasiswa_logbook_batch(request):
+    """
+    Kiriman logbook massal untuk klien offline. Body: array JSON entri
+    (field seperti form logbook + ``idempotency_key`` UUID buatan klien).
+
+    201/200 dengan ``hasil`` per entri (``DIBUAT``/``SUDAH_ADA``) bila semua
+    valid; 400 dengan ``errors`` per indeks (atau ``__all__`` bila masa PKL
+    belum ada) bila ada yang tidak valid (tidak ada yang disimpan). Mengirim
+    ulang batch yang sama aman.
+    """
+    mhs, error = _require_mahasiswa(request)
+    if error:
+        return error
+
+    try:
+        items = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({"error": "Body harus berupa JSON."}, status=400)
+    if not isinstance(items, list) or not items:
+        return JsonResponse({"error": "Body harus berupa array entri logbook."}, status=400)
+    if len(items) > settings.PKL_LOGBOOK_BATCH_MAX:
+        return JsonResponse(
+            {"error": f"Maksimal {settings.PKL_LOGBOOK_BATCH_MAX} entri per kiriman."}, status=413
+        )
+
+    hasil = kirim_logbook_massal(mhs, items)
+    if "errors" in hasil:
+        return JsonResponse(hasil, status=400)
+    return JsonResponse(hasil, status=201 if hasil["dibuat"] else 200)
+
+
 # =========================
 # Bimbingan – mahasiswa
 # =========================
@@ -243,14 +191,8 @@ def mahasiswa_pendaftaran_pkl(request):
         .first()
     )
 
-    # cek periode aktif dari tabel PeriodePKL, bukan dari mhs.periode
-    today = timezone.localdate()
-    periode_aktif = (
-        PeriodePKL.objects
-        .filter(aktif=True)   # jika ingin pakai rentang tanggal, lihat catatan di bawah
-        .order_by("-tanggal_mulai")
-        .first()
-    )
+    # cek periode aktif dari tabel PeriodePKL (di-cache), bukan dari mhs.periode
+    periode_aktif = periode_berjalan()
     eligible = periode_aktif is not None
 
     is_locked = pendaftaran is not None and pendaftaran.status != "DIKIRIM"
@@ -299,43 +241,53 @@ def mahasiswa_pendaftaran_pkl(request):
 # Pendaftaran Seminar Hasil PKL
 # =========================
 
-@login_required
-def mahasiswa_seminar_pendaftaran(request):
-    mhs, error = _require_mahasiswa(request)
-    if error:
-        return error
+# Aturan bisa disesuaikan (di sini minimal 5 bimbingan selesai)
+MINIMAL_BIMBINGAN_SEMINAR = 5
+
 
+def _status_seminar(mhs):
+    """
+    (seminar terakhir, jumlah bimbingan selesai, eligible, is_locked).
+    Dipakai form biasa dan unggahan bertahap (views_upload.py).
+    """
     seminar = (
         SeminarHasilPKL.objects.filter(mahasiswa=mhs)
         .select_related("periode", "dosen_pembimbing")
+        .dengan_panel()
         .order_by("-created_at")
         .first()
     )
-
     jumlah_bimbingan_selesai = GuidanceSession.objects.filter(
         mahasiswa=mhs, status="DONE"
     ).count()
+    eligible = jumlah_bimbingan_selesai >= MINIMAL_BIMBINGAN_SEMINAR
+    is_locked = seminar is not None and seminar.status != "DIKIRIM"
+    return seminar, jumlah_bimbingan_selesai, eligible, is_locked
 
-    # Aturan bisa disesuaikan (di sini minimal 5 bimbingan selesai)
-    minimal_bimbingan = 5
-    eligible = jumlah_bimbingan_selesai >= minimal_bimbingan
 
-    is_locked = seminar is not None and seminar.status != "DIKIRIM"
+def _alasan_tolak_seminar(eligible: bool, is_locked: bool) -> str | None:
+    if not eligible:
+        return (
+            f"Anda belum memenuhi syarat minimal {MINIMAL_BIMBINGAN_SEMINAR} kali bimbingan "
+            "untuk mendaftar seminar."
+        )
+    if is_locked:
+        return "Data seminar sudah diproses sehingga tidak dapat diubah lagi."
+    return None
 
-    if request.method == "POST":
-        if not eligible:
-            messages.error(
-                request,
-                f"Anda belum memenuhi syarat minimal {minimal_bimbingan} kali bimbingan "
-                "untuk mendaftar seminar.",
-            )
-            return redirect("portal:mahasiswa_seminar_pendaftaran")
 
-        if is_locked:
-            messages.error(
-                request,
-                "Data seminar sudah diproses sehingga tidak dapat diubah lagi.",
-            )
+@login_required
+def mahasiswa_seminar_pendaftaran(request):
+    mhs, error = _require_mahasiswa(request)
+    if error:
+        return error
+
+    seminar, jumlah_bimbingan_selesai, eligible, is_locked = _status_seminar(mhs)
+
+    if request.method == "POST":
+        alasan = _alasan_tolak_seminar(eligible, is_locked)
+        if alasan:
+            messages.error(request, alasan)
             return redirect("portal:mahasiswa_seminar_pendaftaran")
 
         form = SeminarHasilMahasiswaForm(
@@ -0,0 +1,43 @@
+from django.contrib.auth.decorators import login_required
+from django.db.models import Count, Q, Sum
+from django.shortcuts import render
+
+from masterdata.periode import daftar_periode
+from search.models import DokumenLaporan
+from search.query import cari_laporan
+
+from .views_dosen import _require_koordinator
+
+
+@login_required
+def koordinator_laporan_cari(request):
+    """Cari isi laporan PKL (teks hasil ekstraksi per halaman) lintas mahasiswa."""
+    koor, error = _require_koordinator(request)
+    if error:
+        return error
+
+    q = request.GET.get("q", "").strip()
+    try:
+        periode_id = int(request.GET.get("periode") or 0) or None
+    except ValueError:
+        periode_id = None
+
+    hasil = cari_laporan(q, periode_id=periode_id) if q else []
+    ringkasan = DokumenLaporan.objects.aggregate(
+        total=Count("id"),
+        selesai=Count("id", filter=Q(status="SELESAI")),
+        antri=Count("id", filter=Q(status="ANTRI")),
+        gagal=Count("id", filter=Q(status="GAGAL")),
+        halaman=Sum("jumlah_halaman", filter=Q(status="SELESAI")),
+        kata=Sum("jumlah_kata", filter=Q(status="SELESAI")),
+    )
+
+    context = {
+        "koordinator": koor,
+        "q": q,
+        "periode_id": periode_id,
+        "periode_list": daftar_periode(),
+        "hasil": hasil,
+        "ringkasan": ringkasan,
+    }
+    return render(request, "portal/koordinator_laporan_cari.html", context)
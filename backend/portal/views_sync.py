@@ -0,0 +1,48 @@
+from django.contrib.auth.decorators import login_required
+from django.http import HttpResponseForbidden, JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from masterdata.changefeed import DEFAULT_LIMIT, cursor_as_json, feed_entities, read_changes
+
+
+def _boleh_membaca_feed(request) -> bool:
+    return request.user.is_staff or request.pkl_role.is_koordinator
+
+
+@login_required
+def change_feed(request):
+    """
+    Change feed JSON untuk sinkronisasi inkremental (data warehouse).
+
+    Parameter: ``entity`` (wajib), ``since`` (ISO-8601), ``after_id``, ``limit``.
+    Kursor ``next`` pada respons dikirim kembali untuk halaman berikutnya.
+    """
+    if not _boleh_membaca_feed(request):
+        return HttpResponseForbidden("Hanya koordinator PKL atau staf yang dapat membaca change feed.")
+
+    entity = request.GET.get("entity", "")
+    if entity not in feed_entities():
+        return JsonResponse(
+            {"error": "Parameter entity tidak valid.", "entities": feed_entities()},
+            status=400,
+        )
+
+    since = None
+    raw_since = request.GET.get("since")
+    if raw_since:
+        since = parse_datetime(raw_since)
+        if since is None:
+            return JsonResponse({"error": "Format since harus ISO-8601."}, status=400)
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+
+    try:
+        after_id = int(request.GET.get("after_id") or 0)
+        limit = int(request.GET.get("limit") or DEFAULT_LIMIT)
+    except ValueError:
+        return JsonResponse({"error": "after_id dan limit harus berupa angka."}, status=400)
+
+    page = read_changes(entity, since=since, after_id=after_id, limit=limit)
+    page["next"] = cursor_as_json(page["next"])
+    return JsonResponse(page)
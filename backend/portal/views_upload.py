@@ -0,0 +1,315 @@
+# backend/portal/views_upload.py
+"""
+Unggahan laporan PKL secara bertahap (chunked) dan bisa dilanjutkan.
+
+Protokol (semua respons JSON, status sesi selalu berisi ``offset``)::
+
+    POST   mhs/seminar/unggah/                   nama_file, ukuran  -> 201 sesi baru
+    GET    mhs/seminar/unggah/<id>/                                  -> status/offset (resume)
+    PUT    mhs/seminar/unggah/<id>/?offset=N     body = byte mentah  -> offset baru
+    DELETE mhs/seminar/unggah/<id>/                                  -> batalkan sesi
+    POST   mhs/seminar/unggah/<id>/selesai/      sha256, judul_laporan
+
+Setiap potongan langsung ditulis ke file sementara di disk (tidak pernah
+ditahan utuh di memori) dan dibatasi ``PKL_UPLOAD_CHUNK_MAX_MB``; total
+dibatasi ``LAPORAN_MAX_SIZE_MB``. Offset yang tidak cocok dijawab 409 beserta
+offset yang benar, sehingga klien cukup melanjutkan dari sana setelah
+koneksi putus. Saat selesai, checksum SHA-256 dicocokkan lalu file dirakit
+ke ``SeminarHasilPKL.file_laporan`` dalam satu transaksi.
+"""
+
+import fcntl
+import hashlib
+import os
+import re
+
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.db import transaction
+from django.http import Http404, HttpResponseNotAllowed, JsonResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.views.decorators.http import require_POST
+
+from masterdata.models import SeminarHasilPKL, UnggahanLaporan, validate_laporan_file
+from .views_mahasiswa import _alasan_tolak_seminar, _require_mahasiswa, _status_seminar
+
+READ_BLOCK = 64 * 1024
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _json_error(pesan: str, status: int, upload=None):
+    data = {"error": pesan}
+    if upload is not None:
+        data["offset"] = upload.diterima
+    return JsonResponse(data, status=status)
+
+
+def _chunk_max() -> int:
+    return int(settings.PKL_UPLOAD_CHUNK_MAX_MB * 1024 * 1024)
+
+
+def _status_json(upload, status: int = 200):
+    return JsonResponse(
+        {
+            "id": str(upload.pk),
+            "status": upload.status,
+            "nama_file": upload.nama_file,
+            "ukuran": upload.ukuran_total,
+            "offset": upload.diterima,
+            "chunk_max": _chunk_max(),
+            "url": reverse("portal:mahasiswa_laporan_upload", args=[upload.pk]),
+            "selesai_url": reverse("portal:mahasiswa_laporan_upload_selesai", args=[upload.pk]),
+        },
+        status=status,
+    )
+
+
+def _hapus_temp(upload) -> None:
+    try:
+        os.remove(upload.temp_path)
+    except FileNotFoundError:
+        pass
+
+
+def _batalkan(upload) -> None:
+    UnggahanLaporan.objects.filter(pk=upload.pk, status="AKTIF").update(
+        status="DIBATALKAN", diupdate_pada=timezone.now()
+    )
+    _hapus_temp(upload)
+
+
+def _upload_milik(request, upload_id):
+    mhs, error = _require_mahasiswa(request)
+    if error:
+        return None, None, error
+    upload = UnggahanLaporan.objects.filter(pk=upload_id, mahasiswa=mhs).first()
+    if upload is None:
+        raise Http404("Sesi unggahan tidak ditemukan.")
+    return mhs, upload, None
+
+
+@login_required
+@require_POST
+def laporan_upload_init(request):
+    mhs, error = _require_mahasiswa(request)
+    if error:
+        return error
+
+    _, _, eligible, is_locked = _status_seminar(mhs)
+    alasan = _alasan_tolak_seminar(eligible, is_locked)
+    if alasan:
+        return _json_error(alasan, 403)
+
+    nama_file = os.path.basename(request.POST.get("nama_file", "")).strip()[:255]
+    if os.path.splitext(nama_file)[1].lower() != ".pdf":
+        return _json_error("Format file tidak didukung. Unggah laporan dalam bentuk PDF.", 400)
+    try:
+        ukuran = int(request.POST.get("ukuran", ""))
+    except ValueError:
+        return _json_error("Ukuran file tidak valid.", 400)
+    max_mb = settings.LAPORAN_MAX_SIZE_MB
+    if ukuran <= 0:
+        return _json_error("File kosong.", 400)
+    if ukuran > int(max_mb * 1024 * 1024):
+        return _json_error(f"Ukuran file terlalu besar. Maksimal {max_mb:.0f} MB.", 413)
+
+    # satu sesi aktif per mahasiswa: sesi lama (mis. file lain) dibuang
+    for lama in UnggahanLaporan.objects.filter(mahasiswa=mhs, status="AKTIF"):
+        _batalkan(lama)
+
+    upload = UnggahanLaporan.objects.create(mahasiswa=mhs, nama_file=nama_file, ukuran_total=ukuran)
+    os.makedirs(os.path.dirname(upload.temp_path), exist_ok=True)
+    open(upload.temp_path, "wb").close()
+
+    response = _status_json(upload, status=201)
+    response["Location"] = reverse("portal:mahasiswa_laporan_upload", args=[upload.pk])
+    return response
+
+
+def _tulis_potongan(request, upload):
+    """PUT satu potongan pada ``?offset=N``; body ditulis langsung ke file sementara."""
+
+    if upload.status != "AKTIF":
+        return _json_error("Sesi unggahan sudah ditutup.", 409, upload)
+    try:
+        offset = int(request.GET["offset"])
+        panjang = int(request.META.get("CONTENT_LENGTH") or 0)
+    except (KeyError, ValueError):
+        return _json_error("Parameter offset / Content-Length tidak valid.", 400, upload)
+    if panjang <= 0:
+        return _json_error("Potongan kosong.", 400, upload)
+    if panjang > _chunk_max():
+        return _json_error(
+            f"Potongan terlalu besar. Maksimal {settings.PKL_UPLOAD_CHUNK_MAX_MB:g} MB.", 413, upload
+        )
+    if offset != upload.diterima:
+        return _json_error("Offset tidak cocok; lanjutkan dari offset server.", 409, upload)
+    if offset + panjang > upload.ukuran_total:
+        return _json_error("Potongan melebihi ukuran file yang didaftarkan.", 413, upload)
+
+    try:
+        part = open(upload.temp_path, "r+b")
+    except FileNotFoundError:
+        _batalkan(upload)
+        return _json_error("File sementara sudah dihapus. Mulai unggahan baru.", 410)
+
+    with part:
+        try:
+            # kunci file, bukan baris DB: transaksi tidak ditahan selama
+            # menunggu byte dari jaringan yang lambat
+            fcntl.flock(part, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return _json_error("Potongan lain sedang ditulis.", 409, upload)
+
+        upload.refresh_from_db(fields=["diterima", "status"])
+        if upload.status != "AKTIF" or offset != upload.diterima:
+            return _json_error("Offset tidak cocok; lanjutkan dari offset server.", 409, upload)
+
+        part.seek(offset)
+        part.truncate()  # sisa potongan yang dulu terputus di tengah jalan
+        tertulis = 0
+        try:
+            while tertulis < panjang:
+                data = request.read(min(READ_BLOCK, panjang - tertulis))
+                if not data:
+                    break
+                part.write(data)
+                tertulis += len(data)
+        except OSError:  # termasuk UnreadablePostError (koneksi klien putus)
+            tertulis = -1
+        if tertulis != panjang:
+            part.truncate(offset)
+            return _json_error("Potongan tidak lengkap; kirim ulang dari offset server.", 400, upload)
+        part.flush()
+
+        UnggahanLaporan.objects.filter(pk=upload.pk, diterima=offset, status="AKTIF").update(
+            diterima=offset + panjang, diupdate_pada=timezone.now()
+        )
+    upload.diterima = offset + panjang
+    return _status_json(upload)
+
+
+@login_required
+def laporan_upload_chunk(request, upload_id):
+    _, upload, error = _upload_milik(request, upload_id)
+    if error:
+        return error
+
+    if request.method == "GET":
+        return _status_json(upload)
+    if request.method == "PUT":
+        return _tulis_potongan(request, upload)
+    if request.method == "DELETE":
+        _batalkan(upload)
+        upload.refresh_from_db(fields=["status"])
+        return _status_json(upload)
+    return HttpResponseNotAllowed(["GET", "PUT", "DELETE"])
+
+
+def _sha256_file(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1024 * 1024), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+@login_required
+@require_POST
+def laporan_upload_finalize(request, upload_id):
+    mhs, upload, error = _upload_milik(request, upload_id)
+    if error:
+        return error
+
+    if upload.status != "AKTIF":
+        return _json_error("Sesi unggahan sudah ditutup.", 409, upload)
+    if upload.diterima != upload.ukuran_total:
+        return _json_error("Unggahan belum lengkap.", 409, upload)
+
+    judul = request.POST.get("judul_laporan", "").strip()
+    if not judul:
+        return _json_error("Judul laporan wajib diisi.", 400, upload)
+    if len(judul) > 255:
+        return _json_error("Judul laporan maksimal 255 karakter.", 400, upload)
+    checksum = request.POST.get("sha256", "").strip().lower()
+    if not _SHA256_RE.match(checksum):
+        return _json_error("Checksum SHA-256 tidak valid.", 400, upload)
+
+    seminar, _, eligible, is_locked = _status_seminar(mhs)
+    alasan = _alasan_tolak_seminar(eligible, is_locked)
+    if alasan:
+        return _json_error(alasan, 403, upload)
+    if mhs.periode_id is None:
+        return _json_error("Periode PKL Anda belum ditetapkan. Hubungi koordinator PKL.", 400, upload)
+
+    try:
+        cocok = (
+            os.path.getsize(upload.temp_path) == upload.ukuran_total
+            and _sha256_file(upload.temp_path) == checksum
+        )
+    except FileNotFoundError:
+        _batalkan(upload)
+        return _json_error("File sementara sudah dihapus. Mulai unggahan baru.", 410)
+    if not cocok:
+        # isi rusak di perjalanan: mulai lagi dari nol pada sesi yang sama
+        with open(upload.temp_path, "r+b") as part:
+            part.truncate(0)
+        UnggahanLaporan.objects.filter(pk=upload.pk).update(diterima=0, diupdate_pada=timezone.now())
+        upload.diterima = 0
+        return _json_error("Checksum tidak cocok. File perlu diunggah ulang.", 422, upload)
+
+    with open(upload.temp_path, "rb") as fh:
+        berkas = File(fh, name=upload.nama_file)
+        try:
+            validate_laporan_file(berkas)
+        except ValidationError as exc:
+            _batalkan(upload)
+            return _json_error(" ".join(exc.messages), 400)
+
+        with transaction.atomic():
+            if seminar is None:
+                # finalisasi bersamaan dari tab lain bisa membuat baris lebih dulu:
+                # get_or_create menangkap IntegrityError (mahasiswa, periode) lalu membacanya
+                seminar, _ = SeminarHasilPKL.objects.get_or_create(
+                    mahasiswa=mhs,
+                    periode=mhs.periode,
+                    defaults={
+                        "judul_laporan": judul,
+                        "dosen_pembimbing": mhs.dosen_pembimbing,
+                        "status": "DIKIRIM",
+                    },
+                )
+            if not SeminarHasilPKL.objects.select_for_update().filter(
+                pk=seminar.pk, status="DIKIRIM"
+            ).exists():
+                return _json_error(_alasan_tolak_seminar(True, True), 403)
+            ditutup = UnggahanLaporan.objects.filter(pk=upload.pk, status="AKTIF").update(
+                status="SELESAI", diupdate_pada=timezone.now()
+            )
+            if not ditutup:
+                # finalisasi ganda dari tab lain
+                return _json_error("Sesi unggahan sudah ditutup.", 409)
+
+            obj = seminar
+            obj.judul_laporan = judul
+            obj.periode = mhs.periode
+            obj.dosen_pembimbing = mhs.dosen_pembimbing
+            obj.status = "DIKIRIM"
+            obj.file_laporan.save(upload.nama_file, berkas, save=False)
+            obj.save()
+            UnggahanLaporan.objects.filter(pk=upload.pk).update(seminar=obj)
+
+    _hapus_temp(upload)
+    messages.success(request, "Pendaftaran seminar berhasil dikirim.")
+    return JsonResponse(
+        {
+            "id": str(upload.pk),
+            "status": "SELESAI",
+            "seminar_id": obj.pk,
+            "redirect": reverse("portal:mahasiswa_seminar_pendaftaran"),
+        }
+    )
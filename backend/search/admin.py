@@ -0,0 +1,22 @@
+from django.contrib import admin
+
+from jobs.registry import enqueue
+
+from .models import DokumenLaporan
+
+
+@admin.register(DokumenLaporan)
+class DokumenLaporanAdmin(admin.ModelAdmin):
+    list_display = ("nama_file", "status", "jumlah_halaman", "jumlah_kata", "diekstrak_pada")
+    list_filter = ("status",)
+    search_fields = ("nama_file", "sha256")
+    readonly_fields = ("sha256", "jumlah_halaman", "jumlah_kata", "error", "dibuat_pada", "diekstrak_pada")
+    actions = ["ekstrak_ulang"]
+
+    @admin.action(description="Ekstrak ulang teks")
+    def ekstrak_ulang(self, request, queryset):
+        ids = list(queryset.values_list("pk", flat=True))
+        queryset.update(status="ANTRI", error="")
+        for pk in ids:
+            enqueue("search.ekstrak_laporan", {"dokumen_id": pk}, user=request.user)
+        self.message_user(request, f"{len(ids)} dokumen dimasukkan ke antrean ekstraksi.")
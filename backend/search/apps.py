@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search'
+    verbose_name = "Pencarian Laporan"
+
+    def ready(self):
+        # laporan baru -> job ekstraksi teks
+        from . import signals  # noqa: F401
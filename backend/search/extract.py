@@ -0,0 +1,42 @@
+# backend/search/extract.py
+"""
+Ekstraksi teks PDF per halaman.
+
+Modul ini sengaja tidak mengimpor Django supaya fungsi ``extract_pages``
+bisa langsung dijalankan di proses anak ``ProcessPoolExecutor`` (spawn)
+tanpa ``django.setup()``; penulisan ke database tetap di proses induk.
+"""
+
+import re
+
+_WS_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class ExtractionUnavailable(RuntimeError):
+    """Dependensi pypdf belum terpasang."""
+
+
+def hitung_kata(teks: str) -> int:
+    return len(_WORD_RE.findall(teks))
+
+
+def extract_pages(path: str) -> list[str]:
+    """Teks tiap halaman (whitespace dirapikan), urut mulai halaman 1."""
+
+    try:
+        from pypdf import PdfReader  # import lokal agar optional di lingkungan dev/CI
+    except ModuleNotFoundError as exc:
+        raise ExtractionUnavailable(
+            "Dependensi pypdf belum terpasang. Install dengan `pip install pypdf`."
+        ) from exc
+
+    reader = PdfReader(path)
+    if reader.is_encrypted:
+        # PDF dengan password kosong (umum dari Word/Office) masih bisa dibaca
+        reader.decrypt("")
+    pages = []
+    for page in reader.pages:
+        teks = page.extract_text() or ""
+        pages.append(_WS_RE.sub(" ", teks.replace("\x00", "")).strip())
+    return pages
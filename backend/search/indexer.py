@@ -0,0 +1,63 @@
+# backend/search/indexer.py
+"""Menyimpan hasil ekstraksi ke tabel halaman (indeks full-text ikut lewat trigger/GIN)."""
+
+import hashlib
+
+from django.db import transaction
+from django.utils import timezone
+
+from jobs.registry import enqueue
+from masterdata.storage import content_storage, sha256_from_name
+
+from .extract import hitung_kata
+from .models import DokumenLaporan, HalamanLaporan
+
+
+def dokumen_untuk(nama_file: str, *, hitung_hash: bool = False):
+    """
+    ``(DokumenLaporan, created)`` untuk file laporan, atau ``(None, False)``
+    jika nama file lama (non content-addressed) dan ``hitung_hash`` False.
+    """
+
+    sha = sha256_from_name(nama_file)
+    if sha is None:
+        if not hitung_hash:
+            return None, False
+        hasher = hashlib.sha256()
+        with content_storage.open(nama_file, "rb") as fh:
+            for chunk in fh.chunks():
+                hasher.update(chunk)
+        sha = hasher.hexdigest()
+    return DokumenLaporan.objects.get_or_create(sha256=sha, defaults={"nama_file": nama_file})
+
+
+def jadwalkan_ekstraksi(nama_file: str):
+    """Buat job ekstraksi hanya untuk isi file yang belum pernah terlihat."""
+
+    dokumen, created = dokumen_untuk(nama_file)
+    if created:
+        enqueue("search.ekstrak_laporan", {"dokumen_id": dokumen.pk})
+    return dokumen
+
+
+def simpan_hasil(dokumen: DokumenLaporan, pages: list[str]) -> None:
+    halaman = [
+        HalamanLaporan(dokumen=dokumen, nomor=nomor, teks=teks, jumlah_kata=hitung_kata(teks))
+        for nomor, teks in enumerate(pages, start=1)
+    ]
+    with transaction.atomic():
+        HalamanLaporan.objects.filter(dokumen=dokumen).delete()
+        HalamanLaporan.objects.bulk_create(halaman, batch_size=500)
+        DokumenLaporan.objects.filter(pk=dokumen.pk).update(
+            status="SELESAI",
+            jumlah_halaman=len(halaman),
+            jumlah_kata=sum(h.jumlah_kata for h in halaman),
+            error="",
+            diekstrak_pada=timezone.now(),
+        )
+
+
+def tandai_gagal(dokumen: DokumenLaporan, error: str) -> None:
+    DokumenLaporan.objects.filter(pk=dokumen.pk).update(
+        status="GAGAL", error=error, diekstrak_pada=timezone.now()
+    )
@@ -0,0 +1,94 @@
+# backend/search/management/commands/index_laporan.py
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError
+
+from masterdata.models import SeminarHasilPKL
+from masterdata.storage import content_storage
+from search.extract import extract_pages
+from search.indexer import dokumen_untuk, simpan_hasil, tandai_gagal
+
+
+class Command(BaseCommand):
+    help = (
+        "Ekstrak teks laporan PKL yang belum terindeks secara paralel (process pool). "
+        "Setiap isi file (SHA-256) hanya diekstrak sekali."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes", type=int, default=os.cpu_count() or 1,
+            help="Jumlah proses ekstraksi (default: jumlah CPU).",
+        )
+        parser.add_argument("--periode", type=int, help="Hanya laporan pada periode (id) ini.")
+        parser.add_argument(
+            "--force", action="store_true", help="Ekstrak ulang juga dokumen yang sudah selesai.",
+        )
+
+    def _dokumen(self, options):
+        qs = SeminarHasilPKL.objects.exclude(file_laporan="")
+        if options["periode"]:
+            qs = qs.filter(periode_id=options["periode"])
+        dokumen = {}
+        for nama_file in qs.values_list("file_laporan", flat=True).distinct().iterator():
+            if not content_storage.exists(nama_file):
+                self.stderr.write(f"File tidak ditemukan: {nama_file}")
+                continue
+            # file lama (non content-addressed) di-hash dari isinya
+            obj, _ = dokumen_untuk(nama_file, hitung_hash=True)
+            if options["force"] or obj.status != "SELESAI":
+                dokumen[obj.pk] = obj
+        return list(dokumen.values())
+
+    def handle(self, *args, **options):
+        try:
+            import pypdf  # noqa: F401
+        except ModuleNotFoundError:
+            raise CommandError("Dependensi pypdf belum terpasang. Install dengan `pip install pypdf`.")
+
+        daftar = self._dokumen(options)
+        if not daftar:
+            self.stdout.write("Semua laporan sudah terindeks.")
+            return
+
+        processes = max(1, min(options["processes"], len(daftar)))
+        self.stdout.write(f"{len(daftar)} dokumen diekstrak dengan {processes} proses.")
+        selesai = gagal = 0
+
+        def catat(dokumen, pages=None, error=None):
+            nonlocal selesai, gagal
+            if error is None:
+                simpan_hasil(dokumen, pages)
+                selesai += 1
+            else:
+                tandai_gagal(dokumen, error)
+                gagal += 1
+                self.stderr.write(f"Gagal: {dokumen.nama_file}: {error}")
+
+        if processes == 1:
+            for dokumen in daftar:
+                try:
+                    pages = extract_pages(content_storage.path(dokumen.nama_file))
+                except Exception as exc:  # noqa: BLE001 - PDF rusak dicatat, lanjut
+                    catat(dokumen, error=f"{type(exc).__name__}: {exc}")
+                else:
+                    catat(dokumen, pages)
+        else:
+            # proses anak hanya mem-parsing PDF (CPU-bound); penulisan DB di proses ini
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=processes, mp_context=ctx) as pool:
+                futures = {
+                    pool.submit(extract_pages, content_storage.path(d.nama_file)): d for d in daftar
+                }
+                for future in as_completed(futures):
+                    dokumen = futures[future]
+                    try:
+                        pages = future.result()
+                    except Exception as exc:  # noqa: BLE001
+                        catat(dokumen, error=f"{type(exc).__name__}: {exc}")
+                    else:
+                        catat(dokumen, pages)
+
+        self.stdout.write(f"Selesai: {selesai} dokumen terindeks, {gagal} gagal.")
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DokumenLaporan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('nama_file', models.CharField(db_index=True, help_text='Nama file di ContentAddressedStorage (sama dengan SeminarHasilPKL.file_laporan).', max_length=255)),
+                ('status', models.CharField(choices=[('ANTRI', 'Menunggu ekstraksi'), ('SELESAI', 'Selesai'), ('GAGAL', 'Gagal')], default='ANTRI', max_length=10)),
+                ('jumlah_halaman', models.PositiveIntegerField(default=0)),
+                ('jumlah_kata', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('dibuat_pada', models.DateTimeField(auto_now_add=True)),
+                ('diekstrak_pada', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Dokumen Laporan',
+                'verbose_name_plural': 'Dokumen Laporan',
+            },
+        ),
+        migrations.CreateModel(
+            name='HalamanLaporan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nomor', models.PositiveIntegerField()),
+                ('teks', models.TextField(blank=True)),
+                ('jumlah_kata', models.PositiveIntegerField(default=0)),
+                ('dokumen', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='halaman', to='search.dokumenlaporan')),
+            ],
+            options={
+                'verbose_name': 'Halaman Laporan',
+                'verbose_name_plural': 'Halaman Laporan',
+                'ordering': ['dokumen', 'nomor'],
+                'unique_together': {('dokumen', 'nomor')},
+            },
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Indeks full-text untuk HalamanLaporan.teks.
+#
+# SQLite: tabel virtual FTS5 (external content) + trigger sinkronisasi.
+# Catatan: jika kelak HalamanLaporan diubah lewat migrasi yang me-"remake"
+# tabel di SQLite, trigger ikut hilang dan harus dibuat ulang.
+
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE search_halaman_fts USING fts5(
+        teks,
+        content='search_halamanlaporan',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER search_halaman_ai AFTER INSERT ON search_halamanlaporan BEGIN
+        INSERT INTO search_halaman_fts(rowid, teks) VALUES (new.id, new.teks);
+    END
+    """,
+    """
+    CREATE TRIGGER search_halaman_ad AFTER DELETE ON search_halamanlaporan BEGIN
+        INSERT INTO search_halaman_fts(search_halaman_fts, rowid, teks)
+        VALUES ('delete', old.id, old.teks);
+    END
+    """,
+    """
+    CREATE TRIGGER search_halaman_au AFTER UPDATE ON search_halamanlaporan BEGIN
+        INSERT INTO search_halaman_fts(search_halaman_fts, rowid, teks)
+        VALUES ('delete', old.id, old.teks);
+        INSERT INTO search_halaman_fts(rowid, teks) VALUES (new.id, new.teks);
+    END
+    """,
+    # isi indeks dari baris yang sudah ada
+    "INSERT INTO search_halaman_fts(search_halaman_fts) VALUES ('rebuild')",
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS search_halaman_ai",
+    "DROP TRIGGER IF EXISTS search_halaman_ad",
+    "DROP TRIGGER IF EXISTS search_halaman_au",
+    "DROP TABLE IF EXISTS search_halaman_fts",
+]
+POSTGRES_FORWARD = [
+    "CREATE INDEX search_halaman_teks_fts ON search_halamanlaporan "
+    "USING gin (to_tsvector('simple', teks))",
+]
+POSTGRES_REVERSE = ["DROP INDEX IF EXISTS search_halaman_teks_fts"]
+
+
+def _jalankan(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _jalankan({"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD}),
+            _jalankan({"sqlite": SQLITE_REVERSE, "postgresql": POSTGRES_REVERSE}),
+        ),
+    ]
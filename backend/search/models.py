@@ -0,0 +1,61 @@
+# backend/search/models.py
+from django.db import models
+
+
+class DokumenLaporan(models.Model):
+    """
+    Hasil ekstraksi teks satu file laporan, dikunci oleh SHA-256 isinya.
+
+    Karena file laporan disimpan content-addressed (masterdata.storage),
+    file yang sama hanya diekstrak sekali walaupun dirujuk beberapa seminar
+    atau diunggah ulang.
+    """
+
+    STATUS_CHOICES = [
+        ("ANTRI", "Menunggu ekstraksi"),
+        ("SELESAI", "Selesai"),
+        ("GAGAL", "Gagal"),
+    ]
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    nama_file = models.CharField(
+        max_length=255,
+        db_index=True,
+        help_text="Nama file di ContentAddressedStorage (sama dengan SeminarHasilPKL.file_laporan).",
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="ANTRI")
+    jumlah_halaman = models.PositiveIntegerField(default=0)
+    jumlah_kata = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+
+    dibuat_pada = models.DateTimeField(auto_now_add=True)
+    diekstrak_pada = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Dokumen Laporan"
+        verbose_name_plural = "Dokumen Laporan"
+
+    def __str__(self):
+        return f"{self.nama_file} ({self.get_status_display()})"
+
+
+class HalamanLaporan(models.Model):
+    """Teks per halaman; diindeks full-text (lihat search.query & migrasi 0002)."""
+
+    dokumen = models.ForeignKey(
+        DokumenLaporan,
+        on_delete=models.CASCADE,
+        related_name="halaman",
+    )
+    nomor = models.PositiveIntegerField()
+    teks = models.TextField(blank=True)
+    jumlah_kata = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Halaman Laporan"
+        verbose_name_plural = "Halaman Laporan"
+        unique_together = ("dokumen", "nomor")
+        ordering = ["dokumen", "nomor"]
+
+    def __str__(self):
+        return f"{self.dokumen.nama_file} hlm. {self.nomor}"
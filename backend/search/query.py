@@ -0,0 +1,132 @@
+# backend/search/query.py
+"""
+Pencarian full-text isi laporan per halaman.
+
+- SQLite: tabel virtual FTS5 ``search_halaman_fts`` (external content,
+  disinkronkan trigger; lihat migrasi 0002), diurutkan dengan bm25.
+- PostgreSQL: indeks GIN ``to_tsvector('simple', teks)``, diurutkan ts_rank.
+- Backend lain: ``icontains`` per kata (tanpa indeks, cukup untuk development).
+
+Semua kata pada kueri harus muncul di halaman yang sama.
+"""
+
+import re
+from dataclasses import dataclass
+
+from django.db import connection
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from masterdata.models import SeminarHasilPKL
+
+from .models import DokumenLaporan, HalamanLaporan
+
+FTS_TABLE = "search_halaman_fts"
+_AWAL, _AKHIR = "\x02", "\x03"
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class HasilCari:
+    seminar: SeminarHasilPKL
+    halaman: int
+    jumlah_halaman: int
+    cuplikan: str
+
+
+def _kata(q: str) -> list[str]:
+    return _WORD_RE.findall(q)[:10]
+
+
+def _sorot(cuplikan: str) -> str:
+    html = escape(cuplikan).replace(_AWAL, "<mark>").replace(_AKHIR, "</mark>")
+    return mark_safe(html)
+
+
+def _cuplikan_python(teks: str, kata: list[str], lebar: int = 80) -> str:
+    lower = teks.lower()
+    pos = min((lower.find(k.lower()) for k in kata if k.lower() in lower), default=0)
+    awal = max(pos - lebar, 0)
+    potong = teks[awal:pos + lebar * 2]
+    for k in kata:
+        potong = re.sub(f"({re.escape(k)})", f"{_AWAL}\\1{_AKHIR}", potong, flags=re.IGNORECASE)
+    return ("…" if awal else "") + potong + "…"
+
+
+def _baris_sql(kata, periode_id, limit):
+    halaman = HalamanLaporan._meta.db_table
+    dokumen = DokumenLaporan._meta.db_table
+    seminar = SeminarHasilPKL._meta.db_table
+    filter_periode = "AND s.periode_id = %s" if periode_id else ""
+
+    if connection.vendor == "sqlite":
+        match = " ".join('"{}"'.format(k.replace('"', '""')) for k in kata)
+        sql = f"""
+            SELECT s.id, h.nomor, d.jumlah_halaman,
+                   snippet({FTS_TABLE}, 0, %s, %s, '…', 24)
+            FROM {FTS_TABLE}
+            JOIN {halaman} h ON h.id = {FTS_TABLE}.rowid
+            JOIN {dokumen} d ON d.id = h.dokumen_id
+            JOIN {seminar} s ON s.file_laporan = d.nama_file
+            WHERE {FTS_TABLE} MATCH %s {filter_periode}
+            ORDER BY bm25({FTS_TABLE}), s.id, h.nomor
+            LIMIT %s
+        """
+        params = [_AWAL, _AKHIR, match]
+    else:  # postgresql
+        sql = f"""
+            SELECT s.id, h.nomor, d.jumlah_halaman,
+                   ts_headline('simple', h.teks, q,
+                               'StartSel=' || %s || ', StopSel=' || %s || ', MaxWords=40, MinWords=15')
+            FROM {halaman} h
+            JOIN {dokumen} d ON d.id = h.dokumen_id
+            JOIN {seminar} s ON s.file_laporan = d.nama_file,
+                 plainto_tsquery('simple', %s) q
+            WHERE to_tsvector('simple', h.teks) @@ q {filter_periode}
+            ORDER BY ts_rank(to_tsvector('simple', h.teks), q) DESC, s.id, h.nomor
+            LIMIT %s
+        """
+        params = [_AWAL, _AKHIR, " ".join(kata)]
+    if periode_id:
+        params.append(periode_id)
+    params.append(limit)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+
+def _baris_orm(kata, periode_id, limit):
+    nama_file = SeminarHasilPKL.objects.exclude(file_laporan="")
+    if periode_id:
+        nama_file = nama_file.filter(periode_id=periode_id)
+    qs = HalamanLaporan.objects.filter(
+        dokumen__nama_file__in=nama_file.values("file_laporan")
+    ).select_related("dokumen")
+    for k in kata:
+        qs = qs.filter(teks__icontains=k)
+
+    rows = []
+    for h in qs.order_by("dokumen_id", "nomor")[:limit]:
+        seminar_ids = nama_file.filter(file_laporan=h.dokumen.nama_file).values_list("id", flat=True)
+        for seminar_id in seminar_ids:
+            rows.append((seminar_id, h.nomor, h.dokumen.jumlah_halaman, _cuplikan_python(h.teks, kata)))
+    return rows[:limit]
+
+
+def cari_laporan(q: str, *, periode_id: int | None = None, limit: int = 50) -> list[HasilCari]:
+    kata = _kata(q)
+    if not kata:
+        return []
+    if connection.vendor in {"sqlite", "postgresql"}:
+        rows = _baris_sql(kata, periode_id, limit)
+    else:
+        rows = _baris_orm(kata, periode_id, limit)
+
+    seminars = SeminarHasilPKL.objects.select_related("mahasiswa", "periode").in_bulk(
+        {row[0] for row in rows}
+    )
+    return [
+        HasilCari(seminars[sid], nomor, jumlah_halaman, _sorot(cuplikan))
+        for sid, nomor, jumlah_halaman, cuplikan in rows
+        if sid in seminars
+    ]
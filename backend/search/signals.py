@@ -0,0 +1,18 @@
+# backend/search/signals.py
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from masterdata.models import SeminarHasilPKL
+
+from .indexer import jadwalkan_ekstraksi
+
+
+@receiver(post_save, sender=SeminarHasilPKL, dispatch_uid="search_laporan_disimpan")
+def laporan_disimpan(sender, instance, update_fields=None, **kwargs):
+    if not instance.file_laporan:
+        return
+    if update_fields is not None and "file_laporan" not in update_fields:
+        return
+    nama_file = instance.file_laporan.name
+    transaction.on_commit(lambda: jadwalkan_ekstraksi(nama_file))
@@ -0,0 +1,29 @@
+# backend/search/tasks.py
+"""Task ekstraksi teks laporan (dijalankan oleh `manage.py runworker`)."""
+
+from jobs.registry import task
+from masterdata.storage import content_storage
+
+from .extract import ExtractionUnavailable, extract_pages
+from .indexer import simpan_hasil, tandai_gagal
+from .models import DokumenLaporan
+
+
+@task("search.ekstrak_laporan", max_attempts=2)
+def ekstrak_laporan(dokumen_id: int) -> dict:
+    dokumen = DokumenLaporan.objects.get(pk=dokumen_id)
+    if dokumen.status == "SELESAI":
+        # sudah diekstrak (mis. lewat index_laporan): satu kali per hash
+        return {"dokumen": dokumen.pk, "status": dokumen.status}
+
+    try:
+        pages = extract_pages(content_storage.path(dokumen.nama_file))
+    except ExtractionUnavailable as exc:
+        tandai_gagal(dokumen, str(exc))
+        raise
+    except Exception as exc:  # noqa: BLE001 - PDF rusak tidak perlu di-retry
+        tandai_gagal(dokumen, f"{type(exc).__name__}: {exc}")
+        return {"dokumen": dokumen.pk, "status": "GAGAL"}
+
+    simpan_hasil(dokumen, pages)
+    return {"dokumen": dokumen.pk, "status": "SELESAI", "halaman": len(pages)}
@@ -0,0 +1,132 @@
+import importlib.util
+import io
+import unittest
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from jobs.models import Job
+from jobs.worker import run_pending
+from masterdata.models import Dosen, Mahasiswa, PeriodePKL, SeminarHasilPKL
+from masterdata.periode import daftar_periode
+from masterdata.testing import MediaSementaraMixin
+from .models import DokumenLaporan
+from .query import cari_laporan
+
+
+def buat_pdf(*halaman: str) -> bytes:
+    """PDF minimal (satu baris teks per halaman, font Helvetica) untuk fixture."""
+
+    objek = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for teks in halaman:
+        stream = f"BT /F1 12 Tf 72 720 Td ({teks}) Tj ET".encode("latin-1")
+        objek.append(f"<< /Length {len(stream)} >>\nstream\n{stream.decode('latin-1')}\nendstream")
+        isi = len(objek)
+        objek.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {isi} 0 R >>"
+        )
+        kids.append(f"{len(objek)} 0 R")
+    objek[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for nomor, badan in enumerate(objek, start=1):
+        offsets.append(len(out))
+        out += f"{nomor} 0 obj\n{badan}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objek) + 1}\n0000000000 65535 f \n".encode()
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objek) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+@unittest.skipUnless(importlib.util.find_spec("pypdf"), "pypdf belum terpasang")
+class EkstraksiLaporanTests(MediaSementaraMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.periode = PeriodePKL.objects.create(
+            nama_periode="PKL 2025 Gasal", tahun_ajaran="2025/2026", semester="GASAL",
+            tanggal_mulai="2025-01-01", tanggal_selesai="2025-06-30",
+        )
+        self.periode_lain = PeriodePKL.objects.create(
+            nama_periode="PKL 2024 Genap", tahun_ajaran="2024/2025", semester="GENAP",
+            tanggal_mulai="2024-07-01", tanggal_selesai="2024-12-31",
+        )
+        self.pdf = buat_pdf("Pendahuluan laporan magang", "Model random forest untuk klasifikasi churn")
+
+    def _seminar(self, nim, periode, isi):
+        mhs = Mahasiswa.objects.create(nim=nim, nama=f"Mhs {nim}", angkatan=2022)
+        with self.captureOnCommitCallbacks(execute=True):
+            return SeminarHasilPKL.objects.create(
+                mahasiswa=mhs, periode=periode, judul_laporan=f"Laporan {nim}",
+                file_laporan=SimpleUploadedFile("laporan.pdf", isi),
+            )
+
+    def test_ekstraksi_sekali_per_hash_dan_hasil_bisa_dicari(self):
+        pertama = self._seminar("2008107000", self.periode, self.pdf)
+        kedua = self._seminar("2008107001", self.periode_lain, self.pdf)  # isi sama
+        with self.captureOnCommitCallbacks(execute=True):
+            pertama.status = "DIJADWALKAN"
+            pertama.save(update_fields=["status"])
+
+        self.assertEqual(DokumenLaporan.objects.count(), 1)
+        self.assertEqual(Job.objects.filter(task="search.ekstrak_laporan").count(), 1)
+        run_pending()
+
+        dokumen = DokumenLaporan.objects.get()
+        self.assertEqual(dokumen.status, "SELESAI")
+        self.assertEqual(dokumen.jumlah_halaman, 2)
+        self.assertEqual(dokumen.jumlah_kata, 9)
+
+        hasil = cari_laporan("Random  klasifikasi")
+        self.assertEqual({h.seminar.pk for h in hasil}, {pertama.pk, kedua.pk})
+        self.assertEqual({h.halaman for h in hasil}, {2})
+        self.assertIn("<mark>random</mark>", hasil[0].cuplikan)
+
+        hasil = cari_laporan("random", periode_id=self.periode.pk)
+        self.assertEqual([h.seminar.pk for h in hasil], [pertama.pk])
+        self.assertEqual(cari_laporan("random pendahuluan"), [])  # beda halaman
+        self.assertEqual(cari_laporan('"); DROP --'), [])
+
+    def test_halaman_cari_hanya_untuk_koordinator(self):
+        self._seminar("2008107002", self.periode, self.pdf)
+        run_pending()
+
+        user = User.objects.create_user(username="koor_cari", password="test")
+        dosen = Dosen.objects.create(user=user, nidn="0777", nama="Koor Cari")
+        self.client.force_login(user)
+        self.assertEqual(self.client.get("/koor/laporan/cari/?q=churn").status_code, 403)
+
+        dosen.is_koordinator_pkl = True
+        dosen.save()
+        response = self.client.get("/koor/laporan/cari/?q=churn")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["koordinator"], dosen)
+        self.assertContains(response, "<strong>Koor Cari</strong> (Koordinator PKL)", html=False)
+        self.assertContains(response, "<mark>churn</mark>", html=False)
+        self.assertContains(response, "2008107002")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/koor/laporan/cari/?q=churn")
+        self.assertEqual(response.context["periode_list"], daftar_periode())
+        self.assertFalse([q for q in ctx.captured_queries if 'FROM "masterdata_periodepkl"' in q["sql"]])
+
+    def test_index_laporan_paralel_untuk_backfill(self):
+        self._seminar("2008107003", self.periode, self.pdf)
+        self._seminar("2008107004", self.periode, buat_pdf("Dashboard penjualan"))
+        Job.objects.all().delete()  # anggap worker belum sempat berjalan
+
+        call_command("index_laporan", processes=2, stdout=io.StringIO())
+        self.assertEqual(
+            sorted(DokumenLaporan.objects.values_list("status", "jumlah_halaman")),
+            [("SELESAI", 1), ("SELESAI", 2)],
+        )
+        self.assertEqual(len(cari_laporan("penjualan")), 1)